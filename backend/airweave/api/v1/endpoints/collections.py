@@ -1,18 +1,26 @@
 """API endpoints for collections."""
 
-from typing import List
+import json
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
 
 from fastapi import BackgroundTasks, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave import crud, schemas
 from airweave.api import deps
 from airweave.api.router import TrailingSlashRouter
 from airweave.core.collection_service import collection_service
+from airweave.core.logging import logger
+from airweave.core.search_cache import search_cache
 from airweave.core.search_service import ResponseType, search_service
 from airweave.core.source_connection_service import source_connection_service
 from airweave.core.sync_service import sync_service
 from airweave.models.user import User
+from airweave.schemas.search import SearchStatus
 
 router = TrailingSlashRouter()
 
@@ -72,6 +80,7 @@ async def update_collection(
     )
     if db_obj is None:
         raise HTTPException(status_code=404, detail="Collection not found")
+    search_cache.forget_collection(readable_id)
     return await crud.collection.update(
         db, db_obj=db_obj, obj_in=collection, current_user=current_user
     )
@@ -110,9 +119,75 @@ async def delete_collection(
         pass
 
     # Delete the collection - CASCADE will handle all child objects
+    search_cache.forget_collection(readable_id)
     return await crud.collection.remove(db, id=db_obj.id, current_user=current_user)
 
 
+def search_params(
+    limit: int = Query(10, ge=1, le=100, description="Maximum number of results to return"),
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    score_threshold: Optional[float] = Query(
+        None, description="Only return results with at least this score"
+    ),
+    source_name: Optional[List[str]] = Query(
+        None, description="Only return entities from these sources"
+    ),
+    sync_id: Optional[List[UUID]] = Query(None, description="Only return entities of these syncs"),
+    entity_type: Optional[List[str]] = Query(
+        None, description="Only return entities of these classes, e.g. SlackMessageEntity"
+    ),
+    time_field: str = Query(
+        "created_at", description="Payload field that time_from and time_to apply to"
+    ),
+    time_from: Optional[datetime] = Query(
+        None, description="Only return entities with time_field at or after this time"
+    ),
+    time_to: Optional[datetime] = Query(
+        None, description="Only return entities with time_field at or before this time"
+    ),
+    include_field: Optional[List[str]] = Query(
+        None, description="Payload fields to return, all fields if not set"
+    ),
+    rerank: Optional[bool] = Query(
+        None, description="Whether to rerank the results, the server default if not set"
+    ),
+) -> schemas.SearchParams:
+    """Parse the pagination, filter and projection query parameters of a search.
+
+    Args:
+        limit: Maximum number of results to return
+        offset: Number of results to skip
+        score_threshold: Only return results with at least this score
+        source_name: Only return entities from these sources
+        sync_id: Only return entities of these syncs
+        entity_type: Only return entities of these classes
+        time_field: Payload field that time_from and time_to apply to
+        time_from: Only return entities with time_field at or after this time
+        time_to: Only return entities with time_field at or before this time
+        include_field: Payload fields to return, all fields if not set
+        rerank: Whether to rerank the results, the server default if not set
+
+    Returns:
+        schemas.SearchParams: The parameters of the search
+    """
+    try:
+        return schemas.SearchParams(
+            limit=limit,
+            offset=offset,
+            score_threshold=score_threshold,
+            source_names=source_name,
+            sync_ids=sync_id,
+            entity_types=entity_type,
+            time_field=time_field,
+            time_from=time_from,
+            time_to=time_to,
+            include_fields=include_field,
+            rerank=rerank,
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+
 @router.get("/{readable_id}/search", response_model=schemas.SearchResponse)
 async def search_collection(
     readable_id: str,
@@ -120,6 +195,7 @@ async def search_collection(
     response_type: ResponseType = Query(
         ResponseType.RAW, description="Type of response: raw search results or AI completion"
     ),
+    params: schemas.SearchParams = Depends(search_params),
     db: AsyncSession = Depends(deps.get_db),
     current_user: User = Depends(deps.get_user),
 ) -> schemas.SearchResponse:
@@ -129,6 +205,7 @@ async def search_collection(
         readable_id: The readable ID of the collection to search
         query: The search query
         response_type: Type of response (raw results or AI completion)
+        params: Pagination, filters and payload projection of the search
         db: The database session
         current_user: The current user
 
@@ -141,9 +218,88 @@ async def search_collection(
         query=query,
         current_user=current_user,
         response_type=response_type,
+        params=params,
+    )
+
+
+@router.post("/search", response_model=schemas.SearchResponse)
+async def search_collections(
+    search_in: schemas.MultiCollectionSearchRequest,
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_user),
+) -> schemas.SearchResponse:
+    """Search several collections at once.
+
+    The results of all collections are merged by score, every result names the readable ID of
+    its collection under "collection".
+
+    Args:
+        search_in: The query, the readable IDs of the collections and the search parameters
+        db: The database session
+        current_user: The current user
+
+    Returns:
+        schemas.SearchResponse: The merged search results
+    """
+    results = await search_service.search_many(
+        db,
+        query=search_in.query,
+        readable_ids=search_in.readable_ids,
+        current_user=current_user,
+        params=search_in.params,
+    )
+    return schemas.SearchResponse(
+        results=results, response_type=ResponseType.RAW, status=SearchStatus.SUCCESS
     )
 
 
+@router.get("/{readable_id}/search/stream", response_class=StreamingResponse)
+async def stream_search_collection(
+    readable_id: str,
+    query: str = Query(..., description="Search query"),
+    params: schemas.SearchParams = Depends(search_params),
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_user),
+) -> StreamingResponse:
+    """Search within a collection and stream an AI completion as server-sent events.
+
+    The search results are sent as a "results" event as soon as the search returns. The
+    completion follows as "completion" events with the next piece of text, and the stream ends
+    with a "done" event carrying the search status, or an "error" event.
+
+    Args:
+        readable_id: The readable ID of the collection to search
+        query: The search query
+        params: Pagination, filters and payload projection of the search
+        db: The database session
+        current_user: The current user
+
+    Returns:
+        StreamingResponse: The stream of search events
+    """
+    events = search_service.stream_search_with_completion(
+        db, readable_id=readable_id, query=query, current_user=current_user, params=params
+    )
+    # Run the search before the response starts, so that a missing collection is still a 404
+    first_event = await anext(events)
+
+    async def event_generator():
+        yield _format_event(*first_event)
+        try:
+            async for event in events:
+                yield _format_event(*event)
+        except Exception as e:
+            logger.error(f"Error in search stream: {str(e)}")
+            yield _format_event("error", {"detail": "Error generating completion"})
+
+    return StreamingResponse(event_generator(), media_type="text/event-stream")
+
+
+def _format_event(name: str, data: dict) -> str:
+    """Format a server-sent event with a JSON payload."""
+    return f"event: {name}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
 @router.post("/{readable_id}/refresh_all", response_model=list[schemas.SourceConnectionJob])
 async def refresh_all_source_connections(
     *,
@@ -211,15 +367,15 @@ async def refresh_all_source_connections(
         # Add to jobs list
         sync_jobs.append(sync_job.to_source_connection_job(sc.id))
 
-        # Start the sync job in the background
-        background_tasks.add_task(
-            sync_service.run,
+        # Start the sync job in the background or queue it for the sync workers
+        await sync_service.dispatch(
             sync,
             sync_job,
             sync_dag,
             collection_obj,  # Use the already converted object
             source_connection,
             current_user,
+            background_tasks=background_tasks,
         )
 
     return sync_jobs
@@ -1,6 +1,7 @@
 """Health check endpoints."""
 
 from airweave.api.router import TrailingSlashRouter
+from airweave.core.search_cache import search_cache
 
 router = TrailingSlashRouter()
 
@@ -14,3 +15,14 @@ async def health_check() -> dict[str, str]:
         dict: A dictionary containing the status of the API.
     """
     return {"status": "healthy"}
+
+
+@router.get("/search-cache")
+async def search_cache_stats() -> dict:
+    """Get the hit and miss counters of the search cache of this process.
+
+    Returns:
+    --------
+        dict: The counters of the query embedding and search result caches.
+    """
+    return search_cache.stats()
@@ -124,8 +124,14 @@ async def create_source_connection(
                 db=db, readable_id=source_connection.collection, current_user=user
             )
             collection = schemas.Collection.model_validate(collection, from_attributes=True)
-    background_tasks.add_task(
-        sync_service.run, sync, sync_job, sync_dag, collection, source_connection, user
+    await sync_service.dispatch(
+        sync,
+        sync_job,
+        sync_dag,
+        collection,
+        source_connection,
+        user,
+        background_tasks=background_tasks,
     )
 
     return source_connection
@@ -225,8 +231,7 @@ async def run_source_connection(
     collection = schemas.Collection.model_validate(collection, from_attributes=True)
     source_connection = schemas.SourceConnection.from_orm_with_collection_mapping(source_connection)
 
-    background_tasks.add_task(
-        sync_service.run,
+    await sync_service.dispatch(
         sync,
         sync_job,
         sync_dag,
@@ -234,6 +239,7 @@ async def run_source_connection(
         source_connection,
         user,
         access_token=sync_job.access_token if hasattr(sync_job, "access_token") else None,
+        background_tasks=background_tasks,
     )
 
     return sync_job.to_source_connection_job(source_connection_id)
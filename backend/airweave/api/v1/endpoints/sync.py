@@ -141,8 +141,14 @@ async def create_sync(
     # If job was created and should run immediately, start it in background
     if sync_job and sync_in.run_immediately:
         sync_dag = await sync_service.get_sync_dag(db=db, sync_id=sync.id, current_user=user)
-        background_tasks.add_task(
-            sync_service.run, sync, sync_job, sync_dag, collection, source_connection, user
+        await sync_service.dispatch(
+            sync,
+            sync_job,
+            sync_dag,
+            collection,
+            source_connection,
+            user,
+            background_tasks=background_tasks,
         )
 
     return sync
@@ -195,13 +201,35 @@ async def run_sync(
     --------
         sync_job (schemas.SyncJob): The sync job
     """
+    # Resolve where the sync writes to before creating a job, which would otherwise never run
+    source_connection = await crud.source_connection.get_by_sync_id(
+        db=db, sync_id=sync_id, current_user=user
+    )
+    if not source_connection:
+        raise HTTPException(status_code=404, detail="Source connection not found for sync")
+    collection = await crud.collection.get_by_readable_id(
+        db=db, readable_id=source_connection.readable_collection_id, current_user=user
+    )
+    if not collection:
+        raise HTTPException(status_code=404, detail="Collection not found for sync")
+    collection = schemas.Collection.model_validate(collection, from_attributes=True)
+    source_connection = schemas.SourceConnection.from_orm_with_collection_mapping(source_connection)
+
     # Trigger the sync run - kinda, not really, we'll do that in the background
     sync, sync_job, sync_dag = await sync_service.trigger_sync_run(
         db=db, sync_id=sync_id, current_user=user
     )
 
-    # Start the sync job in the background - this is where the sync actually runs
-    background_tasks.add_task(sync_service.run, sync, sync_job, sync_dag, user)
+    # Start the sync job in the background or queue it for the sync workers
+    await sync_service.dispatch(
+        sync,
+        sync_job,
+        sync_dag,
+        collection,
+        source_connection,
+        user,
+        background_tasks=background_tasks,
+    )
 
     return sync_job
 
@@ -376,8 +376,14 @@ async def exchange_white_label_oauth2_code(
                 )
                 collection = schemas.Collection.model_validate(collection, from_attributes=True)
 
-            background_tasks.add_task(
-                sync_service.run, sync, sync_job, sync_dag, collection, source_connection, user
+            await sync_service.dispatch(
+                sync,
+                sync_job,
+                sync_dag,
+                collection,
+                source_connection,
+                user,
+                background_tasks=background_tasks,
             )
 
         # Make sure we are returning the source_connection, not anything else
@@ -9,6 +9,7 @@ from openai.types.chat import ChatCompletionChunk
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave import crud, schemas
+from airweave.core.completion_context import build_completion_context, count_prompt_tokens
 from airweave.core.config import settings
 from airweave.models.chat import ChatMessage, ChatRole
 
@@ -101,6 +102,8 @@ class ChatService:
                 "stream": True,  # Enable streaming
             }
 
+            logger.info(f"Chat prompt: {count_prompt_tokens(messages)} tokens")
+
             # Create streaming response
             stream = await self.client.chat.completions.create(
                 model=model,
@@ -234,7 +237,12 @@ class ChatService:
             if not search_results:
                 return ""
 
-            return "\n\n".join(str(result) for result in search_results)
+            context = build_completion_context(search_results)
+            logger.info(
+                f"Chat context: {context.tokens} tokens from "
+                f"{context.chunks_used}/{context.chunks_total} chunks"
+            )
+            return context.text
 
         except Exception as e:
             logger.error(f"Error getting search context: {str(e)}")
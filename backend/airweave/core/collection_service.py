@@ -73,7 +73,12 @@ class CollectionService:
         qdrant_destination = await QdrantDestination.create(collection_id=collection.id)
 
         # Setup the collection on Qdrant
-        await qdrant_destination.setup_collection(vector_size=_determine_vector_size())
+        await qdrant_destination.setup_collection(
+            vector_size=_determine_vector_size(),
+            storage_profile=collection.vector_storage_profile,
+            hnsw_m=collection.hnsw_m,
+            hnsw_ef_construct=collection.hnsw_ef_construct,
+        )
 
         return schemas.Collection.model_validate(collection, from_attributes=True)
 
@@ -0,0 +1,118 @@
+"""Assembly of search results into the context of a completion prompt.
+
+Search results are grouped by the entity they were chunked from, so that a document is shown
+once with its matching chunks in order rather than as scattered fragments. The entities are
+ranked by their best scoring chunk, rendered without platform fields, and packed into a token
+budget in rank order.
+"""
+
+from typing import Dict, List, NamedTuple, Optional
+
+from airweave.core.config import settings
+from airweave.platform.entities._render import render_payload_text
+from airweave.platform.transformers.utils import count_tokens, truncate_to_tokens
+
+# Tokens the chat format adds around the content of every message
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# A chunk cut down to fewer tokens than this carries too little to be worth including
+MIN_TRUNCATED_CHUNK_TOKENS = 64
+
+
+class CompletionContext(NamedTuple):
+    """The rendered context and what went into it."""
+
+    text: str
+    tokens: int
+    chunks_used: int
+    chunks_total: int
+
+
+def _group_by_entity(results: List[dict]) -> List[List[dict]]:
+    """Group results by the entity they were chunked from, in order of the best chunk."""
+    groups: Dict[str, List[dict]] = {}
+    for result in results:
+        payload = result.get("payload") or {}
+        key = payload.get("entity_id") or str(result.get("id"))
+        groups.setdefault(key, []).append(result)
+    return list(groups.values())
+
+
+def _header(number: int, payload: dict) -> str:
+    """Header line of an entity, e.g. "[1] SlackMessageEntity (general > Weekly sync)"."""
+    header = f"[{number}] {payload.get('entity_type', 'Entity')}"
+    path = " > ".join(
+        breadcrumb["name"]
+        for breadcrumb in payload.get("breadcrumbs") or []
+        if isinstance(breadcrumb, dict) and breadcrumb.get("name")
+    )
+    return f"{header} ({path})" if path else header
+
+
+def build_completion_context(
+    results: List[dict], max_tokens: Optional[int] = None
+) -> CompletionContext:
+    """Render search results as prompt context within a token budget.
+
+    Chunks are packed in rank order. A chunk that does not fit is cut down to the remaining
+    budget if enough of it fits, otherwise it is skipped in favor of smaller chunks further down.
+    Chunks with the same text, e.g. the same message synced twice, are included once.
+
+    Args:
+        results (List[dict]): The search results, ordered by relevance.
+        max_tokens (Optional[int]): The token budget of the context, defaults to the
+            COMPLETION_CONTEXT_MAX_TOKENS setting.
+
+    Returns:
+        CompletionContext: The context text and its token count.
+    """
+    if max_tokens is None:
+        max_tokens = settings.COMPLETION_CONTEXT_MAX_TOKENS
+
+    sections = []
+    used_tokens = 0
+    chunks_used = 0
+    seen_texts = set()
+
+    for group in _group_by_entity(results):
+        chunks = sorted(
+            group, key=lambda result: (result.get("payload") or {}).get("chunk_index") or 0
+        )
+        header = _header(len(sections) + 1, chunks[0].get("payload") or {})
+        header_tokens = count_tokens(header)
+
+        texts = []
+        for chunk in chunks:
+            text = render_payload_text(chunk.get("payload") or {})
+            if not text or text in seen_texts:
+                continue
+            seen_texts.add(text)
+
+            remaining = max_tokens - used_tokens - header_tokens * (not texts)
+            tokens = count_tokens(text)
+            if tokens > remaining:
+                if remaining < MIN_TRUNCATED_CHUNK_TOKENS:
+                    continue
+                text = truncate_to_tokens(text, remaining)
+                tokens = remaining
+
+            if not texts:
+                used_tokens += header_tokens
+            texts.append(text)
+            used_tokens += tokens
+            chunks_used += 1
+
+        if texts:
+            sections.append("\n".join([header, *texts]))
+
+    return CompletionContext(
+        text="\n\n".join(sections),
+        tokens=used_tokens,
+        chunks_used=chunks_used,
+        chunks_total=len(results),
+    )
+
+
+def count_prompt_tokens(messages: List[dict]) -> int:
+    """Count the tokens of chat messages as sent to the model."""
+    return sum(count_tokens(message["content"]) + MESSAGE_OVERHEAD_TOKENS for message in messages)
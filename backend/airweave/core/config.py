@@ -34,9 +34,106 @@ class Settings(BaseSettings):
             destinations, and entity types.
         QDRANT_HOST (str): The Qdrant host.
         QDRANT_PORT (int): The Qdrant port.
+        QDRANT_PAYLOAD_INDEX_BACKFILL (bool): Whether missing payload indexes are created in
+            existing Qdrant collections at startup.
         TEXT2VEC_INFERENCE_URL (str): The URL for text2vec-transformers inference service.
+        TEXT2VEC_BATCH_SIZE (int): Number of texts sent per batched inference request.
+        TEXT2VEC_MAX_CONCURRENCY (int): Maximum number of concurrent inference requests, also
+            the size of the inference connection pool.
         OPENAI_API_KEY (Optional[str]): The OpenAI API key.
         MISTRAL_API_KEY (Optional[str]): The Mistral AI API key.
+        OPENAI_EMBEDDING_TOKENS_PER_REQUEST (int): Token budget of a single embeddings request.
+        OPENAI_EMBEDDING_MAX_CONCURRENCY (int): Maximum number of concurrent embeddings requests
+            per embed_many call.
+        OPENAI_EMBEDDING_REQUESTS_PER_MINUTE (int): Embeddings requests per minute allowed by the
+            process-wide rate limiter.
+        OPENAI_EMBEDDING_TOKENS_PER_MINUTE (int): Embedding tokens per minute allowed by the
+            process-wide rate limiter.
+        OPENAI_EMBEDDING_MAX_RETRIES (int): Number of retries for rate limited (429) or failed
+            (5xx) embeddings requests.
+        SYNC_HASH_PREFETCH_ENABLED (bool): Whether to prefetch stored entity hashes at the
+            start of a sync instead of querying the entity table once per entity.
+        SYNC_HASH_PREFETCH_PAGE_SIZE (int): Number of entity rows fetched per prefetch page.
+        SYNC_HASH_INDEX_MAX_IN_MEMORY (int): Number of entries the hash index keeps in memory
+            before spilling to a disk-backed store.
+        SYNC_BATCHING_ENABLED (bool): Whether to micro-batch embedding and destination writes
+            across source entities.
+        SYNC_BATCH_MAX_CHUNKS (int): Number of buffered chunks that triggers a batch flush.
+        SYNC_BATCH_MAX_LATENCY_MS (int): Maximum time an entity waits in the batch buffer.
+        SYNC_LEDGER_BUFFERING_ENABLED (bool): Whether entity table writes are buffered and
+            flushed as multi-row upserts.
+        SYNC_LEDGER_BATCH_SIZE (int): Number of buffered entity rows per upsert flush.
+        SYNC_STALE_ENTITY_CLEANUP_ENABLED (bool): Whether entities that were not seen by a
+            completed sync job are deleted from the destinations and the entity table.
+        SYNC_STALE_ENTITY_PAGE_SIZE (int): Number of stale entities deleted per page.
+        SYNC_JOB_QUEUE_ENABLED (bool): Whether sync jobs are left in the sync_job table for
+            airweave-worker processes instead of running in the API process.
+        SYNC_WORKER_CONCURRENCY (int): Number of sync jobs a worker runs at the same time.
+        SYNC_WORKER_POLL_SECONDS (float): How often an idle worker looks for new jobs.
+        SYNC_JOB_LEASE_SECONDS (int): How long a job stays leased to a worker without a
+            heartbeat, after which another worker may take it over.
+        SYNC_JOB_HEARTBEAT_SECONDS (int): How often a worker renews the leases of its jobs.
+        SYNC_JOB_MAX_ATTEMPTS (int): Number of times a job is claimed before a job whose worker
+            died is failed instead of retried.
+        SYNC_CHECKPOINTS_ENABLED (bool): Whether sources that support checkpoints save their
+            position on the sync job, so that a failed or requeued job resumes from there.
+        SYNC_CHECKPOINT_INTERVAL_SECONDS (int): Minimum time between two saved checkpoints.
+            Saving one waits until every entity before it is stored.
+        SYNC_RESUME_MAX_AGE_HOURS (int): Age after which the checkpoint of a failed job is
+            no longer resumed from, since the entities before it may have changed since.
+        SYNC_INCREMENTAL_ENABLED (bool): Whether scheduled runs between full syncs only fetch
+            the entities that changed since the last completed job, for sources that support it.
+        SYNC_FULL_SYNC_CRON_SCHEDULE (str): Default cron expression of the full syncs of a
+            scheduled sync, which also delete the entities that are gone from the source.
+        SYNC_INCREMENTAL_OVERLAP_SECONDS (int): How far before the watermark incremental runs
+            look for changes, to cover clock skew and changes made while a job ran.
+        SYNC_TRANSFORM_PROCESSES (int): Number of worker processes that chunk files and entities
+            off the event loop, 0 to chunk on the event loop.
+        SYNC_WORKER_POOL_ADAPTIVE_ENABLED (bool): Whether the number of entities a sync processes
+            at the same time adapts to the latency and throttling of its source, embedding and
+            destination calls, instead of staying at SYNC_WORKER_POOL_INITIAL_WORKERS.
+        SYNC_WORKER_POOL_INITIAL_WORKERS (int): Number of entities a sync starts processing at
+            the same time.
+        SYNC_WORKER_POOL_MIN_WORKERS (int): Lowest number a sync backs off to under throttling.
+        SYNC_WORKER_POOL_MAX_WORKERS (int): Highest number a single sync grows to.
+        SYNC_WORKER_POOL_GLOBAL_MAX_WORKERS (int): Highest number of entities all syncs of a
+            process handle at the same time, within the database connection pool.
+        EMBEDDING_COMPACT_VECTORS (bool): Whether sync embeddings are carried as float32 arrays
+            (decoded from base64 for OpenAI) instead of lists of floats.
+        EMBEDDING_CACHE_ENABLED (bool): Whether sync embeddings are served from the
+            content-addressed embedding cache.
+        EMBEDDING_CACHE_PATH (Optional[str]): Location of the embedding cache file, defaults to
+            a file in the temp directory.
+        EMBEDDING_CACHE_MAX_MEMORY_ENTRIES (int): Number of vectors kept in the in-process LRU.
+        EMBEDDING_CACHE_MAX_DISK_MB (int): Size budget of the embedding cache file.
+        SEARCH_HYBRID_ENABLED (bool): Whether syncs store BM25 sparse vectors next to the dense
+            vectors and searches fuse dense and sparse rankings. Off by default, since it adds
+            a sparse vector to new collections and a second query to every search.
+        COMPLETION_CONTEXT_MAX_TOKENS (int): Token budget of the search results that are put
+            into the prompt of search completions and chat responses.
+        SEARCH_RERANK_ENABLED (bool): Whether searches rerank their candidates by default,
+            requests can override this.
+        SEARCH_RERANKER (str): The reranker: "lexical", "local_cross_encoder" or "cohere".
+        SEARCH_RERANK_CANDIDATES (int): Number of candidates fetched for reranking.
+        SEARCH_RERANK_BATCH_SIZE (int): Number of candidates scored per reranker request.
+        RERANKER_INFERENCE_URL (str): The URL of the reranker-transformers inference service.
+        COHERE_API_KEY (Optional[str]): The Cohere API key, for the cohere reranker.
+        COHERE_RERANK_MODEL (str): The Cohere rerank model.
+        SEARCH_CACHE_ENABLED (bool): Whether query embeddings and search results are cached.
+        SEARCH_CACHE_EMBEDDING_TTL_SECONDS (int): Lifetime of a cached query embedding.
+        SEARCH_CACHE_EMBEDDING_MAX_ENTRIES (int): Number of query embeddings kept in the cache.
+        SEARCH_CACHE_RESULT_TTL_SECONDS (int): Lifetime of cached search results.
+        SEARCH_CACHE_RESULT_MAX_ENTRIES (int): Number of search result lists kept in the cache.
+        SEARCH_CACHE_COLLECTION_TTL_SECONDS (int): Lifetime of a cached readable ID to collection
+            resolution.
+        SEARCH_CACHE_COLLECTION_MAX_ENTRIES (int): Number of collection resolutions kept in the
+            cache.
+        SEARCH_CACHE_RERANK_TTL_SECONDS (int): Lifetime of a cached reranker score.
+        SEARCH_CACHE_RERANK_MAX_ENTRIES (int): Number of (query, chunk) reranker scores kept in
+            the cache.
+        SEARCH_CACHE_SYNC_GENERATION_TTL_SECONDS (int): How long the time the last sync job of a
+            collection finished is cached, which bounds how stale results can be when a sync
+            finishes in another process.
 
         # Custom deployment URLs
         API_FULL_URL (Optional[str]): The full URL for the API.
@@ -75,14 +172,83 @@ class Settings(BaseSettings):
 
     QDRANT_HOST: Optional[str] = None
     QDRANT_PORT: Optional[int] = None
+    QDRANT_PAYLOAD_INDEX_BACKFILL: bool = True
     TEXT2VEC_INFERENCE_URL: str = "http://localhost:9878"
+    TEXT2VEC_BATCH_SIZE: int = 64
+    TEXT2VEC_MAX_CONCURRENCY: int = 8
 
     OPENAI_API_KEY: Optional[str] = None
     ANTHROPIC_API_KEY: Optional[str] = None
     MISTRAL_API_KEY: Optional[str] = None
 
+    OPENAI_EMBEDDING_TOKENS_PER_REQUEST: int = 100000
+    OPENAI_EMBEDDING_MAX_CONCURRENCY: int = 4
+    OPENAI_EMBEDDING_REQUESTS_PER_MINUTE: int = 3000
+    OPENAI_EMBEDDING_TOKENS_PER_MINUTE: int = 1000000
+    OPENAI_EMBEDDING_MAX_RETRIES: int = 5
+
     AZURE_KEYVAULT_NAME: Optional[str] = None
 
+    # Sync pipeline tuning
+    SYNC_HASH_PREFETCH_ENABLED: bool = True
+    SYNC_HASH_PREFETCH_PAGE_SIZE: int = 10000
+    SYNC_HASH_INDEX_MAX_IN_MEMORY: int = 500000
+    SYNC_BATCHING_ENABLED: bool = True
+    SYNC_BATCH_MAX_CHUNKS: int = 256
+    SYNC_BATCH_MAX_LATENCY_MS: int = 200
+    SYNC_LEDGER_BUFFERING_ENABLED: bool = True
+    SYNC_LEDGER_BATCH_SIZE: int = 500
+    SYNC_STALE_ENTITY_CLEANUP_ENABLED: bool = True
+    SYNC_STALE_ENTITY_PAGE_SIZE: int = 1000
+
+    # Sync job queue and workers
+    SYNC_JOB_QUEUE_ENABLED: bool = False
+    SYNC_WORKER_CONCURRENCY: int = 4
+    SYNC_WORKER_POLL_SECONDS: float = 2.0
+    SYNC_JOB_LEASE_SECONDS: int = 120
+    SYNC_JOB_HEARTBEAT_SECONDS: int = 30
+    SYNC_JOB_MAX_ATTEMPTS: int = 3
+    SYNC_CHECKPOINTS_ENABLED: bool = True
+    SYNC_CHECKPOINT_INTERVAL_SECONDS: int = 60
+    SYNC_RESUME_MAX_AGE_HOURS: int = 24
+    SYNC_INCREMENTAL_ENABLED: bool = True
+    SYNC_FULL_SYNC_CRON_SCHEDULE: str = "0 0 * * *"
+    SYNC_INCREMENTAL_OVERLAP_SECONDS: int = 300
+    SYNC_TRANSFORM_PROCESSES: int = 0
+    SYNC_WORKER_POOL_ADAPTIVE_ENABLED: bool = True
+    SYNC_WORKER_POOL_INITIAL_WORKERS: int = 20
+    SYNC_WORKER_POOL_MIN_WORKERS: int = 2
+    SYNC_WORKER_POOL_MAX_WORKERS: int = 40
+    SYNC_WORKER_POOL_GLOBAL_MAX_WORKERS: int = 50
+
+    # Embeddings
+    EMBEDDING_COMPACT_VECTORS: bool = True
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_PATH: Optional[str] = None
+    EMBEDDING_CACHE_MAX_MEMORY_ENTRIES: int = 10000
+    EMBEDDING_CACHE_MAX_DISK_MB: int = 1024
+
+    # Search
+    SEARCH_HYBRID_ENABLED: bool = False
+    COMPLETION_CONTEXT_MAX_TOKENS: int = 6000
+    SEARCH_RERANK_ENABLED: bool = False
+    SEARCH_RERANKER: str = "lexical"
+    SEARCH_RERANK_CANDIDATES: int = 50
+    SEARCH_RERANK_BATCH_SIZE: int = 32
+    RERANKER_INFERENCE_URL: str = "http://localhost:9879"
+    COHERE_API_KEY: Optional[str] = None
+    COHERE_RERANK_MODEL: str = "rerank-v3.5"
+    SEARCH_CACHE_ENABLED: bool = True
+    SEARCH_CACHE_EMBEDDING_TTL_SECONDS: int = 86400
+    SEARCH_CACHE_EMBEDDING_MAX_ENTRIES: int = 10000
+    SEARCH_CACHE_RESULT_TTL_SECONDS: int = 300
+    SEARCH_CACHE_RESULT_MAX_ENTRIES: int = 2000
+    SEARCH_CACHE_COLLECTION_TTL_SECONDS: int = 60
+    SEARCH_CACHE_COLLECTION_MAX_ENTRIES: int = 10000
+    SEARCH_CACHE_RERANK_TTL_SECONDS: int = 3600
+    SEARCH_CACHE_RERANK_MAX_ENTRIES: int = 100000
+    SEARCH_CACHE_SYNC_GENERATION_TTL_SECONDS: int = 5
+
     # Custom deployment URLs - these are used to override the default URLs to allow
     # for custom domains in custom deployments
     API_FULL_URL: Optional[str] = None
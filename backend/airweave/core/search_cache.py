@@ -0,0 +1,298 @@
+"""Cache of query embeddings and search results.
+
+The cache has two levels:
+- query text -> embedding, per embedding model
+- (collection, generations, query vector digest, search params) -> results
+
+It also remembers which collection a readable ID resolved to for a user, so that a cached search
+does not need a database round trip, and the reranker scores of (query, chunk text) pairs.
+
+Results are keyed by two generations of their collection, so results cached before a sync are
+never served again and age out of the LRU:
+- a counter that is bumped when a sync job of the collection finishes in this process
+- the sync generation, the time the last sync job of the collection finished, which the search
+  service reads from the database and caches for a few seconds, so that syncs run by the sync
+  workers invalidate the results of every API process
+Both levels also expire entries after a TTL.
+"""
+
+import copy
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
+from uuid import UUID
+
+import numpy as np
+
+from airweave.core.config import settings
+
+
+class _TTLCache:
+    """LRU cache whose entries expire after a fixed time to live."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries (int): The number of entries kept before the least recently used
+                entry is evicted.
+            ttl_seconds (float): The lifetime of an entry.
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries, including expired ones not yet removed."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the value of a key, or None if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entries over the size limit."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def discard(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Remove all entries whose key matches a predicate."""
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return the counters of the cache."""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+def _vector_digest(vector: Sequence[float]) -> str:
+    """Digest of a query vector, computed over its float32 representation."""
+    return hashlib.sha256(np.asarray(vector, dtype=np.float32).tobytes()).hexdigest()
+
+
+def _rerank_key(reranker: str, query: str, text: str) -> tuple:
+    """Key of a reranker score, chunk texts are keyed by digest to keep the cache small."""
+    return (reranker, query, hashlib.sha256(text.encode()).hexdigest())
+
+
+class SearchCache:
+    """Two-level cache of query embeddings and search results with generation invalidation."""
+
+    def __init__(
+        self,
+        embedding_max_entries: int,
+        embedding_ttl_seconds: float,
+        result_max_entries: int,
+        result_ttl_seconds: float,
+        collection_max_entries: int = 10000,
+        collection_ttl_seconds: float = 60,
+        rerank_max_entries: int = 100000,
+        rerank_ttl_seconds: float = 3600,
+        sync_generation_ttl_seconds: float = 5,
+        enabled: bool = True,
+    ) -> None:
+        """Initialize the search cache.
+
+        Args:
+            embedding_max_entries (int): Number of query embeddings kept.
+            embedding_ttl_seconds (float): Lifetime of a query embedding.
+            result_max_entries (int): Number of search result lists kept.
+            result_ttl_seconds (float): Lifetime of a search result list.
+            collection_max_entries (int): Number of collection resolutions kept.
+            collection_ttl_seconds (float): Lifetime of a collection resolution.
+            rerank_max_entries (int): Number of reranker scores kept.
+            rerank_ttl_seconds (float): Lifetime of a reranker score.
+            sync_generation_ttl_seconds (float): Lifetime of a collection's sync generation.
+            enabled (bool): Whether the cache stores and serves entries at all.
+        """
+        self.enabled = enabled
+        self._embeddings = _TTLCache(embedding_max_entries, embedding_ttl_seconds)
+        self._results = _TTLCache(result_max_entries, result_ttl_seconds)
+        self._collections = _TTLCache(collection_max_entries, collection_ttl_seconds)
+        self._rerank_scores = _TTLCache(rerank_max_entries, rerank_ttl_seconds)
+        self._sync_generations = _TTLCache(collection_max_entries, sync_generation_ttl_seconds)
+        self._generations: Dict[UUID, int] = {}
+        self.invalidations = 0
+
+    def generation(self, collection_id: UUID) -> int:
+        """Return the current generation of a collection."""
+        return self._generations.get(collection_id, 0)
+
+    def invalidate_collection(self, collection_id: UUID) -> None:
+        """Invalidate all cached results of a collection by bumping its generation."""
+        self._generations[collection_id] = self.generation(collection_id) + 1
+        self._sync_generations.discard(lambda key: key == collection_id)
+        self.invalidations += 1
+
+    def get_sync_generation(self, collection_id: UUID) -> Optional[str]:
+        """Return the cached sync generation of a collection, or None on a miss."""
+        if not self.enabled:
+            return None
+        return self._sync_generations.get(collection_id)
+
+    def put_sync_generation(self, collection_id: UUID, sync_generation: str) -> None:
+        """Cache the sync generation of a collection, read from the database."""
+        if self.enabled:
+            self._sync_generations.put(collection_id, sync_generation)
+
+    def get_collection_id(self, readable_id: str, user_email: str) -> Optional[UUID]:
+        """Return the ID of the collection a readable ID resolved to for a user, or None.
+
+        Only resolutions that passed the permission check of the user are cached.
+        """
+        if not self.enabled:
+            return None
+        return self._collections.get((readable_id, user_email))
+
+    def put_collection_id(self, readable_id: str, user_email: str, collection_id: UUID) -> None:
+        """Cache the collection a readable ID resolved to for a user."""
+        if self.enabled:
+            self._collections.put((readable_id, user_email), collection_id)
+
+    def forget_collection(self, readable_id: str) -> None:
+        """Drop the cached resolutions of a readable ID, e.g. after the collection changed."""
+        self._collections.discard(lambda key: key[0] == readable_id)
+
+    def get_embedding(self, model_name: str, query: str) -> Optional[List[float]]:
+        """Return the cached embedding of a query, or None on a miss."""
+        if not self.enabled:
+            return None
+        return self._embeddings.get((model_name, query))
+
+    def put_embedding(self, model_name: str, query: str, vector: List[float]) -> None:
+        """Cache the embedding of a query."""
+        if self.enabled:
+            self._embeddings.put((model_name, query), vector)
+
+    def get_results(
+        self,
+        collection_id: UUID,
+        vector: Sequence[float],
+        params: dict,
+        sync_generation: str = "",
+    ) -> Optional[List[dict]]:
+        """Return a copy of the cached results of a search, or None on a miss.
+
+        Args:
+            collection_id (UUID): The ID of the searched collection.
+            vector (Sequence[float]): The query vector.
+            params (dict): The search parameters that affect the results.
+            sync_generation (str): The sync generation of the collection.
+
+        Returns:
+            Optional[List[dict]]: The results, which callers are free to modify.
+        """
+        if not self.enabled:
+            return None
+        results = self._results.get(
+            self._result_key(collection_id, vector, params, sync_generation)
+        )
+        return copy.deepcopy(results) if results is not None else None
+
+    def put_results(
+        self,
+        collection_id: UUID,
+        vector: Sequence[float],
+        params: dict,
+        results: List[dict],
+        sync_generation: str = "",
+    ) -> None:
+        """Cache a copy of the results of a search."""
+        if self.enabled:
+            self._results.put(
+                self._result_key(collection_id, vector, params, sync_generation),
+                copy.deepcopy(results),
+            )
+
+    def get_rerank_score(self, reranker: str, query: str, text: str) -> Optional[float]:
+        """Return the cached reranker score of a chunk text for a query, or None on a miss."""
+        if not self.enabled:
+            return None
+        return self._rerank_scores.get(_rerank_key(reranker, query, text))
+
+    def put_rerank_score(self, reranker: str, query: str, text: str, score: float) -> None:
+        """Cache the reranker score of a chunk text for a query."""
+        if self.enabled:
+            self._rerank_scores.put(_rerank_key(reranker, query, text), score)
+
+    def clear(self) -> None:
+        """Remove all cached embeddings, results, collection resolutions and reranker scores."""
+        self._embeddings.clear()
+        self._results.clear()
+        self._collections.clear()
+        self._rerank_scores.clear()
+        self._sync_generations.clear()
+
+    def stats(self) -> dict:
+        """Return the hit and miss counters of all caches."""
+        return {
+            "enabled": self.enabled,
+            "embeddings": self._embeddings.stats(),
+            "results": self._results.stats(),
+            "collections": self._collections.stats(),
+            "rerank_scores": self._rerank_scores.stats(),
+            "sync_generations": self._sync_generations.stats(),
+            "invalidations": self.invalidations,
+        }
+
+    def _result_key(
+        self, collection_id: UUID, vector: Sequence[float], params: dict, sync_generation: str
+    ) -> tuple:
+        return (
+            collection_id,
+            self.generation(collection_id),
+            sync_generation,
+            _vector_digest(vector),
+            json.dumps(params, sort_keys=True, default=str),
+        )
+
+
+search_cache = SearchCache(
+    embedding_max_entries=settings.SEARCH_CACHE_EMBEDDING_MAX_ENTRIES,
+    embedding_ttl_seconds=settings.SEARCH_CACHE_EMBEDDING_TTL_SECONDS,
+    result_max_entries=settings.SEARCH_CACHE_RESULT_MAX_ENTRIES,
+    result_ttl_seconds=settings.SEARCH_CACHE_RESULT_TTL_SECONDS,
+    collection_max_entries=settings.SEARCH_CACHE_COLLECTION_MAX_ENTRIES,
+    collection_ttl_seconds=settings.SEARCH_CACHE_COLLECTION_TTL_SECONDS,
+    rerank_max_entries=settings.SEARCH_CACHE_RERANK_MAX_ENTRIES,
+    rerank_ttl_seconds=settings.SEARCH_CACHE_RERANK_TTL_SECONDS,
+    sync_generation_ttl_seconds=settings.SEARCH_CACHE_SYNC_GENERATION_TTL_SECONDS,
+    enabled=settings.SEARCH_CACHE_ENABLED,
+)
@@ -1,29 +1,107 @@
 """Search service for vector database integrations."""
 
+import asyncio
 import logging
+from typing import Any, AsyncGenerator, Dict, Optional, Tuple, Type
+from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave import crud, schemas
+from airweave.core.completion_context import build_completion_context, count_prompt_tokens
 from airweave.core.config import settings
 from airweave.core.exceptions import NotFoundException
+from airweave.core.search_cache import search_cache
+from airweave.platform.destinations._base import BaseDestination
+from airweave.platform.embedding_models._base import BaseEmbeddingModel
+from airweave.platform.embedding_models.bm25 import bm25_encoder
 from airweave.platform.embedding_models.local_text2vec import LocalText2Vec
 from airweave.platform.embedding_models.openai_text2vec import OpenAIText2Vec
+from airweave.platform.entities._render import render_payload_text
 from airweave.platform.locator import resource_locator
+from airweave.platform.rerankers._base import BaseReranker
+from airweave.platform.rerankers.cohere import CohereReranker
+from airweave.platform.rerankers.lexical import LexicalReranker
+from airweave.platform.rerankers.local_cross_encoder import LocalCrossEncoderReranker
 from airweave.schemas.search import ResponseType, SearchStatus
 
 logger = logging.getLogger(__name__)
 
+# Minimum dense similarity of a result that completions are generated from
+RELEVANCE_THRESHOLD = 0.25
+
+# Answers given instead of a completion when the results cannot answer the query
+COMPLETION_FALLBACKS = {
+    SearchStatus.NO_RESULTS: (
+        "I couldn't find any relevant information for that query. "
+        "Try asking about something in your data collection."
+    ),
+    SearchStatus.NO_RELEVANT_RESULTS: (
+        "Your query didn't match anything meaningful in the database. "
+        "Please try a different question related to your data."
+    ),
+}
+
+# Damping constant of reciprocal rank fusion, the value from the original RRF paper
+RRF_K = 60
+
+
+def reciprocal_rank_fusion(rankings: Dict[str, list[dict]], k: int = RRF_K) -> list[dict]:
+    """Fuse ranked result lists with reciprocal rank fusion.
+
+    Every result scores the sum of 1 / (k + rank) over the rankings it appears in. The fused
+    score replaces "score", the original score per ranking is kept in "scores".
+
+    Args:
+        rankings (Dict[str, list[dict]]): The ranked results per channel name.
+        k (int): Damping constant, higher values flatten the influence of the top ranks.
+
+    Returns:
+        list[dict]: The results ordered by fused score.
+    """
+    fused: Dict[Any, dict] = {}
+    for name, results in rankings.items():
+        for rank, result in enumerate(results, start=1):
+            entry = fused.setdefault(result["id"], {**result, "score": 0.0, "scores": {}})
+            entry["score"] += 1.0 / (k + rank)
+            entry["scores"][name] = result["score"]
+    return sorted(fused.values(), key=lambda result: result["score"], reverse=True)
+
+
+def _is_relevant(result: dict) -> bool:
+    """Whether a result is relevant enough to answer from.
+
+    Dense scores must pass a similarity threshold. Results matched by the sparse channel share
+    exact terms with the query and always count.
+    """
+    scores = result.get("scores")
+    if scores is None:
+        return result.get("score", 0) > RELEVANCE_THRESHOLD
+    return scores.get("dense", 0) > RELEVANCE_THRESHOLD or "sparse" in scores
+
 
 class SearchService:
     """Service for handling vector database searches."""
 
+    def __init__(self):
+        """Initialize the search service.
+
+        The embedding model, destination class and reranker are resolved on first use and reused
+        by all searches, the embedding models and destinations pool their connections per
+        process.
+        """
+        self._embedding_model: Optional[BaseEmbeddingModel] = None
+        self._destination_class: Optional[Type[BaseDestination]] = None
+        self._destination_short_name: Optional[str] = None
+        self._reranker: Optional[BaseReranker] = None
+
     async def search(
         self,
         db: AsyncSession,
         query: str,
         readable_id: str,
         current_user: schemas.User,
+        params: Optional[schemas.SearchParams] = None,
     ) -> list[dict]:
         """Search across vector database using existing connections.
 
@@ -32,6 +110,7 @@ class SearchService:
             query (str): Search query text
             readable_id (str): Readable ID of the collection to search within
             current_user (schemas.User): Current user performing the search
+            params (Optional[schemas.SearchParams]): Pagination, filters and payload projection
 
         Returns:
             list[dict]: List of search results
@@ -40,44 +119,304 @@ class SearchService:
             NotFoundException: If sync or connections not found
         """
         try:
-            collection = await crud.collection.get_by_readable_id(db, readable_id, current_user)
-            if not collection:
-                raise NotFoundException("Collection not found")
+            collection_id = await self._resolve_collection_id(db, readable_id, current_user)
+            sync_generation = await self._get_sync_generation(db, collection_id)
+            await self._get_destination_class(db)
+            vector = await self._embed_query(query)
+
+            return await self._search_collection(
+                collection_id,
+                query,
+                vector,
+                params or schemas.SearchParams(),
+                sync_generation=sync_generation,
+            )
 
-            # Get the destination model
-            destination_model = await crud.destination.get_by_short_name(db, "qdrant_native")
-            if not destination_model:
-                raise NotFoundException("Destination not found")
+        except Exception as e:
+            logger.error(f"Search error: {str(e)}")
+            raise
 
-            # Initialize destination class
-            destination_class = resource_locator.get_destination(destination_model)
+    async def search_many(
+        self,
+        db: AsyncSession,
+        query: str,
+        readable_ids: list[str],
+        current_user: schemas.User,
+        params: Optional[schemas.SearchParams] = None,
+    ) -> list[dict]:
+        """Search several collections at once and merge their results by score.
 
-            # Use OpenAI embeddings if API key is available
-            if settings.OPENAI_API_KEY:
-                logger.info(
-                    "Using OpenAI embedding model for search in "
-                    f"collection {readable_id} {collection.id}"
-                )
-                embedding_model = OpenAIText2Vec(api_key=settings.OPENAI_API_KEY)
-            else:
-                logger.info(
-                    "Using local embedding model for search in "
-                    f"collection {readable_id} {collection.id}"
-                )
-                embedding_model = LocalText2Vec()
+        The query is embedded once and the collections are searched concurrently. Every
+        result names the readable ID of its collection under "collection".
 
-            vector = await embedding_model.embed(query)
-            destination = await destination_class.create(collection_id=collection.id)
+        Args:
+            db (AsyncSession): Database session
+            query (str): Search query text
+            readable_ids (list[str]): Readable IDs of the collections to search within
+            current_user (schemas.User): Current user performing the search
+            params (Optional[schemas.SearchParams]): Pagination, filters and payload projection,
+                the page is cut from the merged results
 
-            # Perform search
-            results = await destination.search(vector)
+        Returns:
+            list[dict]: List of search results
 
-            return results
+        Raises:
+            NotFoundException: If any of the collections is not found for the user
+        """
+        try:
+            # Resolved one by one, the database session does not support concurrent queries
+            readable_ids = list(dict.fromkeys(readable_ids))
+            collection_ids = [
+                await self._resolve_collection_id(db, readable_id, current_user)
+                for readable_id in readable_ids
+            ]
+            sync_generations = [
+                await self._get_sync_generation(db, collection_id)
+                for collection_id in collection_ids
+            ]
+            await self._get_destination_class(db)
+            vector = await self._embed_query(query)
+
+            params = params or schemas.SearchParams()
+            window = params.model_copy(update={"limit": params.offset + params.limit, "offset": 0})
+            collection_results = await asyncio.gather(
+                *(
+                    self._search_collection(
+                        collection_id, query, vector, window, sync_generation=sync_generation
+                    )
+                    for collection_id, sync_generation in zip(
+                        collection_ids, sync_generations, strict=True
+                    )
+                )
+            )
+
+            results = [
+                {**result, "collection": readable_id}
+                for readable_id, found in zip(readable_ids, collection_results, strict=True)
+                for result in found
+            ]
+            results.sort(key=lambda result: result["score"], reverse=True)
+            return results[params.offset : params.offset + params.limit]
 
         except Exception as e:
             logger.error(f"Search error: {str(e)}")
             raise
 
+    async def _embed_query(self, query: str) -> list[float]:
+        """Embed a query, reusing the embedding of an earlier search of the same text."""
+        embedding_model = self._get_embedding_model()
+        vector = search_cache.get_embedding(embedding_model.model_name, query)
+        if vector is None:
+            vector = await embedding_model.embed(query)
+            search_cache.put_embedding(embedding_model.model_name, query, vector)
+        return vector
+
+    async def _search_collection(
+        self,
+        collection_id: UUID,
+        query: str,
+        vector: list[float],
+        params: schemas.SearchParams,
+        sync_generation: str = "",
+    ) -> list[dict]:
+        """Search one collection with an embedded query, served from the cache if possible.
+
+        The destination class must have been resolved with _get_destination_class. Cached
+        results are only served for the sync generation from _get_sync_generation.
+        """
+        rerank = settings.SEARCH_RERANK_ENABLED if params.rerank is None else params.rerank
+        search_params = {
+            "destination": self._destination_short_name,
+            "hybrid": settings.SEARCH_HYBRID_ENABLED,
+            "reranker": settings.SEARCH_RERANKER if rerank else None,
+            **params.model_dump(mode="json"),
+        }
+        cached_results = search_cache.get_results(
+            collection_id, vector, search_params, sync_generation
+        )
+        if cached_results is not None:
+            return cached_results
+
+        destination = await self._destination_class.create(collection_id=collection_id)
+
+        if rerank:
+            # Over-fetch candidates and cut the page from the reranked candidates
+            candidate_params = params.model_copy(
+                update={
+                    "limit": max(settings.SEARCH_RERANK_CANDIDATES, params.offset + params.limit),
+                    "offset": 0,
+                }
+            )
+            candidates = await self._retrieve(destination, query, vector, candidate_params)
+            results = await self._rerank(query, candidates)
+            results = results[params.offset : params.offset + params.limit]
+        else:
+            results = await self._retrieve(destination, query, vector, params)
+
+        # Destinations report search errors as empty results, those are not cached
+        if results:
+            search_cache.put_results(collection_id, vector, search_params, results, sync_generation)
+
+        return results
+
+    async def _retrieve(
+        self,
+        destination: BaseDestination,
+        query: str,
+        vector: list[float],
+        params: schemas.SearchParams,
+    ) -> list[dict]:
+        """Search a destination with the dense vector, fused with the sparse channel if enabled."""
+        if settings.SEARCH_HYBRID_ENABLED:
+            return await self._hybrid_search(destination, query, vector, params)
+        return await destination.search(vector, params)
+
+    async def _rerank(self, query: str, results: list[dict]) -> list[dict]:
+        """Reorder results by reranker score.
+
+        Scores of cacheable rerankers are served from the cache per (query, chunk text), only
+        the other candidates are sent to the reranker. The reranker score replaces "score", the
+        retrieval scores are kept in "scores". If the reranker fails, the retrieval order is
+        kept.
+        """
+        if not results:
+            return results
+
+        reranker = self._get_reranker()
+        texts = [render_payload_text(result.get("payload") or {}) for result in results]
+        scores: list[Optional[float]] = [None] * len(results)
+        if reranker.cacheable:
+            scores = [search_cache.get_rerank_score(reranker.name, query, text) for text in texts]
+
+        missing = [i for i, score in enumerate(scores) if score is None]
+        if missing:
+            try:
+                new_scores = await reranker.score(query, [texts[i] for i in missing])
+            except Exception as e:
+                logger.error(f"Reranking with {reranker.name} failed, keeping retrieval order: {e}")
+                return results
+
+            for i, score in zip(missing, new_scores, strict=True):
+                scores[i] = score
+                if reranker.cacheable:
+                    search_cache.put_rerank_score(reranker.name, query, texts[i], score)
+
+        for result, score in zip(results, scores, strict=True):
+            result["scores"] = {**result.get("scores", {"dense": result["score"]}), "rerank": score}
+            result["score"] = score
+        return sorted(results, key=lambda result: result["score"], reverse=True)
+
+    async def _hybrid_search(
+        self,
+        destination: BaseDestination,
+        query: str,
+        vector: list[float],
+        params: schemas.SearchParams,
+    ) -> list[dict]:
+        """Search the dense and the sparse channel concurrently and fuse their rankings.
+
+        Both channels fetch every result up to the requested page, so that the page is cut from
+        the fused ranking rather than from either channel.
+        """
+        window = params.model_copy(update={"limit": params.offset + params.limit, "offset": 0})
+        dense_results, sparse_results = await asyncio.gather(
+            destination.search(vector, window),
+            destination.sparse_search(bm25_encoder.encode_query(query), window),
+        )
+
+        if not sparse_results:
+            results = dense_results
+        else:
+            results = reciprocal_rank_fusion({"dense": dense_results, "sparse": sparse_results})
+        return results[params.offset : params.offset + params.limit]
+
+    async def _resolve_collection_id(
+        self, db: AsyncSession, readable_id: str, current_user: schemas.User
+    ) -> UUID:
+        """Resolve the readable ID of a collection the user may access to its ID.
+
+        Raises:
+            NotFoundException: If the collection does not exist
+        """
+        collection_id = search_cache.get_collection_id(readable_id, current_user.email)
+        if collection_id is not None:
+            return collection_id
+
+        collection = await crud.collection.get_by_readable_id(db, readable_id, current_user)
+        if not collection:
+            raise NotFoundException("Collection not found")
+
+        search_cache.put_collection_id(readable_id, current_user.email, collection.id)
+        return collection.id
+
+    async def _get_sync_generation(self, db: AsyncSession, collection_id: UUID) -> str:
+        """Return when the last sync job of a collection finished, in any process.
+
+        Syncs run by the sync workers cannot invalidate the search cache of this process, so
+        the cached results of a collection are keyed by this generation, which is read from
+        the database at most every few seconds per collection.
+        """
+        if not search_cache.enabled:
+            return ""
+
+        sync_generation = search_cache.get_sync_generation(collection_id)
+        if sync_generation is None:
+            finished_at = await crud.sync_job.get_last_finished_at_for_collection(
+                db, collection_id=collection_id
+            )
+            sync_generation = finished_at.isoformat() if finished_at else ""
+            search_cache.put_sync_generation(collection_id, sync_generation)
+        return sync_generation
+
+    async def _get_destination_class(self, db: AsyncSession) -> Type[BaseDestination]:
+        """Get the class of the destination that is searched.
+
+        Raises:
+            NotFoundException: If the destination does not exist
+        """
+        if self._destination_class is None:
+            destination_model = await crud.destination.get_by_short_name(db, "qdrant_native")
+            if not destination_model:
+                raise NotFoundException("Destination not found")
+
+            self._destination_class = resource_locator.get_destination(destination_model)
+            self._destination_short_name = destination_model.short_name
+        return self._destination_class
+
+    def _get_reranker(self) -> BaseReranker:
+        """Get the reranker configured by SEARCH_RERANKER."""
+        if self._reranker is None:
+            if settings.SEARCH_RERANKER == "local_cross_encoder":
+                self._reranker = LocalCrossEncoderReranker(
+                    inference_url=settings.RERANKER_INFERENCE_URL,
+                    batch_size=settings.SEARCH_RERANK_BATCH_SIZE,
+                )
+            elif settings.SEARCH_RERANKER == "cohere":
+                if not settings.COHERE_API_KEY:
+                    raise ValueError("COHERE_API_KEY must be set to rerank with cohere")
+                self._reranker = CohereReranker(
+                    api_key=settings.COHERE_API_KEY,
+                    model=settings.COHERE_RERANK_MODEL,
+                    batch_size=settings.SEARCH_RERANK_BATCH_SIZE,
+                )
+            elif settings.SEARCH_RERANKER == "lexical":
+                self._reranker = LexicalReranker()
+            else:
+                raise ValueError(f"Unknown reranker: {settings.SEARCH_RERANKER}")
+        return self._reranker
+
+    def _get_embedding_model(self) -> BaseEmbeddingModel:
+        """Get the embedding model that queries are embedded with."""
+        if self._embedding_model is None:
+            # Use OpenAI embeddings if API key is available
+            if settings.OPENAI_API_KEY:
+                logger.info("Using OpenAI embedding model for search")
+                self._embedding_model = OpenAIText2Vec(api_key=settings.OPENAI_API_KEY)
+            else:
+                logger.info("Using local embedding model for search")
+                self._embedding_model = LocalText2Vec()
+        return self._embedding_model
+
     async def search_with_completion(
         self,
         db: AsyncSession,
@@ -85,6 +424,7 @@ class SearchService:
         readable_id: str,
         current_user: schemas.User,
         response_type: ResponseType = ResponseType.RAW,
+        params: Optional[schemas.SearchParams] = None,
     ) -> schemas.SearchResponse:
         """Search and optionally generate AI completion for results.
 
@@ -94,6 +434,7 @@ class SearchService:
             readable_id: Readable ID of the collection to search in
             current_user: The current user
             response_type: Type of response (raw results or AI completion)
+            params: Pagination, filters and payload projection of the search
 
         Returns:
             dict: A dictionary containing search results or AI completion
@@ -106,6 +447,7 @@ class SearchService:
             query=query,
             readable_id=readable_id,
             current_user=current_user,
+            params=params,
         )
 
         if response_type == ResponseType.RAW:
@@ -113,71 +455,28 @@ class SearchService:
                 results=results, response_type=response_type, status=SearchStatus.SUCCESS
             )
 
-        # If no results found, return a more specific message
-        if not results:
-            return schemas.SearchResponse(
-                results=[],
-                completion=(
-                    "I couldn't find any relevant information for that query. "
-                    "Try asking about something in your data collection."
-                ),
-                response_type=ResponseType.COMPLETION,
-                status=SearchStatus.NO_RESULTS,
-            )
-
-        # For low-quality results (where scores are low), add this check:
-        has_relevant_results = any(result.get("score", 0) > 0.25 for result in results)
-        if not has_relevant_results:
+        status = self._completion_status(results)
+        if status != SearchStatus.SUCCESS:
             return schemas.SearchResponse(
                 results=results,
-                completion=(
-                    "Your query didn't match anything meaningful in the database. "
-                    "Please try a different question related to your data."
-                ),
+                completion=COMPLETION_FALLBACKS[status],
                 response_type=ResponseType.COMPLETION,
-                status=SearchStatus.NO_RELEVANT_RESULTS,
+                status=status,
             )
 
-        # Extract vector data from each result's payload
-        vector_data = []
-        for result in results:
-            if isinstance(result, dict) and "payload" in result:
-                if "vector" in result["payload"]:
-                    vector_data.append(str(result["payload"]["vector"]))
-                    # Remove vector from payload to avoid sending large data back
-                    result["payload"].pop("vector", None)
-
-                # Also remove download URLs from payload
-                if "download_url" in result["payload"]:
-                    result["payload"].pop("download_url", None)
-
-        # Modify the context prompt to be more specific about only answering based on context
-        messages = [
-            {
-                "role": "system",
-                "content": chat_service.CONTEXT_PROMPT.format(
-                    context=str(results),
-                    additional_instruction=(
-                        "If the provided context doesn't contain information to answer "
-                        "the query directly, respond with 'I don't have enough information to "
-                        "answer that question based on the available data.'"
-                    ),
-                ),
-            },
-            {"role": "user", "content": query},
-        ]
+        self._strip_payloads(results)
 
         # Generate completion
-        model = chat_service.DEFAULT_MODEL
         model_settings = chat_service.DEFAULT_MODEL_SETTINGS.copy()
 
         # Remove streaming setting if present
         if "stream" in model_settings:
             model_settings.pop("stream")
 
+        messages, prompt_tokens = self._completion_messages(query, results)
         try:
             response = await chat_service.client.chat.completions.create(
-                model=model, messages=messages, **model_settings
+                model=chat_service.DEFAULT_MODEL, messages=messages, **model_settings
             )
 
             completion = (
@@ -193,7 +492,121 @@ class SearchService:
             completion=completion,
             response_type=response_type,
             status=SearchStatus.SUCCESS,
+            prompt_tokens=prompt_tokens,
+        )
+
+    async def stream_search_with_completion(
+        self,
+        db: AsyncSession,
+        query: str,
+        readable_id: str,
+        current_user: schemas.User,
+        params: Optional[schemas.SearchParams] = None,
+    ) -> AsyncGenerator[Tuple[str, dict], None]:
+        """Search and stream an AI completion for the results.
+
+        The results are yielded as soon as the search returns, the completion follows token by
+        token while it is generated.
+
+        Args:
+            db (AsyncSession): Database session
+            query (str): Search query text
+            readable_id (str): Readable ID of the collection to search within
+            current_user (schemas.User): Current user performing the search
+            params (Optional[schemas.SearchParams]): Pagination, filters and payload projection
+
+        Yields:
+            Tuple[str, dict]: Events as (name, data) pairs. One "results" event, then
+                "completion" events with the next piece of the completion, then a "done" event
+                with the status of the search and the number of prompt tokens.
+
+        Raises:
+            NotFoundException: If the collection or destination does not exist
+        """
+        # Lazy import to avoid circular dependency
+        from airweave.core.chat_service import chat_service
+
+        results = await self.search(
+            db=db,
+            query=query,
+            readable_id=readable_id,
+            current_user=current_user,
+            params=params,
+        )
+        self._strip_payloads(results)
+        yield "results", {"results": results}
+
+        status = self._completion_status(results)
+        if status != SearchStatus.SUCCESS:
+            yield "completion", {"content": COMPLETION_FALLBACKS[status]}
+            yield "done", {"status": status.value}
+            return
+
+        messages, prompt_tokens = self._completion_messages(query, results)
+        stream = await chat_service.client.chat.completions.create(
+            model=chat_service.DEFAULT_MODEL,
+            messages=messages,
+            **{**chat_service.DEFAULT_MODEL_SETTINGS, "stream": True},
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield "completion", {"content": chunk.choices[0].delta.content}
+
+        yield "done", {"status": status.value, "prompt_tokens": prompt_tokens}
+
+    @staticmethod
+    def _completion_status(results: list[dict]) -> SearchStatus:
+        """Whether a completion can be generated from the results, and why not."""
+        if not results:
+            return SearchStatus.NO_RESULTS
+        if not any(_is_relevant(result) for result in results):
+            return SearchStatus.NO_RELEVANT_RESULTS
+        return SearchStatus.SUCCESS
+
+    @staticmethod
+    def _strip_payloads(results: list[dict]) -> None:
+        """Remove vectors and download URLs from the payloads to avoid sending large data back."""
+        for result in results:
+            if isinstance(result, dict) and "payload" in result:
+                result["payload"].pop("vector", None)
+                result["payload"].pop("download_url", None)
+
+    @staticmethod
+    def _completion_messages(query: str, results: list[dict]) -> Tuple[list[dict], int]:
+        """Build the chat messages that answer a query from search results.
+
+        The results are packed into the context token budget, and the size of the prompt is
+        logged to keep track of the completion cost.
+
+        Returns:
+            Tuple[list[dict], int]: The messages and their number of prompt tokens.
+        """
+        # Lazy import to avoid circular dependency
+        from airweave.core.chat_service import chat_service
+
+        context = build_completion_context(results)
+
+        # Modify the context prompt to be more specific about only answering based on context
+        messages = [
+            {
+                "role": "system",
+                "content": chat_service.CONTEXT_PROMPT.format(
+                    context=context.text,
+                    additional_instruction=(
+                        "If the provided context doesn't contain information to answer "
+                        "the query directly, respond with 'I don't have enough information to "
+                        "answer that question based on the available data.'"
+                    ),
+                ),
+            },
+            {"role": "user", "content": query},
+        ]
+        prompt_tokens = count_prompt_tokens(messages)
+        logger.info(
+            f"Search completion prompt: {prompt_tokens} tokens, context {context.tokens} tokens "
+            f"from {context.chunks_used}/{context.chunks_total} chunks"
         )
+        return messages, prompt_tokens
 
 
 # Create singleton instance
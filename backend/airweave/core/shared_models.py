@@ -20,6 +20,17 @@ class SyncJobStatus(str, Enum):
     FAILED = "failed"
 
 
+class SyncMode(str, Enum):
+    """How a sync job crawls the source.
+
+    - FULL: every entity is fetched, and entities that are gone from the source are deleted
+    - INCREMENTAL: only entities changed since the last completed job are fetched
+    """
+
+    FULL = "full"
+    INCREMENTAL = "incremental"
+
+
 class IntegrationType(str, Enum):
     """Integration type enum."""
 
@@ -66,3 +77,18 @@ class CollectionStatus(str, Enum):
     PARTIAL_ERROR = "PARTIAL ERROR"
     NEEDS_SOURCE = "NEEDS SOURCE"
     ERROR = "ERROR"
+
+
+class VectorStorageProfile(str, Enum):
+    """How the vectors of a collection are stored in the vector database.
+
+    - STANDARD: full precision vectors in RAM
+    - SCALAR: int8 quantized vectors in RAM, full precision vectors on disk for rescoring
+    - BINARY: binary quantized vectors in RAM, full precision vectors on disk for rescoring
+    - ON_DISK: full precision vectors and HNSW graph on disk
+    """
+
+    STANDARD = "standard"
+    SCALAR = "scalar"
+    BINARY = "binary"
+    ON_DISK = "on_disk"
@@ -767,7 +767,10 @@ class SourceConnectionService:
 
         # Trigger the sync run using the sync service
         sync, sync_job, sync_dag = await sync_service.trigger_sync_run(
-            db=db, sync_id=source_connection.sync_id, current_user=current_user
+            db=db,
+            sync_id=source_connection.sync_id,
+            current_user=current_user,
+            run_in_process=access_token is not None,
         )
 
         # Store access token directly without validation if provided
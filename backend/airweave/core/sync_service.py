@@ -1,13 +1,17 @@
 """Service for data synchronization."""
 
+import asyncio
+import os
+import socket
 from datetime import datetime
 from typing import AsyncGenerator, List, Optional, Union
 from uuid import UUID
 
-from fastapi import HTTPException
+from fastapi import BackgroundTasks, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave import crud, schemas
+from airweave.core.config import settings
 from airweave.core.dag_service import dag_service
 from airweave.core.logging import logger
 from airweave.core.shared_models import SyncJobStatus
@@ -22,6 +26,12 @@ from airweave.platform.sync.pubsub import sync_pubsub
 class SyncService:
     """Main service for data synchronization."""
 
+    def __init__(self) -> None:
+        """Initialize the sync service."""
+        # Syncs running in this process, referenced so they are not garbage collected
+        self._tasks: set[asyncio.Task] = set()
+        self._process_id = f"api:{socket.gethostname()}:{os.getpid()}"
+
     async def create(
         self,
         db: AsyncSession,
@@ -111,6 +121,116 @@ class SyncService:
 
         return await sync_orchestrator.run(sync_context)
 
+    async def dispatch(
+        self,
+        sync: schemas.Sync,
+        sync_job: schemas.SyncJob,
+        dag: schemas.SyncDag,
+        collection: schemas.Collection,
+        source_connection: schemas.Connection,
+        current_user: schemas.User,
+        access_token: Optional[str] = None,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> None:
+        """Hand a pending sync job over to whatever runs it.
+
+        With the job queue enabled, the job is left in the sync_job table for the sync workers.
+        Jobs with a request-scoped access token cannot be run by a worker, since the token is
+        not stored, so those and all jobs without the queue run in this process, after the
+        response when background tasks are given. A job is only run here once it is held, so
+        it is never run both here and by a worker.
+
+        Args:
+        ----
+            sync (schemas.Sync): The sync to run.
+            sync_job (schemas.SyncJob): The pending sync job.
+            dag (schemas.SyncDag): The DAG to run.
+            collection (schemas.Collection): The collection to sync.
+            source_connection (schemas.Connection): The source connection to sync.
+            current_user (schemas.User): The current user.
+            access_token (Optional[str]): Optional access token to use
+                instead of stored credentials.
+            background_tasks (Optional[BackgroundTasks]): The background tasks of the request.
+        """
+        if settings.SYNC_JOB_QUEUE_ENABLED:
+            if access_token is None:
+                logger.info(f"Queued sync job {sync_job.id} for the sync workers")
+                return
+            async with get_db_context() as db:
+                held = await crud.sync_job.hold(db, id=sync_job.id, holder=self._process_id)
+            if not held:
+                # A worker claimed the job between its creation and now, it runs it
+                logger.warning(
+                    f"Sync job {sync_job.id} was claimed by a sync worker before it could be "
+                    "held, it runs without the request's access token"
+                )
+                return
+
+        args = (sync, sync_job, dag, collection, source_connection, current_user)
+        if background_tasks is not None:
+            background_tasks.add_task(self.run, *args, access_token=access_token)
+        else:
+            task = asyncio.create_task(self.run(*args, access_token=access_token))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def run_job(self, sync_job_id: UUID) -> schemas.Sync:
+        """Run a queued sync job, as the user who created it.
+
+        Args:
+        ----
+            sync_job_id (UUID): The ID of the sync job.
+
+        Returns:
+        -------
+            schemas.Sync: The sync.
+        """
+        current_user = None
+        try:
+            async with get_db_context() as db:
+                db_sync_job = await crud.sync_job.get(db=db, id=sync_job_id)
+                if not db_sync_job:
+                    raise ValueError(f"Sync job {sync_job_id} not found")
+                sync_job = schemas.SyncJob.model_validate(db_sync_job)
+
+                db_user = await crud.user.get_by_email(db, email=db_sync_job.created_by_email)
+                current_user = schemas.User.model_validate(db_user)
+                sync = await crud.sync.get(
+                    db, id=sync_job.sync_id, current_user=current_user, with_connections=True
+                )
+                sync_dag = await crud.sync_dag.get_by_sync_id(
+                    db=db, sync_id=sync_job.sync_id, current_user=current_user
+                )
+                source_connection = await crud.source_connection.get_by_sync_id(
+                    db=db, sync_id=sync_job.sync_id, current_user=current_user
+                )
+                if not sync or not sync_dag or not source_connection:
+                    raise ValueError(f"Sync {sync_job.sync_id} of job {sync_job_id} is incomplete")
+                collection = await crud.collection.get_by_readable_id(
+                    db=db,
+                    readable_id=source_connection.readable_collection_id,
+                    current_user=current_user,
+                )
+
+                sync_dag = schemas.SyncDag.model_validate(sync_dag)
+                collection = schemas.Collection.model_validate(collection, from_attributes=True)
+                source_connection = schemas.SourceConnection.from_orm_with_collection_mapping(
+                    source_connection
+                )
+        except Exception as e:
+            logger.error(f"Error loading sync job {sync_job_id}: {e}")
+            if current_user is not None:
+                await sync_job_service.update_status(
+                    sync_job_id=sync_job_id,
+                    status=SyncJobStatus.FAILED,
+                    current_user=current_user,
+                    error=str(e),
+                    failed_at=datetime.now(),
+                )
+            raise e
+
+        return await self.run(sync, sync_job, sync_dag, collection, source_connection, current_user)
+
     async def list_syncs(
         self,
         db: AsyncSession,
@@ -285,6 +405,7 @@ class SyncService:
         db: AsyncSession,
         sync_id: UUID,
         current_user: schemas.User,
+        run_in_process: bool = False,
     ) -> tuple[schemas.Sync, schemas.SyncJob, schemas.SyncDag]:
         """Trigger a sync run.
 
@@ -297,6 +418,9 @@ class SyncService:
             db (AsyncSession): The database session.
             sync_id (UUID): The ID of the sync to run.
             current_user (schemas.User): The current user.
+            run_in_process (bool): Whether this process runs the job, e.g. with a
+                request-scoped access token. The job is then created held by this process,
+                so that no sync worker claims it before it is dispatched.
 
         Returns:
         -------
@@ -314,7 +438,9 @@ class SyncService:
 
         sync_schema = schemas.Sync.model_validate(sync)
 
-        sync_job_in = schemas.SyncJobCreate(sync_id=sync_id)
+        sync_job_in = schemas.SyncJobCreate(sync_id=sync_id).model_dump(exclude_unset=True)
+        if run_in_process and settings.SYNC_JOB_QUEUE_ENABLED:
+            sync_job_in["leased_by"] = self._process_id
         sync_job = await crud.sync_job.create(db=db, obj_in=sync_job_in, current_user=current_user)
         await db.flush()
         sync_job_schema = schemas.SyncJob.model_validate(sync_job)
@@ -4,13 +4,18 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave.crud._base_organization import CRUDBaseOrganization
+from airweave.db.unit_of_work import UnitOfWork
 from airweave.models.entity import Entity
 from airweave.schemas.entity import EntityCreate, EntityUpdate
 
+# Rows per INSERT statement, keeps bind parameters well below the Postgres limit of 32767
+BULK_UPSERT_CHUNK_SIZE = 1000
+
 
 class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
     """CRUD operations for entities."""
@@ -26,6 +31,89 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
         result = await db.execute(stmt)
         return result.unique().scalars().one_or_none()
 
+    async def get_hash_page_by_sync_id(
+        self,
+        db: AsyncSession,
+        sync_id: UUID,
+        after_entity_id: Optional[str] = None,
+        limit: int = 10000,
+    ) -> list[tuple[UUID, str, str]]:
+        """Get a page of (id, entity_id, hash) rows for a sync, ordered by entity id.
+
+        Uses keyset pagination on entity_id so that each page is served by the
+        uq_sync_id_entity_id index instead of an increasingly expensive OFFSET scan.
+
+        Args:
+            db (AsyncSession): The database session.
+            sync_id (UUID): The ID of the sync.
+            after_entity_id (Optional[str]): Only return rows with an entity_id greater than this.
+            limit (int): The maximum number of rows to return.
+
+        Returns:
+            list[tuple[UUID, str, str]]: The (id, entity_id, hash) rows.
+        """
+        stmt = select(Entity.id, Entity.entity_id, Entity.hash).where(Entity.sync_id == sync_id)
+        if after_entity_id is not None:
+            stmt = stmt.where(Entity.entity_id > after_entity_id)
+        stmt = stmt.order_by(Entity.entity_id).limit(limit)
+        result = await db.execute(stmt)
+        return [tuple(row) for row in result.all()]
+
+    async def bulk_upsert(
+        self,
+        db: AsyncSession,
+        *,
+        rows: list[dict],
+        organization_id: UUID,
+        uow: Optional[UnitOfWork] = None,
+    ) -> int:
+        """Insert or update many entity rows with multi-row INSERT ... ON CONFLICT statements.
+
+        Conflicts on the uq_sync_id_entity_id constraint update the hash and sync job of the
+        existing row, so the same call serves both INSERT and UPDATE actions.
+
+        Args:
+            db (AsyncSession): The database session.
+            rows (list[dict]): Rows with the keys id, sync_id, entity_id, hash and sync_job_id.
+                The id is only used when a new row is inserted.
+            organization_id (UUID): The UUID of the organization.
+            uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
+
+        Returns:
+            int: The number of rows written.
+        """
+        if not rows:
+            return 0
+
+        now = datetime.utcnow()
+        # A single statement may not touch the same row twice, keep the last write per key
+        deduplicated = {
+            (row["sync_id"], row["entity_id"]): {
+                **row,
+                "organization_id": organization_id,
+                "created_at": now,
+                "modified_at": now,
+            }
+            for row in rows
+        }
+        values = list(deduplicated.values())
+
+        for start in range(0, len(values), BULK_UPSERT_CHUNK_SIZE):
+            stmt = insert(Entity).values(values[start : start + BULK_UPSERT_CHUNK_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_sync_id_entity_id",
+                set_={
+                    "hash": stmt.excluded.hash,
+                    "sync_job_id": stmt.excluded.sync_job_id,
+                    "modified_at": stmt.excluded.modified_at,
+                },
+            )
+            await db.execute(stmt)
+
+        if not uow:
+            await db.commit()
+        return len(values)
+
     async def update_job_id(
         self,
         db: AsyncSession,
@@ -52,6 +140,138 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
         result = await db.execute(stmt)
         return list(result.unique().scalars().all())
 
+    async def get_outdated_page(
+        self,
+        db: AsyncSession,
+        sync_id: UUID,
+        sync_job_id: UUID,
+        after_entity_id: Optional[str] = None,
+        limit: int = 1000,
+    ) -> list[tuple[UUID, str]]:
+        """Get a page of (id, entity_id) rows of a sync that were not written by a sync job.
+
+        Pages are ordered by entity_id and selected with keyset pagination, so rows deleted
+        between two calls do not shift the next page.
+
+        Args:
+            db (AsyncSession): The database session.
+            sync_id (UUID): The ID of the sync.
+            sync_job_id (UUID): The ID of the current sync job.
+            after_entity_id (Optional[str]): Only return rows with an entity_id greater than this.
+            limit (int): The maximum number of rows to return.
+
+        Returns:
+            list[tuple[UUID, str]]: The (id, entity_id) rows.
+        """
+        stmt = select(Entity.id, Entity.entity_id).where(
+            Entity.sync_id == sync_id, Entity.sync_job_id != sync_job_id
+        )
+        if after_entity_id is not None:
+            stmt = stmt.where(Entity.entity_id > after_entity_id)
+        stmt = stmt.order_by(Entity.entity_id).limit(limit)
+        result = await db.execute(stmt)
+        return [tuple(row) for row in result.all()]
+
+    async def bulk_update_sync_job_id(
+        self,
+        db: AsyncSession,
+        *,
+        sync_id: UUID,
+        entity_ids: list[str],
+        sync_job_id: UUID,
+        uow: Optional[UnitOfWork] = None,
+    ) -> int:
+        """Mark unchanged entities of a sync as seen by a sync job.
+
+        Args:
+            db (AsyncSession): The database session.
+            sync_id (UUID): The ID of the sync.
+            entity_ids (list[str]): The source entity IDs to mark.
+            sync_job_id (UUID): The ID of the sync job that saw the entities.
+            uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
+
+        Returns:
+            int: The number of rows updated.
+        """
+        if not entity_ids:
+            return 0
+
+        updated = 0
+        for start in range(0, len(entity_ids), BULK_UPSERT_CHUNK_SIZE):
+            stmt = (
+                update(Entity)
+                .where(
+                    Entity.sync_id == sync_id,
+                    Entity.entity_id.in_(entity_ids[start : start + BULK_UPSERT_CHUNK_SIZE]),
+                )
+                .values(sync_job_id=sync_job_id, modified_at=datetime.utcnow())
+            )
+            result = await db.execute(stmt)
+            updated += result.rowcount
+
+        if not uow:
+            await db.commit()
+        return updated
+
+    async def reassign_sync_job(
+        self,
+        db: AsyncSession,
+        *,
+        sync_id: UUID,
+        from_sync_job_id: UUID,
+        to_sync_job_id: UUID,
+        uow: Optional[UnitOfWork] = None,
+    ) -> int:
+        """Mark the entities a sync job saw as seen by another job of the same sync.
+
+        Used when a job resumes from the checkpoint of a failed job, so that the entities the
+        failed job stored before its checkpoint are not removed as stale.
+
+        Args:
+            db (AsyncSession): The database session.
+            sync_id (UUID): The ID of the sync.
+            from_sync_job_id (UUID): The ID of the job that saw the entities.
+            to_sync_job_id (UUID): The ID of the job that takes them over.
+            uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
+
+        Returns:
+            int: The number of rows updated.
+        """
+        stmt = (
+            update(Entity)
+            .where(Entity.sync_id == sync_id, Entity.sync_job_id == from_sync_job_id)
+            .values(sync_job_id=to_sync_job_id)
+        )
+        result = await db.execute(stmt)
+        if not uow:
+            await db.commit()
+        return result.rowcount
+
+    async def bulk_remove(
+        self,
+        db: AsyncSession,
+        *,
+        ids: list[UUID],
+        uow: Optional[UnitOfWork] = None,
+    ) -> int:
+        """Delete many entity rows by their IDs.
+
+        Args:
+            db (AsyncSession): The database session.
+            ids (list[UUID]): The IDs of the rows to delete.
+            uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
+
+        Returns:
+            int: The number of rows deleted.
+        """
+        if not ids:
+            return 0
+
+        result = await db.execute(delete(Entity).where(Entity.id.in_(ids)))
+        if not uow:
+            await db.commit()
+        return result.rowcount
+
     async def get_by_sync_job(
         self,
         db: AsyncSession,
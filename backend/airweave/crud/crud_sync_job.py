@@ -1,16 +1,26 @@
 """CRUD operations for sync jobs."""
 
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import DateTime, and_, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from airweave.core.shared_models import SyncJobStatus, SyncMode
 from airweave.crud._base import CRUDBase
+from airweave.models.collection import Collection
+from airweave.models.source_connection import SourceConnection
 from airweave.models.sync import Sync
 from airweave.models.sync_job import SyncJob
 from airweave.schemas.sync_job import SyncJobCreate, SyncJobUpdate
 
+# Lease timestamps are taken from the database clock, so that workers on different nodes agree
+# on when a lease expires. The columns are naive UTC timestamps.
+_db_utc_now = func.timezone("utc", func.now(), type_=DateTime)
+
+_UNFINISHED_STATUSES = [SyncJobStatus.PENDING, SyncJobStatus.IN_PROGRESS]
+
 
 class CRUDSyncJob(CRUDBase[SyncJob, SyncJobCreate, SyncJobUpdate]):
     """CRUD operations for sync jobs."""
@@ -97,5 +107,378 @@ class CRUDSyncJob(CRUDBase[SyncJob, SyncJobCreate, SyncJobUpdate]):
         job.sync_name = sync_name
         return job
 
+    async def claim_next(
+        self, db: AsyncSession, worker_id: str, lease_seconds: int, max_attempts: int
+    ) -> Optional[UUID]:
+        """Lease the oldest runnable job to a worker.
+
+        A job is runnable when it is pending and not held by anyone, or when the lease of the
+        worker that ran it expired, e.g. because the worker crashed. The candidate row is
+        locked with FOR UPDATE SKIP LOCKED, so concurrent workers never claim the same job
+        and never wait on each other.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            worker_id (str): The ID of the claiming worker.
+            lease_seconds (int): How long the lease is valid without a heartbeat.
+            max_attempts (int): Jobs that were claimed this often are not claimed again.
+
+        Returns:
+        -------
+            Optional[UUID]: The ID of the claimed job, or None when there is nothing to run.
+        """
+        candidate = (
+            select(SyncJob.id)
+            .where(
+                or_(
+                    and_(SyncJob.status == SyncJobStatus.PENDING, SyncJob.leased_by.is_(None)),
+                    and_(
+                        SyncJob.status.in_(_UNFINISHED_STATUSES),
+                        SyncJob.lease_expires_at < _db_utc_now,
+                    ),
+                ),
+                SyncJob.attempts < max_attempts,
+            )
+            .order_by(SyncJob.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(SyncJob)
+            .where(SyncJob.id == candidate)
+            .values(
+                leased_by=worker_id,
+                lease_expires_at=_db_utc_now + timedelta(seconds=lease_seconds),
+                heartbeat_at=_db_utc_now,
+                attempts=SyncJob.attempts + 1,
+            )
+            .returning(SyncJob.id)
+            .execution_options(synchronize_session=False)
+        )
+        job_id = (await db.execute(stmt)).scalar_one_or_none()
+        await db.commit()
+        return job_id
+
+    async def hold(self, db: AsyncSession, id: UUID, holder: str) -> bool:
+        """Mark a pending job as held by a process that runs it itself.
+
+        Held jobs have no lease expiry, so workers never claim them. The job is only held
+        while no worker has claimed it yet, so it never runs twice. Jobs created held by the
+        holder already are held.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            id (UUID): The ID of the job.
+            holder (str): The ID of the process that runs the job.
+
+        Returns:
+        -------
+            bool: False when a worker claimed the job first.
+        """
+        stmt = (
+            update(SyncJob)
+            .where(
+                SyncJob.id == id,
+                SyncJob.status == SyncJobStatus.PENDING,
+                or_(SyncJob.leased_by.is_(None), SyncJob.leased_by == holder),
+            )
+            .values(leased_by=holder)
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        await db.commit()
+        return result.rowcount == 1
+
+    async def renew_lease(
+        self, db: AsyncSession, id: UUID, worker_id: str, lease_seconds: int
+    ) -> bool:
+        """Extend the lease of a job that a worker is still running.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            id (UUID): The ID of the job.
+            worker_id (str): The ID of the worker that runs the job.
+            lease_seconds (int): How long the renewed lease is valid.
+
+        Returns:
+        -------
+            bool: False when the worker lost the lease, e.g. to another worker after it expired.
+        """
+        stmt = (
+            update(SyncJob)
+            .where(SyncJob.id == id, SyncJob.leased_by == worker_id)
+            .values(
+                lease_expires_at=_db_utc_now + timedelta(seconds=lease_seconds),
+                heartbeat_at=_db_utc_now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        await db.commit()
+        return result.rowcount == 1
+
+    async def release_lease(
+        self, db: AsyncSession, id: UUID, worker_id: str, requeue: bool = False
+    ) -> None:
+        """Give up the lease of a job.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            id (UUID): The ID of the job.
+            worker_id (str): The ID of the worker that holds the lease.
+            requeue (bool): Whether to put an unfinished job back in the queue, for a worker
+                that stops before the job is done. The attempt of the stopping worker does not
+                count towards the job's attempts.
+        """
+        values = {"leased_by": None, "lease_expires_at": None}
+        if requeue:
+            values["status"] = SyncJobStatus.PENDING
+            values["attempts"] = func.greatest(SyncJob.attempts - 1, 0)
+        stmt = (
+            update(SyncJob)
+            .where(SyncJob.id == id, SyncJob.leased_by == worker_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if requeue:
+            stmt = stmt.where(SyncJob.status.in_(_UNFINISHED_STATUSES))
+        await db.execute(stmt)
+        await db.commit()
+
+    async def fail_abandoned(self, db: AsyncSession, max_attempts: int) -> int:
+        """Fail jobs that are out of attempts and that no worker runs anymore.
+
+        These are jobs whose lease expired after their last allowed attempt, and pending jobs
+        without a lease that claim_next skips since they used up their attempts.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            max_attempts (int): The number of attempts a job gets.
+
+        Returns:
+        -------
+            int: The number of failed jobs.
+        """
+        stmt = (
+            update(SyncJob)
+            .where(
+                or_(
+                    and_(
+                        SyncJob.status.in_(_UNFINISHED_STATUSES),
+                        SyncJob.lease_expires_at < _db_utc_now,
+                    ),
+                    and_(SyncJob.status == SyncJobStatus.PENDING, SyncJob.leased_by.is_(None)),
+                ),
+                SyncJob.attempts >= max_attempts,
+            )
+            .values(
+                status=SyncJobStatus.FAILED,
+                failed_at=_db_utc_now,
+                error=f"Sync job was abandoned by its worker after {max_attempts} attempts",
+                leased_by=None,
+                lease_expires_at=None,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        await db.commit()
+        return result.rowcount
+
+    async def save_checkpoint(self, db: AsyncSession, id: UUID, cursor: Dict[str, Any]) -> None:
+        """Store the last durable source checkpoint of a job.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            id (UUID): The ID of the job.
+            cursor (Dict[str, Any]): The source cursor.
+        """
+        stmt = (
+            update(SyncJob)
+            .where(SyncJob.id == id)
+            .values(checkpoint=cursor, checkpoint_at=_db_utc_now)
+            .execution_options(synchronize_session=False)
+        )
+        await db.execute(stmt)
+        await db.commit()
+
+    async def get_resumable_checkpoint(
+        self, db: AsyncSession, sync_job_id: UUID, sync_id: UUID, max_age_seconds: int
+    ) -> Optional[Tuple[UUID, Dict[str, Any]]]:
+        """Find the checkpoint a job resumes from.
+
+        A job that already saved a checkpoint, e.g. one that was requeued by a stopping worker,
+        resumes from its own checkpoint. Otherwise a job resumes from the checkpoint of the
+        previous job of the sync, if that job ran in the same sync mode and failed less than
+        max_age_seconds ago.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            sync_job_id (UUID): The ID of the job that is starting.
+            sync_id (UUID): The ID of its sync.
+            max_age_seconds (int): How old the checkpoint of a failed job may be.
+
+        Returns:
+        -------
+            Optional[Tuple[UUID, Dict[str, Any]]]: The ID of the job that saved the checkpoint
+                and its cursor, or None to start from the beginning.
+        """
+        own = (
+            await db.execute(
+                select(SyncJob.checkpoint, SyncJob.sync_mode, SyncJob.created_at).where(
+                    SyncJob.id == sync_job_id
+                )
+            )
+        ).one()
+        if own.checkpoint is not None:
+            return sync_job_id, own.checkpoint
+
+        stmt = (
+            select(
+                SyncJob.id,
+                SyncJob.status,
+                SyncJob.sync_mode,
+                SyncJob.checkpoint,
+                (SyncJob.checkpoint_at > _db_utc_now - timedelta(seconds=max_age_seconds)).label(
+                    "fresh"
+                ),
+            )
+            .where(SyncJob.sync_id == sync_id, SyncJob.id != sync_job_id)
+            .where(SyncJob.created_at <= own.created_at)
+            .order_by(SyncJob.created_at.desc())
+            .limit(1)
+        )
+        previous = (await db.execute(stmt)).first()
+        if (
+            previous is None
+            or previous.status != SyncJobStatus.FAILED
+            or previous.sync_mode != own.sync_mode
+            or previous.checkpoint is None
+            or not previous.fresh
+        ):
+            return None
+        return previous.id, previous.checkpoint
+
+    async def start_window(self, db: AsyncSession, id: UUID, sync_mode: SyncMode) -> None:
+        """Record the mode a job runs in and the start of the window of changes it syncs.
+
+        The watermark of a job that already started, e.g. one that was requeued, is kept.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            id (UUID): The ID of the job.
+            sync_mode (SyncMode): The mode the job runs in.
+        """
+        stmt = (
+            update(SyncJob)
+            .where(SyncJob.id == id)
+            .values(sync_mode=sync_mode, watermark=func.coalesce(SyncJob.watermark, _db_utc_now))
+            .execution_options(synchronize_session=False)
+        )
+        await db.execute(stmt)
+        await db.commit()
+
+    async def take_over_watermark(self, db: AsyncSession, id: UUID, from_id: UUID) -> None:
+        """Move the watermark of a job back to that of a job whose checkpoint it resumes from.
+
+        The entities before the checkpoint were fetched by the other job, so changes made since
+        that job started must be fetched again by the next incremental job.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            id (UUID): The ID of the resuming job.
+            from_id (UUID): The ID of the job that saved the checkpoint.
+        """
+        earlier = select(SyncJob.watermark).where(SyncJob.id == from_id).scalar_subquery()
+        stmt = (
+            update(SyncJob)
+            .where(SyncJob.id == id)
+            .values(watermark=func.least(SyncJob.watermark, earlier))
+            .execution_options(synchronize_session=False)
+        )
+        await db.execute(stmt)
+        await db.commit()
+
+    async def get_last_watermark(self, db: AsyncSession, sync_id: UUID) -> Optional[datetime]:
+        """Get the watermark of the last completed job of a sync.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            sync_id (UUID): The ID of the sync.
+
+        Returns:
+        -------
+            Optional[datetime]: The watermark as a naive UTC timestamp, or None if no job
+                completed yet.
+        """
+        stmt = (
+            select(SyncJob.watermark)
+            .where(
+                SyncJob.sync_id == sync_id,
+                SyncJob.status == SyncJobStatus.COMPLETED,
+                SyncJob.watermark.is_not(None),
+            )
+            .order_by(SyncJob.created_at.desc())
+            .limit(1)
+        )
+        result = await db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_last_full_sync_at(self, db: AsyncSession, sync_id: UUID) -> Optional[datetime]:
+        """Get when the last completed full job of a sync was created.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            sync_id (UUID): The ID of the sync.
+
+        Returns:
+        -------
+            Optional[datetime]: The creation time of the job, or None if no full job completed.
+        """
+        stmt = select(func.max(SyncJob.created_at)).where(
+            SyncJob.sync_id == sync_id,
+            SyncJob.status == SyncJobStatus.COMPLETED,
+            SyncJob.sync_mode == SyncMode.FULL,
+        )
+        result = await db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_last_finished_at_for_collection(
+        self, db: AsyncSession, collection_id: UUID
+    ) -> Optional[datetime]:
+        """Get when the last job of any sync into a collection completed or failed.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            collection_id (UUID): The ID of the collection.
+
+        Returns:
+        -------
+            Optional[datetime]: The time the job finished, or None if no job finished yet.
+        """
+        stmt = (
+            select(func.max(func.coalesce(SyncJob.completed_at, SyncJob.failed_at)))
+            .join(SourceConnection, SourceConnection.sync_id == SyncJob.sync_id)
+            .join(Collection, Collection.readable_id == SourceConnection.readable_collection_id)
+            .where(
+                Collection.id == collection_id,
+                SyncJob.status.in_([SyncJobStatus.COMPLETED, SyncJobStatus.FAILED]),
+            )
+        )
+        result = await db.execute(stmt)
+        return result.scalar_one_or_none()
+
 
 sync_job = CRUDSyncJob(SyncJob)
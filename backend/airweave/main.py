@@ -29,8 +29,10 @@ from airweave.core.logging import logger
 from airweave.db.init_db import init_db
 from airweave.db.session import AsyncSessionLocal
 from airweave.platform.db_sync import sync_platform_components
+from airweave.platform.destinations.qdrant import backfill_payload_indexes
 from airweave.platform.entities._base import ensure_file_entity_models
 from airweave.platform.scheduler import platform_scheduler
+from airweave.platform.transformers.process_pool import transform_pool
 
 
 @asynccontextmanager
@@ -47,6 +49,12 @@ async def lifespan(app: FastAPI):
             await sync_platform_components("airweave/platform", db)
         await init_db(db)
 
+    if settings.QDRANT_PAYLOAD_INDEX_BACKFILL:
+        try:
+            await backfill_payload_indexes()
+        except Exception as e:
+            logger.warning(f"Could not backfill Qdrant payload indexes: {e}")
+
     # Start the sync scheduler
     await platform_scheduler.start()
 
@@ -56,6 +64,9 @@ async def lifespan(app: FastAPI):
     # Stop the sync scheduler
     await platform_scheduler.stop()
 
+    # Stop the transformer worker processes
+    transform_pool.shutdown()
+
 
 # Create FastAPI app with our custom router and disable FastAPI's built-in redirects
 app = FastAPI(
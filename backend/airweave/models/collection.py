@@ -1,10 +1,12 @@
 """Collection model."""
 
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import String
+from sqlalchemy import Enum as SQLAlchemyEnum
+from sqlalchemy import Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from airweave.core.shared_models import VectorStorageProfile
 from airweave.models._base import OrganizationBase, UserMixin
 
 if TYPE_CHECKING:
@@ -20,6 +22,16 @@ class Collection(OrganizationBase, UserMixin):
     readable_id: Mapped[str] = mapped_column(String, nullable=False, unique=True)
     # Status is now ephemeral - removed from database model
 
+    # Vector storage, applied when the vector database collection is created
+    vector_storage_profile: Mapped[VectorStorageProfile] = mapped_column(
+        SQLAlchemyEnum(VectorStorageProfile),
+        nullable=False,
+        default=VectorStorageProfile.STANDARD,
+        server_default=VectorStorageProfile.STANDARD.name,
+    )
+    hnsw_m: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    hnsw_ef_construct: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
     # Relationships
     if TYPE_CHECKING:
         source_connections: List["SourceConnection"]
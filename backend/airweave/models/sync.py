@@ -26,6 +26,7 @@ class Sync(OrganizationBase, UserMixin):
     description: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     status: Mapped[SyncStatus] = mapped_column(default=SyncStatus.ACTIVE)
     cron_schedule: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    full_sync_cron_schedule: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     next_scheduled_run: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
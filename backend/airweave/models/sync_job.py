@@ -4,11 +4,11 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy import Enum as SQLAlchemyEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from airweave.core.shared_models import SyncJobStatus
+from airweave.core.shared_models import SyncJobStatus, SyncMode
 from airweave.models._base import OrganizationBase, UserMixin
 
 if TYPE_CHECKING:
@@ -20,6 +20,7 @@ class SyncJob(OrganizationBase, UserMixin):
     """Sync job model."""
 
     __tablename__ = "sync_job"
+    __table_args__ = (Index("ix_sync_job_status_created_at", "status", "created_at"),)
 
     sync_id: Mapped[UUID] = mapped_column(
         ForeignKey("sync.id", ondelete="CASCADE", name="fk_sync_job_sync_id"), nullable=False
@@ -38,6 +39,26 @@ class SyncJob(OrganizationBase, UserMixin):
     error: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     entities_encountered: Mapped[Optional[dict]] = mapped_column(JSON, default={})
 
+    # Incremental sync: the mode the job ran in, and the start of the window of source changes
+    # it synced, from which the next incremental job fetches changes
+    sync_mode: Mapped[SyncMode] = mapped_column(
+        SQLAlchemyEnum(SyncMode),
+        nullable=False,
+        default=SyncMode.FULL,
+        server_default=SyncMode.FULL.name,
+    )
+    watermark: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    # Job queue lease, held by the worker that runs the job and renewed by its heartbeats
+    leased_by: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    lease_expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+
+    # Last durable source checkpoint, from which a failed or requeued job resumes
+    checkpoint: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    checkpoint_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
     sync: Mapped["Sync"] = relationship(
         "Sync",
         back_populates="jobs",
@@ -0,0 +1,121 @@
+"""Signals that the calls of a sync send to its adaptive concurrency limit.
+
+Sources, embedding models and destinations report the latency and throttling of their calls
+here, without knowing about the sync pipeline. The sync binds its limit, an
+AdaptiveConcurrencyLimit of the worker pool, for the duration of a run.
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional, Protocol
+
+import httpx
+
+THROTTLING_STATUS_CODES = {429, 503}
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """Whether an error means that a service is overloaded or rate limits us.
+
+    Args:
+        error (BaseException): The error a task failed with.
+
+    Returns:
+        bool: True for timeouts and 429/503 responses, also when wrapped by a client library
+            that keeps the status code or response on the error.
+    """
+    if isinstance(error, (asyncio.TimeoutError, httpx.TimeoutException)):
+        return True
+
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    return status_code in THROTTLING_STATUS_CODES
+
+
+class ConcurrencyLimit(Protocol):
+    """A limit that the calls of a sync report to."""
+
+    def on_throttled(self, started_at: float) -> None:
+        """Back off for a call that was rate limited or timed out."""
+
+    def on_latency(self, stage: str, started_at: float, latency: float) -> None:
+        """Add the latency of a call of a stage."""
+
+
+_current_limit: ContextVar[Optional[ConcurrencyLimit]] = ContextVar(
+    "sync_concurrency_limit", default=None
+)
+
+
+@contextmanager
+def bind_concurrency_limit(limit: Optional[ConcurrencyLimit]) -> Iterator[None]:
+    """Make a limit the one that the stages of the running sync report to.
+
+    Tasks created inside the block, e.g. the source stream, the entity tasks and the batcher's
+    flushes, report to the same limit.
+
+    Args:
+        limit (Optional[ConcurrencyLimit]): The limit of the sync, if it adapts.
+    """
+    token = _current_limit.set(limit)
+    try:
+        yield
+    finally:
+        _current_limit.reset(token)
+
+
+@contextmanager
+def measure_stage(stage: str) -> Iterator[None]:
+    """Report the latency and throttling errors of a call to the running sync's limit.
+
+    Args:
+        stage (str): The stage of the call, whose latencies are averaged together.
+    """
+    limit = _current_limit.get()
+    if limit is None:
+        yield
+        return
+
+    started_at = time.monotonic()
+    try:
+        yield
+    except Exception as e:
+        if is_throttling_error(e):
+            limit.on_throttled(started_at)
+        raise
+    limit.on_latency(stage, started_at, time.monotonic() - started_at)
+
+
+async def _start_request(request: httpx.Request) -> None:
+    """Note when a request was sent, for `_report_response`."""
+    request.extensions["sync_stage_started_at"] = time.monotonic()
+
+
+async def _report_response(response: httpx.Response) -> None:
+    """Report the latency or throttling of a source API response to the sync's limit."""
+    limit = _current_limit.get()
+    started_at = response.request.extensions.get("sync_stage_started_at")
+    if limit is None or started_at is None:
+        return
+
+    if response.status_code in THROTTLING_STATUS_CODES:
+        limit.on_throttled(started_at)
+    else:
+        limit.on_latency("source", started_at, time.monotonic() - started_at)
+
+
+def reporting_http_client(**kwargs: Any) -> httpx.AsyncClient:
+    """Create an HTTP client whose responses are reported to the running sync's limit.
+
+    Args:
+        **kwargs (Any): Arguments of httpx.AsyncClient.
+
+    Returns:
+        httpx.AsyncClient: The client.
+    """
+    return httpx.AsyncClient(
+        event_hooks={"request": [_start_request], "response": [_report_response]}, **kwargs
+    )
@@ -2,10 +2,11 @@
 
 import json
 from abc import ABC, abstractmethod
-from typing import ClassVar, List
+from typing import ClassVar, List, Optional
 from uuid import UUID
 
 from airweave import schemas
+from airweave.platform.embedding_models.bm25 import SparseVector
 from airweave.platform.entities._base import ChunkEntity
 
 
@@ -50,16 +51,31 @@ class BaseDestination(ABC):
         """Delete entities from the destination by sync ID."""
         pass
 
+    @abstractmethod
+    async def bulk_delete_orphans(
+        self, entities: list[ChunkEntity], parent_ids: list[str], sync_id: UUID
+    ) -> None:
+        """Delete the entities of the given parents that are not among the written entities."""
+        pass
+
     @abstractmethod
     async def bulk_delete_by_parent_id(self, parent_id: UUID) -> None:
         """Bulk delete entities from the destination by parent ID and entity ID."""
         pass
 
     @abstractmethod
-    async def search(self, query_vector: list[float]) -> None:
-        """Search for a sync_id in the destination."""
+    async def search(
+        self, query_vector: list[float], params: Optional[schemas.SearchParams] = None
+    ) -> list[dict]:
+        """Search the destination for the entities closest to a query vector."""
         pass
 
+    async def sparse_search(
+        self, sparse_vector: SparseVector, params: Optional[schemas.SearchParams] = None
+    ) -> list[dict]:
+        """Search the destination by sparse term weights, if the destination supports it."""
+        return []
+
     @abstractmethod
     async def get_credentials(self, user: schemas.User) -> None:
         """Get credentials for the destination."""
@@ -1,18 +1,246 @@
 """Qdrant destination implementation."""
 
-from uuid import UUID
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple, Union
+from uuid import UUID, uuid5
 
+import numpy as np
 from qdrant_client import AsyncQdrantClient
 from qdrant_client.http import models as rest
 
+from airweave import schemas
 from airweave.core.config import settings
 from airweave.core.logging import logger
+from airweave.core.shared_models import VectorStorageProfile
 from airweave.platform.auth.schemas import AuthType
 from airweave.platform.configs.auth import QdrantAuthConfig
 from airweave.platform.decorators import destination
 from airweave.platform.destinations._base import VectorDBDestination
+from airweave.platform.embedding_models.bm25 import SparseVector
 from airweave.platform.entities._base import ChunkEntity
 
+# Payload fields that deletes and searches filter on, each gets a keyword index
+PAYLOAD_INDEX_FIELDS = ("entity_id", "parent_entity_id", "sync_id", "source_name", "entity_type")
+
+# Name of the BM25 sparse vector that is stored next to the unnamed dense vector
+SPARSE_VECTOR_NAME = "bm25"
+
+# Whether a collection has the sparse vector configured, collections never change this
+_sparse_collections: Dict[str, bool] = {}
+
+# Quantized collections search the quantized vectors for this many times the requested results
+# and rescore those with the full precision vectors, ignored by collections without quantization
+QUANTIZATION_SEARCH_PARAMS = rest.SearchParams(
+    quantization=rest.QuantizationSearchParams(rescore=True, oversampling=2.0)
+)
+
+# Namespace of the UUIDv5 point IDs, changing it orphans every point written before
+POINT_ID_NAMESPACE = UUID("6f1c1c3e-52a4-4d3e-9a0f-3f5c0d6b8e21")
+
+
+def _storage_config(
+    profile: VectorStorageProfile, hnsw_m: Optional[int], hnsw_ef_construct: Optional[int]
+) -> Dict[str, Any]:
+    """Collection settings of a vector storage profile.
+
+    Quantized profiles keep the compact vectors in RAM and move the full precision vectors,
+    which are only read for rescoring, to disk.
+
+    Returns:
+        Dict[str, Any]: The on_disk flag of the dense vector, and the quantization and HNSW
+            configs of the collection.
+    """
+    on_disk = profile != VectorStorageProfile.STANDARD
+    quantization_config = None
+    if profile == VectorStorageProfile.SCALAR:
+        quantization_config = rest.ScalarQuantization(
+            scalar=rest.ScalarQuantizationConfig(
+                type=rest.ScalarType.INT8, quantile=0.99, always_ram=True
+            )
+        )
+    elif profile == VectorStorageProfile.BINARY:
+        quantization_config = rest.BinaryQuantization(
+            binary=rest.BinaryQuantizationConfig(always_ram=True)
+        )
+
+    hnsw_config = None
+    if hnsw_m is not None or hnsw_ef_construct is not None:
+        hnsw_config = rest.HnswConfigDiff(m=hnsw_m, ef_construct=hnsw_ef_construct)
+    if profile == VectorStorageProfile.ON_DISK:
+        hnsw_config = (hnsw_config or rest.HnswConfigDiff()).model_copy(update={"on_disk": True})
+
+    return {
+        "on_disk": on_disk,
+        "quantization_config": quantization_config,
+        "hnsw_config": hnsw_config,
+    }
+
+
+# Connected clients shared by all destinations in the process, keyed by (location, api key).
+# Each client is bound to the event loop it was created in.
+_clients: Dict[Tuple[str, Optional[str]], Tuple[asyncio.AbstractEventLoop, AsyncQdrantClient]] = {}
+
+
+async def _get_client(location: str, api_key: Optional[str]) -> AsyncQdrantClient:
+    """Return the shared client of a Qdrant service, connecting on first use.
+
+    Destinations are created per sync and per search. Sharing the client keeps its connection
+    pool warm and only pays for the connectivity check once per service and event loop.
+
+    Args:
+        location (str): The URL of the Qdrant service.
+        api_key (Optional[str]): The API key of the Qdrant service.
+
+    Returns:
+        AsyncQdrantClient: The connected client.
+    """
+    loop = asyncio.get_running_loop()
+    key = (location, api_key)
+    cached = _clients.get(key)
+    if cached is not None and cached[0] is loop:
+        return cached[1]
+
+    client_config = {
+        "location": location,
+        "prefer_grpc": False,  # Use HTTP by default
+    }
+
+    if location[-4:] != ":6333":
+        # allow railway to work
+        client_config["port"] = None
+
+    if api_key:
+        client_config["api_key"] = api_key
+
+    client = AsyncQdrantClient(**client_config)
+
+    # Test connection
+    await client.get_collections()
+    logger.info("Successfully connected to Qdrant service.")
+
+    _clients[key] = (loop, client)
+    return client
+
+
+def _point_id(entity: ChunkEntity) -> str:
+    """Return the deterministic point ID of an entity chunk.
+
+    The ID is derived from (sync_id, entity_id, chunk_index), so writing the same chunk twice
+    overwrites the same point. Replaying a batch after a crash is a no-op, and chunks of one
+    entity no longer overwrite each other.
+    """
+    chunk_index = entity.chunk_index if entity.chunk_index is not None else 0
+    return str(uuid5(POINT_ID_NAMESPACE, f"{entity.sync_id}:{entity.entity_id}:{chunk_index}"))
+
+
+def _point_vector(vector: Union[List[float], np.ndarray]) -> List[float]:
+    """Return a vector as the list of floats that a Qdrant point is sent with.
+
+    Entities may carry compact float32 arrays; they are only expanded here, one batch at a
+    time, right before the upsert.
+    """
+    if isinstance(vector, np.ndarray):
+        return vector.tolist()
+    return vector
+
+
+def _point_vectors(entity: ChunkEntity, with_sparse: bool) -> Union[List[float], Dict[str, Any]]:
+    """Return the vectors a point is sent with, the dense vector plus the sparse one if any."""
+    dense = _point_vector(entity.vector)
+    if not with_sparse or entity.sparse_vector is None:
+        return dense
+    return {
+        "": dense,
+        SPARSE_VECTOR_NAME: rest.SparseVector(
+            indices=entity.sparse_vector.indices, values=entity.sparse_vector.values
+        ),
+    }
+
+
+async def _ensure_payload_indexes(
+    client: AsyncQdrantClient, collection_name: str, wait: bool = True
+) -> List[str]:
+    """Create the missing keyword payload indexes of a collection.
+
+    Args:
+        client (AsyncQdrantClient): The client of the Qdrant service.
+        collection_name (str): The name of the collection.
+        wait (bool): Whether to wait until Qdrant has built each index.
+
+    Returns:
+        List[str]: The fields an index was created for.
+    """
+    collection_info = await client.get_collection(collection_name)
+    existing = set(collection_info.payload_schema or {})
+
+    created = []
+    for field_name in PAYLOAD_INDEX_FIELDS:
+        if field_name in existing:
+            continue
+        await client.create_payload_index(
+            collection_name=collection_name,
+            field_name=field_name,
+            field_schema=rest.PayloadSchemaType.KEYWORD,
+            wait=wait,
+        )
+        created.append(field_name)
+    return created
+
+
+async def backfill_payload_indexes(
+    location: Optional[str] = None, api_key: Optional[str] = None
+) -> Dict[str, List[str]]:
+    """Create the missing payload indexes of all collections of a Qdrant service.
+
+    Collections created before setup_collection indexed payload fields have no indexes. Qdrant
+    builds the indexes in the background, so this returns before they are complete.
+
+    Args:
+        location (Optional[str]): The URL of the Qdrant service, defaults to the configured one.
+        api_key (Optional[str]): The API key of the Qdrant service.
+
+    Returns:
+        Dict[str, List[str]]: The fields an index was created for, per collection.
+    """
+    client = await _get_client(location or settings.qdrant_url, api_key)
+    collections_response = await client.get_collections()
+
+    created = {}
+    for collection in collections_response.collections:
+        fields = await _ensure_payload_indexes(client, collection.name, wait=False)
+        if fields:
+            logger.info(f"Creating payload indexes {fields} in collection {collection.name}")
+            created[collection.name] = fields
+    return created
+
+
+def _search_filter(params: schemas.SearchParams) -> Optional[rest.Filter]:
+    """Build the payload filter of a search, or None if the search is not filtered."""
+    conditions = []
+    if params.source_names:
+        conditions.append(
+            rest.FieldCondition(key="source_name", match=rest.MatchAny(any=params.source_names))
+        )
+    if params.sync_ids:
+        conditions.append(
+            rest.FieldCondition(
+                key="sync_id",
+                match=rest.MatchAny(any=[str(sync_id) for sync_id in params.sync_ids]),
+            )
+        )
+    if params.entity_types:
+        conditions.append(
+            rest.FieldCondition(key="entity_type", match=rest.MatchAny(any=params.entity_types))
+        )
+    if params.time_from or params.time_to:
+        conditions.append(
+            rest.FieldCondition(
+                key=params.time_field,
+                range=rest.DatetimeRange(gte=params.time_from, lte=params.time_to),
+            )
+        )
+    return rest.Filter(must=conditions) if conditions else None
+
 
 @destination("Qdrant", "qdrant", AuthType.config_class, "QdrantAuthConfig", labels=["Vector"])
 class QdrantDestination(VectorDBDestination):
@@ -74,32 +302,8 @@ class QdrantDestination(VectorDBDestination):
         """Connect to Qdrant service with appropriate authentication."""
         if self.client is None:
             try:
-                # Configure client
-                if self.url:
-                    location = self.url
-                else:
-                    location = settings.qdrant_url
-
-                client_config = {
-                    "location": location,
-                    "prefer_grpc": False,  # Use HTTP by default
-                }
-
-                if location[-4:] != ":6333":
-                    # allow railway to work
-                    client_config["port"] = None
-
-                # Add API key if provided
-                api_key = self.api_key
-                if api_key:
-                    client_config["api_key"] = api_key
-
-                # Initialize client
-                self.client = AsyncQdrantClient(**client_config)
-
-                # Test connection
-                await self.client.get_collections()
-                logger.info("Successfully connected to Qdrant service.")
+                location = self.url or settings.qdrant_url
+                self.client = await _get_client(location, self.api_key)
             except Exception as e:
                 logger.error(f"Error connecting to Qdrant service: {e}")
                 self.client = None
@@ -113,10 +317,12 @@ class QdrantDestination(VectorDBDestination):
                 raise Exception("Qdrant client failed to connect.")
 
     async def close_connection(self) -> None:
-        """Close the connection to the Qdrant service."""
+        """Release the connection to the Qdrant service.
+
+        The client is shared with other destinations, so it is only dropped from this instance.
+        """
         if self.client:
             logger.info("Closing Qdrant client connection gracefully...")
-            # Qdrant client doesn't have an explicit close method, but we can set it to None
             self.client = None
         else:
             logger.info("No Qdrant client connection to close.")
@@ -139,11 +345,22 @@ class QdrantDestination(VectorDBDestination):
             logger.error(f"Error checking if collection exists: {e}")
             return False
 
-    async def setup_collection(self, vector_size: int) -> None:  # noqa: C901
+    async def setup_collection(  # noqa: C901
+        self,
+        vector_size: int,
+        storage_profile: VectorStorageProfile = VectorStorageProfile.STANDARD,
+        hnsw_m: Optional[int] = None,
+        hnsw_ef_construct: Optional[int] = None,
+    ) -> None:
         """Set up the Qdrant collection for storing entities.
 
         Args:
             vector_size (int): The size of the vectors to use.
+            storage_profile (VectorStorageProfile): How the vectors are stored, see
+                VectorStorageProfile.
+            hnsw_m (Optional[int]): Edges per node of the HNSW index, Qdrant's default if None.
+            hnsw_ef_construct (Optional[int]): Candidates considered while building the HNSW
+                index, Qdrant's default if None.
         """
         await self.ensure_client_readiness()
 
@@ -151,27 +368,57 @@ class QdrantDestination(VectorDBDestination):
             # Check if collection exists
             if await self.collection_exists(self.collection_name):
                 logger.info(f"Collection {self.collection_name} already exists.")
+                await _ensure_payload_indexes(self.client, self.collection_name)
                 return
 
             logger.info(f"Creating collection {self.collection_name}...")
 
-            # Create the collection
+            # Create the collection, with a BM25 sparse vector for hybrid search. Qdrant applies
+            # the IDF part of BM25 at query time.
+            sparse_vectors_config = None
+            if settings.SEARCH_HYBRID_ENABLED:
+                sparse_vectors_config = {
+                    SPARSE_VECTOR_NAME: rest.SparseVectorParams(modifier=rest.Modifier.IDF)
+                }
+
+            storage = _storage_config(storage_profile, hnsw_m, hnsw_ef_construct)
             await self.client.create_collection(
                 collection_name=self.collection_name,
                 vectors_config=rest.VectorParams(
                     size=vector_size if vector_size else self.vector_size,
                     distance=rest.Distance.COSINE,
+                    on_disk=storage["on_disk"],
                 ),
+                sparse_vectors_config=sparse_vectors_config,
+                quantization_config=storage["quantization_config"],
+                hnsw_config=storage["hnsw_config"],
                 optimizers_config=rest.OptimizersConfigDiff(
                     indexing_threshold=20000,  # Default indexing threshold
                 ),
                 on_disk_payload=True,  # Store payload on disk to save memory
             )
+            _sparse_collections[self.collection_name] = sparse_vectors_config is not None
 
         except Exception as e:
             if "already exists" not in str(e):
                 raise
 
+        # Index the payload fields that deletes and searches filter on
+        await _ensure_payload_indexes(self.client, self.collection_name)
+
+    async def has_sparse_vectors(self) -> bool:
+        """Whether the collection stores BM25 sparse vectors.
+
+        Collections created before hybrid search only have the dense vector, they are written
+        and searched without the sparse channel.
+        """
+        if self.collection_name not in _sparse_collections:
+            await self.ensure_client_readiness()
+            collection_info = await self.client.get_collection(self.collection_name)
+            sparse_vectors = collection_info.config.params.sparse_vectors or {}
+            _sparse_collections[self.collection_name] = SPARSE_VECTOR_NAME in sparse_vectors
+        return _sparse_collections[self.collection_name]
+
     async def insert(self, entity: ChunkEntity) -> None:
         """Insert a single entity into Qdrant.
 
@@ -187,13 +434,15 @@ class QdrantDestination(VectorDBDestination):
         if not hasattr(entity, "vector") or entity.vector is None:
             raise ValueError(f"Entity {entity.entity_id} has no vector")
 
+        with_sparse = entity.sparse_vector is not None and await self.has_sparse_vectors()
+
         # Insert point with vector from entity
         await self.client.upsert(
             collection_name=self.collection_name,
             points=[
                 rest.PointStruct(
-                    id=str(entity.db_entity_id),
-                    vector=entity.vector,
+                    id=_point_id(entity),
+                    vector=_point_vectors(entity, with_sparse),
                     payload=data_object,
                 )
             ],
@@ -210,6 +459,11 @@ class QdrantDestination(VectorDBDestination):
 
         await self.ensure_client_readiness()
 
+        with_sparse = (
+            any(entity.sparse_vector is not None for entity in entities)
+            and await self.has_sparse_vectors()
+        )
+
         # Convert entities to Qdrant points
         point_structs = []
         for entity in entities:
@@ -224,8 +478,8 @@ class QdrantDestination(VectorDBDestination):
             # Create point for Qdrant
             point_structs.append(
                 rest.PointStruct(
-                    id=str(entity.db_entity_id),
-                    vector=entity.vector,
+                    id=_point_id(entity),
+                    vector=_point_vectors(entity, with_sparse),
                     payload=entity_data,
                 )
             )
@@ -245,7 +499,7 @@ class QdrantDestination(VectorDBDestination):
             raise Exception(f"Errors during bulk insert: {operation_response.errors}")
 
     async def delete(self, db_entity_id: UUID) -> None:
-        """Delete a single entity from Qdrant.
+        """Delete a single entity and its chunks from Qdrant.
 
         Args:
             db_entity_id (UUID): The ID of the entity to delete.
@@ -254,8 +508,14 @@ class QdrantDestination(VectorDBDestination):
 
         await self.client.delete(
             collection_name=self.collection_name,
-            points_selector=rest.PointIdsList(
-                points=[str(db_entity_id)],
+            points_selector=rest.FilterSelector(
+                filter=rest.Filter(
+                    must=[
+                        rest.FieldCondition(
+                            key="db_entity_id", match=rest.MatchValue(value=str(db_entity_id))
+                        )
+                    ]
+                )
             ),
             wait=True,  # Wait for operation to complete
         )
@@ -281,6 +541,9 @@ class QdrantDestination(VectorDBDestination):
     async def bulk_delete(self, entity_ids: list[str], sync_id: UUID) -> None:
         """Bulk delete entities from Qdrant.
 
+        Points derived from the entities (chunks that reference them through
+        parent_entity_id) are deleted as well.
+
         Args:
             entity_ids (list[str]): The IDs of the entities to delete.
             sync_id (UUID): The sync ID.
@@ -298,8 +561,52 @@ class QdrantDestination(VectorDBDestination):
                         rest.FieldCondition(
                             key="sync_id", match=rest.MatchValue(value=str(sync_id))
                         ),
+                    ],
+                    should=[
                         rest.FieldCondition(key="entity_id", match=rest.MatchAny(any=entity_ids)),
-                    ]
+                        rest.FieldCondition(
+                            key="parent_entity_id", match=rest.MatchAny(any=entity_ids)
+                        ),
+                    ],
+                )
+            ),
+            wait=True,  # Wait for operation to complete
+        )
+
+    async def bulk_delete_orphans(
+        self, entities: list[ChunkEntity], parent_ids: list[str], sync_id: UUID
+    ) -> None:
+        """Delete the points of parent entities that were not just written.
+
+        Together with the upsert in bulk_insert this replaces the points of updated entities
+        without a window in which they are missing: chunks that still exist were overwritten in
+        place, and only chunks that disappeared (or points written under older IDs) are removed.
+
+        Args:
+            entities (list[ChunkEntity]): The entities that were written for the parents.
+            parent_ids (list[str]): The entity IDs of the updated parent entities.
+            sync_id (UUID): The sync ID.
+        """
+        if not parent_ids:
+            return
+
+        await self.ensure_client_readiness()
+
+        await self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=rest.FilterSelector(
+                filter=rest.Filter(
+                    must=[
+                        rest.FieldCondition(
+                            key="sync_id", match=rest.MatchValue(value=str(sync_id))
+                        ),
+                        rest.FieldCondition(
+                            key="parent_entity_id", match=rest.MatchAny(any=parent_ids)
+                        ),
+                    ],
+                    must_not=[
+                        rest.HasIdCondition(has_id=[_point_id(entity) for entity in entities])
+                    ],
                 )
             ),
             wait=True,  # Wait for operation to complete
@@ -349,30 +656,39 @@ class QdrantDestination(VectorDBDestination):
             # Fallback to a different approach if needed
             raise
 
-    async def search(self, query_vector: list[float]) -> list[dict]:
-        """Search for a sync_id in the destination.
+    async def search(
+        self, query_vector: list[float], params: Optional[schemas.SearchParams] = None
+    ) -> list[dict]:
+        """Search the collection for the points closest to a query vector.
 
         Args:
             query_vector (list[float]): The query vector to search with.
-            sync_id (UUID): The sync_id to search for.
+            params (Optional[schemas.SearchParams]): Pagination, payload filters and payload
+                projection, defaults to the first 10 results with their full payload.
 
         Returns:
             list[dict]: The search results.
         """
         await self.ensure_client_readiness()
 
+        params = params or schemas.SearchParams()
+
         try:
             # Perform search
-            search_results = await self.client.search(
+            response = await self.client.query_points(
                 collection_name=self.collection_name,
-                query_vector=query_vector,
-                limit=10,
-                with_payload=True,
+                query=query_vector,
+                query_filter=_search_filter(params),
+                limit=params.limit,
+                offset=params.offset,
+                score_threshold=params.score_threshold,
+                search_params=QUANTIZATION_SEARCH_PARAMS,
+                with_payload=params.include_fields if params.include_fields else True,
             )
 
             # Convert results to a standard format
             results = []
-            for result in search_results:
+            for result in response.points:
                 results.append(
                     {
                         "id": result.id,
@@ -385,3 +701,43 @@ class QdrantDestination(VectorDBDestination):
         except Exception as e:
             logger.error(f"Error searching with Qdrant filter: {e}")
             return []
+
+    async def sparse_search(
+        self, sparse_vector: SparseVector, params: Optional[schemas.SearchParams] = None
+    ) -> list[dict]:
+        """Search the collection for the points whose BM25 terms best match a query.
+
+        Args:
+            sparse_vector (SparseVector): The encoded query terms.
+            params (Optional[schemas.SearchParams]): Pagination, payload filters and payload
+                projection. The score threshold only applies to dense scores and is ignored.
+
+        Returns:
+            list[dict]: The search results, empty if the collection has no sparse vectors.
+        """
+        if not sparse_vector.indices:
+            return []
+
+        params = params or schemas.SearchParams()
+
+        try:
+            if not await self.has_sparse_vectors():
+                return []
+
+            response = await self.client.query_points(
+                collection_name=self.collection_name,
+                query=rest.SparseVector(indices=sparse_vector.indices, values=sparse_vector.values),
+                using=SPARSE_VECTOR_NAME,
+                query_filter=_search_filter(params),
+                limit=params.limit,
+                offset=params.offset,
+                with_payload=params.include_fields if params.include_fields else True,
+            )
+
+            return [
+                {"id": result.id, "score": result.score, "payload": result.payload}
+                for result in response.points
+            ]
+        except Exception as e:
+            logger.error(f"Error in sparse search: {e}")
+            return []
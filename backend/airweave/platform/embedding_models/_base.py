@@ -1,27 +1,55 @@
 """Base class for embedding models."""
 
+import base64
 from abc import abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Union
 
+import numpy as np
 from pydantic import BaseModel
 
+# A vector as a list of floats, or as a compact float32 array
+Vector = Union[List[float], np.ndarray]
+
+
+def decode_base64_vector(data: str) -> np.ndarray:
+    """Decode a base64 encoded little-endian float32 vector."""
+    return np.frombuffer(base64.b64decode(data), dtype="<f4")
+
 
 class BaseEmbeddingModel(BaseModel):
     """Abstract base class for embedding models.
 
     This base class defines a generic interface for embedding models
     that can be used with different vector stores.
+
+    With compact_vectors set, embed_many returns float32 NumPy arrays instead of lists of
+    Python floats, which take roughly a tenth of the memory.
     """
 
     model_name: str
     vector_dimensions: int
     enabled: bool = True
+    compact_vectors: bool = False
 
     @classmethod
     def create(cls, **kwargs) -> "BaseEmbeddingModel":
         """Create an instance of the embedding model."""
         return cls(**kwargs)
 
+    def _format_vector(self, vector: Vector) -> Vector:
+        """Return a vector in the representation configured by compact_vectors."""
+        if self.compact_vectors:
+            return np.asarray(vector, dtype=np.float32)
+        if isinstance(vector, np.ndarray):
+            return vector.tolist()
+        return vector
+
+    def _zero_vector(self) -> Vector:
+        """Return the zero vector used for empty texts and failed embeddings."""
+        if self.compact_vectors:
+            return np.zeros(self.vector_dimensions, dtype=np.float32)
+        return [0.0] * self.vector_dimensions
+
     @abstractmethod
     async def embed(
         self,
@@ -50,7 +78,7 @@ class BaseEmbeddingModel(BaseModel):
         model: Optional[str] = None,
         encoding_format: str = "float",
         dimensions: Optional[int] = None,
-    ) -> List[List[float]]:
+    ) -> List[Vector]:
         """Embed multiple text strings.
 
         Args:
@@ -60,6 +88,6 @@ class BaseEmbeddingModel(BaseModel):
             dimensions: Vector dimensions (defaults to self.vector_dimensions)
 
         Returns:
-            List of embedding vectors
+            List of embedding vectors, float32 arrays if compact_vectors is set
         """
         pass
@@ -0,0 +1,128 @@
+"""Local BM25 sparse encoder for hybrid search.
+
+Dense embeddings are good at meaning but poor at exact identifiers such as ticket keys
+(ENG-1234), function names or email addresses. The sparse channel indexes the terms of each
+chunk with BM25 term frequency weights. The inverse document frequency part of BM25 is applied by
+Qdrant at query time (the sparse vector is configured with the IDF modifier), so the weights of a
+chunk never depend on the rest of the collection and need no corpus statistics here.
+"""
+
+import hashlib
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import List, NamedTuple
+
+# Words, optionally joined into compound identifiers like ENG-1234, get_user or a.b@example.com
+_TOKEN_PATTERN = re.compile(r"\w+(?:[-.@/:#]\w+)*")
+_SEPARATOR_PATTERN = re.compile(r"[-_.@/:#]")
+_CAMEL_CASE_PATTERN = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+
+STOPWORDS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "for",
+        "from",
+        "has",
+        "in",
+        "is",
+        "it",
+        "of",
+        "on",
+        "or",
+        "that",
+        "the",
+        "this",
+        "to",
+        "was",
+        "were",
+        "with",
+    }
+)
+
+
+class SparseVector(NamedTuple):
+    """Sparse vector as parallel lists of term indices and weights."""
+
+    indices: List[int]
+    values: List[float]
+
+
+@lru_cache(maxsize=100000)
+def _term_index(term: str) -> int:
+    """Stable 32 bit index of a term, the same in every process."""
+    return int.from_bytes(hashlib.blake2b(term.encode(), digest_size=4).digest(), "little")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split a text into lowercase terms.
+
+    Compound identifiers are kept as a whole and also split into their parts, and camelCase
+    words into their words, so "getUserName" matches both itself and "user name".
+    """
+    terms = []
+    for match in _TOKEN_PATTERN.finditer(text):
+        token = match.group()
+        lowered = token.lower()
+        if lowered in STOPWORDS:
+            continue
+        terms.append(lowered)
+
+        parts = [
+            part.lower()
+            for piece in _SEPARATOR_PATTERN.split(token)
+            for part in _CAMEL_CASE_PATTERN.findall(piece)
+        ]
+        if len(parts) > 1:
+            terms.extend(part for part in parts if part not in STOPWORDS)
+    return terms
+
+
+class BM25SparseEncoder:
+    """Encodes chunks and queries as BM25 sparse vectors on the CPU."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, avg_doc_length: float = 256.0) -> None:
+        """Initialize the encoder.
+
+        Args:
+            k1 (float): Term frequency saturation.
+            b (float): Strength of the document length normalization.
+            avg_doc_length (float): Expected number of terms of a chunk, chunks are capped by the
+                chunkers so a fixed value stands in for the corpus average.
+        """
+        self.k1 = k1
+        self.b = b
+        self.avg_doc_length = avg_doc_length
+
+    def encode_document(self, text: str) -> SparseVector:
+        """Encode a chunk as BM25 term frequency weights."""
+        terms = tokenize(text)
+        if not terms:
+            return SparseVector([], [])
+
+        length_norm = 1 - self.b + self.b * len(terms) / self.avg_doc_length
+        weights: dict[int, float] = {}
+        for term, frequency in Counter(terms).items():
+            weight = frequency * (self.k1 + 1) / (frequency + self.k1 * length_norm)
+            index = _term_index(term)
+            weights[index] = weights.get(index, 0.0) + weight
+        return SparseVector(list(weights), list(weights.values()))
+
+    def encode_documents(self, texts: List[str]) -> List[SparseVector]:
+        """Encode many chunks."""
+        return [self.encode_document(text) for text in texts]
+
+    def encode_query(self, text: str) -> SparseVector:
+        """Encode a query, every distinct term with weight 1."""
+        indices = list(dict.fromkeys(_term_index(term) for term in tokenize(text)))
+        return SparseVector(indices, [1.0] * len(indices))
+
+
+bm25_encoder = BM25SparseEncoder()
@@ -0,0 +1,374 @@
+"""Content-addressed cache for embedding vectors."""
+
+import asyncio
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional
+
+import numpy as np
+from pydantic import ConfigDict, Field
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+
+from ._base import BaseEmbeddingModel, Vector
+
+# Fraction of the disk budget that is kept after an eviction pass
+_DISK_EVICTION_TARGET = 0.9
+# Upper bound on the number of SQLite bind parameters per statement
+_SQLITE_BATCH_SIZE = 500
+
+CacheKey = tuple[str, str, int]
+
+
+def _text_digest(text: str) -> str:
+    """Return the sha256 hex digest of a text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _unpack_vector(value: bytes) -> np.ndarray:
+    """Read a vector stored as float32 bytes."""
+    return np.frombuffer(value, dtype=np.float32)
+
+
+class EmbeddingCache:
+    """Two-level cache of embedding vectors keyed by (sha256(text), model, dimensions).
+
+    Lookups go to an in-process LRU first and then to a SQLite file, so vectors survive
+    restarts and are shared by all syncs in the process. The file is bounded by
+    `max_disk_bytes`; when it grows past the budget the least recently used vectors are
+    evicted. Vectors are stored and returned as float32 arrays.
+
+    The SQLite connection is opened lazily and guarded by a lock, so the cache can be used
+    from worker threads (see CachedEmbeddingModel) without blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_memory_entries: int = 10000,
+        max_disk_bytes: int = 1024 * 1024 * 1024,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: Location of the SQLite file, defaults to a file in the temp directory
+            max_memory_entries: Number of vectors kept in the in-process LRU
+            max_disk_bytes: Approximate size budget of the vectors stored on disk
+        """
+        self.path = path or os.path.join(tempfile.gettempdir(), "airweave-embedding-cache.sqlite")
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_bytes = max_disk_bytes
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._memory: OrderedDict[CacheKey, np.ndarray] = OrderedDict()
+        self._disk: Optional[sqlite3.Connection] = None
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        hits = self.memory_hits + self.disk_hits
+        total = hits + self.misses
+        return hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        """Return the cache metrics."""
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+            "evictions": self.evictions,
+            "memory_entries": len(self._memory),
+            "disk_bytes": self._disk_bytes,
+        }
+
+    def get_many(self, texts: List[str], model: str, dimensions: int) -> List[Optional[np.ndarray]]:
+        """Look up the vectors of many texts, returning None for texts that are not cached."""
+        keys = [(_text_digest(text), model, dimensions) for text in texts]
+        results: List[Optional[np.ndarray]] = [None] * len(keys)
+
+        with self._lock:
+            missing: dict[str, list[int]] = {}
+            for i, key in enumerate(keys):
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    results[i] = vector
+                    self.memory_hits += 1
+                else:
+                    missing.setdefault(key[0], []).append(i)
+
+            if missing:
+                found = self._read_disk(list(missing), model, dimensions)
+                for digest, indices in missing.items():
+                    vector = found.get(digest)
+                    if vector is None:
+                        self.misses += len(indices)
+                        continue
+                    self._remember((digest, model, dimensions), vector)
+                    for i in indices:
+                        results[i] = vector
+                    self.disk_hits += len(indices)
+
+        return results
+
+    def put_many(
+        self, texts: List[str], vectors: List[Vector], model: str, dimensions: int
+    ) -> None:
+        """Store the vectors of many texts."""
+        rows = []
+        now = time.time()
+        with self._lock:
+            for text, vector in zip(texts, vectors, strict=True):
+                digest = _text_digest(text)
+                vector = np.asarray(vector, dtype=np.float32)
+                self._remember((digest, model, dimensions), vector)
+                rows.append((digest, model, dimensions, vector.tobytes(), now))
+
+            if rows:
+                self._write_disk(rows)
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._disk is not None:
+                self._disk.close()
+                self._disk = None
+
+    def _remember(self, key: CacheKey, vector: np.ndarray) -> None:
+        """Put a vector into the in-process LRU, evicting the least recently used one."""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the SQLite file on first use."""
+        if self._disk is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._disk = sqlite3.connect(self.path, check_same_thread=False)
+            self._disk.execute("PRAGMA journal_mode=WAL")
+            self._disk.execute("PRAGMA synchronous=NORMAL")
+            self._disk.execute(
+                "CREATE TABLE IF NOT EXISTS embedding ("
+                "text_hash TEXT NOT NULL, model TEXT NOT NULL, dimensions INTEGER NOT NULL, "
+                "vector BLOB NOT NULL, accessed_at REAL NOT NULL, "
+                "PRIMARY KEY (text_hash, model, dimensions)) WITHOUT ROWID"
+            )
+            self._disk.execute(
+                "CREATE INDEX IF NOT EXISTS ix_embedding_accessed_at ON embedding (accessed_at)"
+            )
+            row = self._disk.execute("SELECT COALESCE(SUM(length(vector)), 0) FROM embedding")
+            self._disk_bytes = row.fetchone()[0]
+        return self._disk
+
+    def _read_disk(self, digests: List[str], model: str, dimensions: int) -> dict:
+        """Read vectors from the SQLite file and mark them as recently used."""
+        disk = self._connection()
+        found = {}
+        for start in range(0, len(digests), _SQLITE_BATCH_SIZE):
+            batch = digests[start : start + _SQLITE_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = disk.execute(
+                f"SELECT text_hash, vector FROM embedding WHERE model = ? AND dimensions = ? "
+                f"AND text_hash IN ({placeholders})",
+                (model, dimensions, *batch),
+            ).fetchall()
+            found.update((digest, _unpack_vector(vector)) for digest, vector in rows)
+
+        if found:
+            now = time.time()
+            disk.executemany(
+                "UPDATE embedding SET accessed_at = ? "
+                "WHERE text_hash = ? AND model = ? AND dimensions = ?",
+                [(now, digest, model, dimensions) for digest in found],
+            )
+            disk.commit()
+        return found
+
+    def _write_disk(self, rows: list[tuple]) -> None:
+        """Write vectors to the SQLite file and evict old ones if over budget."""
+        disk = self._connection()
+        disk.executemany(
+            "INSERT OR REPLACE INTO embedding "
+            "(text_hash, model, dimensions, vector, accessed_at) VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        disk.commit()
+        self._disk_bytes += sum(len(row[3]) for row in rows)
+
+        if self._disk_bytes > self.max_disk_bytes:
+            self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """Delete the least recently used vectors until the file is back under budget."""
+        disk = self._connection()
+        target = int(self.max_disk_bytes * _DISK_EVICTION_TARGET)
+        remaining = disk.execute(
+            "SELECT COALESCE(SUM(length(vector)), 0) FROM embedding"
+        ).fetchone()[0]
+        rows = disk.execute(
+            "SELECT text_hash, model, dimensions, length(vector) FROM embedding "
+            "ORDER BY accessed_at"
+        ).fetchall()
+
+        evict = []
+        for text_hash, model, dimensions, size in rows:
+            if remaining <= target:
+                break
+            evict.append((text_hash, model, dimensions))
+            remaining -= size
+
+        disk.executemany(
+            "DELETE FROM embedding WHERE text_hash = ? AND model = ? AND dimensions = ?", evict
+        )
+        disk.commit()
+
+        self._disk_bytes = remaining
+        self.evictions += len(evict)
+        logger.info(f"Evicted {len(evict)} vectors from the embedding cache")
+
+
+class CachedEmbeddingModel(BaseEmbeddingModel):
+    """Embedding model wrapper that serves repeated texts from an EmbeddingCache.
+
+    Only the texts that miss the cache are sent to the wrapped model. Empty texts and
+    zero vectors (the wrapped models' placeholder for failed embeddings) are never cached.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    model: BaseEmbeddingModel = Field(..., description="The wrapped embedding model")
+    cache: EmbeddingCache = Field(..., description="The cache to read and write vectors")
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    @classmethod
+    def wrap(cls, model: BaseEmbeddingModel, cache: EmbeddingCache) -> "CachedEmbeddingModel":
+        """Wrap an embedding model with a cache."""
+        return cls(
+            model=model,
+            cache=cache,
+            model_name=model.model_name,
+            vector_dimensions=model.vector_dimensions,
+            enabled=model.enabled,
+            compact_vectors=model.compact_vectors,
+        )
+
+    async def embed(
+        self,
+        text: str,
+        model: Optional[str] = None,
+        encoding_format: str = "float",
+        dimensions: Optional[int] = None,
+    ) -> List[float]:
+        """Embed a single text string, using the cache when possible.
+
+        Args:
+            text: The text to embed
+            model: Optional specific model to use (defaults to the wrapped model)
+            encoding_format: Format of the embedding (default: float)
+            dimensions: Vector dimensions (defaults to self.vector_dimensions)
+
+        Returns:
+            List of embedding values
+        """
+        vectors = await self.embed_many([text], model, encoding_format, dimensions)
+        return vectors[0]
+
+    async def embed_many(
+        self,
+        texts: List[str],
+        model: Optional[str] = None,
+        encoding_format: str = "float",
+        dimensions: Optional[int] = None,
+    ) -> List[Vector]:
+        """Embed multiple text strings, only sending cache misses to the wrapped model.
+
+        Args:
+            texts: List of texts to embed
+            model: Optional specific model to use (defaults to the wrapped model)
+            encoding_format: Format of the embedding (default: float)
+            dimensions: Vector dimensions (defaults to self.vector_dimensions)
+
+        Returns:
+            List of embedding vectors
+        """
+        if not texts:
+            return []
+
+        cache_model = self._cache_model_name(model)
+        cache_dimensions = dimensions or self.vector_dimensions
+
+        cacheable = [i for i, text in enumerate(texts) if text.strip()]
+        try:
+            cached = await asyncio.to_thread(
+                self.cache.get_many, [texts[i] for i in cacheable], cache_model, cache_dimensions
+            )
+        except Exception as e:
+            # The cache must never fail the embedding, e.g. when the SQLite file is locked
+            logger.warning(f"Embedding cache lookup failed, embedding all texts: {e}")
+            cached = [None] * len(cacheable)
+
+        results: List[Optional[Vector]] = [None] * len(texts)
+        for i, vector in zip(cacheable, cached, strict=True):
+            if vector is not None:
+                results[i] = self._format_vector(vector)
+
+        missing = [i for i, vector in enumerate(results) if vector is None]
+        self.cache_hits += len(texts) - len(missing)
+        self.cache_misses += len(missing)
+
+        if missing:
+            vectors = await self.model.embed_many(
+                [texts[i] for i in missing], model, encoding_format, dimensions
+            )
+            to_store = []
+            for i, vector in zip(missing, vectors, strict=True):
+                results[i] = vector
+                if texts[i].strip() and len(vector) and np.any(vector):
+                    to_store.append(i)
+
+            if to_store:
+                try:
+                    await asyncio.to_thread(
+                        self.cache.put_many,
+                        [texts[i] for i in to_store],
+                        [results[i] for i in to_store],
+                        cache_model,
+                        cache_dimensions,
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to store {len(to_store)} embeddings in the cache: {e}")
+
+        logger.debug(
+            f"Embedding cache served {len(texts) - len(missing)}/{len(texts)} texts "
+            f"for {cache_model}"
+        )
+        return results
+
+    def _cache_model_name(self, model: Optional[str]) -> str:
+        """Name that identifies the vectors of the wrapped model in the cache."""
+        if model:
+            return model
+        # OpenAIText2Vec keeps the provider model (e.g. text-embedding-3-small) separately
+        return getattr(self.model, "embedding_model", None) or self.model.model_name
+
+
+embedding_cache = EmbeddingCache(
+    path=settings.EMBEDDING_CACHE_PATH,
+    max_memory_entries=settings.EMBEDDING_CACHE_MAX_MEMORY_ENTRIES,
+    max_disk_bytes=settings.EMBEDDING_CACHE_MAX_DISK_MB * 1024 * 1024,
+)
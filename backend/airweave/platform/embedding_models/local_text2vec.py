@@ -1,5 +1,6 @@
 """Local text2vec model for embedding."""
 
+import asyncio
 from typing import List, Optional
 
 import httpx
@@ -8,8 +9,25 @@ from pydantic import Field
 from airweave.core.config import settings
 from airweave.core.logging import logger
 from airweave.platform.decorators import embedding_model
+from airweave.platform.utils.http import get_loop_bound_client
 
-from ._base import BaseEmbeddingModel
+from ._base import BaseEmbeddingModel, Vector
+
+# Status codes with which an inference server rejects the batched request format
+_BATCH_UNSUPPORTED_STATUS_CODES = {404, 405, 422}
+
+# Inference URLs known not to support batched requests
+_batch_unsupported_urls: set[str] = set()
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared inference client, with a connection per concurrent request."""
+    concurrency = settings.TEXT2VEC_MAX_CONCURRENCY
+    return get_loop_bound_client(
+        "local_text2vec",
+        timeout=60.0,
+        limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+    )
 
 
 @embedding_model(
@@ -64,10 +82,9 @@ class LocalText2Vec(BaseEmbeddingModel):
             # Return zero vector for empty text
             return [0.0] * self.vector_dimensions
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(f"{self.inference_url}/vectors", json={"text": text})
-            response.raise_for_status()
-            return response.json()["vector"]
+        response = await _get_client().post(f"{self.inference_url}/vectors", json={"text": text})
+        response.raise_for_status()
+        return response.json()["vector"]
 
     async def embed_many(
         self,
@@ -75,7 +92,7 @@ class LocalText2Vec(BaseEmbeddingModel):
         model: Optional[str] = None,
         encoding_format: str = "float",
         dimensions: Optional[int] = None,
-    ) -> List[List[float]]:
+    ) -> List[Vector]:
         """Embed multiple text strings using the local text2vec model.
 
         Args:
@@ -96,25 +113,54 @@ class LocalText2Vec(BaseEmbeddingModel):
         if dimensions:
             raise ValueError("Dimensions override not supported for local text2vec")
 
-        # Create result list with same order as input
-        result = []
-
-        # Process each text individually since batch endpoint isn't available
-        async with httpx.AsyncClient() as client:
-            for text in texts:
-                if text.strip():
-                    try:
-                        response = await client.post(
-                            f"{self.inference_url}/vectors/", json={"text": text}
-                        )
-                        response.raise_for_status()
-                        result.append(response.json()["vector"])
-                    except Exception as e:
-                        logger.error(f"Error embedding text: {e}")
-                        # Return zero vector for failed embedding
-                        result.append([0.0] * self.vector_dimensions)
-                else:
-                    # Return zero vector for empty text
-                    result.append([0.0] * self.vector_dimensions)
+        # Empty texts get a zero vector without a round trip
+        result = [self._zero_vector() for _ in texts]
+        indices = [i for i, text in enumerate(texts) if text.strip()]
+
+        batch_size = settings.TEXT2VEC_BATCH_SIZE
+        batches = [indices[i : i + batch_size] for i in range(0, len(indices), batch_size)]
+        for batch in batches:
+            vectors = await self._embed_batch([texts[i] for i in batch])
+            for i, vector in zip(batch, vectors, strict=True):
+                result[i] = self._format_vector(vector)
 
         return result
+
+    async def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed non-empty texts with one batched request.
+
+        Falls back to concurrent single-text requests if the inference server does not
+        accept batched requests, or if the batched request fails.
+        """
+        if self.inference_url not in _batch_unsupported_urls:
+            try:
+                response = await _get_client().post(
+                    f"{self.inference_url}/vectors", json={"texts": texts}
+                )
+                if response.status_code in _BATCH_UNSUPPORTED_STATUS_CODES:
+                    logger.info(
+                        f"Inference server at {self.inference_url} does not support batched "
+                        "requests, embedding texts one by one"
+                    )
+                    _batch_unsupported_urls.add(self.inference_url)
+                else:
+                    response.raise_for_status()
+                    vectors = response.json()["vectors"]
+                    if len(vectors) != len(texts):
+                        raise ValueError(f"Expected {len(texts)} vectors, got {len(vectors)}")
+                    return vectors
+            except Exception as e:
+                logger.error(f"Error embedding batch of {len(texts)} texts: {e}")
+
+        semaphore = asyncio.Semaphore(settings.TEXT2VEC_MAX_CONCURRENCY)
+
+        async def embed_one(text: str) -> List[float]:
+            async with semaphore:
+                try:
+                    return await self.embed(text)
+                except Exception as e:
+                    logger.error(f"Error embedding text: {e}")
+                    # Return zero vector for failed embedding
+                    return [0.0] * self.vector_dimensions
+
+        return list(await asyncio.gather(*(embed_one(text) for text in texts)))
@@ -1,16 +1,96 @@
 """OpenAI text2vec model for embedding."""
 
+import asyncio
+import random
 import time
-from typing import List, Optional
+from typing import List, NamedTuple, Optional
 
 import httpx
 from pydantic import Field
 
+from airweave.core.config import settings
 from airweave.core.logging import logger
 from airweave.platform.auth.schemas import AuthType
+from airweave.platform.concurrency import measure_stage
 from airweave.platform.decorators import embedding_model
+from airweave.platform.transformers.utils import count_tokens
+from airweave.platform.utils.http import get_loop_bound, get_loop_bound_client
+
+from ._base import BaseEmbeddingModel, Vector, decode_base64_vector
+
+OPENAI_EMBEDDINGS_URL = "https://api.openai.com/v1/embeddings"
+# Per-request limits of the embeddings endpoint
+MAX_INPUTS_PER_REQUEST = 2048
+MAX_TOKENS_PER_REQUEST = 300000
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 60.0
+
+
+class _SubBatch(NamedTuple):
+    """A slice of the input texts that fits in a single embeddings request."""
+
+    indices: List[int]
+    texts: List[str]
+    tokens: int
+
+
+class _RateLimiter:
+    """Token bucket limiter for requests per minute and tokens per minute.
+
+    Both buckets start full and refill continuously; a request waits until there is room
+    for one more request and its estimated token count.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        """Initialize the limiter with its per-minute budgets."""
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until a request with the given number of tokens fits in the budget."""
+        # A single request larger than the whole budget would otherwise wait forever
+        tokens = min(tokens, self.tokens_per_minute)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._requests >= 1 and self._tokens >= tokens:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    return
+                wait = max(
+                    (1 - self._requests) * 60 / self.requests_per_minute,
+                    (tokens - self._tokens) * 60 / self.tokens_per_minute,
+                )
+                await asyncio.sleep(wait)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(
+            self.requests_per_minute, self._requests + elapsed * self.requests_per_minute / 60
+        )
+        self._tokens = min(
+            self.tokens_per_minute, self._tokens + elapsed * self.tokens_per_minute / 60
+        )
+
 
-from ._base import BaseEmbeddingModel
+def _get_client_and_rate_limiter() -> tuple[httpx.AsyncClient, _RateLimiter]:
+    """Return the process-wide OpenAI client and rate limiter."""
+    rate_limiter = get_loop_bound(
+        "openai_embeddings_rate_limiter",
+        lambda: _RateLimiter(
+            settings.OPENAI_EMBEDDING_REQUESTS_PER_MINUTE,
+            settings.OPENAI_EMBEDDING_TOKENS_PER_MINUTE,
+        ),
+    )
+    return get_loop_bound_client("openai_embeddings"), rate_limiter
 
 
 @embedding_model(
@@ -63,22 +143,16 @@ class OpenAIText2Vec(BaseEmbeddingModel):
 
         start_time = time.time()
         try:
-            async with httpx.AsyncClient() as client:
-                logger.debug("Sending embedding request to OpenAI API")
-                response = await client.post(
-                    "https://api.openai.com/v1/embeddings",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={"input": text, "model": used_model, "encoding_format": encoding_format},
-                    timeout=60.0,  # Add longer timeout
-                )
-                response.raise_for_status()
-                result = response.json()["data"][0]["embedding"]
-                elapsed = time.time() - start_time
-                logger.debug(f"Embedding completed in {elapsed:.2f}s, vector size: {len(result)}")
-                return result
+            logger.debug("Sending embedding request to OpenAI API")
+            response = await self._post_with_retry(
+                {"input": text, "model": used_model, "encoding_format": encoding_format},
+                tokens=count_tokens(text),
+                timeout=60.0,  # Add longer timeout
+            )
+            result = response.json()["data"][0]["embedding"]
+            elapsed = time.time() - start_time
+            logger.debug(f"Embedding completed in {elapsed:.2f}s, vector size: {len(result)}")
+            return result
         except httpx.HTTPStatusError as e:
             logger.error(f"OpenAI API HTTP error: {e.response.status_code} - {e.response.text}")
             raise
@@ -89,51 +163,138 @@ class OpenAIText2Vec(BaseEmbeddingModel):
             logger.error(f"Unexpected error during embedding: {str(e)}")
             raise
 
-    async def _process_empty_texts(self, texts: List[str]) -> tuple:
-        """Process texts to separate empty from non-empty.
+    async def _post_with_retry(self, payload: dict, tokens: int, timeout: float) -> httpx.Response:
+        """Send an embeddings request under the rate limiter, retrying on 429 and 5xx.
 
-        Returns:
-            Tuple of (filtered_texts, empty_indices)
+        Retries back off exponentially with full jitter, honoring a Retry-After header. The
+        latency and throttling of every attempt are reported to the limit of the running sync.
         """
-        filtered_texts = []
-        empty_indices = []
-
-        for i, text in enumerate(texts):
-            if text.strip():
-                filtered_texts.append(text)
-            else:
-                empty_indices.append(i)
-
-        return filtered_texts, empty_indices
+        client, rate_limiter = _get_client_and_rate_limiter()
+        max_retries = settings.OPENAI_EMBEDDING_MAX_RETRIES
+
+        for attempt in range(max_retries + 1):
+            await rate_limiter.acquire(tokens)
+            try:
+                # Every attempt is reported to the running sync, also the 429s that we retry
+                with measure_stage("embedding"):
+                    response = await client.post(
+                        OPENAI_EMBEDDINGS_URL,
+                        headers={
+                            "Authorization": f"Bearer {self.api_key}",
+                            "Content-Type": "application/json",
+                        },
+                        json=payload,
+                        timeout=timeout,
+                    )
+                    response.raise_for_status()
+                return response
+            except (httpx.HTTPStatusError, httpx.TransportError) as e:
+                retry_after = None
+                if isinstance(e, httpx.HTTPStatusError):
+                    if e.response.status_code not in RETRY_STATUS_CODES:
+                        raise
+                    retry_after = e.response.headers.get("retry-after")
+                if attempt == max_retries:
+                    raise
+
+                delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt))
+                if retry_after:
+                    try:
+                        delay = max(delay, float(retry_after))
+                    except ValueError:
+                        pass
+                logger.warning(
+                    f"OpenAI embedding request failed ({e}), "
+                    f"retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries})"
+                )
+                await asyncio.sleep(delay)
+
+    def _split_into_sub_batches(self, texts: List[str], indices: List[int]) -> List[_SubBatch]:
+        """Group texts into sub-batches that respect the per-request input and token limits."""
+        token_budget = min(MAX_TOKENS_PER_REQUEST, settings.OPENAI_EMBEDDING_TOKENS_PER_REQUEST)
+
+        sub_batches: List[_SubBatch] = []
+        batch_indices: List[int] = []
+        batch_texts: List[str] = []
+        batch_tokens = 0
+
+        for i in indices:
+            tokens = count_tokens(texts[i])
+            if batch_texts and (
+                len(batch_texts) >= MAX_INPUTS_PER_REQUEST or batch_tokens + tokens > token_budget
+            ):
+                sub_batches.append(_SubBatch(batch_indices, batch_texts, batch_tokens))
+                batch_indices, batch_texts, batch_tokens = [], [], 0
+            batch_indices.append(i)
+            batch_texts.append(texts[i])
+            batch_tokens += tokens
+
+        if batch_texts:
+            sub_batches.append(_SubBatch(batch_indices, batch_texts, batch_tokens))
+        return sub_batches
 
     async def _make_openai_request(
-        self, filtered_texts: List[str], used_model: str, encoding_format: str
+        self, sub_batch: _SubBatch, used_model: str, encoding_format: str
     ) -> List:
-        """Make the actual request to OpenAI API.
+        """Make the actual request to OpenAI API for one sub-batch.
 
         Returns:
-            List of embeddings
+            List of embeddings in the order of the sub-batch texts, base64 encoded
+            embeddings are decoded into float32 arrays
         """
-        max_text_length = max(len(text) for text in filtered_texts) if filtered_texts else 0
-        logger.debug(f"Maximum text length in batch: {max_text_length} chars")
-
-        async with httpx.AsyncClient() as client:
-            logger.debug(f"Sending batch embedding request to OpenAI API using model {used_model}")
-            response = await client.post(
-                "https://api.openai.com/v1/embeddings",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "input": filtered_texts,
-                    "model": used_model,
-                    "encoding_format": encoding_format,
-                },
-                timeout=120.0,  # Longer timeout for batches
-            )
-            response.raise_for_status()
-            return [e["embedding"] for e in response.json()["data"]]
+        logger.debug(
+            f"Sending batch embedding request to OpenAI API using model {used_model} "
+            f"({len(sub_batch.texts)} texts, {sub_batch.tokens} tokens)"
+        )
+        response = await self._post_with_retry(
+            {
+                "input": sub_batch.texts,
+                "model": used_model,
+                "encoding_format": encoding_format,
+            },
+            tokens=sub_batch.tokens,
+            timeout=120.0,  # Longer timeout for batches
+        )
+        data = sorted(response.json()["data"], key=lambda e: e.get("index", 0))
+        return [
+            decode_base64_vector(e["embedding"])
+            if isinstance(e["embedding"], str)
+            else e["embedding"]
+            for e in data
+        ]
+
+    async def _embed_sub_batches(
+        self,
+        sub_batches: List[_SubBatch],
+        result: List[Vector],
+        used_model: str,
+        encoding_format: str,
+    ) -> None:
+        """Embed sub-batches concurrently, writing each vector to its input position.
+
+        When a sub-batch fails, the others are cancelled, so they neither use up the rate limit
+        nor write into the result after the error was raised.
+        """
+        semaphore = asyncio.Semaphore(settings.OPENAI_EMBEDDING_MAX_CONCURRENCY)
+
+        async def embed_sub_batch(sub_batch: _SubBatch) -> None:
+            async with semaphore:
+                embeddings = await self._make_openai_request(sub_batch, used_model, encoding_format)
+            if len(embeddings) != len(sub_batch.indices):
+                raise ValueError(
+                    f"Expected {len(sub_batch.indices)} embeddings, got {len(embeddings)}"
+                )
+            for i, embedding in zip(sub_batch.indices, embeddings, strict=True):
+                result[i] = self._format_vector(embedding)
+
+        tasks = [asyncio.create_task(embed_sub_batch(sub_batch)) for sub_batch in sub_batches]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
     async def embed_many(
         self,
@@ -141,9 +302,12 @@ class OpenAIText2Vec(BaseEmbeddingModel):
         model: Optional[str] = None,
         encoding_format: str = "float",
         dimensions: Optional[int] = None,
-    ) -> List[List[float]]:
+    ) -> List[Vector]:
         """Embed multiple text strings using OpenAI.
 
+        With compact_vectors set, float embeddings are requested base64 encoded and decoded
+        straight into float32 arrays, skipping the JSON float lists.
+
         Args:
             texts: List of texts to embed
             model: The OpenAI model to use (defaults to self.embedding_model)
@@ -164,41 +328,34 @@ class OpenAIText2Vec(BaseEmbeddingModel):
         # Log batch size
         logger.info(f"Embedding batch of {len(texts)} texts")
 
-        # Filter out empty texts and track their positions
-        filtered_texts, empty_indices = await self._process_empty_texts(texts)
+        # Empty texts get a zero vector, only the others are sent to OpenAI
+        result = [self._zero_vector() for _ in texts]
+        indices = [i for i, text in enumerate(texts) if text.strip()]
 
-        if not filtered_texts:
+        if not indices:
             logger.debug("All texts in batch were empty, returning zero vectors")
-            return [[0.0] * self.vector_dimensions] * len(texts)
+            return result
 
         # Log actual texts to embed
         logger.debug(
-            f"Embedding {len(filtered_texts)} non-empty texts "
-            f"(skipped {len(empty_indices)} empty texts)"
+            f"Embedding {len(indices)} non-empty texts "
+            f"(skipped {len(texts) - len(indices)} empty texts)"
         )
 
         used_model = model or self.embedding_model
+        if self.compact_vectors and encoding_format == "float":
+            encoding_format = "base64"
         start_time = time.time()
 
         try:
-            embeddings = await self._make_openai_request(
-                filtered_texts, used_model, encoding_format
-            )
-            elapsed = time.time() - start_time
-            logger.info(f"Batch embedding completed in {elapsed:.2f}s ({len(embeddings)} vectors)")
-
-            # Reinsert empty vectors at the correct positions
-            result = []
-            embedding_idx = 0
+            sub_batches = self._split_into_sub_batches(texts, indices)
+            await self._embed_sub_batches(sub_batches, result, used_model, encoding_format)
 
-            for i in range(len(texts)):
-                if i in empty_indices:
-                    result.append([0.0] * self.vector_dimensions)
-                else:
-                    result.append(embeddings[embedding_idx])
-                    embedding_idx += 1
-
-            logger.debug(f"Final result contains {len(result)} vectors")
+            elapsed = time.time() - start_time
+            logger.info(
+                f"Batch embedding completed in {elapsed:.2f}s "
+                f"({len(indices)} vectors, {len(sub_batches)} requests)"
+            )
             return result
         except httpx.HTTPStatusError as e:
             logger.error(f"OpenAI API HTTP error: {e.response.status_code} - {e.response.text}")
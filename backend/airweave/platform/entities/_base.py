@@ -7,11 +7,15 @@ import os
 import sys
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Type
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type, Union
 from uuid import UUID, uuid4
 
+import numpy as np
 from pydantic import BaseModel, Field, create_model
 
+from airweave.platform.embedding_models.bm25 import SparseVector
+from airweave.platform.entities._render import render_entity_text
+
 
 class DestinationAction(str, Enum):
     """Action for an entity."""
@@ -32,6 +36,9 @@ class Breadcrumb(BaseModel):
 class BaseEntity(BaseModel):
     """Base entity schema."""
 
+    # Fields rendered into the embeddable text, in order. None renders all content fields.
+    embeddable_fields: ClassVar[Optional[List[str]]] = None
+
     # Set in source connector
     entity_id: str = Field(
         ..., description="ID of the entity this entity represents in the source."
@@ -60,7 +67,12 @@ class BaseEntity(BaseModel):
         None, description="ID of the parent entity in the source."
     )
 
-    vector: Optional[List[float]] = Field(None, description="Vector representation of the entity.")
+    vector: Optional[Union[List[float], np.ndarray]] = Field(
+        None, description="Vector representation of the entity, a list or a float32 array."
+    )
+    sparse_vector: Optional[SparseVector] = Field(
+        None, description="Sparse BM25 term weights of the entity, used by hybrid search."
+    )
     chunk_index: Optional[int] = Field(
         None,
         description=(
@@ -75,6 +87,7 @@ class BaseEntity(BaseModel):
         """Pydantic config."""
 
         from_attributes = True
+        arbitrary_types_allowed = True
 
     def hash(self) -> str:
         """Hash the entity using only content-relevant fields."""
@@ -85,6 +98,7 @@ class BaseEntity(BaseModel):
         metadata_fields = {
             "sync_job_id",
             "vector",
+            "sparse_vector",
             "_hash",
             "db_entity_id",
             "source_name",
@@ -97,7 +111,7 @@ class BaseEntity(BaseModel):
         content_fields = all_fields - metadata_fields
 
         # Extract only content fields
-        data = {k: v for k, v in self.model_dump().items() if k in content_fields}
+        data = self.model_dump(include=content_fields)
 
         # Use stable serialization
         def stable_serialize(obj):
@@ -121,6 +135,16 @@ class BaseEntity(BaseModel):
         self._hash = hashlib.sha256(json_str.encode()).hexdigest()
         return self._hash
 
+    def to_embeddable_text(self) -> str:
+        """Render the entity as the compact text that is embedded.
+
+        The text is rendered once per entity and cached, so that embedding, token counting
+        and the embedding cache key all work off the same string.
+        """
+        if getattr(self, "_embeddable_text", None) is None:
+            self._embeddable_text = render_entity_text(self)
+        return self._embeddable_text
+
     def to_storage_dict(self, exclude_fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """Convert entity to a dictionary suitable for storage in vector databases.
 
@@ -133,14 +157,8 @@ class BaseEntity(BaseModel):
         Returns:
             Dict with all fields properly serialized for storage
         """
-        # Start with the full model dump
-        data = self.model_dump()
-
-        # Remove excluded fields
-        if exclude_fields:
-            for field in exclude_fields:
-                if field in data:
-                    del data[field]
+        # Dump the model without the excluded fields (e.g. without copying the vector)
+        data = self.model_dump(exclude=set(exclude_fields) if exclude_fields else None)
 
         # Fields that should remain as objects and not be JSON serialized
         object_fields = {"breadcrumbs"}
@@ -150,6 +168,9 @@ class BaseEntity(BaseModel):
             if key not in object_fields and isinstance(value, (dict, list)):
                 data[key] = json.dumps(value)
 
+        # The entity class, so that searches can be scoped to entity types
+        data["entity_type"] = type(self).__name__
+
         return data
 
 
@@ -159,6 +180,7 @@ class ChunkEntity(BaseEntity):
     # Default fields to exclude when creating storage dict
     default_exclude_fields: List[str] = [
         "vector",  # Exclude the vector itself from the payload
+        "sparse_vector",
         "sync_job_id",
         "sync_metadata",
         "parent_entity_id",
@@ -357,6 +379,7 @@ class FileEntity(BaseEntity):
         chunk_model = create_model(
             f"{class_name_prefix}Chunk", __base__=ChunkEntity, **chunk_fields
         )
+        chunk_model.embeddable_fields = ["md_parent_title", "md_title", "md_content"]
 
         # Set module name to match the source entity's module
         chunk_model.__module__ = cls.__module__
@@ -383,6 +406,14 @@ class FileEntity(BaseEntity):
 class CodeFileEntity(ChunkEntity):
     """Base schema for code file entities."""
 
+    embeddable_fields: ClassVar[Optional[List[str]]] = [
+        "repo_name",
+        "path_in_repo",
+        "language",
+        "summary",
+        "content",
+    ]
+
     # Basic entity fields
     source_name: str = Field(..., description="Source name")
     name: str = Field(..., description="File name")
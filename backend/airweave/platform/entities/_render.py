@@ -0,0 +1,134 @@
+"""Rendering of entities into the compact text that is embedded."""
+
+import re
+from datetime import date, datetime
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from airweave.platform.entities._base import BaseEntity
+
+# Fields set by the platform rather than the source, they carry no content
+SYSTEM_FIELDS = frozenset(
+    {
+        "entity_id",
+        "breadcrumbs",
+        "db_entity_id",
+        "source_name",
+        "sync_id",
+        "sync_job_id",
+        "url",
+        "sync_metadata",
+        "parent_entity_id",
+        "vector",
+        "sparse_vector",
+        "chunk_index",
+        "default_exclude_fields",
+        # File handling
+        "file_id",
+        "file_uuid",
+        "local_path",
+        "checksum",
+        "download_url",
+        "should_skip",
+        "mime_type",
+        "size",
+        "total_size",
+        # Polymorphic (table) entities
+        "schema_name",
+        "primary_key_columns",
+    }
+)
+
+_IDENTIFIER_SUFFIXES = ("_id", "_ids", "_url", "_urls", "_uuid", "_hash")
+
+
+def _is_identifier_field(name: str) -> bool:
+    """Whether a field name denotes an identifier or link rather than content."""
+    return name in ("id", "id_") or name.endswith(_IDENTIFIER_SUFFIXES)
+
+
+def _format_value(value: Any, include_scalars: bool) -> Optional[str]:
+    """Format a field value as compact text, or None if it carries no content.
+
+    Numbers, booleans, timestamps and UUIDs are only rendered when include_scalars is set.
+    """
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, str):
+        return value.strip() or None
+    if isinstance(value, (bool, int, float, datetime, date, UUID)):
+        return str(value) if include_scalars else None
+    if isinstance(value, BaseModel):
+        value = value.model_dump()
+    if isinstance(value, dict):
+        parts = []
+        for key, item in value.items():
+            text = _format_value(item, include_scalars)
+            if text and not _is_identifier_field(str(key)):
+                parts.append(f"{key}: {text}")
+        return "; ".join(parts) or None
+    if isinstance(value, (list, tuple, set)):
+        parts = [_format_value(item, include_scalars) for item in value]
+        return ", ".join(part for part in parts if part) or None
+    return str(value)
+
+
+def entity_type_label(entity_class: type) -> str:
+    """Readable entity type, e.g. "Todoist Task" for TodoistTaskEntity."""
+    name = entity_class.__name__.removesuffix("Entity")
+    return " ".join(re.findall(r"[A-Z]+(?![a-z])|[A-Z]?[a-z0-9]+", name)) or name
+
+
+def render_entity_text(entity: "BaseEntity") -> str:
+    """Render an entity as compact "field: value" lines for embedding.
+
+    If the entity class sets embeddable_fields, exactly those fields are rendered in that
+    order. Otherwise all fields are rendered except platform fields, identifiers and links,
+    and scalar values (numbers, flags, timestamps) that carry no content. The entity type
+    and its breadcrumb path are always included for context.
+    """
+    lines = [f"type: {entity_type_label(type(entity))}"]
+
+    path = " > ".join(breadcrumb.name for breadcrumb in entity.breadcrumbs if breadcrumb.name)
+    if path:
+        lines.append(f"path: {path}")
+
+    if entity.embeddable_fields is not None:
+        fields = entity.embeddable_fields
+        include_scalars = True
+    else:
+        fields = [
+            name
+            for name in type(entity).model_fields
+            if name not in SYSTEM_FIELDS and not _is_identifier_field(name)
+        ]
+        include_scalars = False
+
+    for name in fields:
+        text = _format_value(getattr(entity, name, None), include_scalars)
+        if text:
+            lines.append(f"{name}: {text}")
+
+    return "\n".join(lines)
+
+
+def render_payload_text(payload: dict) -> str:
+    """Render the content fields of a stored payload as compact "field: value" lines.
+
+    Used to show search results to a language model. Platform fields, identifiers and links
+    are left out, timestamps and numbers are kept since questions often refer to them.
+    """
+    lines = []
+    for name, value in payload.items():
+        if name in SYSTEM_FIELDS or name == "entity_type" or _is_identifier_field(name):
+            continue
+        text = _format_value(value, include_scalars=True)
+        if text:
+            lines.append(f"{name}: {text}")
+    return "\n".join(lines)
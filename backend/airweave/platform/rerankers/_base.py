@@ -0,0 +1,47 @@
+"""Base class for rerankers."""
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import List
+
+
+class BaseReranker(ABC):
+    """Scores search candidates against a query, higher scores rank first.
+
+    Rerankers see the candidates in retrieval order and score them in batches of batch_size.
+    Rerankers whose score of a text only depends on the query and the text set cacheable,
+    so that SearchService can cache their scores per (query, chunk).
+    """
+
+    name: str
+    cacheable: bool = True
+
+    def __init__(self, batch_size: int = 32) -> None:
+        """Initialize the reranker.
+
+        Args:
+            batch_size (int): Number of candidates scored per batch.
+        """
+        self.batch_size = batch_size
+
+    async def score(self, query: str, texts: List[str]) -> List[float]:
+        """Score texts against a query, batch by batch.
+
+        Args:
+            query (str): The search query.
+            texts (List[str]): The candidate texts in retrieval order.
+
+        Returns:
+            List[float]: A score per text.
+        """
+        if not texts:
+            return []
+
+        batches = [texts[i : i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+        scores = await asyncio.gather(*(self._score_batch(query, batch) for batch in batches))
+        return [score for batch_scores in scores for score in batch_scores]
+
+    @abstractmethod
+    async def _score_batch(self, query: str, texts: List[str]) -> List[float]:
+        """Score one batch of texts against a query."""
+        pass
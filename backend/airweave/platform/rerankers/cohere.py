@@ -0,0 +1,43 @@
+"""Reranker backed by the Cohere rerank API."""
+
+from typing import List
+
+from airweave.platform.utils.http import get_loop_bound_client
+
+from ._base import BaseReranker
+
+COHERE_RERANK_URL = "https://api.cohere.com/v2/rerank"
+
+
+class CohereReranker(BaseReranker):
+    """Hosted cross-encoder reranker, for deployments that prefer an API over a local model."""
+
+    name = "cohere"
+
+    def __init__(self, api_key: str, model: str = "rerank-v3.5", batch_size: int = 32) -> None:
+        """Initialize the reranker.
+
+        Args:
+            api_key (str): The Cohere API key.
+            model (str): The rerank model.
+            batch_size (int): Number of candidates scored per request.
+        """
+        super().__init__(batch_size=batch_size)
+        self.api_key = api_key
+        self.model = model
+
+    async def _score_batch(self, query: str, texts: List[str]) -> List[float]:
+        """Score one batch of texts with one API request."""
+        client = get_loop_bound_client("cohere_rerank", timeout=30.0)
+        response = await client.post(
+            COHERE_RERANK_URL,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            json={"model": self.model, "query": query, "documents": texts},
+        )
+        response.raise_for_status()
+
+        # Results are ordered by relevance and point back to the documents by index
+        scores = [0.0] * len(texts)
+        for result in response.json()["results"]:
+            scores[result["index"]] = float(result["relevance_score"])
+        return scores
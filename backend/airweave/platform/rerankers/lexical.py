@@ -0,0 +1,69 @@
+"""Lexical reranker that needs no model."""
+
+import math
+from collections import Counter
+from typing import List
+
+from airweave.platform.embedding_models.bm25 import tokenize
+
+from ._base import BaseReranker
+
+# Damping constant of the rank fusion, the same as the hybrid search fusion
+RRF_K = 60
+
+
+class LexicalReranker(BaseReranker):
+    """Promotes candidates that contain the query terms.
+
+    Candidates are scored with BM25 over the candidate set, and the BM25 ranking is fused with
+    the retrieval ranking, so that a chunk matching the exact query terms moves up without
+    losing what the vector search found. The scores depend on the whole candidate set, so all
+    candidates are scored at once and the scores are not cacheable.
+    """
+
+    name = "lexical"
+    cacheable = False
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75) -> None:
+        """Initialize the reranker.
+
+        Args:
+            k1 (float): Term frequency saturation.
+            b (float): Strength of the document length normalization.
+        """
+        super().__init__()
+        self.k1 = k1
+        self.b = b
+
+    async def score(self, query: str, texts: List[str]) -> List[float]:
+        """Score all candidates in one batch, their scores depend on each other."""
+        return await self._score_batch(query, texts) if texts else []
+
+    async def _score_batch(self, query: str, texts: List[str]) -> List[float]:
+        """Fuse the retrieval ranking with the BM25 ranking of the candidates."""
+        query_terms = set(tokenize(query))
+        documents = [Counter(tokenize(text)) for text in texts]
+        lengths = [sum(terms.values()) for terms in documents]
+        avg_length = sum(lengths) / len(lengths) or 1.0
+
+        bm25_scores = []
+        for terms, length in zip(documents, lengths, strict=True):
+            length_norm = 1 - self.b + self.b * length / avg_length
+            score = 0.0
+            for term in query_terms:
+                frequency = terms.get(term, 0)
+                if not frequency:
+                    continue
+                document_frequency = sum(1 for document in documents if term in document)
+                idf = math.log(
+                    1 + (len(documents) - document_frequency + 0.5) / (document_frequency + 0.5)
+                )
+                score += idf * frequency * (self.k1 + 1) / (frequency + self.k1 * length_norm)
+            bm25_scores.append(score)
+
+        bm25_order = sorted(range(len(texts)), key=lambda i: bm25_scores[i], reverse=True)
+        bm25_ranks = {index: rank for rank, index in enumerate(bm25_order, start=1)}
+        return [
+            1.0 / (RRF_K + i + 1) + (1.0 / (RRF_K + bm25_ranks[i]) if bm25_scores[i] else 0.0)
+            for i in range(len(texts))
+        ]
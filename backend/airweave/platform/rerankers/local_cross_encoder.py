@@ -0,0 +1,39 @@
+"""Local cross-encoder reranker served by a reranker inference container."""
+
+from typing import List
+
+from airweave.platform.utils.http import get_loop_bound_client
+
+from ._base import BaseReranker
+
+
+class LocalCrossEncoderReranker(BaseReranker):
+    """Cross-encoder that reads the query and each candidate together.
+
+    The model runs on the CPU in the reranker-transformers container (see docker-compose.yml),
+    by default ms-marco-MiniLM-L-6-v2, which scores 50 candidates in well under a second.
+    """
+
+    name = "local_cross_encoder"
+
+    def __init__(self, inference_url: str, batch_size: int = 32) -> None:
+        """Initialize the reranker.
+
+        Args:
+            inference_url (str): URL of the reranker inference API.
+            batch_size (int): Number of candidates scored per request.
+        """
+        super().__init__(batch_size=batch_size)
+        self.inference_url = inference_url
+
+    async def _score_batch(self, query: str, texts: List[str]) -> List[float]:
+        """Score one batch of texts with one inference request."""
+        client = get_loop_bound_client("local_cross_encoder", timeout=30.0)
+        response = await client.post(
+            f"{self.inference_url}/rerank", json={"query": query, "documents": texts}
+        )
+        response.raise_for_status()
+        scores = response.json()["scores"]
+        if len(scores) != len(texts):
+            raise ValueError(f"Expected {len(texts)} scores, got {len(scores)}")
+        return [float(score["score"]) for score in scores]
@@ -13,8 +13,9 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave import crud, schemas
+from airweave.core.config import settings
 from airweave.core.logging import logger
-from airweave.core.shared_models import SyncJobStatus, SyncStatus
+from airweave.core.shared_models import SyncJobStatus, SyncMode, SyncStatus
 from airweave.core.sync_service import sync_service
 from airweave.db.session import get_db_context
 from airweave.models.sync import Sync
@@ -342,6 +343,28 @@ class PlatformScheduler:
             )
             return False
 
+    async def _choose_sync_mode(self, db: AsyncSession, sync: schemas.Sync) -> SyncMode:
+        """Choose between a full and an incremental run of a scheduled sync.
+
+        A run is full when no full sync completed since the latest time the full sync cron of
+        the sync, or the default one, was due. Runs in between are incremental; the
+        orchestrator still runs them in full when the source does not support it.
+        """
+        if not settings.SYNC_INCREMENTAL_ENABLED:
+            return SyncMode.FULL
+
+        last_full_sync_at = await crud.sync_job.get_last_full_sync_at(db, sync_id=sync.id)
+        if last_full_sync_at is None:
+            return SyncMode.FULL
+
+        full_sync_cron = sync.full_sync_cron_schedule or settings.SYNC_FULL_SYNC_CRON_SCHEDULE
+        full_sync_due = ensure_utc(
+            croniter(full_sync_cron, datetime.now(timezone.utc)).get_prev(datetime)
+        )
+        if ensure_utc(last_full_sync_at) < full_sync_due:
+            return SyncMode.FULL
+        return SyncMode.INCREMENTAL
+
     async def _trigger_sync(self, db: AsyncSession, sync: schemas.Sync):
         """Trigger a sync job."""
         try:
@@ -361,10 +384,12 @@ class PlatformScheduler:
                 f"Found user {current_user.email} (id: {current_user.id}) for sync {sync.id}"
             )
 
+            sync_mode = await self._choose_sync_mode(db, sync)
+
             # Create a new sync job with unit of work
-            logger.debug(f"Creating new sync job for sync {sync.id}")
+            logger.debug(f"Creating new {sync_mode.value} sync job for sync {sync.id}")
             async with get_db_context() as db:
-                sync_job_in = schemas.SyncJobCreate(sync_id=sync.id)
+                sync_job_in = schemas.SyncJobCreate(sync_id=sync.id, sync_mode=sync_mode)
                 # Use the system user for creating the job
                 sync_job = await crud.sync_job.create(
                     db=db, obj_in=sync_job_in, current_user=current_user
@@ -402,17 +427,15 @@ class PlatformScheduler:
                 source_connection
             )
 
-            # Run the sync using the original user
+            # Run the sync using the original user, or queue it for the sync workers
             logger.info(f"Starting sync task for job {sync_job.id} (sync {sync.id})")
-            asyncio.create_task(
-                sync_service.run(
-                    sync,
-                    sync_job_schema,
-                    sync_dag_schema,
-                    collection,
-                    source_connection,
-                    current_user,
-                )
+            await sync_service.dispatch(
+                sync,
+                sync_job_schema,
+                sync_dag_schema,
+                collection,
+                source_connection,
+                current_user,
             )
 
             logger.info(
@@ -1,11 +1,14 @@
 """Base source class."""
 
 from abc import abstractmethod
+from datetime import datetime
 from typing import Any, AsyncGenerator, ClassVar, Dict, List, Optional
 
+import httpx
 from pydantic import BaseModel
 
 from airweave.core.logging import logger
+from airweave.platform.concurrency import reporting_http_client
 from airweave.platform.entities._base import ChunkEntity
 from airweave.platform.file_handling.file_manager import file_manager
 
@@ -16,6 +19,15 @@ class BaseSource:
     # Class variables for integration metadata
     _labels: ClassVar[List[str]] = []
 
+    # Sources that can resume a sync set this and call checkpoint() in generate_entities
+    supports_checkpoints: ClassVar[bool] = False
+    _resume_cursor: Optional[Dict[str, Any]] = None
+    _checkpoint_cursor: Optional[Dict[str, Any]] = None
+
+    # Sources that can fetch only changed entities set this and honor _changed_since
+    supports_incremental: ClassVar[bool] = False
+    _changed_since: Optional[datetime] = None
+
     @classmethod
     @abstractmethod
     async def create(
@@ -38,6 +50,58 @@ class BaseSource:
         """Generate entities for the source."""
         pass
 
+    def sync_changes_since(self, watermark: datetime) -> None:
+        """Make the next generate_entities call yield only entities changed since a watermark.
+
+        Entities that did not change may be yielded too, but every entity that was created or
+        updated at or after the watermark must be. Deleted entities are not detected, the
+        periodic full sync removes them.
+
+        Args:
+            watermark: Timezone-aware UTC time, already moved back by the configured overlap.
+        """
+        self._changed_since = watermark
+
+    def resume_from(self, cursor: Dict[str, Any]) -> None:
+        """Make the next generate_entities call start at a checkpoint of an earlier run.
+
+        Args:
+            cursor: A cursor that the source passed to checkpoint() before.
+        """
+        self._resume_cursor = cursor
+
+    def checkpoint(self, cursor: Dict[str, Any]) -> None:
+        """Record a point from which generate_entities can resume.
+
+        Called by the source while generating entities. The cursor must be JSON serializable,
+        e.g. a page token, the last primary key or the last modified timestamp, and must
+        cover every entity yielded so far: resuming from it yields the entities that come
+        after. The sync saves it once all those entities are stored.
+
+        Args:
+            cursor: The position in the source.
+        """
+        self._checkpoint_cursor = cursor
+
+    def pop_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Return the cursor recorded since the last call, if any."""
+        cursor, self._checkpoint_cursor = self._checkpoint_cursor, None
+        return cursor
+
+    def http_client(self, **kwargs: Any) -> httpx.AsyncClient:
+        """Create the HTTP client for the requests of the source.
+
+        The latency and rate limiting of its responses adjust the number of entities that the
+        sync processes at the same time.
+
+        Args:
+            **kwargs: Arguments of httpx.AsyncClient, e.g. base_url
+
+        Returns:
+            httpx.AsyncClient: The client, to be used as an async context manager
+        """
+        return reporting_http_client(**kwargs)
+
     async def process_file_entity(
         self, file_entity, download_url=None, access_token=None, headers=None
     ) -> Optional[ChunkEntity]:
@@ -143,7 +143,7 @@ class ClickUpSource(BaseSource):
     async def generate_entities(self) -> AsyncGenerator[Any, None]:
         """Generate all ClickUp entities (Workspaces, Spaces, Folders, Lists, Tasks, Comments)."""
         print("Generating ClickUp entities")
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             # Generate Workspace entities
             async for workspace in self._fetch_workspaces(client):
                 print(f"Generating Workspace entity: {workspace}")
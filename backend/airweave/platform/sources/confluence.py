@@ -384,7 +384,7 @@ class ConfluenceSource(BaseSource):
 
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:  # noqa: C901
         """Generate all Confluence content."""
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             # 1) Yield all spaces (top-level)
             async for space_entity in self._generate_space_entities(client):
                 yield space_entity
@@ -470,7 +470,7 @@ class DropboxSource(BaseSource):
             1. Account-level entities
             2. For each folder (including root), folder entity and its contents recursively
         """
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             # 1. Account(s)
             async for account_entity in self._generate_account_entities(client):
                 yield account_entity
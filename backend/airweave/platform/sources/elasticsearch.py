@@ -107,7 +107,7 @@ class ElasticsearchSource(BaseSource):
 
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:
         """Generate Elasticsearch index and document entities."""
-        async with httpx.AsyncClient(base_url=self.url) as client:
+        async with self.http_client(base_url=self.url) as client:
             # Get all indices and their stats
             params = {
                 "format": "json",
@@ -378,7 +378,7 @@ class GitHubSource(BaseSource):
         if not hasattr(self, "repo_name") or not self.repo_name:
             raise ValueError("Repository name must be specified")
 
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             repo_url = f"{self.BASE_URL}/repos/{self.repo_name}"
             repo_data = await self._get_with_auth(client, repo_url)
 
@@ -422,7 +422,7 @@ class GmailSource(BaseSource):
 
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:
         """Generate all Gmail entities: Labels, Threads (Messages), Drafts."""
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             # 1) Generate label entities
             async for label_entity in self._generate_label_entities(client):
                 yield label_entity
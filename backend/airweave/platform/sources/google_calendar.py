@@ -229,7 +229,7 @@ class GoogleCalendarSource(BaseSource):
           - Events for each calendar
           - FreeBusy data for each calendar (7-day window)
         """
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             # 1) Get the user's calendarList
             #    For each item, yield a CalendarList entity and store in memory for subsequent calls
             calendar_list_entries: List[GoogleCalendarListEntity] = []
@@ -14,7 +14,7 @@ References:
     https://developers.google.com/drive/api/v3/reference/files  (Files)
 """
 
-from typing import Any, AsyncGenerator, Dict, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
 import httpx
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
@@ -42,8 +42,16 @@ class GoogleDriveSource(BaseSource):
       - GoogleDriveDriveEntity objects, representing shared drives
       - GoogleDriveFileEntity objects, representing files in each shared drive
       - GoogleDriveFileEntity objects, representing files in the user's My Drive
+
+    The source checkpoints the drive and the next page token after every page of files, so
+    that a failed sync resumes at the file page it stopped at.
+
+    Incremental syncs list only the files modified since the watermark.
     """
 
+    supports_checkpoints = True
+    supports_incremental = True
+
     @classmethod
     async def create(
         cls, access_token: str, config: Optional[Dict[str, Any]] = None
@@ -134,15 +142,19 @@ class GoogleDriveSource(BaseSource):
         include_all_drives: bool,
         drive_id: Optional[str] = None,
         context: str = "",
+        page_token: Optional[str] = None,
     ) -> AsyncGenerator[Dict, None]:
         """Generic method to list files with configurable parameters.
 
+        The start of the listing and the next page token after every page are checkpointed.
+
         Args:
             client: HTTP client to use for requests
             corpora: Google Drive API corpora parameter ("drive" or "user")
             include_all_drives: Whether to include items from all drives
             drive_id: ID of the shared drive to list files from (only for corpora="drive")
             context: Context string for logging
+            page_token: Page token of a checkpoint to start at
         """
         url = "https://www.googleapis.com/drive/v3/files"
         params = {
@@ -156,11 +168,29 @@ class GoogleDriveSource(BaseSource):
             "modifiedTime, size, md5Checksum, webContentLink)",
         }
 
+        if self._changed_since is not None:
+            since = self._changed_since.strftime("%Y-%m-%dT%H:%M:%S")
+            params["q"] += f" and modifiedTime > '{since}'"
         if drive_id:
             params["driveId"] = drive_id
+        if page_token:
+            params["pageToken"] = page_token
+        else:
+            # Everything listed before this corpus is done
+            self.checkpoint({"corpus": drive_id or "user", "page_token": None})
 
         while url:
-            data = await self._get_with_auth(client, url, params=params)
+            try:
+                data = await self._get_with_auth(client, url, params=params)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 400 or page_token is None:
+                    raise
+                # The page token of the checkpoint expired, list the drive from the start
+                logger.warning(f"Checkpoint page token expired, relisting {drive_id or 'MY DRIVE'}")
+                params.pop("pageToken")
+                page_token = None
+                continue
+
             for file_obj in data.get("files", []):
                 log_context = f"drive_id {drive_id}" if drive_id else "MY DRIVE"
                 logger.info(f"\nfiles in {log_context}: {file_obj}\n")
@@ -171,6 +201,8 @@ class GoogleDriveSource(BaseSource):
             if not next_page_token:
                 break
             params["pageToken"] = next_page_token
+            page_token = None
+            self.checkpoint({"corpus": drive_id or "user", "page_token": next_page_token})
             url = "https://www.googleapis.com/drive/v3/files"
 
     def _build_file_entity(self, file_obj: Dict) -> Optional[GoogleDriveFileEntity]:
@@ -229,10 +261,11 @@ class GoogleDriveSource(BaseSource):
         include_all_drives: bool,
         drive_id: Optional[str] = None,
         context: str = "",
+        page_token: Optional[str] = None,
     ) -> AsyncGenerator[ChunkEntity, None]:
         """Generate file entities from a file listing."""
         async for file_obj in self._list_files(
-            client, corpora, include_all_drives, drive_id, context
+            client, corpora, include_all_drives, drive_id, context, page_token
         ):
             try:
                 # Check if file should be included based on exclusion patterns
@@ -263,6 +296,19 @@ class GoogleDriveSource(BaseSource):
                 )
                 raise
 
+    def _resume_drives(self, drive_ids: List[str]) -> Tuple[List[str], Dict[str, Any]]:
+        """Return the drives left to sync and the checkpoint to resume from.
+
+        A sync resumes at the drive and page of its checkpoint, if that drive is still there.
+        """
+        resume = self._resume_cursor or {}
+        resume_corpus = resume.get("corpus")
+        if resume_corpus == "user":
+            return [], resume
+        if resume_corpus in drive_ids:
+            return drive_ids[drive_ids.index(resume_corpus) :], resume
+        return drive_ids, {}
+
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:
         """Generate all Google Drive entities.
 
@@ -271,7 +317,7 @@ class GoogleDriveSource(BaseSource):
           - Files in each shared drive
           - Files in My Drive (corpora=user)
         """
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             # For testing: count file entities yielded
             file_entity_count = 0
             # Testing flag - set to True to stop after first file entity
@@ -287,13 +333,18 @@ class GoogleDriveSource(BaseSource):
             async for drive_obj in self._list_drives(client):
                 drive_ids.append(drive_obj["id"])
 
+            drive_ids, resume = self._resume_drives(drive_ids)
+            resume_corpus = resume.get("corpus")
+
             for drive_id in drive_ids:
+                page_token = resume.get("page_token") if drive_id == resume_corpus else None
                 async for file_entity in self._generate_file_entities(
                     client,
                     corpora="drive",
                     include_all_drives=True,
                     drive_id=drive_id,
                     context=f"drive {drive_id}",
+                    page_token=page_token,
                 ):
                     yield file_entity
                     file_entity_count += 1
@@ -304,8 +355,13 @@ class GoogleDriveSource(BaseSource):
             # 3) Finally, yield file entities for My Drive (corpora=user)
             # Only reach here if we didn't find any files in shared drives
             if not (stop_after_first_file and file_entity_count >= 4):
+                page_token = resume.get("page_token") if resume_corpus == "user" else None
                 async for mydrive_file_entity in self._generate_file_entities(
-                    client, corpora="user", include_all_drives=False, context="MY DRIVE"
+                    client,
+                    corpora="user",
+                    include_all_drives=False,
+                    context="MY DRIVE",
+                    page_token=page_token,
                 ):
                     yield mydrive_file_entity
                     file_entity_count += 1
@@ -182,7 +182,7 @@ class IntercomSource(BaseSource):
         Yields:
             Intercom entities: Contacts, Companies, Conversations, and Tickets.
         """
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             # Yield contact entities
             async for contact_entity in self._generate_contact_entities(client):
                 yield contact_entity
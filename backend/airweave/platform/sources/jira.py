@@ -7,6 +7,8 @@ References:
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/overview
 """
 
+import math
+from datetime import datetime, timezone
 from typing import Any, AsyncGenerator, Dict, Optional
 
 import httpx
@@ -38,8 +40,17 @@ class JiraSource(BaseSource):
     This connector retrieves hierarchical data from Jira's REST API:
       - Projects
       - Issues (within each project)
+
+    Projects and issues are read in key order, and the source checkpoints the project and
+    the last issue key after every issue page, so that a failed sync resumes after the last
+    issue page it stored.
+
+    Incremental syncs read all projects, but only the issues updated since the watermark.
     """
 
+    supports_checkpoints = True
+    supports_incremental = True
+
     @staticmethod
     async def _get_accessible_resources(access_token: str) -> list[dict]:
         """Get the list of accessible Atlassian resources for this token."""
@@ -233,6 +244,7 @@ class JiraSource(BaseSource):
             # Construct URL with pagination parameters
             project_search_url = (
                 f"{self.base_url}{search_api_path}?startAt={start_at}&maxResults={max_results}"
+                "&orderBy=key"
             )
             logger.info(f"Fetching project page {page} from {project_search_url}")
 
@@ -259,10 +271,24 @@ class JiraSource(BaseSource):
             logger.debug(f"Moving to next page, startAt={start_at}")
 
     async def _generate_issue_entities(
-        self, client: httpx.AsyncClient, project: JiraProjectEntity
+        self,
+        client: httpx.AsyncClient,
+        project: JiraProjectEntity,
+        after_issue_key: Optional[str] = None,
     ) -> AsyncGenerator[JiraIssueEntity, None]:
-        """Generate JiraIssueEntity for each issue in the given project using JQL search."""
+        """Generate JiraIssueEntity for each issue in the given project using JQL search.
+
+        Issues are ordered by key and start after after_issue_key. The last issue key of every
+        page is checkpointed.
+        """
         project_key = project.project_key
+        jql = f"project = {project_key}"
+        if after_issue_key:
+            jql += f" AND key > {after_issue_key}"
+        if self._changed_since is not None:
+            # A relative date does not depend on the time zone of the Jira user
+            elapsed = datetime.now(timezone.utc) - self._changed_since
+            jql += f" AND updated >= -{math.ceil(elapsed.total_seconds() / 60)}m"
         logger.info(f"Starting issue entity generation for project: {project_key} ({project.name})")
 
         # Setup for pagination
@@ -275,7 +301,7 @@ class JiraSource(BaseSource):
         while True:
             # Construct parameters with JQL query for the project
             params = {
-                "jql": f"project = {project_key}",
+                "jql": f"{jql} ORDER BY key ASC",
                 "startAt": start_at,
                 "maxResults": max_results,
                 "fields": "summary,description,status,issuetype,created,updated",
@@ -299,6 +325,9 @@ class JiraSource(BaseSource):
                 issue_entity = self._create_issue_entity(issue_data, project)
                 yield issue_entity
 
+            if issues:
+                self.checkpoint({"project_key": project_key, "after_issue_key": issues[-1]["key"]})
+
             # Check if we've processed all issues
             start_at += max_results
             page += 1
@@ -314,14 +343,29 @@ class JiraSource(BaseSource):
     async def generate_entities(self) -> AsyncGenerator[BaseEntity, None]:
         """Generate all entities from Jira."""
         logger.info("Starting Jira entity generation process")
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             project_count = 0
             issue_count = 0
             # Track already processed entity IDs with their type to avoid duplicates
             processed_entities = set()  # Will store tuples of (entity_id, key)
 
+            # Resume at the project and issue of the checkpoint
+            resume = self._resume_cursor or {}
+
             # 1) Generate (and yield) all Projects
             async for project_entity in self._generate_project_entities(client):
+                after_issue_key = None
+                if resume:
+                    # Projects are ordered by key, skip the ones before the checkpoint
+                    if project_entity.project_key < resume.get("project_key", ""):
+                        continue
+                    if project_entity.project_key == resume.get("project_key"):
+                        after_issue_key = resume.get("after_issue_key")
+                    resume = {}
+                else:
+                    # All projects before this one are done
+                    self.checkpoint({"project_key": project_entity.project_key})
+
                 project_count += 1
                 # Create a unique identifier for this project
                 project_identifier = (project_entity.entity_id, project_entity.project_key)
@@ -342,7 +386,9 @@ class JiraSource(BaseSource):
 
                 # 2) Generate (and yield) all Issues for each Project
                 project_issue_count = 0
-                async for issue_entity in self._generate_issue_entities(client, project_entity):
+                async for issue_entity in self._generate_issue_entities(
+                    client, project_entity, after_issue_key
+                ):
                     # Create a unique identifier for this issue
                     issue_identifier = (issue_entity.entity_id, issue_entity.issue_key)
 
@@ -763,7 +763,7 @@ class LinearSource(BaseSource):
         Yields:
             All Linear entities (teams, projects, users, issues, attachments)
         """
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             # Generate team entities
             try:
                 logger.info("Starting team entity generation")
@@ -454,7 +454,7 @@ class MondaySource(BaseSource):
             - Subitems per item
             - Updates per item or board
         """
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             # 1) Boards
             async for board_entity in self._generate_board_entities(client):
                 yield board_entity
@@ -162,7 +162,7 @@ class OneDriveSource(BaseSource):
           - OneDriveDriveEntity for each drive
           - OneDriveDriveItemEntity for each item in each drive (folders/files).
         """
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             # 1) Yield drive entities
             #    Note: We'll also collect them in memory to enumerate items from each drive
             drives = []
@@ -161,7 +161,7 @@ class OutlookCalendarSource(BaseSource):
 
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:
         """Generate all entities from Outlook Calendar: Calendars and Events."""
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             # 1) Get the user's calendars
             async for calendar_entity in self._generate_calendar_entities(client):
                 yield calendar_entity
@@ -174,7 +174,7 @@ class OutlookMailSource(BaseSource):
           - Mail folders (recursive)
           - Messages in each folder
         """
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             # 1) Generate all mail folders (including subfolders)
             #    and yield them as OutlookMailFolderEntity
             async for folder_entity in self._generate_folder_entities(client):
@@ -37,6 +37,24 @@ PG_TYPE_MAP = {
     "jsonb": Dict[str, Any],
 }
 
+# Primary key types that keyset pagination orders by and casts a text cursor value back to
+KEYSET_PK_TYPES = {
+    "integer",
+    "bigint",
+    "smallint",
+    "numeric",
+    "decimal",
+    "character varying",
+    "character",
+    "text",
+    "uuid",
+    "date",
+    "timestamp without time zone",
+    "timestamp with time zone",
+}
+
+BATCH_SIZE = 50
+
 
 @source(
     name="PostgreSQL",
@@ -54,8 +72,14 @@ class PostgreSQLSource(BaseSource):
     1. Discover tables and their structures
     2. Create appropriate entity classes dynamically
     3. Generate entities for each table's data
+
+    Tables are read in primary key order with keyset pagination, and the source checkpoints
+    the last primary key of every batch, so that a failed sync resumes where it stopped.
+    Tables without a usable primary key are read with OFFSET and resume from their start.
     """
 
+    supports_checkpoints = True
+
     def __init__(self):
         """Initialize the PostgreSQL source."""
         self.conn: Optional[asyncpg.Connection] = None
@@ -169,18 +193,19 @@ class PostgreSQLSource(BaseSource):
             "primary_keys": primary_keys,
         }
 
-    async def _create_entity_class(self, schema: str, table: str) -> Type[PolymorphicEntity]:
+    async def _create_entity_class(
+        self, schema: str, table: str, table_info: Dict[str, Any]
+    ) -> Type[PolymorphicEntity]:
         """Create a entity class for a specific table.
 
         Args:
             schema: Schema name
             table: Table name
+            table_info: Column and primary key information of the table
 
         Returns:
             Dynamically created entity class for the table
         """
-        table_info = await self._get_table_info(schema, table)
-
         return PolymorphicEntity.create_table_entity_class(
             table_name=table,
             schema_name=schema,
@@ -202,6 +227,7 @@ class PostgreSQLSource(BaseSource):
             FROM information_schema.tables
             WHERE table_schema = $1
             AND table_type = 'BASE TABLE'
+            ORDER BY table_name
         """
         tables = await self.conn.fetch(query, schema)
         return [table["table_name"] for table in tables]
@@ -247,6 +273,69 @@ class PostgreSQLSource(BaseSource):
 
             yield entity_class(entity_id=entity_id, **data)
 
+    async def _generate_table_entities(
+        self,
+        schema: str,
+        table: str,
+        entity_class: Type[PolymorphicEntity],
+        table_info: Dict[str, Any],
+        last_pk: Optional[List[str]] = None,
+    ) -> AsyncGenerator[ChunkEntity, None]:
+        """Generate the entities of one table, batch by batch.
+
+        Args:
+            schema: Schema name
+            table: Table name
+            entity_class: Entity class of the table
+            table_info: Column and primary key information of the table
+            last_pk: Primary key after which to start, as text values
+        """
+        primary_keys = table_info["primary_keys"]
+        pk_types = [table_info["columns"][pk]["pg_type"] for pk in primary_keys]
+
+        if not primary_keys or not all(pk_type in KEYSET_PK_TYPES for pk_type in pk_types):
+            offset = 0
+            while True:
+                # Fetch records in batches using LIMIT and OFFSET
+                batch_query = (
+                    f'SELECT * FROM "{schema}"."{table}" LIMIT {BATCH_SIZE} OFFSET {offset}'
+                )
+                records = await self.conn.fetch(batch_query)
+                if not records:
+                    break
+
+                async for entity in self._process_table_batch(schema, table, entity_class, records):
+                    yield entity
+                offset += BATCH_SIZE
+            return
+
+        pk_columns = ", ".join(f'"{pk}"' for pk in primary_keys)
+        while True:
+            if last_pk is None:
+                records = await self.conn.fetch(
+                    f'SELECT * FROM "{schema}"."{table}" ORDER BY {pk_columns} LIMIT {BATCH_SIZE}'
+                )
+            else:
+                # The cursor holds text values, cast back to the key's types for the comparison
+                params = ", ".join(
+                    f"${i}::text::{pk_type}" for i, pk_type in enumerate(pk_types, start=1)
+                )
+                records = await self.conn.fetch(
+                    f'SELECT * FROM "{schema}"."{table}" WHERE ({pk_columns}) > ({params}) '
+                    f"ORDER BY {pk_columns} LIMIT {BATCH_SIZE}",
+                    *last_pk,
+                )
+            if not records:
+                break
+
+            async for entity in self._process_table_batch(schema, table, entity_class, records):
+                yield entity
+
+            last_pk = [str(records[-1][pk]) for pk in primary_keys]
+            self.checkpoint({"table": table, "last_pk": last_pk})
+            if len(records) < BATCH_SIZE:
+                break
+
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:
         """Generate entities for all tables in specified schemas."""
         try:
@@ -254,38 +343,35 @@ class PostgreSQLSource(BaseSource):
             schema = self.config.get("schema", "public")
             tables = await self._get_table_list(schema)
 
+            # Skip the tables that were done before the checkpoint
+            last_pk = None
+            cursor = self._resume_cursor
+            if cursor and cursor.get("table") in tables:
+                tables = tables[tables.index(cursor["table"]) :]
+                last_pk = cursor.get("last_pk")
+
             # Start a transaction
             async with self.conn.transaction():
                 for table in tables:
+                    table_info = await self._get_table_info(schema, table)
+
                     # Create entity class if not already created
                     if f"{schema}.{table}" not in self.entity_classes:
                         self.entity_classes[f"{schema}.{table}"] = await self._create_entity_class(
-                            schema, table
+                            schema, table, table_info
                         )
 
                     entity_class = self.entity_classes[f"{schema}.{table}"]
-                    BATCH_SIZE = 50
-                    offset = 0
-
-                    while True:
-                        # Fetch records in batches using LIMIT and OFFSET
-                        batch_query = (
-                            f'SELECT * FROM "{schema}"."{table}" LIMIT {BATCH_SIZE} OFFSET {offset}'
-                        )
-                        records = await self.conn.fetch(batch_query)
-
-                        # Break if no more records
-                        if not records:
-                            break
 
-                        # Process the batch
-                        async for entity in self._process_table_batch(
-                            schema, table, entity_class, records
-                        ):
-                            yield entity
+                    if last_pk is None:
+                        # All tables before this one are done
+                        self.checkpoint({"table": table, "last_pk": None})
 
-                        # Increment offset for next batch
-                        offset += BATCH_SIZE
+                    async for entity in self._generate_table_entities(
+                        schema, table, entity_class, table_info, last_pk
+                    ):
+                        yield entity
+                    last_pk = None
 
         finally:
             if self.conn:
@@ -218,7 +218,7 @@ class SlackSource(BaseSource):
 
         Channels, Users, and Messages.
         """
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             # Yield channel entities
             async for channel_entity in self._generate_channel_entities(client):
                 yield channel_entity
@@ -484,7 +484,7 @@ class StripeSource(BaseSource):
         - Refunds
         - Subscriptions
         """
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             # 1) Single Balance resource
             async for balance_entity in self._generate_balance_entity(client):
                 yield balance_entity
@@ -259,7 +259,7 @@ class TrelloSource(BaseSource):
         This version includes a breadcrumb path to reflect the hierarchical
         structure: Organization → Board → List → Card, etc.
         """
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             # Yield all organization (workspace) entities
             async for org_entity in self._generate_organization_entities(client):
                 yield org_entity
@@ -194,7 +194,7 @@ class ZendeskSource(BaseSource):
         - Tickets
           - Comments for each ticket
         """
-        async with httpx.AsyncClient() as client:
+        async with self.http_client() as client:
             # 1) Yield organization entities
             async for org_entity in self._generate_organization_entities(client):
                 yield org_entity
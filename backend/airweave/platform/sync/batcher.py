@@ -0,0 +1,130 @@
+"""Micro-batching stage between entity processing and the destinations."""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, NamedTuple, Optional
+
+from airweave.platform.entities._base import BaseEntity, DestinationAction
+from airweave.schemas.entity import Entity
+
+
+class PendingEntity(NamedTuple):
+    """A transformed parent entity waiting to be embedded and persisted."""
+
+    parent_entity: BaseEntity
+    entities: list[BaseEntity]
+    db_entity: Optional[Entity]
+    action: DestinationAction
+
+
+FlushCallback = Callable[[list[PendingEntity]], Awaitable[None]]
+
+
+class EntityBatcher:
+    """Accumulates transformed entities across many source entities and flushes them together.
+
+    A flush is triggered when the buffered chunk count reaches `max_chunks` or when the oldest
+    buffered entity has waited `max_latency` seconds, whichever comes first. Each flush hands
+    the whole batch to `flush_callback`, so embedding and destination writes happen once per
+    batch instead of once per source entity.
+
+    Submitting into a full buffer flushes in the caller's task, which gives the worker pool
+    natural backpressure. If a batch fails, its entities are retried one by one so that the
+    failure is attributed to the entities that actually caused it.
+    """
+
+    def __init__(
+        self,
+        flush_callback: FlushCallback,
+        max_chunks: int = 256,
+        max_latency: float = 0.2,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            flush_callback: Coroutine that embeds and persists a batch of pending entities
+            max_chunks: Number of buffered chunks that triggers a flush
+            max_latency: Maximum time in seconds an entity waits in the buffer
+            logger: Optional contextualized logger, falls back to module logger if not provided
+        """
+        self.flush_callback = flush_callback
+        self.max_chunks = max_chunks
+        self.max_latency = max_latency
+        self.logger = logger or logging.getLogger(__name__)
+        self.failed_entity_ids: list[str] = []
+
+        self._buffer: list[PendingEntity] = []
+        self._buffered_chunks = 0
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+
+    async def submit(self, item: PendingEntity) -> None:
+        """Add a pending entity to the buffer, flushing if the batch is full."""
+        self._buffer.append(item)
+        self._buffered_chunks += max(len(item.entities), 1)
+
+        if self._buffered_chunks >= self.max_chunks:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_latency())
+
+    async def flush(self) -> None:
+        """Flush everything currently buffered."""
+        self._cancel_timer()
+        async with self._lock:
+            items, self._buffer = self._buffer, []
+            self._buffered_chunks = 0
+            if items:
+                await self._flush_items(items)
+
+    async def close(self) -> None:
+        """Flush the remaining buffer and stop the latency timer."""
+        await self.flush()
+        if self.failed_entity_ids:
+            self.logger.error(
+                f"{len(self.failed_entity_ids)} entities failed to persist: "
+                f"{self.failed_entity_ids[:20]}"
+            )
+
+    async def _flush_after_latency(self) -> None:
+        """Flush the buffer once the latency bound has passed."""
+        try:
+            await asyncio.sleep(self.max_latency)
+            await self.flush()
+        except asyncio.CancelledError:
+            pass
+
+    def _cancel_timer(self) -> None:
+        """Cancel the pending latency flush, unless we are running inside it."""
+        timer, self._timer = self._timer, None
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+
+    async def _flush_items(self, items: list[PendingEntity]) -> None:
+        """Flush a batch, falling back to per-entity flushes to isolate failures."""
+        chunk_count = sum(len(item.entities) for item in items)
+        self.logger.debug(f"Flushing batch of {len(items)} entities ({chunk_count} chunks)")
+
+        try:
+            await self.flush_callback(items)
+            return
+        except Exception as e:
+            if len(items) == 1:
+                self._record_failure(items[0], e)
+                return
+            self.logger.warning(
+                f"Batch of {len(items)} entities failed ({e}), retrying entities individually"
+            )
+
+        for item in items:
+            try:
+                await self.flush_callback([item])
+            except Exception as e:
+                self._record_failure(item, e)
+
+    def _record_failure(self, item: PendingEntity, error: Exception) -> None:
+        """Record an entity that could not be persisted."""
+        entity_id = item.parent_entity.entity_id
+        self.failed_entity_ids.append(entity_id)
+        self.logger.error(f"Error persisting entity {entity_id}: {str(error)}")
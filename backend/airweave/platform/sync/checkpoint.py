@@ -0,0 +1,98 @@
+"""Tracking and saving of source checkpoints during a sync."""
+
+import logging
+import time
+from collections import deque
+from typing import Any, AsyncGenerator, Deque, Dict, Optional, Tuple
+from uuid import UUID
+
+from airweave import crud
+from airweave.db.session import get_db_context
+from airweave.platform.entities._base import BaseEntity
+from airweave.platform.sources._base import BaseSource
+
+
+class SourceCheckpointTracker:
+    """Relates the checkpoints of a source to positions in its entity stream.
+
+    The source runs ahead of the entity processing, so the cursor it recorded last usually
+    covers entities that are not stored yet. `track` wraps the source's generator and notes,
+    for every checkpoint, how many entities the source had yielded before it. The orchestrator
+    counts the entities it takes from the stream and asks `due` for the latest checkpoint
+    before that count. Once it has stored every entity it took, it saves that checkpoint with
+    `save`, so a saved checkpoint never skips an entity that was not stored.
+    """
+
+    def __init__(
+        self,
+        source: BaseSource,
+        sync_job_id: UUID,
+        interval_seconds: float = 60.0,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """Initialize the tracker.
+
+        Args:
+            source: The source whose checkpoints are tracked
+            sync_job_id: The ID of the sync job the checkpoints are saved on
+            interval_seconds: Minimum time between two saved checkpoints
+            logger: Optional contextualized logger, falls back to module logger if not provided
+        """
+        self.source = source
+        self.sync_job_id = sync_job_id
+        self.interval_seconds = interval_seconds
+        self.logger = logger or logging.getLogger(__name__)
+        self.checkpoints_saved = 0
+
+        self._pending: Deque[Tuple[int, Dict[str, Any]]] = deque()
+        self._candidate: Optional[Dict[str, Any]] = None
+        self._produced = 0
+        self._last_saved = time.monotonic()
+
+    async def track(
+        self, entities: AsyncGenerator[BaseEntity, None]
+    ) -> AsyncGenerator[BaseEntity, None]:
+        """Pass the source's entities through, noting where the source checkpointed."""
+        async for entity in entities:
+            cursor = self.source.pop_checkpoint()
+            if cursor is not None:
+                self._pending.append((self._produced, cursor))
+            self._produced += 1
+            yield entity
+
+    def due(self, consumed: int) -> Optional[Dict[str, Any]]:
+        """Return a checkpoint to save, if one is due.
+
+        Args:
+            consumed: Number of entities taken from the stream so far
+
+        Returns:
+            The latest checkpoint that covers at most the consumed entities, once the interval
+            since the last saved checkpoint has passed.
+        """
+        while self._pending and self._pending[0][0] <= consumed:
+            self._candidate = self._pending.popleft()[1]
+
+        if self._candidate is None:
+            return None
+        if time.monotonic() - self._last_saved < self.interval_seconds:
+            return None
+
+        cursor, self._candidate = self._candidate, None
+        return cursor
+
+    async def save(self, cursor: Dict[str, Any]) -> None:
+        """Save a checkpoint on the sync job, all entities it covers must be stored.
+
+        Failures are logged, a sync does not fail because its checkpoint could not be saved.
+        """
+        self._last_saved = time.monotonic()
+        try:
+            async with get_db_context() as db:
+                await crud.sync_job.save_checkpoint(db, id=self.sync_job_id, cursor=cursor)
+        except Exception as e:
+            self.logger.warning(f"Could not save checkpoint {cursor}: {e}")
+            return
+
+        self.checkpoints_saved += 1
+        self.logger.debug(f"Saved checkpoint {cursor}")
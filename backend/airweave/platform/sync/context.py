@@ -11,14 +11,20 @@ from airweave.core import credentials
 from airweave.core.config import settings
 from airweave.core.exceptions import NotFoundException
 from airweave.core.logging import LoggerConfigurator, _ContextualLogger
+from airweave.core.shared_models import SyncMode
 from airweave.platform.auth.services import oauth2_service
 from airweave.platform.destinations._base import BaseDestination
 from airweave.platform.embedding_models._base import BaseEmbeddingModel
+from airweave.platform.embedding_models.cache import CachedEmbeddingModel, embedding_cache
 from airweave.platform.embedding_models.local_text2vec import LocalText2Vec
 from airweave.platform.embedding_models.openai_text2vec import OpenAIText2Vec
 from airweave.platform.entities._base import BaseEntity
 from airweave.platform.locator import resource_locator
 from airweave.platform.sources._base import BaseSource
+from airweave.platform.sync.batcher import EntityBatcher
+from airweave.platform.sync.checkpoint import SourceCheckpointTracker
+from airweave.platform.sync.entity_index import EntityHashIndex
+from airweave.platform.sync.ledger import EntityLedgerWriter
 from airweave.platform.sync.pubsub import SyncProgress
 from airweave.platform.sync.router import SyncDAGRouter
 
@@ -40,6 +46,14 @@ class SyncContext:
     - source connection - the source connection that the sync is for
     - white label (optional)
     - logger - contextual logger with sync job metadata
+    - entity index (optional) - prefetched entity hashes, set by the orchestrator
+    - batcher (optional) - micro-batching stage for embedding and persistence
+    - ledger (optional) - buffered writer for the entity table
+    - checkpoints (optional) - tracker of the source's resumable checkpoints
+    - failed entity ids - source entities that failed processing in this sync job
+    - entities encountered - entity ids per entity type seen in this sync job, set up by the
+      orchestrator from the DAG
+    - sync mode - whether the job runs as a full or an incremental sync, set by the orchestrator
     """
 
     source: BaseSource
@@ -58,6 +72,10 @@ class SyncContext:
     logger: _ContextualLogger
 
     white_label: Optional[schemas.WhiteLabel] = None
+    entity_index: Optional[EntityHashIndex] = None
+    batcher: Optional[EntityBatcher] = None
+    ledger: Optional[EntityLedgerWriter] = None
+    checkpoints: Optional[SourceCheckpointTracker] = None
 
     def __init__(
         self,
@@ -76,6 +94,10 @@ class SyncContext:
         current_user: schemas.User,
         logger: _ContextualLogger,
         white_label: Optional[schemas.WhiteLabel] = None,
+        entity_index: Optional[EntityHashIndex] = None,
+        batcher: Optional[EntityBatcher] = None,
+        ledger: Optional[EntityLedgerWriter] = None,
+        checkpoints: Optional[SourceCheckpointTracker] = None,
     ):
         """Initialize the sync context."""
         self.source = source
@@ -93,6 +115,13 @@ class SyncContext:
         self.current_user = current_user
         self.white_label = white_label
         self.logger = logger
+        self.entity_index = entity_index
+        self.batcher = batcher
+        self.ledger = ledger
+        self.checkpoints = checkpoints
+        self.failed_entity_ids: set[str] = set()
+        self.entities_encountered: dict[str, set[str]] = {}
+        self.sync_mode = SyncMode.FULL
 
 
 class SyncContextFactory:
@@ -252,6 +281,7 @@ class SyncContextFactory:
         """Get embedding model instance.
 
         If OpenAI API key is available, it will use OpenAI embeddings instead of local.
+        Unless disabled, the model is wrapped with the process-wide embedding cache.
 
         Args:
             sync (schemas.Sync): The sync configuration
@@ -264,11 +294,18 @@ class SyncContextFactory:
 
         if settings.OPENAI_API_KEY:
             logger.info(f"Using OpenAI embedding model (text-embedding-3-small) for sync {sync.id}")
-            return OpenAIText2Vec(api_key=settings.OPENAI_API_KEY)
+            embedding_model = OpenAIText2Vec(
+                api_key=settings.OPENAI_API_KEY,
+                compact_vectors=settings.EMBEDDING_COMPACT_VECTORS,
+            )
+        else:
+            # Otherwise use the local model
+            logger.info(f"Using local embedding model (MiniLM-L6-v2) for sync {sync.id}")
+            embedding_model = LocalText2Vec(compact_vectors=settings.EMBEDDING_COMPACT_VECTORS)
 
-        # Otherwise use the local model
-        logger.info(f"Using local embedding model (MiniLM-L6-v2) for sync {sync.id}")
-        return LocalText2Vec()
+        if settings.EMBEDDING_CACHE_ENABLED:
+            return CachedEmbeddingModel.wrap(embedding_model, embedding_cache)
+        return embedding_model
 
     @classmethod
     async def _create_destination_instances(
@@ -0,0 +1,197 @@
+"""Prefetched index of stored entity hashes used for change detection."""
+
+import os
+import sqlite3
+import tempfile
+from typing import Iterable, NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from airweave import crud
+from airweave.core.logging import logger
+
+_HEX_HASH_TAG = b"\x00"
+_RAW_HASH_TAG = b"\x01"
+
+
+class IndexedEntity(NamedTuple):
+    """An entity row as stored in the hash index."""
+
+    db_id: UUID
+    hash: str
+
+
+def _pack_hash(value: str) -> bytes:
+    """Pack a hash string into bytes, halving the size of hex digests."""
+    if len(value) == 64:
+        try:
+            return _HEX_HASH_TAG + bytes.fromhex(value)
+        except ValueError:
+            pass
+    return _RAW_HASH_TAG + value.encode()
+
+
+def _unpack_hash(value: bytes) -> str:
+    """Reverse _pack_hash."""
+    if value[:1] == _HEX_HASH_TAG:
+        return value[1:].hex()
+    return value[1:].decode()
+
+
+class EntityHashIndex:
+    """Maps source entity ids to their stored DB id and hash for a single sync.
+
+    The index is loaded once at the start of a sync so that INSERT / UPDATE / KEEP can be
+    resolved without a database round trip per entity. Entries are kept in a compact
+    in-memory dict (UUID and digest stored as raw bytes). Once the number of entries exceeds
+    `max_in_memory`, the index spills to a temporary SQLite file so that very large syncs
+    don't exhaust memory.
+    """
+
+    def __init__(self, max_in_memory: int = 500000):
+        """Initialize an empty index.
+
+        Args:
+            max_in_memory: Number of entries to keep in memory before spilling to disk
+        """
+        self.max_in_memory = max_in_memory
+        self.hits = 0
+        self.misses = 0
+        self._memory: dict[str, tuple[bytes, bytes]] = {}
+        self._disk: Optional[sqlite3.Connection] = None
+        self._disk_path: Optional[str] = None
+        self._size = 0
+
+    @classmethod
+    async def load(
+        cls,
+        db: AsyncSession,
+        sync_id: UUID,
+        page_size: int = 10000,
+        max_in_memory: int = 500000,
+    ) -> "EntityHashIndex":
+        """Load the (entity_id, hash) pairs of a sync into a new index.
+
+        Rows are streamed from the entity table in keyset-paginated pages, so the full
+        result set is never materialised at once.
+
+        Args:
+            db: The database session
+            sync_id: The ID of the sync to load the entity hashes for
+            page_size: Number of rows fetched per page
+            max_in_memory: Number of entries to keep in memory before spilling to disk
+
+        Returns:
+            The loaded index
+        """
+        index = cls(max_in_memory=max_in_memory)
+        after_entity_id = None
+        while True:
+            rows = await crud.entity.get_hash_page_by_sync_id(
+                db, sync_id=sync_id, after_entity_id=after_entity_id, limit=page_size
+            )
+            if not rows:
+                break
+            index.add_many(rows)
+            if len(rows) < page_size:
+                break
+            after_entity_id = rows[-1][1]
+
+        logger.info(
+            f"Loaded hash index for sync {sync_id} with {len(index)} entities "
+            f"({'disk' if index.is_spilled else 'memory'})"
+        )
+        return index
+
+    @property
+    def is_spilled(self) -> bool:
+        """Whether the index has spilled to its disk-backed store."""
+        return self._disk is not None
+
+    def __len__(self) -> int:
+        """Number of entities in the index."""
+        return self._size
+
+    def add_many(self, rows: Iterable[tuple[UUID, str, str]]) -> None:
+        """Add (db_id, entity_id, hash) rows to the index.
+
+        Args:
+            rows: The rows to add
+        """
+        packed = [
+            (entity_id, db_id.bytes, _pack_hash(entity_hash))
+            for db_id, entity_id, entity_hash in rows
+        ]
+
+        if self._disk is None and self._size + len(packed) > self.max_in_memory:
+            self._spill()
+
+        if self._disk is not None:
+            self._disk.executemany(
+                "INSERT OR REPLACE INTO entity_hash (entity_id, db_id, hash) VALUES (?, ?, ?)",
+                packed,
+            )
+            self._disk.commit()
+        else:
+            for entity_id, db_id, entity_hash in packed:
+                self._memory[entity_id] = (db_id, entity_hash)
+
+        self._size += len(packed)
+
+    def get(self, entity_id: str) -> Optional[IndexedEntity]:
+        """Look up an entity and record a hit or miss.
+
+        Args:
+            entity_id: The source entity ID
+
+        Returns:
+            The indexed entity, or None if the entity is not stored for this sync
+        """
+        if self._disk is not None:
+            row = self._disk.execute(
+                "SELECT db_id, hash FROM entity_hash WHERE entity_id = ?", (entity_id,)
+            ).fetchone()
+        else:
+            row = self._memory.get(entity_id)
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        db_id, entity_hash = row
+        return IndexedEntity(db_id=UUID(bytes=bytes(db_id)), hash=_unpack_hash(bytes(entity_hash)))
+
+    def close(self) -> None:
+        """Release the memory and disk resources held by the index."""
+        self._memory.clear()
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+        if self._disk_path:
+            try:
+                os.unlink(self._disk_path)
+            except OSError as e:
+                logger.warning(f"Could not remove hash index file {self._disk_path}: {e}")
+            self._disk_path = None
+
+    def _spill(self) -> None:
+        """Move the in-memory entries to a temporary SQLite file."""
+        fd, self._disk_path = tempfile.mkstemp(prefix="airweave-hash-index-", suffix=".sqlite")
+        os.close(fd)
+
+        self._disk = sqlite3.connect(self._disk_path, check_same_thread=False)
+        self._disk.execute("PRAGMA journal_mode=OFF")
+        self._disk.execute("PRAGMA synchronous=OFF")
+        self._disk.execute(
+            "CREATE TABLE entity_hash "
+            "(entity_id TEXT PRIMARY KEY, db_id BLOB NOT NULL, hash BLOB NOT NULL) WITHOUT ROWID"
+        )
+        self._disk.executemany(
+            "INSERT INTO entity_hash (entity_id, db_id, hash) VALUES (?, ?, ?)",
+            ((entity_id, db_id, h) for entity_id, (db_id, h) in self._memory.items()),
+        )
+        self._disk.commit()
+        self._memory.clear()
+        logger.info(f"Hash index exceeded {self.max_in_memory} entries, spilled to disk")
@@ -0,0 +1,119 @@
+"""Buffered writer for the entity table (the sync's entity ledger)."""
+
+import asyncio
+import logging
+from typing import Optional
+from uuid import UUID
+
+from airweave import crud
+from airweave.db.session import get_db_context
+from airweave.platform.entities._base import BaseEntity
+
+
+class EntityLedgerWriter:
+    """Collects (sync_id, entity_id, hash, sync_job_id) rows and flushes them in bulk.
+
+    Instead of a crud.entity.create / crud.entity.update call (and session) per parent entity,
+    rows are buffered and written with one multi-row INSERT ... ON CONFLICT upsert per
+    `batch_size` rows, committed per flush. The row id is taken from the parent entity's
+    db_entity_id, so callers know the id of newly inserted rows without a round trip.
+
+    Unchanged (KEEP) entities are buffered separately with `touch` and only get their
+    sync_job_id bumped, which is what the stale-entity cleanup at the end of a sync relies on.
+    """
+
+    def __init__(
+        self,
+        sync_id: UUID,
+        sync_job_id: UUID,
+        organization_id: UUID,
+        batch_size: int = 500,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """Initialize the ledger writer.
+
+        Args:
+            sync_id: The ID of the sync the rows belong to
+            sync_job_id: The ID of the sync job writing the rows
+            organization_id: The ID of the organization owning the sync
+            batch_size: Number of buffered rows that triggers a flush
+            logger: Optional contextualized logger, falls back to module logger if not provided
+        """
+        self.sync_id = sync_id
+        self.sync_job_id = sync_job_id
+        self.organization_id = organization_id
+        self.batch_size = batch_size
+        self.logger = logger or logging.getLogger(__name__)
+        self.rows_written = 0
+        self.rows_touched = 0
+
+        self._buffer: list[dict] = []
+        self._touched: list[str] = []
+        self._lock = asyncio.Lock()
+
+    async def add(self, parent_entity: BaseEntity) -> None:
+        """Buffer the entity row of a parent entity, flushing if the buffer is full.
+
+        A failed flush is logged and its rows are kept for the next flush, so that a transient
+        database error does not fail the batch the row was added from.
+        """
+        self._buffer.append(
+            {
+                "id": parent_entity.db_entity_id,
+                "sync_id": self.sync_id,
+                "sync_job_id": self.sync_job_id,
+                "entity_id": parent_entity.entity_id,
+                "hash": parent_entity.hash(),
+            }
+        )
+
+        await self._flush_if_full()
+
+    async def touch(self, entity_id: str) -> None:
+        """Buffer marking an unchanged entity as seen by this sync job."""
+        self._touched.append(entity_id)
+        await self._flush_if_full()
+
+    async def flush(self) -> None:
+        """Write all buffered rows to the entity table."""
+        async with self._lock:
+            rows, self._buffer = self._buffer, []
+            touched, self._touched = self._touched, []
+            if not rows and not touched:
+                return
+
+            try:
+                async with get_db_context() as db:
+                    written = await crud.entity.bulk_upsert(
+                        db, rows=rows, organization_id=self.organization_id
+                    )
+                    await crud.entity.bulk_update_sync_job_id(
+                        db,
+                        sync_id=self.sync_id,
+                        entity_ids=touched,
+                        sync_job_id=self.sync_job_id,
+                    )
+            except Exception:
+                # Keep the rows so the next flush retries them
+                self._buffer = rows + self._buffer
+                self._touched = touched + self._touched
+                raise
+
+            self.rows_written += written
+            self.rows_touched += len(touched)
+            self.logger.debug(
+                f"Flushed {written} rows to the entity ledger, touched {len(touched)} rows"
+            )
+
+    async def close(self) -> None:
+        """Flush the remaining rows, raising if they cannot be written."""
+        await self.flush()
+
+    async def _flush_if_full(self) -> None:
+        """Flush once the buffers hold a full batch."""
+        if len(self._buffer) + len(self._touched) < self.batch_size:
+            return
+        try:
+            await self.flush()
+        except Exception as e:
+            self.logger.error(f"Error flushing entity ledger, will retry: {str(e)}")
@@ -1,29 +1,43 @@
 """Module for data synchronization with improved architecture."""
 
+import asyncio
 import time
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import AsyncGenerator, Dict, List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave import crud, schemas
-from airweave.core.shared_models import SyncJobStatus
+from airweave.core.config import settings
+from airweave.core.search_cache import search_cache
+from airweave.core.shared_models import SyncJobStatus, SyncMode
 from airweave.core.sync_job_service import sync_job_service
 from airweave.db.session import get_db_context
+from airweave.platform.concurrency import bind_concurrency_limit, measure_stage
+from airweave.platform.embedding_models.bm25 import bm25_encoder
+from airweave.platform.embedding_models.cache import CachedEmbeddingModel
 from airweave.platform.entities._base import BaseEntity, DestinationAction
+from airweave.platform.sync.batcher import EntityBatcher, PendingEntity
+from airweave.platform.sync.checkpoint import SourceCheckpointTracker
 from airweave.platform.sync.context import SyncContext
+from airweave.platform.sync.entity_index import EntityHashIndex
+from airweave.platform.sync.ledger import EntityLedgerWriter
 from airweave.platform.sync.stream import AsyncSourceStream
-from airweave.platform.sync.worker_pool import AsyncWorkerPool
+from airweave.platform.sync.worker_pool import (
+    AdaptiveConcurrencyLimit,
+    AsyncWorkerPool,
+    global_worker_limit,
+)
 from airweave.schemas.dag import NodeType
 
 
 # Pipeline Pattern
 class EntityProcessor:
-    """Processes entities through a pipeline of stages."""
+    """Processes entities through a pipeline of stages.
 
-    def __init__(self):
-        """Initialize the entity processor with empty tracking dictionary."""
-        self._entities_encountered: dict[str, set[str]] = {}
+    The processor is shared by all syncs of a process, so it keeps no state of its own; what a
+    sync has encountered is tracked on its SyncContext.
+    """
 
     async def process(
         self,
@@ -38,25 +52,26 @@ class EntityProcessor:
 
             # Track the current entity
             entity_type = entity.__class__.__name__
+            entities_encountered = sync_context.entities_encountered
 
             # Validate entity type is known
-            if entity_type not in self._entities_encountered:
+            if entity_type not in entities_encountered:
                 raise ValueError(
                     f"Encountered unknown entity type: {entity_type}. This entity type is not "
                     f"registered in the system. Entity ID: {entity.entity_id}"
                 )
 
             # If we encounter the same entity from a different path, silently skip it
-            if entity.entity_id in self._entities_encountered[entity_type]:
+            if entity.entity_id in entities_encountered[entity_type]:
                 sync_context.logger.info("\nalready encountered this entity, so silently skip\n")
                 return []
 
             # Add the entity id to the entity_type set - we're processing it now
-            self._entities_encountered[entity_type].add(entity.entity_id)
+            entities_encountered[entity_type].add(entity.entity_id)
 
             # Update progress tracker with latest entities encountered
             # NOTE: this will only be published when the other stats are being published
-            await sync_context.progress.update_entities_encountered(self._entities_encountered)
+            await sync_context.progress.update_entities_encountered(entities_encountered)
 
             # Stage 1: Enrich entity with metadata
             enriched_entity = await self._enrich(entity, sync_context)
@@ -67,6 +82,7 @@ class EntityProcessor:
 
             # Stage 2.5: Skip further processing if KEEP
             if action == DestinationAction.KEEP:
+                await self._touch_ledger(enriched_entity, sync_context, db)
                 await sync_context.progress.increment("kept", 1)
                 return []
 
@@ -78,6 +94,17 @@ class EntityProcessor:
                 f"Transformed entity {entity.entity_id} into {len(processed_entities)} entities"
             )
 
+            # Stage 4 + 5: Hand off to the micro-batching stage if enabled, which embeds and
+            # persists entities together with those of other source entities
+            if sync_context.batcher is not None:
+                if not processed_entities:
+                    sync_context.logger.info(f"No processed entities for {entity.entity_id}")
+                    return []
+                await sync_context.batcher.submit(
+                    PendingEntity(enriched_entity, processed_entities, db_entity, action)
+                )
+                return processed_entities
+
             # Stage 4: Compute vector
             processed_entities_with_vector = await self._compute_vector(
                 processed_entities, sync_context
@@ -91,6 +118,8 @@ class EntityProcessor:
             return processed_entities
         except Exception as e:
             sync_context.logger.error(f"Error processing entity {entity.entity_id}: {str(e)}")
+            # Keep the stored state of the entity out of the stale entity cleanup
+            sync_context.failed_entity_ids.add(entity.entity_id)
             raise
 
     async def _enrich(self, entity: BaseEntity, sync_context: SyncContext) -> BaseEntity:
@@ -110,12 +139,15 @@ class EntityProcessor:
             f"Determining action for entity {entity.entity_id} (type: {type(entity).__name__})"
         )
 
+        current_hash = entity.hash()
+
+        if sync_context.entity_index is not None:
+            return await self._determine_action_from_index(entity, current_hash, sync_context, db)
+
         db_entity = await crud.entity.get_by_entity_and_sync_id(
             db=db, entity_id=entity.entity_id, sync_id=sync_context.sync.id
         )
 
-        current_hash = entity.hash()
-
         if db_entity:
             sync_context.logger.info(
                 f"Found existing entity in DB with id {db_entity.id}, "
@@ -141,6 +173,49 @@ class EntityProcessor:
 
         return db_entity, action
 
+    async def _determine_action_from_index(
+        self,
+        entity: BaseEntity,
+        current_hash: str,
+        sync_context: SyncContext,
+        db: AsyncSession,
+    ) -> tuple[Optional[schemas.Entity], DestinationAction]:
+        """Determine the action for an entity using the prefetched hash index.
+
+        INSERT and KEEP are resolved in memory. UPDATEs only read their DB row when the
+        entity table is written per entity; the buffered ledger just needs the row id.
+        """
+        indexed = sync_context.entity_index.get(entity.entity_id)
+        sync_context.progress.update_hash_index_stats(
+            sync_context.entity_index.hits, sync_context.entity_index.misses
+        )
+
+        if indexed is None:
+            sync_context.logger.info(
+                f"Entity {entity.entity_id} not in hash index for sync "
+                f"{sync_context.sync.id}, will INSERT"
+            )
+            return None, DestinationAction.INSERT
+
+        if indexed.hash == current_hash:
+            sync_context.logger.info(
+                f"Hashes match for entity {entity.entity_id}, will KEEP (no changes)"
+            )
+            return None, DestinationAction.KEEP
+
+        sync_context.logger.info(f"Hashes differ for entity {entity.entity_id}, will UPDATE")
+        if sync_context.ledger is not None:
+            entity.db_entity_id = indexed.db_id
+            return None, DestinationAction.UPDATE
+
+        db_entity = await crud.entity.get(
+            db, id=indexed.db_id, organization_id=sync_context.sync.organization_id
+        )
+        if db_entity is None:
+            # Row was removed after the index was loaded
+            return None, DestinationAction.INSERT
+        return db_entity, DestinationAction.UPDATE
+
     async def _transform(
         self,
         entity: BaseEntity,
@@ -233,8 +308,18 @@ class EntityProcessor:
                 f"Computing vectors for {entity_count} entities using {embedding_model.model_name}"
             )
 
+            # Render each entity once, the same text is counted, cached and embedded
+            entity_texts = []
+            for entity in processed_entities:
+                try:
+                    entity_texts.append(entity.to_embeddable_text())
+                except Exception as e:
+                    sync_context.logger.error(f"Error rendering entity text: {str(e)}")
+                    # Provide a fallback empty string to maintain array alignment
+                    entity_texts.append("")
+
             # Log entity content lengths for debugging
-            content_lengths = [len(str(entity.to_storage_dict())) for entity in processed_entities]
+            content_lengths = [len(text) for text in entity_texts]
             total_length = sum(content_lengths)
             avg_length = total_length / entity_count if entity_count else 0
             max_length = max(content_lengths) if content_lengths else 0
@@ -246,19 +331,11 @@ class EntityProcessor:
 
             start_time = time.time()
 
-            # Convert entities to dictionary representations
-            entity_dicts = []
-            for entity in processed_entities:
-                try:
-                    entity_dict = str(entity.to_storage_dict())
-                    entity_dicts.append(entity_dict)
-                except Exception as e:
-                    sync_context.logger.error(f"Error converting entity to dict: {str(e)}")
-                    # Provide a fallback empty string to maintain array alignment
-                    entity_dicts.append("")
-
             # Get embeddings from the model
-            embeddings = await embedding_model.embed_many(entity_dicts)
+            embeddings = await embedding_model.embed_many(entity_texts)
+
+            if settings.SEARCH_HYBRID_ENABLED:
+                await self._compute_sparse_vectors(processed_entities, entity_texts)
 
             elapsed = time.time() - start_time
             sync_context.logger.info(
@@ -281,7 +358,7 @@ class EntityProcessor:
                         sync_context.logger.warning(f"Received None vector for entity at index {i}")
                         continue
 
-                    vector_dim = len(vector) if vector else 0
+                    vector_dim = len(vector)
                     sync_context.logger.debug(
                         f"Assigning vector of dimension {vector_dim} to "
                         f"entity {processed_entity.entity_id}"
@@ -298,6 +375,17 @@ class EntityProcessor:
             sync_context.logger.error(f"Error computing vectors: {str(e)}")
             raise
 
+    async def _compute_sparse_vectors(
+        self, processed_entities: List[BaseEntity], entity_texts: List[str]
+    ) -> None:
+        """Compute the BM25 sparse vectors of entities from their embeddable texts.
+
+        The encoder runs locally on the CPU, so it is moved off the event loop.
+        """
+        sparse_vectors = await asyncio.to_thread(bm25_encoder.encode_documents, entity_texts)
+        for processed_entity, sparse_vector in zip(processed_entities, sparse_vectors, strict=True):
+            processed_entity.sparse_vector = sparse_vector if sparse_vector.indices else None
+
     async def _handle_keep(self, sync_context: SyncContext) -> None:
         """Handle KEEP action."""
         await sync_context.progress.increment(kept=1)
@@ -315,30 +403,17 @@ class EntityProcessor:
             sync_context.logger.info("No processed entities to insert")
             return
 
-        # Prepare entities with parent reference
-        for processed_entity in processed_entities:
-            if (
-                not hasattr(processed_entity, "parent_entity_id")
-                or not processed_entity.parent_entity_id
-            ):
-                processed_entity.parent_entity_id = parent_entity.entity_id
+        self._set_parent_reference(parent_entity, processed_entities)
 
         # Insert into database
-        new_db_entity = await crud.entity.create(
-            db=db,
-            obj_in=schemas.EntityCreate(
-                sync_job_id=sync_context.sync_job.id,
-                sync_id=sync_context.sync.id,
-                entity_id=parent_entity.entity_id,
-                hash=parent_entity.hash(),
-            ),
-            organization_id=sync_context.sync.organization_id,
+        await self._write_ledger(
+            parent_entity, db_entity, DestinationAction.INSERT, sync_context, db
         )
-        parent_entity.db_entity_id = new_db_entity.id
 
         # Insert to destinations
-        for destination in sync_context.destinations:
-            await destination.bulk_insert(processed_entities)
+        with measure_stage("destination"):
+            for destination in sync_context.destinations:
+                await destination.bulk_insert(processed_entities)
 
         await sync_context.progress.increment("inserted", 1)
 
@@ -356,7 +431,76 @@ class EntityProcessor:
             sync_context.logger.info("No processed entities to update")
             return
 
-        # Prepare entities with parent reference
+        self._set_parent_reference(parent_entity, processed_entities)
+
+        # Update hash in database
+        await self._write_ledger(
+            parent_entity, db_entity, DestinationAction.UPDATE, sync_context, db
+        )
+
+        # Update in destinations: overwrite the chunks in place, then drop chunks that are gone
+        with measure_stage("destination"):
+            for destination in sync_context.destinations:
+                await destination.bulk_insert(processed_entities)
+                await destination.bulk_delete_orphans(
+                    processed_entities, [parent_entity.entity_id], sync_context.sync.id
+                )
+
+        await sync_context.progress.increment("updated", 1)
+
+    async def _persist_batch(self, items: List[PendingEntity], sync_context: SyncContext) -> None:
+        """Embed and persist a batch of pending entities.
+
+        Called by the EntityBatcher. All chunks in the batch are embedded with a single
+        embedding call and written with a single bulk insert per destination. The entity
+        table is written last, so a failed batch leaves no ledger rows behind and can be
+        retried entity by entity.
+
+        Args:
+            items: The pending entities to persist
+            sync_context: The sync context
+        """
+        all_entities: List[BaseEntity] = []
+        for item in items:
+            self._set_parent_reference(item.parent_entity, item.entities)
+            if item.db_entity is not None:
+                item.parent_entity.db_entity_id = item.db_entity.id
+            all_entities.extend(item.entities)
+
+        await self._compute_vector(all_entities, sync_context)
+
+        updates = [item for item in items if item.action == DestinationAction.UPDATE]
+        with measure_stage("destination"):
+            for destination in sync_context.destinations:
+                await destination.bulk_insert(all_entities)
+                if updates:
+                    await destination.bulk_delete_orphans(
+                        [entity for item in updates for entity in item.entities],
+                        [item.parent_entity.entity_id for item in updates],
+                        sync_context.sync.id,
+                    )
+
+        async with get_db_context() as db:
+            for item in items:
+                await self._write_ledger(
+                    item.parent_entity, item.db_entity, item.action, sync_context, db
+                )
+
+        inserted = len(items) - len(updates)
+        if inserted:
+            await sync_context.progress.increment("inserted", inserted)
+        if updates:
+            await sync_context.progress.increment("updated", len(updates))
+
+    def _set_parent_reference(
+        self, parent_entity: BaseEntity, processed_entities: List[BaseEntity]
+    ) -> None:
+        """Point processed entities without a parent at the entity they were derived from.
+
+        Entities without a chunk index are numbered in order of appearance per entity ID, so
+        that every chunk maps to its own deterministic point in the destinations.
+        """
+        chunk_counts: Dict[str, int] = {}
         for processed_entity in processed_entities:
             if (
                 not hasattr(processed_entity, "parent_entity_id")
@@ -364,22 +508,68 @@ class EntityProcessor:
             ):
                 processed_entity.parent_entity_id = parent_entity.entity_id
 
-        # Update hash in database
-        await crud.entity.update(
-            db=db,
-            db_obj=db_entity,
-            obj_in=schemas.EntityUpdate(hash=parent_entity.hash()),
-        )
-        parent_entity.db_entity_id = db_entity.id
+            chunk_index = chunk_counts.get(processed_entity.entity_id, 0)
+            chunk_counts[processed_entity.entity_id] = chunk_index + 1
+            if processed_entity.chunk_index is None:
+                processed_entity.chunk_index = chunk_index
 
-        # Update in destinations (delete then insert)
-        for destination in sync_context.destinations:
-            await destination.bulk_delete_by_parent_id(
-                parent_entity.entity_id, sync_context.sync.id
+    async def _write_ledger(
+        self,
+        parent_entity: BaseEntity,
+        db_entity: Optional[schemas.Entity],
+        action: DestinationAction,
+        sync_context: SyncContext,
+        db: AsyncSession,
+    ) -> None:
+        """Record the parent entity and its hash in the entity table.
+
+        With a buffered ledger the row is queued for a bulk upsert, otherwise it is written
+        right away with the given session.
+        """
+        if sync_context.ledger is not None:
+            if db_entity is not None:
+                parent_entity.db_entity_id = db_entity.id
+            await sync_context.ledger.add(parent_entity)
+            return
+
+        if action == DestinationAction.INSERT:
+            new_db_entity = await crud.entity.create(
+                db=db,
+                obj_in=schemas.EntityCreate(
+                    sync_job_id=sync_context.sync_job.id,
+                    sync_id=sync_context.sync.id,
+                    entity_id=parent_entity.entity_id,
+                    hash=parent_entity.hash(),
+                ),
+                organization_id=sync_context.sync.organization_id,
             )
-            await destination.bulk_insert(processed_entities)
+            parent_entity.db_entity_id = new_db_entity.id
+        elif action == DestinationAction.UPDATE:
+            await crud.entity.update(
+                db=db,
+                db_obj=db_entity,
+                obj_in=schemas.EntityUpdate(hash=parent_entity.hash()),
+            )
+            parent_entity.db_entity_id = db_entity.id
 
-        await sync_context.progress.increment("updated", 1)
+    async def _touch_ledger(
+        self, parent_entity: BaseEntity, sync_context: SyncContext, db: AsyncSession
+    ) -> None:
+        """Mark an unchanged entity as seen by the current sync job.
+
+        Entities whose row is not written or touched by a sync job are removed by the stale
+        entity cleanup once the job completes.
+        """
+        if sync_context.ledger is not None:
+            await sync_context.ledger.touch(parent_entity.entity_id)
+            return
+
+        await crud.entity.bulk_update_sync_job_id(
+            db,
+            sync_id=sync_context.sync.id,
+            entity_ids=[parent_entity.entity_id],
+            sync_job_id=sync_context.sync_job.id,
+        )
 
 
 # Refactored Orchestrator
@@ -388,7 +578,6 @@ class SyncOrchestrator:
 
     def __init__(self):
         """Initialize the sync orchestrator."""
-        self.worker_pool = AsyncWorkerPool(max_workers=20)
         self.entity_processor = EntityProcessor()
 
     async def run(self, sync_context: SyncContext) -> schemas.Sync:
@@ -401,6 +590,21 @@ class SyncOrchestrator:
             # Initialize entity tracking with all known entity types
             self._initialize_entity_tracking(sync_context)
 
+            # Load stored entity hashes so change detection doesn't hit the DB per entity
+            await self._prefetch_entity_hashes(sync_context)
+
+            # Batch embedding and destination writes across source entities
+            self._initialize_batcher(sync_context)
+
+            # Buffer entity table writes into bulk upserts
+            self._initialize_ledger(sync_context)
+
+            # Fetch only the changes since the last completed job in incremental runs
+            await self._initialize_sync_mode(sync_context)
+
+            # Track source checkpoints, and resume from the last one of a failed run
+            await self._initialize_checkpoints(sync_context)
+
             # Mark job as started
             await sync_job_service.update_status(
                 sync_job_id=sync_context.sync_job.id,
@@ -415,6 +619,15 @@ class SyncOrchestrator:
             # Process entity stream
             await self._process_entity_stream(source_node, sync_context)
 
+            # Remove entities that were deleted in the source since the last sync. Incremental
+            # runs do not see unchanged entities, their deletions wait for the next full sync.
+            if sync_context.sync_mode == SyncMode.FULL:
+                await self._delete_stale_entities(sync_context)
+
+            self._log_embedding_cache_stats(sync_context)
+
+            await sync_context.progress.finalize(is_complete=True)
+
             # Use sync_job_service to update job status
             await sync_job_service.update_status(
                 sync_job_id=sync_context.sync_job.id,
@@ -432,6 +645,8 @@ class SyncOrchestrator:
         except Exception as e:
             sync_context.logger.error(f"Error during sync: {e}")
 
+            await sync_context.progress.finalize(is_complete=False)
+
             # Use sync_job_service to update job status
             await sync_job_service.update_status(
                 sync_job_id=sync_context.sync_job.id,
@@ -445,30 +660,290 @@ class SyncOrchestrator:
             )
 
             raise
+        finally:
+            # Completed and failed jobs may both have changed the collection
+            search_cache.invalidate_collection(sync_context.collection.id)
+
+            if sync_context.entity_index is not None:
+                sync_context.entity_index.close()
+                sync_context.entity_index = None
+
+    async def _prefetch_entity_hashes(self, sync_context: SyncContext) -> None:
+        """Load the stored (entity_id, hash) pairs of the sync into the sync context."""
+        if not settings.SYNC_HASH_PREFETCH_ENABLED:
+            return
+
+        async with get_db_context() as db:
+            sync_context.entity_index = await EntityHashIndex.load(
+                db,
+                sync_id=sync_context.sync.id,
+                page_size=settings.SYNC_HASH_PREFETCH_PAGE_SIZE,
+                max_in_memory=settings.SYNC_HASH_INDEX_MAX_IN_MEMORY,
+            )
+
+    def _initialize_batcher(self, sync_context: SyncContext) -> None:
+        """Attach a micro-batching stage to the sync context if batching is enabled."""
+        if not settings.SYNC_BATCHING_ENABLED:
+            return
+
+        async def flush(items: List[PendingEntity]) -> None:
+            await self.entity_processor._persist_batch(items, sync_context)
+
+        sync_context.batcher = EntityBatcher(
+            flush_callback=flush,
+            max_chunks=settings.SYNC_BATCH_MAX_CHUNKS,
+            max_latency=settings.SYNC_BATCH_MAX_LATENCY_MS / 1000,
+            logger=sync_context.logger,
+        )
+
+    def _initialize_ledger(self, sync_context: SyncContext) -> None:
+        """Attach a buffered entity ledger writer to the sync context if enabled."""
+        if not settings.SYNC_LEDGER_BUFFERING_ENABLED:
+            return
+
+        sync_context.ledger = EntityLedgerWriter(
+            sync_id=sync_context.sync.id,
+            sync_job_id=sync_context.sync_job.id,
+            organization_id=sync_context.sync.organization_id,
+            batch_size=settings.SYNC_LEDGER_BATCH_SIZE,
+            logger=sync_context.logger,
+        )
+
+    async def _initialize_sync_mode(self, sync_context: SyncContext) -> None:
+        """Decide whether the job runs incrementally and record its watermark.
+
+        An incremental job fetches the changes since the watermark of the last completed job.
+        It runs as a full sync instead when the source does not support incremental syncs or
+        no job completed yet.
+        """
+        source = sync_context.source
+        sync_mode = SyncMode.FULL
+
+        async with get_db_context() as db:
+            if (
+                sync_context.sync_job.sync_mode == SyncMode.INCREMENTAL
+                and settings.SYNC_INCREMENTAL_ENABLED
+                and source.supports_incremental
+            ):
+                watermark = await crud.sync_job.get_last_watermark(db, sync_id=sync_context.sync.id)
+                if watermark is not None:
+                    changed_since = watermark.replace(tzinfo=timezone.utc) - timedelta(
+                        seconds=settings.SYNC_INCREMENTAL_OVERLAP_SECONDS
+                    )
+                    source.sync_changes_since(changed_since)
+                    sync_mode = SyncMode.INCREMENTAL
+                    sync_context.logger.info(
+                        f"Running incremental sync of changes since {changed_since.isoformat()}"
+                    )
+
+            if sync_context.sync_job.sync_mode != sync_mode:
+                sync_context.logger.info("Running full sync instead of incremental sync")
+            await crud.sync_job.start_window(db, id=sync_context.sync_job.id, sync_mode=sync_mode)
+
+        sync_context.sync_mode = sync_mode
+
+    async def _initialize_checkpoints(self, sync_context: SyncContext) -> None:
+        """Attach a checkpoint tracker and resume the source from a saved checkpoint.
+
+        A job resumes from its own checkpoint when it was requeued, or from the checkpoint of
+        the previous job of the sync when that job failed recently. In the latter case the
+        entities the failed job stored are handed over to this job first, so that the stale
+        entity cleanup keeps the entities before the checkpoint.
+        """
+        source = sync_context.source
+        if not settings.SYNC_CHECKPOINTS_ENABLED or not source.supports_checkpoints:
+            return
+
+        sync_context.checkpoints = SourceCheckpointTracker(
+            source=source,
+            sync_job_id=sync_context.sync_job.id,
+            interval_seconds=settings.SYNC_CHECKPOINT_INTERVAL_SECONDS,
+            logger=sync_context.logger,
+        )
+
+        async with get_db_context() as db:
+            resumable = await crud.sync_job.get_resumable_checkpoint(
+                db,
+                sync_job_id=sync_context.sync_job.id,
+                sync_id=sync_context.sync.id,
+                max_age_seconds=settings.SYNC_RESUME_MAX_AGE_HOURS * 3600,
+            )
+            if resumable is None:
+                return
+
+            checkpoint_job_id, cursor = resumable
+            if checkpoint_job_id != sync_context.sync_job.id:
+                taken_over = await crud.entity.reassign_sync_job(
+                    db,
+                    sync_id=sync_context.sync.id,
+                    from_sync_job_id=checkpoint_job_id,
+                    to_sync_job_id=sync_context.sync_job.id,
+                )
+                await crud.sync_job.save_checkpoint(db, id=sync_context.sync_job.id, cursor=cursor)
+                await crud.sync_job.take_over_watermark(
+                    db, id=sync_context.sync_job.id, from_id=checkpoint_job_id
+                )
+                sync_context.logger.info(
+                    f"Took over {taken_over} entities of failed sync job {checkpoint_job_id}"
+                )
+
+        source.resume_from(cursor)
+        sync_context.logger.info(f"Resuming source from checkpoint {cursor}")
+
+    async def _save_checkpoint(
+        self, cursor: dict, in_flight: set[asyncio.Task], sync_context: SyncContext
+    ) -> None:
+        """Store everything taken from the stream so far, then save the checkpoint."""
+        if in_flight:
+            await asyncio.wait(in_flight)
+        if sync_context.batcher is not None:
+            await sync_context.batcher.flush()
+        if sync_context.ledger is not None:
+            try:
+                await sync_context.ledger.flush()
+            except Exception as e:
+                # The ledger keeps its rows for the next flush, the checkpoint waits for them
+                sync_context.logger.warning(f"Not saving checkpoint, ledger flush failed: {e}")
+                return
+        await sync_context.checkpoints.save(cursor)
+
+    async def _flush_pipeline(self, sync_context: SyncContext) -> None:
+        """Persist everything still buffered in the batching stage and the entity ledger."""
+        if sync_context.batcher is not None:
+            await sync_context.batcher.close()
+        if sync_context.ledger is not None:
+            await sync_context.ledger.close()
+            sync_context.logger.info(
+                f"Wrote {sync_context.ledger.rows_written} rows to the entity ledger, "
+                f"touched {sync_context.ledger.rows_touched} unchanged rows"
+            )
+
+    async def _delete_stale_entities(self, sync_context: SyncContext) -> None:
+        """Delete entities of the sync that the current sync job did not see.
+
+        Every entity the job inserted, updated or kept has its row stamped with the job's
+        sync_job_id, so any other row belongs to an entity that no longer exists in the source.
+        The outdated rows are streamed in pages; each page is deleted from every destination
+        with one bulk delete and then removed from the entity table. Entities that failed to
+        process in this job are left alone.
+        """
+        if not settings.SYNC_STALE_ENTITY_CLEANUP_ENABLED:
+            return
+
+        excluded = set(sync_context.failed_entity_ids)
+        if sync_context.batcher is not None:
+            excluded.update(sync_context.batcher.failed_entity_ids)
+
+        page_size = settings.SYNC_STALE_ENTITY_PAGE_SIZE
+        deleted = 0
+        after_entity_id = None
+
+        async with get_db_context() as db:
+            while True:
+                page = await crud.entity.get_outdated_page(
+                    db,
+                    sync_id=sync_context.sync.id,
+                    sync_job_id=sync_context.sync_job.id,
+                    after_entity_id=after_entity_id,
+                    limit=page_size,
+                )
+                if not page:
+                    break
+                after_entity_id = page[-1][1]
+
+                stale = [
+                    (db_id, entity_id) for db_id, entity_id in page if entity_id not in excluded
+                ]
+                if stale:
+                    entity_ids = [entity_id for _, entity_id in stale]
+                    for destination in sync_context.destinations:
+                        await destination.bulk_delete(entity_ids, sync_context.sync.id)
+                    await crud.entity.bulk_remove(db, ids=[db_id for db_id, _ in stale])
+
+                    deleted += len(stale)
+                    await sync_context.progress.increment("deleted", len(stale))
+
+                if len(page) < page_size:
+                    break
+
+        sync_context.logger.info(
+            f"Deleted {deleted} stale entities from sync {sync_context.sync.id}"
+        )
+
+    def _log_embedding_cache_stats(self, sync_context: SyncContext) -> None:
+        """Log how many of the sync's embeddings were served from the embedding cache."""
+        embedding_model = sync_context.embedding_model
+        if not isinstance(embedding_model, CachedEmbeddingModel):
+            return
+
+        lookups = embedding_model.cache_hits + embedding_model.cache_misses
+        hit_rate = embedding_model.cache_hits / lookups if lookups else 0.0
+        sync_context.logger.info(
+            f"Embedding cache: {embedding_model.cache_hits}/{lookups} texts served from cache "
+            f"({hit_rate:.1%}), process-wide stats: {embedding_model.cache.stats()}"
+        )
+
+    def _log_worker_pool_stats(
+        self, worker_pool: AsyncWorkerPool, sync_context: SyncContext
+    ) -> None:
+        """Log the concurrency the sync's worker pool ended with."""
+        sync_context.logger.info(
+            f"Worker pool: ended at a limit of {worker_pool.current_limit} concurrent entities "
+            f"(per-sync max {worker_pool.max_workers}, global max "
+            f"{global_worker_limit.max_workers})"
+        )
 
     async def _process_entity_stream(
         self, source_node: schemas.DagNode, sync_context: SyncContext
     ) -> None:
         """Process stream of entities from source."""
-        error_occurred = False
-
         sync_context.logger.info(
             f"Starting entity stream processing from source {sync_context.source._name}"
         )
 
+        entities = sync_context.source.generate_entities()
+        checkpoints = sync_context.checkpoints
+        if checkpoints is not None:
+            entities = checkpoints.track(entities)
+
+        # Every sync gets its own pool, so one that is throttled does not slow down the others
+        worker_pool = self._create_worker_pool()
+
+        # The source, embedding and destination calls of the sync report to the pool's limit
+        with bind_concurrency_limit(worker_pool.limit):
+            await self._consume_entity_stream(entities, worker_pool, source_node, sync_context)
+
+    async def _consume_entity_stream(
+        self,
+        entities: AsyncGenerator[BaseEntity, None],
+        worker_pool: AsyncWorkerPool,
+        source_node: schemas.DagNode,
+        sync_context: SyncContext,
+    ) -> None:
+        """Submit the entities of the source to the worker pool and wait for them."""
+        checkpoints = sync_context.checkpoints
+
+        # Tasks of this stream that are not done yet, awaited before saving a checkpoint
+        in_flight: set[asyncio.Task] = set()
+        consumed = 0
+
         # Use the stream as a context manager
-        async with AsyncSourceStream(
-            sync_context.source.generate_entities(), logger=sync_context.logger
-        ) as stream:
+        async with AsyncSourceStream(entities, logger=sync_context.logger) as stream:
             try:
                 # Process entities as they come
                 async for entity in stream.get_entities():
+                    if checkpoints is not None:
+                        cursor = checkpoints.due(consumed)
+                        if cursor is not None:
+                            await self._save_checkpoint(cursor, in_flight, sync_context)
+                    consumed += 1
+
                     if getattr(entity, "should_skip", False):
                         await sync_context.progress.increment("skipped")
                         continue  # Do not process further
 
                     # Submit each entity for processing in the worker pool
-                    task = await self.worker_pool.submit(
+                    task = await worker_pool.submit(
                         self._process_single_entity,
                         entity=entity,
                         source_node=source_node,
@@ -477,22 +952,49 @@ class SyncOrchestrator:
 
                     # Pythonic way to save entity for error reporting
                     task.entity = entity
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+
+                    sync_context.progress.update_worker_pool_stats(
+                        worker_pool.current_limit, worker_pool.queue_depth
+                    )
 
                     # If we have too many pending tasks, wait for some to complete
-                    if len(self.worker_pool.pending_tasks) >= self.worker_pool.max_workers * 2:
-                        await self.worker_pool.wait_for_batch(timeout=0.5)
+                    if len(worker_pool.pending_tasks) >= worker_pool.current_limit * 2:
+                        await worker_pool.wait_for_batch(timeout=0.5)
 
                 # Wait for all remaining tasks
-                await self.worker_pool.wait_for_completion()
+                await worker_pool.wait_for_completion()
                 sync_context.logger.info("All entity processing tasks completed")
+                self._log_worker_pool_stats(worker_pool, sync_context)
 
             except Exception as e:
                 sync_context.logger.error(f"Error during entity stream processing: {e}")
-                error_occurred = True
                 raise
             finally:
-                # Finalize progress
-                await sync_context.progress.finalize(is_complete=not error_occurred)
+                try:
+                    # Persist whatever is still buffered, also when the stream failed
+                    await self._flush_pipeline(sync_context)
+                except Exception as e:
+                    sync_context.logger.error(f"Error flushing buffered entities: {e}")
+                    raise
+
+    def _create_worker_pool(self) -> AsyncWorkerPool:
+        """Create the worker pool that processes the entities of one sync."""
+        limit = None
+        if settings.SYNC_WORKER_POOL_ADAPTIVE_ENABLED:
+            limit = AdaptiveConcurrencyLimit(
+                initial_limit=settings.SYNC_WORKER_POOL_INITIAL_WORKERS,
+                min_limit=settings.SYNC_WORKER_POOL_MIN_WORKERS,
+                max_limit=settings.SYNC_WORKER_POOL_MAX_WORKERS,
+            )
+            max_workers = settings.SYNC_WORKER_POOL_MAX_WORKERS
+        else:
+            max_workers = settings.SYNC_WORKER_POOL_INITIAL_WORKERS
+
+        return AsyncWorkerPool(
+            max_workers=max_workers, limit=limit, global_limit=global_worker_limit
+        )
 
     async def _process_single_entity(
         self, entity: BaseEntity, source_node: schemas.DagNode, sync_context: SyncContext
@@ -507,7 +1009,7 @@ class SyncOrchestrator:
 
     def _initialize_entity_tracking(self, sync_context: SyncContext) -> None:
         """Initialize entity tracking with entity types from the DAG."""
-        self.entity_processor._entities_encountered.clear()
+        sync_context.entities_encountered = {}
 
         # Get all entity nodes from the DAG
         entity_nodes = [node for node in sync_context.dag.nodes if node.type == NodeType.entity]
@@ -516,7 +1018,7 @@ class SyncOrchestrator:
         # Create a dictionary with entity names as keys and empty sets as values
         for node in entity_nodes:
             if node.name.endswith("Entity"):
-                self.entity_processor._entities_encountered[node.name] = set()
+                sync_context.entities_encountered[node.name] = set()
 
 
 # Singleton instance
@@ -18,6 +18,10 @@ class SyncProgressUpdate(BaseModel):
     deleted: int = 0
     kept: int = 0
     skipped: int = 0
+    hash_index_hits: int = 0
+    hash_index_misses: int = 0
+    worker_limit: int = 0
+    worker_queue_depth: int = 0
     entities_encountered: dict[str, int] = {}
     is_complete: bool = False  # Add completion flag
     is_failed: bool = False  # Add failure flag
@@ -141,6 +145,16 @@ class SyncProgress:
         # We don't publish here to avoid too frequent updates
         # Regular increment will trigger publishing based on threshold
 
+    def update_hash_index_stats(self, hits: int, misses: int) -> None:
+        """Update the hit/miss counters of the prefetched entity hash index."""
+        self.stats.hash_index_hits = hits
+        self.stats.hash_index_misses = misses
+
+    def update_worker_pool_stats(self, limit: int, queue_depth: int) -> None:
+        """Update the concurrency limit and queue depth of the sync's worker pool."""
+        self.stats.worker_limit = limit
+        self.stats.worker_queue_depth = queue_depth
+
 
 # Create a global instance for the entire app
 sync_pubsub = SyncPubSub()
@@ -1,48 +1,253 @@
 """Worker pool implementation for controlling async concurrency."""
 
 import asyncio
-from typing import Any, Callable
+import time
+from typing import Any, Callable, Dict, Optional
 
+from airweave.core.config import settings
 from airweave.core.logging import logger
+from airweave.platform.concurrency import is_throttling_error
+
+
+class _StageLatency:
+    """Short- and long-term moving averages of the latency of one pipeline stage."""
+
+    def __init__(self) -> None:
+        """Initialize the averages, which start at the first sample."""
+        self.short: Optional[float] = None
+        self.long: Optional[float] = None
+        self.samples = 0
+
+    def add(self, latency: float) -> None:
+        """Add a latency to the averages."""
+        if self.short is None or self.long is None:
+            self.short = self.long = latency
+        else:
+            self.short += 0.2 * (latency - self.short)
+            self.long += 0.02 * (latency - self.long)
+        self.samples += 1
+
+
+class AdaptiveConcurrencyLimit:
+    """Concurrency limit that adapts to the latency and throttling of the stages of a sync.
+
+    Additive increase, multiplicative decrease (AIMD): every entity task that completes while
+    the limit is in use raises it by 1/limit, so by about one per round of tasks. The stages
+    that call other services report to the limit on their own, see `measure_stage`: a
+    throttling error, or a short-term average latency of a stage that exceeds its long-term
+    average by the latency tolerance, multiplies the limit by the backoff ratio. Latencies are
+    averaged per stage, since a source page, an embedding batch and a destination upsert take
+    very different times. Only calls started after the last decrease can decrease it again, so
+    one burst of slow calls backs off once.
+
+    Fast sources, e.g. a local file system, grow the limit to its maximum, while the limit of a
+    sync whose source, embedding model or destination throttles stays low.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 50,
+        backoff_ratio: float = 0.9,
+        latency_tolerance: float = 2.0,
+        warmup_samples: int = 10,
+    ) -> None:
+        """Initialize the limit.
+
+        Args:
+            initial_limit (int): Limit before any task completed.
+            min_limit (int): Lowest limit, also under sustained throttling.
+            max_limit (int): Highest limit, however fast tasks complete.
+            backoff_ratio (float): Factor the limit is multiplied with on a decrease.
+            latency_tolerance (float): How many times slower than usual a stage may get before
+                the limit decreases.
+            warmup_samples (int): Number of calls per stage that set its usual latency before
+                its latency can decrease the limit.
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.warmup_samples = warmup_samples
+
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._latencies: Dict[str, _StageLatency] = {}
+        self._last_decrease = float("-inf")
+
+    @property
+    def limit(self) -> int:
+        """The number of tasks that may run at the same time."""
+        return int(self._limit)
+
+    def on_success(self, in_flight: int) -> None:
+        """Grow the limit for a completed task.
+
+        Args:
+            in_flight (int): Number of tasks that ran at the same time, including this one.
+        """
+        # Only grow a limit that is in use, an idle pool tells nothing about capacity
+        if in_flight * 2 >= self._limit:
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+    def on_throttled(self, started_at: float) -> None:
+        """Back off for a call that was rate limited or timed out.
+
+        Args:
+            started_at (float): `time.monotonic()` when the call started.
+        """
+        self._decrease(started_at)
+
+    def on_latency(self, stage: str, started_at: float, latency: float) -> None:
+        """Add the latency of a call of a stage, backing off when the stage got too slow.
+
+        Args:
+            stage (str): The stage of the call, e.g. "source" or "embedding".
+            started_at (float): `time.monotonic()` when the call started.
+            latency (float): Duration of the call in seconds.
+        """
+        stats = self._latencies.setdefault(stage, _StageLatency())
+        stats.add(latency)
+        if stats.samples > self.warmup_samples and stats.short > (
+            stats.long * self.latency_tolerance
+        ):
+            self._decrease(started_at)
+
+    def _decrease(self, started_at: float) -> None:
+        """Multiply the limit by the backoff ratio, once per round of calls."""
+        if started_at > self._last_decrease:
+            self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+            self._last_decrease = time.monotonic()
+
+
+class GlobalConcurrencyLimit:
+    """Ceiling on the tasks of all worker pools in this process together.
+
+    Every sync has its own AsyncWorkerPool with its own limit, this keeps many syncs with high
+    limits from overloading the process and the database connection pool.
+    """
+
+    def __init__(self, max_workers: int = settings.SYNC_WORKER_POOL_GLOBAL_MAX_WORKERS) -> None:
+        """Initialize the ceiling.
+
+        Args:
+            max_workers (int): Maximum number of tasks of all pools running at the same time.
+        """
+        self.max_workers = max_workers
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore of the ceiling, bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+
+global_worker_limit = GlobalConcurrencyLimit()
 
 
 class AsyncWorkerPool:
     """Manages a pool of workers with controlled concurrency.
 
-    This class limits how many async tasks can run at once using a semaphore,
-    preventing system overload when processing many items in parallel.
+    This class limits how many async tasks can run at once, preventing system overload when
+    processing many items in parallel. With an AdaptiveConcurrencyLimit the number follows the
+    completed tasks and the latency and throttling of the sync's stages, up to max_workers;
+    without one it is fixed at max_workers. A GlobalConcurrencyLimit caps the tasks of all
+    pools that share it.
     """
 
-    def __init__(self, max_workers: int = 20):
+    def __init__(
+        self,
+        max_workers: int = 20,
+        limit: Optional[AdaptiveConcurrencyLimit] = None,
+        global_limit: Optional[GlobalConcurrencyLimit] = None,
+    ):
         """Initialize worker pool with concurrency control.
 
         Args:
             max_workers: Maximum number of tasks allowed to run concurrently
+            limit: Optional adaptive limit on the number of tasks, at most max_workers
+            global_limit: Optional ceiling shared with other pools
         """
-        self.semaphore = asyncio.Semaphore(max_workers)
         self.pending_tasks = set()
         self.max_workers = max_workers
+        self.limit = limit
+        self.global_limit = global_limit
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def current_limit(self) -> int:
+        """The number of tasks that may run at the same time right now."""
+        if self.limit is None:
+            return self.max_workers
+        return min(self.limit.limit, self.max_workers)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of tasks running right now."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of submitted tasks waiting for a worker."""
+        return len(self.pending_tasks) - self._in_flight
 
     async def submit(self, coro: Callable, *args, **kwargs) -> asyncio.Task:
         """Submit a coroutine to be executed by the worker pool.
 
         Creates a task, adds it to our tracking set, and returns it.
-        Tasks run with controlled concurrency through the semaphore.
+        Tasks run with controlled concurrency once a worker is free.
         """
-        task = asyncio.create_task(self._run_with_semaphore(coro, *args, **kwargs))
+        task = asyncio.create_task(self._run_with_limit(coro, *args, **kwargs))
         self.pending_tasks.add(task)
         task.add_done_callback(self._handle_task_completion)
         return task
 
-    async def _run_with_semaphore(self, coro: Callable, *args, **kwargs) -> Any:
-        """Run a coroutine with semaphore control.
+    async def _run_with_limit(self, coro: Callable, *args, **kwargs) -> Any:
+        """Run a coroutine once the pool's limit and the global ceiling allow it.
+
+        Completed tasks grow an adaptive limit, tasks that fail with a throttling error
+        shrink it.
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.current_limit)
+            self._in_flight += 1
+
+        try:
+            if self.global_limit is None:
+                return await self._run_and_report(coro, *args, **kwargs)
+            async with self.global_limit.get_semaphore():
+                return await self._run_and_report(coro, *args, **kwargs)
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                # The limit may have grown, so wake every waiting task
+                self._condition.notify_all()
+
+    async def _run_and_report(self, coro: Callable, *args, **kwargs) -> Any:
+        """Run a coroutine and report its outcome to the adaptive limit.
 
-        Acquires a semaphore before running the coroutine, limiting concurrency.
-        Semaphore is automatically released when coroutine completes.
+        The duration of a task is not reported, it mixes stages that take very different
+        times, e.g. the task that fills a batch also waits for it to be embedded and stored.
+        The stages report their latencies with `measure_stage`.
         """
-        async with self.semaphore:
+        if self.limit is None:
             return await coro(*args, **kwargs)
 
+        started_at = time.monotonic()
+        try:
+            result = await coro(*args, **kwargs)
+        except Exception as e:
+            if is_throttling_error(e):
+                self.limit.on_throttled(started_at)
+            raise
+        self.limit.on_success(self._in_flight)
+        return result
+
     def _handle_task_completion(self, task: asyncio.Task) -> None:
         """Handle task completion and clean up."""
         self.pending_tasks.discard(task)
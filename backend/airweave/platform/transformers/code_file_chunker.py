@@ -2,13 +2,14 @@
 
 import os
 from copy import deepcopy
-from typing import List
+from typing import List, Optional, Tuple
 
 from chonkie import CodeChunker, SemanticChunker
 
 from airweave.core.logging import logger
 from airweave.platform.decorators import transformer
 from airweave.platform.entities._base import CodeFileEntity
+from airweave.platform.transformers.process_pool import transform_pool
 from airweave.platform.transformers.utils import (
     MARGIN_OF_ERROR,
     MAX_CHUNK_SIZE,
@@ -17,45 +18,39 @@ from airweave.platform.transformers.utils import (
 )
 
 
-@transformer(name="Code File Chunker")
-async def code_file_chunker(file: CodeFileEntity) -> List[CodeFileEntity]:
-    """Chunk a code file.
+def chunk_code_file(
+    name: str, model_json: str, content: str
+) -> Optional[List[Tuple[str, int, int, int]]]:
+    """Chunk the content of a code file that is too large.
 
-    This transformer:
-    1. Takes a CodeFileEntity as input
-    2. Uses Chonkie to chunk the code file if size is greater than 8191 tokens
-    3. Yields each chunk as a CodeFileEntity
+    Runs in a transformer worker process, see TransformProcessPool.
 
     Args:
-        file: The CodeFileEntity to process
+        name: The name of the file
+        model_json: The JSON dump of the file entity, whose tokens are counted
+        content: The content of the file
 
     Returns:
-        List[CodeFileEntity]: The processed chunks
+        The text, start index, end index and token count of every chunk, or None when the
+        file is small enough. An empty list means that chunking failed.
     """
-    logger.info(f"Starting code file chunker for file: {file.name} (file_id: {file.file_id})")
-
-    # If file.content is None, return empty list
-    if file.content is None:
-        logger.warning(f"File content is None for {file.name}, returning empty list")
-        return []
-
     # Count tokens in the file
-    token_count = count_tokens(file.model_dump_json())
-    logger.info(f"File {file.name} has {token_count} tokens")
+    token_count = count_tokens(model_json)
+    logger.info(f"File {name} has {token_count} tokens")
 
     # If the entire entity is small enough, return it as is
     if token_count <= MAX_CHUNK_SIZE - MARGIN_OF_ERROR:
-        logger.info(f"File {file.name} is small enough ({token_count} tokens), no chunking needed")
-        return [file]
+        logger.info(f"File {name} is small enough ({token_count} tokens), no chunking needed")
+        return None
 
     # Check if this is a text file by extension
-    file_extension = os.path.splitext(file.name)[1].lower().lstrip(".")
+    file_extension = os.path.splitext(name)[1].lower().lstrip(".")
     is_text_file = file_extension in ["txt", "text", "csv"]
-    logger.info(f"File {file.name} has extension {file_extension}, is_text_file={is_text_file}")
+    logger.info(f"File {name} has extension {file_extension}, is_text_file={is_text_file}")
 
     if is_text_file:
         # Use semantic chunking for text files instead of code chunking
-        logger.info(f"Using semantic chunker for text file {file.name}")
+        logger.info(f"Using semantic chunker for text file {name}")
         semantic_chunker = SemanticChunker(
             tokenizer_or_token_counter=count_tokens,
             chunk_size=MAX_CHUNK_SIZE - METADATA_SIZE,  # Leave room for metadata
@@ -64,18 +59,56 @@ async def code_file_chunker(file: CodeFileEntity) -> List[CodeFileEntity]:
             mode="window",  # Use window mode for comparison
             similarity_window=2,  # Consider 2 sentences for similarity
         )
-        chunks = semantic_chunker.chunk(file.content)
+        chunks = semantic_chunker.chunk(content)
         logger.debug(f"Semantic chunker produced {len(chunks)} chunks")
     else:
         # Use CodeChunker for actual code files
-        logger.info(f"Using code chunker for code file {file.name}")
+        logger.info(f"Using code chunker for code file {name}")
         code_chunker = CodeChunker(
             tokenizer_or_token_counter=count_tokens,
             chunk_size=MAX_CHUNK_SIZE - METADATA_SIZE,  # Leave room for metadata
         )
-        chunks = code_chunker.chunk(file.content)
+        chunks = code_chunker.chunk(content)
         logger.debug(f"Code chunker produced {len(chunks)} chunks")
 
+    return [
+        (chunk.text, chunk.start_index, chunk.end_index, count_tokens(chunk.text))
+        for chunk in chunks
+    ]
+
+
+@transformer(name="Code File Chunker")
+async def code_file_chunker(file: CodeFileEntity) -> List[CodeFileEntity]:
+    """Chunk a code file.
+
+    This transformer:
+    1. Takes a CodeFileEntity as input
+    2. Uses Chonkie to chunk the code file if size is greater than 8191 tokens
+    3. Yields each chunk as a CodeFileEntity
+
+    Args:
+        file: The CodeFileEntity to process
+
+    Returns:
+        List[CodeFileEntity]: The processed chunks
+    """
+    logger.info(f"Starting code file chunker for file: {file.name} (file_id: {file.file_id})")
+
+    # If file.content is None, return empty list
+    if file.content is None:
+        logger.warning(f"File content is None for {file.name}, returning empty list")
+        return []
+
+    # A token is at least one byte long, so small files need no token counting
+    model_json = file.model_dump_json()
+    if len(model_json.encode()) <= MAX_CHUNK_SIZE - MARGIN_OF_ERROR:
+        logger.info(f"File {file.name} is small enough, no chunking needed")
+        return [file]
+
+    chunks = await transform_pool.run(chunk_code_file, file.name, model_json, file.content)
+    if chunks is None:
+        return [file]
+
     if not chunks:  # If chunking failed or returned empty, return original
         logger.warning(
             f"Chunking failed or returned empty for {file.name}, returning original file"
@@ -87,17 +120,16 @@ async def code_file_chunker(file: CodeFileEntity) -> List[CodeFileEntity]:
     total_chunks = len(chunks)
     logger.info(f"Creating {total_chunks} chunked entities for {file.name}")
 
-    for idx, chunk in enumerate(chunks):
+    for idx, (chunk_text, start_index, end_index, chunk_token_count) in enumerate(chunks):
         # Create a deep copy of the original file
         chunked_file = deepcopy(file)
 
         # Update the content with just this chunk
-        chunked_file.content = chunk.text
-        chunk_token_count = count_tokens(chunked_file.content)
+        chunked_file.content = chunk_text
 
         logger.debug(
             f"Chunk {idx + 1}/{total_chunks} for {file.name}: {chunk_token_count} tokens, "
-            f"span: {chunk.start_index}-{chunk.end_index}"
+            f"span: {start_index}-{end_index}"
         )
 
         # Add chunk metadata to entity metadata
@@ -109,8 +141,8 @@ async def code_file_chunker(file: CodeFileEntity) -> List[CodeFileEntity]:
                 "chunk_index": idx + 1,
                 "total_chunks": total_chunks,
                 "original_file_id": file.file_id,
-                "chunk_start_index": chunk.start_index,
-                "chunk_end_index": chunk.end_index,
+                "chunk_start_index": start_index,
+                "chunk_end_index": end_index,
             }
         )
 
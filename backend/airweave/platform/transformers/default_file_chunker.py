@@ -1,11 +1,14 @@
 """Default file transformer using Chonkie for improved semantic chunking."""
 
+from typing import List
+
 from chonkie import RecursiveChunker, RecursiveLevel, RecursiveRules, SemanticChunker
 
 from airweave.core.logging import logger
 from airweave.platform.decorators import transformer
 from airweave.platform.entities._base import ChunkEntity, FileEntity, ParentEntity
 from airweave.platform.file_handling.conversion.factory import document_converter
+from airweave.platform.transformers.process_pool import transform_pool
 from airweave.platform.transformers.utils import MAX_CHUNK_SIZE, count_tokens
 
 
@@ -51,6 +54,40 @@ def get_semantic_chunker(max_chunk_size: int = MAX_CHUNK_SIZE):
     )
 
 
+def chunk_markdown(text: str) -> List[str]:
+    """Split markdown into chunks of at most MAX_CHUNK_SIZE tokens.
+
+    Runs in a transformer worker process, see TransformProcessPool.
+
+    Args:
+        text: The markdown of a converted file
+
+    Returns:
+        List[str]: The chunk texts
+    """
+    # Step 1: Initial chunking with RecursiveChunker
+    recursive_chunker = get_recursive_chunker()
+    initial_chunks = recursive_chunker.chunk(text)
+
+    # Step 2: Apply semantic chunking if any chunks are still too large
+    final_chunk_texts = []
+    semantic_chunker = None
+
+    for chunk in initial_chunks:
+        if chunk.token_count <= MAX_CHUNK_SIZE:
+            final_chunk_texts.append(chunk.text)
+        else:
+            # Only initialize the semantic chunker if needed
+            if not semantic_chunker:
+                semantic_chunker = get_semantic_chunker(MAX_CHUNK_SIZE)
+
+            # Apply semantic chunking to the large chunk
+            semantic_chunks = semantic_chunker.chunk(chunk.text)
+            final_chunk_texts.extend([sc.text for sc in semantic_chunks])
+
+    return final_chunk_texts
+
+
 @transformer(name="File Chunker")
 async def file_chunker(file: FileEntity) -> list[ParentEntity | ChunkEntity]:
     """Default file chunker that converts files to markdown chunks using Chonkie.
@@ -87,25 +124,7 @@ async def file_chunker(file: FileEntity) -> list[ParentEntity | ChunkEntity]:
             logger.warning(f"No content extracted from file {file.name}")
             return []
 
-        # Step 1: Initial chunking with RecursiveChunker
-        recursive_chunker = get_recursive_chunker()
-        initial_chunks = recursive_chunker.chunk(result.text_content)
-
-        # Step 2: Apply semantic chunking if any chunks are still too large
-        final_chunk_texts = []
-        semantic_chunker = None
-
-        for chunk in initial_chunks:
-            if chunk.token_count <= MAX_CHUNK_SIZE:
-                final_chunk_texts.append(chunk.text)
-            else:
-                # Only initialize the semantic chunker if needed
-                if not semantic_chunker:
-                    semantic_chunker = get_semantic_chunker(MAX_CHUNK_SIZE)
-
-                # Apply semantic chunking to the large chunk
-                semantic_chunks = semantic_chunker.chunk(chunk.text)
-                final_chunk_texts.extend([sc.text for sc in semantic_chunks])
+        final_chunk_texts = await transform_pool.run(chunk_markdown, result.text_content)
 
         # Create parent entity for the file using all fields from original entity
         file_data = file.model_dump()
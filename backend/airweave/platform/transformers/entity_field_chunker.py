@@ -1,13 +1,14 @@
 """Entity chunker for chunking large text fields in entities."""
 
 import math
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from chonkie import SemanticChunker
 
 from airweave.core.logging import logger
 from airweave.platform.decorators import transformer
 from airweave.platform.entities._base import BaseEntity
+from airweave.platform.transformers.process_pool import transform_pool
 from airweave.platform.transformers.utils import (
     MARGIN_OF_ERROR,
     MAX_CHUNK_SIZE,
@@ -94,6 +95,26 @@ def calculate_entity_size(entity_dict: Dict) -> Tuple[int, Dict[str, int]]:
     return total_size, field_sizes
 
 
+def max_entity_size(entity_dict: Dict) -> int:
+    """Upper bound of calculate_entity_size that needs no tokenizer.
+
+    A token is at least one byte long, so an entity has at most as many tokens as bytes.
+
+    Args:
+        entity_dict: Entity dictionary from model_dump()
+
+    Returns:
+        The UTF-8 size of the fields that calculate_entity_size counts
+    """
+    size = 0
+    for field_value in entity_dict.values():
+        if isinstance(field_value, str):
+            size += len(field_value.encode())
+        elif isinstance(field_value, (dict, list)):
+            size += len(str(field_value).encode())
+    return size
+
+
 def find_field_to_chunk(entity_dict: Dict, field_sizes: Dict[str, int]) -> Tuple[str, int]:
     """Find the largest chunkable field that contributes most to entity size.
 
@@ -119,33 +140,23 @@ def find_field_to_chunk(entity_dict: Dict, field_sizes: Dict[str, int]) -> Tuple
     return largest_field, largest_field_size
 
 
-@transformer(name="Entity Chunker")
-async def entity_chunker(entity: BaseEntity) -> List[BaseEntity]:
-    """Chunk large text fields in an entity with minimal cuts.
+def chunk_entity_dict(entity_dict: Dict) -> Optional[Tuple[str, List[str]]]:
+    """Chunk the largest text field of an entity that is too large.
 
-    This transformer ensures both individual fields and the overall entity size
-    remain under MAX_CHUNK_SIZE by:
-    1. Calculating the total entity size
-    2. Finding the largest field to chunk if needed
-    3. Creating appropriately sized chunks to keep the total entity size under MAX_CHUNK_SIZE
+    Runs in a transformer worker process, see TransformProcessPool.
 
     Args:
-        entity: The BaseEntity to process
+        entity_dict: Entity dictionary from model_dump()
 
     Returns:
-        List[BaseEntity]: Multiple copies of the entity with chunks of the large field
+        The name of the chunked field and its chunk texts, or None to keep the entity as is
     """
-    # Skip if already chunked
-    if getattr(entity, "chunk_index", None) is not None:
-        return [entity]
-
-    # Get entity data and calculate sizes
-    entity_dict = entity.model_dump()
+    entity_id = entity_dict.get("entity_id")
     total_size, field_sizes = calculate_entity_size(entity_dict)
 
     # If entity is small enough, return as is
     if total_size <= MAX_CHUNK_SIZE - MARGIN_OF_ERROR:
-        return [entity]
+        return None
 
     # Find the largest field to chunk
     largest_field, largest_field_size = find_field_to_chunk(entity_dict, field_sizes)
@@ -153,13 +164,13 @@ async def entity_chunker(entity: BaseEntity) -> List[BaseEntity]:
     # If no suitable field found, log warning and return original
     if not largest_field:
         logger.warning(
-            f"Entity {entity.entity_id} exceeds max size ({total_size} > {MAX_CHUNK_SIZE}), "
+            f"Entity {entity_id} exceeds max size ({total_size} > {MAX_CHUNK_SIZE}), "
             f"but no suitable field found for chunking"
         )
-        return [entity]
+        return None
 
     logger.info(
-        f"Chunking entity {entity.entity_id} (total size: {total_size}, max: {MAX_CHUNK_SIZE})"
+        f"Chunking entity {entity_id} (total size: {total_size}, max: {MAX_CHUNK_SIZE})"
         f" using field '{largest_field}' (size: {largest_field_size})"
     )
 
@@ -195,13 +206,46 @@ async def entity_chunker(entity: BaseEntity) -> List[BaseEntity]:
         f"{', '.join(str(size) for size in estimated_entity_sizes)}"
     )
 
+    return largest_field, [chunk.text for chunk in chunks]
+
+
+@transformer(name="Entity Chunker")
+async def entity_chunker(entity: BaseEntity) -> List[BaseEntity]:
+    """Chunk large text fields in an entity with minimal cuts.
+
+    This transformer ensures both individual fields and the overall entity size
+    remain under MAX_CHUNK_SIZE by:
+    1. Calculating the total entity size
+    2. Finding the largest field to chunk if needed
+    3. Creating appropriately sized chunks to keep the total entity size under MAX_CHUNK_SIZE
+
+    Args:
+        entity: The BaseEntity to process
+
+    Returns:
+        List[BaseEntity]: Multiple copies of the entity with chunks of the large field
+    """
+    # Skip if already chunked
+    if getattr(entity, "chunk_index", None) is not None:
+        return [entity]
+
+    # Get entity data; most entities are small enough without counting their tokens
+    entity_dict = entity.model_dump()
+    if max_entity_size(entity_dict) <= MAX_CHUNK_SIZE - MARGIN_OF_ERROR:
+        return [entity]
+
+    chunked = await transform_pool.run(chunk_entity_dict, entity_dict)
+    if chunked is None:
+        return [entity]
+    largest_field, chunk_texts = chunked
+
     # Create a copy of the entity for each chunk
     chunked_entities = []
     entity_class = type(entity)
 
-    for i, chunk in enumerate(chunks):
+    for i, chunk_text in enumerate(chunk_texts):
         # Create a new entity with the chunked field
-        chunked_entity_data = {**entity_dict, largest_field: chunk.text, "chunk_index": i}
+        chunked_entity_data = {**entity_dict, largest_field: chunk_text, "chunk_index": i}
         chunked_entity = entity_class(**chunked_entity_data)
         chunked_entities.append(chunked_entity)
 
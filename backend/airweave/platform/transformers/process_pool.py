@@ -0,0 +1,117 @@
+"""Process pool for CPU-bound transformer work."""
+
+import asyncio
+import multiprocessing
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.platform.transformers.utils import count_tokens
+
+T = TypeVar("T")
+
+
+def _initialize_worker() -> None:
+    """Prepare a worker process, once when it starts.
+
+    Interrupts are left to the parent process, which shuts the pool down. The tokenizer is
+    loaded up front, so that the first chunks a worker gets do not wait for it.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        count_tokens("")
+    except Exception as e:
+        # An initializer that raises breaks the whole pool, the tokenizer loads on first use
+        logger.warning(f"Could not load the tokenizer in a transformer worker: {e}")
+
+
+class TransformProcessPool:
+    """Runs the CPU-bound part of transformers in worker processes.
+
+    Chunking and token counting hold the GIL, so on the event loop one large file stalls every
+    other entity of the sync and the API. Transformers hand that work to `run` as a module-level
+    function with plain arguments, e.g. the text of a converted file, and build the entities from
+    the plain result again. Entity classes are not sent, since many of them are created at
+    runtime and cannot be pickled.
+
+    At most two tasks per process are submitted at a time. Further callers wait on the event
+    loop while holding their slot of the orchestrator's AsyncWorkerPool, so a busy pool slows
+    down the entity stream instead of queueing payloads in memory.
+
+    Without processes, the functions run directly on the event loop as before.
+    """
+
+    def __init__(self, processes: int = settings.SYNC_TRANSFORM_PROCESSES) -> None:
+        """Initialize the pool; the worker processes start on first use.
+
+        Args:
+            processes (int): Number of worker processes, 0 to run on the event loop.
+        """
+        self.processes = processes
+        self.max_pending = processes * 2
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether work runs in worker processes."""
+        return self.processes > 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Return the executor, starting it on first use or after it broke."""
+        if self._executor is None:
+            logger.info(f"Starting {self.processes} transformer worker processes")
+            # Forking a process with running threads and an event loop is not safe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_initialize_worker,
+            )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore that limits pending tasks, bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_pending)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a function in a worker process and return its result.
+
+        Args:
+            fn (Callable[..., T]): A module-level function; it and its arguments are pickled.
+            *args (Any): The arguments of the function.
+
+        Returns:
+            T: The result of the function.
+        """
+        if not self.enabled:
+            return fn(*args)
+
+        async with self._get_semaphore():
+            executor = self._get_executor()
+            try:
+                return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+            except BrokenProcessPool:
+                # A worker died, e.g. out of memory on a huge file. Start a new pool for the
+                # next task, this one fails.
+                logger.error("A transformer worker process died, restarting the pool")
+                if self._executor is executor:
+                    self._executor = None
+                    executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+    def shutdown(self) -> None:
+        """Stop the worker processes; they start again on next use."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+transform_pool = TransformProcessPool()
@@ -1,5 +1,7 @@
 """Utils for transformers."""
 
+from functools import lru_cache
+
 import tiktoken
 
 # Max chunk size for embedding models (e.g. OpenAI's text-embedding-ada-002)
@@ -8,7 +10,20 @@ MARGIN_OF_ERROR = 250
 METADATA_SIZE = 1000
 
 
+@lru_cache(maxsize=1)
+def _get_encoding() -> tiktoken.Encoding:
+    """Load the cl100k_base tokenizer once per process."""
+    return tiktoken.get_encoding("cl100k_base")
+
+
 def count_tokens(text: str) -> int:
     """Count tokens using the cl100k_base tokenizer (used by OpenAI's text-embedding models)."""
-    encoding = tiktoken.get_encoding("cl100k_base")
-    return len(encoding.encode(text))
+    return len(_get_encoding().encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut a text down to its first max_tokens tokens."""
+    tokens = _get_encoding().encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return _get_encoding().decode(tokens[:max_tokens])
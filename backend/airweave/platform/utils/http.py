@@ -0,0 +1,49 @@
+"""Process-wide HTTP clients shared across calls."""
+
+import asyncio
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+_loop_bound: Dict[str, Tuple[asyncio.AbstractEventLoop, Any]] = {}
+
+
+def get_loop_bound(key: str, factory: Callable[[], T]) -> T:
+    """Return the process-wide object of a key, created for the running event loop.
+
+    Clients, locks and semaphores can only be used from the loop they were created on, so the
+    object is created again by `factory` when called from a different loop, e.g. in another
+    test or worker thread.
+
+    Args:
+        key: Name of the object, unique per module that uses it
+        factory: Creates the object when there is none for the running loop
+
+    Returns:
+        The object of the key
+    """
+    loop = asyncio.get_running_loop()
+    bound = _loop_bound.get(key)
+    if bound is None or bound[0] is not loop:
+        bound = (loop, factory())
+        _loop_bound[key] = bound
+    return bound[1]
+
+
+def get_loop_bound_client(key: str, **kwargs: Any) -> httpx.AsyncClient:
+    """Return the process-wide HTTP client of a key, keeping connections alive across calls.
+
+    Args:
+        key: Name of the client, unique per module that uses it
+        **kwargs: Arguments of httpx.AsyncClient, used when the client is created
+
+    Returns:
+        The client, bound to the running event loop
+    """
+    client = get_loop_bound(key, lambda: httpx.AsyncClient(**kwargs))
+    if client.is_closed:
+        _loop_bound.pop(key)
+        client = get_loop_bound(key, lambda: httpx.AsyncClient(**kwargs))
+    return client
@@ -68,7 +68,7 @@ from .organization import (
     OrganizationInDBBase,
     OrganizationUpdate,
 )
-from .search import SearchResponse
+from .search import MultiCollectionSearchRequest, SearchParams, SearchResponse
 from .source import (
     Source,
     SourceCreate,
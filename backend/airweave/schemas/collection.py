@@ -9,7 +9,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
 
-from airweave.core.shared_models import CollectionStatus
+from airweave.core.shared_models import CollectionStatus, VectorStorageProfile
 
 
 def generate_readable_id(name: str) -> str:
@@ -81,7 +81,25 @@ class CollectionBase(BaseModel):
 class CollectionCreate(CollectionBase):
     """Schema for creating a collection."""
 
-    pass
+    vector_storage_profile: VectorStorageProfile = Field(
+        VectorStorageProfile.STANDARD,
+        description=(
+            "How vectors are stored: full precision in RAM (standard), quantized to int8 "
+            "(scalar) or to bits (binary) with rescoring, or entirely on disk (on_disk)"
+        ),
+    )
+    hnsw_m: Optional[int] = Field(
+        None,
+        ge=4,
+        le=128,
+        description="Edges per node of the HNSW index, higher improves recall but costs memory",
+    )
+    hnsw_ef_construct: Optional[int] = Field(
+        None,
+        ge=4,
+        le=1024,
+        description="Candidates considered while building the HNSW index",
+    )
 
 
 class CollectionUpdate(BaseModel):
@@ -105,6 +123,9 @@ class CollectionInDBBase(CollectionBase):
     organization_id: UUID
     created_by_email: EmailStr
     modified_by_email: EmailStr
+    vector_storage_profile: VectorStorageProfile = VectorStorageProfile.STANDARD
+    hnsw_m: Optional[int] = None
+    hnsw_ef_construct: Optional[int] = None
 
     class Config:
         """Pydantic config."""
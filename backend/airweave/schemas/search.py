@@ -1,9 +1,11 @@
 """Schemas for search."""
 
+from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
+from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class ResponseType(str, Enum):
@@ -21,6 +23,56 @@ class SearchStatus(str, Enum):
     NO_RESULTS = "no_results"
 
 
+class SearchParams(BaseModel):
+    """Schema for the parameters of a vector search.
+
+    All filters are combined with AND, the values within one filter with OR.
+    """
+
+    limit: int = Field(10, ge=1, le=100, description="Maximum number of results to return")
+    offset: int = Field(0, ge=0, description="Number of results to skip")
+    score_threshold: Optional[float] = Field(
+        None, description="Only return results with at least this score"
+    )
+    source_names: Optional[List[str]] = Field(
+        None, description="Only return entities from these sources"
+    )
+    sync_ids: Optional[List[UUID]] = Field(None, description="Only return entities of these syncs")
+    entity_types: Optional[List[str]] = Field(
+        None, description="Only return entities of these classes, e.g. SlackMessageEntity"
+    )
+    time_field: str = Field(
+        "created_at",
+        pattern=r"^[A-Za-z_][A-Za-z0-9_]*$",
+        description="Payload field that time_from and time_to apply to",
+    )
+    time_from: Optional[datetime] = Field(
+        None, description="Only return entities with time_field at or after this time"
+    )
+    time_to: Optional[datetime] = Field(
+        None, description="Only return entities with time_field at or before this time"
+    )
+    include_fields: Optional[List[str]] = Field(
+        None, description="Payload fields to return, all fields if not set"
+    )
+    rerank: Optional[bool] = Field(
+        None, description="Whether to rerank the results, the server default if not set"
+    )
+
+
+class MultiCollectionSearchRequest(BaseModel):
+    """Schema for a search across several collections."""
+
+    query: str = Field(..., description="Search query")
+    readable_ids: List[str] = Field(
+        ..., min_length=1, max_length=20, description="Readable IDs of the collections to search"
+    )
+    params: SearchParams = Field(
+        default_factory=SearchParams,
+        description="Pagination, filters and payload projection, applied to every collection",
+    )
+
+
 class SearchResponse(BaseModel):
     """Schema for search response."""
 
@@ -28,3 +80,4 @@ class SearchResponse(BaseModel):
     response_type: ResponseType
     completion: Optional[str] = None
     status: SearchStatus
+    prompt_tokens: Optional[int] = None
@@ -21,11 +21,13 @@ class SyncBase(BaseModel):
     destination_connection_ids: list[UUID]
     description: Optional[str] = None
     cron_schedule: Optional[str] = None  # Actual cron expression
+    # Cron expression of the full syncs, scheduled runs in between are incremental
+    full_sync_cron_schedule: Optional[str] = None
     next_scheduled_run: Optional[datetime] = None
     sync_metadata: Optional[dict] = None
     status: Optional[SyncStatus] = SyncStatus.ACTIVE
 
-    @field_validator("cron_schedule")
+    @field_validator("cron_schedule", "full_sync_cron_schedule")
     def validate_cron_schedule(cls, v: str) -> str:
         """Validate cron schedule format.
 
@@ -72,6 +74,7 @@ class SyncUpdate(BaseModel):
 
     name: Optional[str] = None
     cron_schedule: Optional[str] = None
+    full_sync_cron_schedule: Optional[str] = None
     next_scheduled_run: Optional[datetime] = None
     sync_metadata: Optional[dict] = None
     status: Optional[SyncStatus] = None
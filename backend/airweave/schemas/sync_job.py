@@ -6,6 +6,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, EmailStr, Field
 
+from airweave.core.shared_models import SyncMode
 from airweave.models.sync_job import SyncJobStatus
 
 
@@ -14,6 +15,7 @@ class SyncJobBase(BaseModel):
 
     sync_id: UUID
     status: SyncJobStatus = SyncJobStatus.PENDING
+    sync_mode: SyncMode = SyncMode.FULL
     entities_inserted: Optional[int] = 0
     entities_updated: Optional[int] = 0
     entities_deleted: Optional[int] = 0
@@ -87,6 +89,7 @@ class SyncJob(SyncJobInDBBase):
             created_at=self.created_at,
             modified_at=self.modified_at,
             status=self.status,
+            sync_mode=self.sync_mode,
             entities_inserted=self.entities_inserted,
             entities_updated=self.entities_updated,
             entities_deleted=self.entities_deleted,
@@ -115,6 +118,7 @@ class SourceConnectionJob(BaseModel):
     created_at: datetime
     modified_at: datetime
     status: SyncJobStatus = SyncJobStatus.PENDING
+    sync_mode: SyncMode = SyncMode.FULL
     entities_inserted: Optional[int] = 0
     entities_updated: Optional[int] = 0
     entities_deleted: Optional[int] = 0
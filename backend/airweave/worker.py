@@ -0,0 +1,207 @@
+"""Sync worker process.
+
+Sync workers run the sync jobs that the API and the scheduler leave in the sync_job table when
+SYNC_JOB_QUEUE_ENABLED is set. Any number of workers can run next to each other, on any node
+that reaches the database: jobs are claimed with SELECT ... FOR UPDATE SKIP LOCKED, so every job
+runs on one worker. A worker renews the lease of each of its jobs with heartbeats. When a worker
+dies, its leases expire and another worker takes the jobs over.
+
+Run with:
+    airweave-worker --concurrency 4
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import socket
+import sys
+import uuid
+from typing import Dict, Optional
+from uuid import UUID
+
+from airweave import crud
+from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.core.sync_service import sync_service
+from airweave.db.session import get_db_context
+from airweave.platform.entities._base import ensure_file_entity_models
+from airweave.platform.transformers.process_pool import transform_pool
+
+
+class SyncWorker:
+    """Pulls sync jobs from the queue and runs up to `concurrency` of them at a time."""
+
+    def __init__(
+        self,
+        concurrency: int = settings.SYNC_WORKER_CONCURRENCY,
+        poll_seconds: float = settings.SYNC_WORKER_POLL_SECONDS,
+        lease_seconds: int = settings.SYNC_JOB_LEASE_SECONDS,
+        heartbeat_seconds: int = settings.SYNC_JOB_HEARTBEAT_SECONDS,
+        max_attempts: int = settings.SYNC_JOB_MAX_ATTEMPTS,
+        worker_id: Optional[str] = None,
+    ) -> None:
+        """Initialize the worker.
+
+        Args:
+            concurrency (int): Number of jobs run at the same time.
+            poll_seconds (float): How often to look for jobs while idle or full.
+            lease_seconds (int): How long a claimed job stays leased without a heartbeat.
+            heartbeat_seconds (int): How often the leases of running jobs are renewed.
+            max_attempts (int): Number of times a job is claimed before it is failed.
+            worker_id (Optional[str]): ID of the worker in the lease columns, defaults to the
+                host name and process ID.
+        """
+        if heartbeat_seconds >= lease_seconds:
+            raise ValueError("The heartbeat interval must be shorter than the lease")
+
+        self.concurrency = concurrency
+        self.poll_seconds = poll_seconds
+        self.lease_seconds = lease_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self.max_attempts = max_attempts
+        self.worker_id = worker_id or (
+            f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self._jobs: Dict[UUID, asyncio.Task] = {}
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        """Stop claiming jobs and put the running jobs back in the queue."""
+        if not self._stopping.is_set():
+            logger.info(f"Sync worker {self.worker_id} is stopping")
+            self._stopping.set()
+
+    async def run(self) -> None:
+        """Claim and run jobs until stopped."""
+        logger.info(f"Sync worker {self.worker_id} started with concurrency {self.concurrency}")
+        try:
+            while not self._stopping.is_set():
+                if len(self._jobs) < self.concurrency:
+                    job_id = await self._claim()
+                    if job_id is not None:
+                        self._start(job_id)
+                        continue
+                await self._sleep(self.poll_seconds)
+        finally:
+            jobs = list(self._jobs.values())
+            for task in jobs:
+                task.cancel()
+            await asyncio.gather(*jobs, return_exceptions=True)
+            logger.info(f"Sync worker {self.worker_id} stopped")
+
+    async def _claim(self) -> Optional[UUID]:
+        """Fail abandoned jobs and lease the next runnable job, if any."""
+        try:
+            async with get_db_context() as db:
+                failed = await crud.sync_job.fail_abandoned(db, max_attempts=self.max_attempts)
+                if failed:
+                    logger.warning(f"Failed {failed} sync jobs that were abandoned too often")
+                return await crud.sync_job.claim_next(
+                    db,
+                    worker_id=self.worker_id,
+                    lease_seconds=self.lease_seconds,
+                    max_attempts=self.max_attempts,
+                )
+        except Exception as e:
+            logger.error(f"Sync worker {self.worker_id} could not claim a job: {e}")
+            return None
+
+    def _start(self, job_id: UUID) -> None:
+        """Run a claimed job in the background."""
+        logger.info(f"Sync worker {self.worker_id} claimed sync job {job_id}")
+        task = asyncio.create_task(self._run_job(job_id))
+        self._jobs[job_id] = task
+        task.add_done_callback(lambda _: self._jobs.pop(job_id, None))
+
+    async def _run_job(self, job_id: UUID) -> None:
+        """Run a job while its lease is renewed, then release the lease."""
+        run = asyncio.create_task(sync_service.run_job(job_id))
+        heartbeat = asyncio.create_task(self._heartbeat(job_id, run))
+        try:
+            await run
+        except asyncio.CancelledError:
+            if not self._stopping.is_set():
+                logger.warning(f"Sync job {job_id} was cancelled after its lease was lost")
+        except Exception as e:
+            logger.error(f"Sync job {job_id} failed: {e}")
+        finally:
+            heartbeat.cancel()
+            await self._release(job_id, requeue=self._stopping.is_set())
+
+    async def _heartbeat(self, job_id: UUID, run: asyncio.Task) -> None:
+        """Renew the lease of a running job, and cancel the job when the lease is lost.
+
+        A lease is lost when the worker could not renew it in time, e.g. because the database
+        was unreachable, and another worker has taken the job over. Failed renewals are retried
+        at the next heartbeat, the lease stays valid until it expires.
+        """
+        while not run.done():
+            await asyncio.sleep(self.heartbeat_seconds)
+            try:
+                async with get_db_context() as db:
+                    renewed = await crud.sync_job.renew_lease(
+                        db,
+                        id=job_id,
+                        worker_id=self.worker_id,
+                        lease_seconds=self.lease_seconds,
+                    )
+            except Exception as e:
+                logger.warning(f"Could not renew the lease of sync job {job_id}: {e}")
+                continue
+            if not renewed:
+                run.cancel()
+                return
+
+    async def _release(self, job_id: UUID, requeue: bool) -> None:
+        """Release the lease of a job, putting it back in the queue if it is unfinished."""
+        try:
+            async with get_db_context() as db:
+                await crud.sync_job.release_lease(
+                    db, id=job_id, worker_id=self.worker_id, requeue=requeue
+                )
+        except Exception as e:
+            # The lease expires on its own and the job is then taken over
+            logger.warning(f"Could not release the lease of sync job {job_id}: {e}")
+
+    async def _sleep(self, seconds: float) -> None:
+        """Sleep, waking up early when the worker is stopped."""
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def _serve(concurrency: int) -> None:
+    """Run a worker until SIGTERM or SIGINT."""
+    worker = SyncWorker(concurrency=concurrency)
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, worker.stop)
+    try:
+        await worker.run()
+    finally:
+        transform_pool.shutdown()
+
+
+def main() -> None:
+    """Entry point of the airweave-worker command."""
+    parser = argparse.ArgumentParser(description="Run Airweave sync jobs from the job queue.")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.SYNC_WORKER_CONCURRENCY,
+        help="Number of sync jobs run at the same time.",
+    )
+    args = parser.parse_args()
+
+    if not settings.SYNC_JOB_QUEUE_ENABLED:
+        # Without the queue, the API runs jobs itself and a worker would run them a second time
+        sys.exit("SYNC_JOB_QUEUE_ENABLED must be set to run sync workers")
+
+    ensure_file_entity_models()
+    asyncio.run(_serve(args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
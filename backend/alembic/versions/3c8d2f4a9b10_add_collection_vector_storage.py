@@ -0,0 +1,43 @@
+"""add collection vector storage
+
+Revision ID: 3c8d2f4a9b10
+Revises: b1170e606aae
+Create Date: 2026-10-18 10:12:41.530211
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "3c8d2f4a9b10"
+down_revision = "b1170e606aae"
+branch_labels = None
+depends_on = None
+
+vector_storage_profile = sa.Enum(
+    "STANDARD", "SCALAR", "BINARY", "ON_DISK", name="vectorstorageprofile"
+)
+
+
+def upgrade():
+    vector_storage_profile.create(op.get_bind(), checkfirst=True)
+    op.add_column(
+        "collection",
+        sa.Column(
+            "vector_storage_profile",
+            vector_storage_profile,
+            nullable=False,
+            server_default="STANDARD",
+        ),
+    )
+    op.add_column("collection", sa.Column("hnsw_m", sa.Integer(), nullable=True))
+    op.add_column("collection", sa.Column("hnsw_ef_construct", sa.Integer(), nullable=True))
+
+
+def downgrade():
+    op.drop_column("collection", "hnsw_ef_construct")
+    op.drop_column("collection", "hnsw_m")
+    op.drop_column("collection", "vector_storage_profile")
+    vector_storage_profile.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,35 @@
+"""add sync job queue lease
+
+Revision ID: 7e4b9c2d1a35
+Revises: 3c8d2f4a9b10
+Create Date: 2026-10-18 11:03:17.942310
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "7e4b9c2d1a35"
+down_revision = "3c8d2f4a9b10"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("sync_job", sa.Column("leased_by", sa.String(), nullable=True))
+    op.add_column("sync_job", sa.Column("lease_expires_at", sa.DateTime(), nullable=True))
+    op.add_column("sync_job", sa.Column("heartbeat_at", sa.DateTime(), nullable=True))
+    op.add_column(
+        "sync_job", sa.Column("attempts", sa.Integer(), nullable=False, server_default="0")
+    )
+    op.create_index("ix_sync_job_status_created_at", "sync_job", ["status", "created_at"])
+
+
+def downgrade():
+    op.drop_index("ix_sync_job_status_created_at", table_name="sync_job")
+    op.drop_column("sync_job", "attempts")
+    op.drop_column("sync_job", "heartbeat_at")
+    op.drop_column("sync_job", "lease_expires_at")
+    op.drop_column("sync_job", "leased_by")
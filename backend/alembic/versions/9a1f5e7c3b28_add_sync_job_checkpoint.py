@@ -0,0 +1,27 @@
+"""add sync job checkpoint
+
+Revision ID: 9a1f5e7c3b28
+Revises: 7e4b9c2d1a35
+Create Date: 2026-10-18 14:21:46.118205
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9a1f5e7c3b28"
+down_revision = "7e4b9c2d1a35"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("sync_job", sa.Column("checkpoint", sa.JSON(), nullable=True))
+    op.add_column("sync_job", sa.Column("checkpoint_at", sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    op.drop_column("sync_job", "checkpoint_at")
+    op.drop_column("sync_job", "checkpoint")
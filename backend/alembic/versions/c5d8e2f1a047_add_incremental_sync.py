@@ -0,0 +1,38 @@
+"""add incremental sync
+
+Revision ID: c5d8e2f1a047
+Revises: 9a1f5e7c3b28
+Create Date: 2026-10-18 16:02:13.402117
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c5d8e2f1a047"
+down_revision = "9a1f5e7c3b28"
+branch_labels = None
+depends_on = None
+
+sync_mode = sa.Enum("FULL", "INCREMENTAL", name="syncmode")
+
+
+def upgrade():
+    sync_mode.create(op.get_bind(), checkfirst=True)
+    op.add_column(
+        "sync_job",
+        sa.Column("sync_mode", sync_mode, nullable=False, server_default="FULL"),
+    )
+    op.add_column("sync_job", sa.Column("watermark", sa.DateTime(), nullable=True))
+    op.add_column(
+        "sync", sa.Column("full_sync_cron_schedule", sa.String(length=100), nullable=True)
+    )
+
+
+def downgrade():
+    op.drop_column("sync", "full_sync_cron_schedule")
+    op.drop_column("sync_job", "watermark")
+    op.drop_column("sync_job", "sync_mode")
+    sync_mode.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,122 @@
+"""Benchmark of embedded tokens per entity, before and after entity text rendering.
+
+Before rendering, entities were embedded as str(entity.to_storage_dict()). This benchmark
+fills every built-in chunk entity type with representative values and compares the token
+count of that representation with the rendered embeddable text.
+
+Run with: pytest tests/benchmarks/test_entity_text_tokens.py -s --no-cov
+"""
+
+import importlib
+import pkgutil
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Dict, List, Literal, Union, get_args, get_origin
+from uuid import UUID, uuid4
+
+import pytest
+
+import airweave.platform.entities as entities_package
+from airweave.platform.entities._base import BaseEntity, ChunkEntity, ensure_file_entity_models
+from airweave.platform.transformers.utils import count_tokens
+
+SAMPLE_TEXT = "Quarterly planning notes for the search team, covering goals and owners."
+
+
+def _sample_class_value(name: str, annotation: type) -> Any:
+    """Build a representative value for a plain class annotation."""
+    if issubclass(annotation, Enum):
+        return next(iter(annotation))
+    if issubclass(annotation, bool):
+        return True
+    if issubclass(annotation, (int, float)):
+        return annotation(42)
+    if issubclass(annotation, UUID):
+        return uuid4()
+    if issubclass(annotation, datetime):
+        return datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+    if issubclass(annotation, str):
+        if name.endswith(("_id", "_ids")) or name in ("id", "entity_id"):
+            return str(uuid4())
+        if name.endswith(("url", "_urls")):
+            return f"https://example.com/{uuid4()}"
+    if hasattr(annotation, "model_fields"):
+        return annotation.model_construct(
+            **{
+                field: _sample_value(field, info.annotation)
+                for field, info in annotation.model_fields.items()
+            }
+        )
+    return SAMPLE_TEXT
+
+
+def _sample_value(name: str, annotation: Any) -> Any:
+    """Build a representative value for a field annotation."""
+    origin = get_origin(annotation)
+    if origin is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _sample_value(name, args[0]) if args else None
+    if origin is Literal:
+        return get_args(annotation)[0]
+    if origin in (list, List):
+        args = get_args(annotation)
+        return [_sample_value(name, args[0] if args else str) for _ in range(2)]
+    if origin in (dict, Dict) or annotation in (dict, Dict, Any):
+        return {"key": "value", "label": SAMPLE_TEXT}
+    if isinstance(annotation, type):
+        return _sample_class_value(name, annotation)
+    return SAMPLE_TEXT
+
+
+def _builtin_chunk_entity_classes() -> List[type]:
+    """Import all built-in entity modules and return their concrete chunk entity classes."""
+    for module in pkgutil.iter_modules(entities_package.__path__):
+        if not module.name.startswith("_"):
+            importlib.import_module(f"{entities_package.__name__}.{module.name}")
+    ensure_file_entity_models()
+
+    classes, pending = [], list(ChunkEntity.__subclasses__())
+    while pending:
+        cls = pending.pop()
+        pending.extend(cls.__subclasses__())
+        if cls.__module__.startswith(entities_package.__name__ + ".") and not (
+            cls.__module__.endswith("._base")
+        ):
+            classes.append(cls)
+    return sorted(set(classes), key=lambda cls: cls.__name__)
+
+
+def _sample_entity(cls: type) -> BaseEntity:
+    """Build an entity of a class with every field set to a representative value."""
+    values = {name: _sample_value(name, info.annotation) for name, info in cls.model_fields.items()}
+    values["breadcrumbs"] = []
+    values["vector"] = None
+    return cls.model_construct(**values)
+
+
+@pytest.mark.slow
+def test_tokens_per_entity_before_and_after():
+    """Report the embedded tokens per built-in entity type and check that none grew."""
+    try:
+        count_tokens("warm up")
+    except Exception as e:
+        pytest.skip(f"Tokenizer unavailable: {e}")
+
+    rows = []
+    for cls in _builtin_chunk_entity_classes():
+        entity = _sample_entity(cls)
+        before = count_tokens(str(entity.to_storage_dict()))
+        after = count_tokens(entity.to_embeddable_text())
+        rows.append((cls.__name__, before, after))
+
+    print(f"\n{'entity type':<40} {'before':>8} {'after':>8} {'saved':>7}")
+    for name, before, after in rows:
+        print(f"{name:<40} {before:>8} {after:>8} {1 - after / before:>7.0%}")
+    total_before = sum(row[1] for row in rows)
+    total_after = sum(row[2] for row in rows)
+    print(
+        f"{'total':<40} {total_before:>8} {total_after:>8} {1 - total_after / total_before:>7.0%}"
+    )
+
+    assert rows
+    assert all(after <= before for _, before, after in rows)
@@ -0,0 +1,113 @@
+"""Benchmark of delete-by-filter latency in Qdrant, before and after payload indexes.
+
+Qdrant's embedded local mode ignores payload indexes, so this benchmark needs a running Qdrant
+service, e.g. the one from docker-compose.dev.yml or `docker run -p 6333:6333 qdrant/qdrant`.
+
+Run with QDRANT_BENCHMARK_URL set, e.g. to http://localhost:6333:
+    pytest tests/benchmarks/test_qdrant_payload_indexes.py -s --no-cov
+"""
+
+import os
+import random
+import statistics
+import time
+import uuid
+
+import pytest
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models as rest
+
+from airweave.platform.destinations.qdrant import _ensure_payload_indexes
+
+QDRANT_URL = os.environ.get("QDRANT_BENCHMARK_URL")
+POINT_COUNT = int(os.environ.get("QDRANT_BENCHMARK_POINTS", "100000"))
+CHUNKS_PER_PARENT = 5
+DELETES_PER_RUN = 50
+VECTOR_SIZE = 16
+UPSERT_BATCH_SIZE = 2000
+
+
+async def _fill_collection(client: AsyncQdrantClient, collection_name: str, sync_id: str) -> int:
+    """Fill a collection with chunk points of CHUNKS_PER_PARENT chunks per parent entity."""
+    await client.create_collection(
+        collection_name=collection_name,
+        vectors_config=rest.VectorParams(size=VECTOR_SIZE, distance=rest.Distance.COSINE),
+    )
+
+    parent_count = POINT_COUNT // CHUNKS_PER_PARENT
+    points = []
+    for index in range(POINT_COUNT):
+        parent = index // CHUNKS_PER_PARENT
+        points.append(
+            rest.PointStruct(
+                id=index,
+                vector=[random.random() for _ in range(VECTOR_SIZE)],
+                payload={
+                    "sync_id": sync_id,
+                    "entity_id": f"entity-{parent}",
+                    "parent_entity_id": f"entity-{parent}",
+                    "chunk_index": index % CHUNKS_PER_PARENT,
+                },
+            )
+        )
+        if len(points) == UPSERT_BATCH_SIZE:
+            await client.upsert(collection_name=collection_name, points=points, wait=True)
+            points = []
+    if points:
+        await client.upsert(collection_name=collection_name, points=points, wait=True)
+    return parent_count
+
+
+async def _time_deletes(
+    client: AsyncQdrantClient, collection_name: str, sync_id: str, parents: list[int]
+) -> list[float]:
+    """Delete the points of parent entities one by one, the way UPDATE does, and time each."""
+    latencies = []
+    for parent in parents:
+        start = time.perf_counter()
+        await client.delete(
+            collection_name=collection_name,
+            points_selector=rest.FilterSelector(
+                filter=rest.Filter(
+                    must=[
+                        rest.FieldCondition(
+                            key="parent_entity_id", match=rest.MatchValue(value=f"entity-{parent}")
+                        ),
+                        rest.FieldCondition(key="sync_id", match=rest.MatchValue(value=sync_id)),
+                    ]
+                )
+            ),
+            wait=True,
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not QDRANT_URL, reason="QDRANT_BENCHMARK_URL is not set")
+@pytest.mark.asyncio
+async def test_delete_by_filter_latency_with_payload_indexes():
+    """Report delete-by-filter latency without and with payload indexes."""
+    client = AsyncQdrantClient(url=QDRANT_URL, timeout=120)
+    collection_name = f"benchmark_payload_indexes_{uuid.uuid4().hex}"
+    sync_id = str(uuid.uuid4())
+
+    try:
+        parent_count = await _fill_collection(client, collection_name, sync_id)
+        parents = random.sample(range(parent_count), 2 * DELETES_PER_RUN)
+
+        before = await _time_deletes(client, collection_name, sync_id, parents[:DELETES_PER_RUN])
+        await _ensure_payload_indexes(client, collection_name, wait=True)
+        after = await _time_deletes(client, collection_name, sync_id, parents[DELETES_PER_RUN:])
+
+        print(f"\n{POINT_COUNT} points, {DELETES_PER_RUN} deletes by parent_entity_id + sync_id")
+        print(f"{'':<16} {'p50 ms':>8} {'p95 ms':>8}")
+        for label, latencies in (("no indexes", before), ("payload indexes", after)):
+            p95 = statistics.quantiles(latencies, n=20)[-1]
+            print(f"{label:<16} {statistics.median(latencies):>8.2f} {p95:>8.2f}")
+
+        count = await client.count(collection_name=collection_name, exact=True)
+        assert count.count == POINT_COUNT - 2 * DELETES_PER_RUN * CHUNKS_PER_PARENT
+    finally:
+        await client.delete_collection(collection_name)
+        await client.close()
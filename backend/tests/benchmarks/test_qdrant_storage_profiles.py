@@ -0,0 +1,133 @@
+"""Benchmark of recall@10 and search latency of the vector storage profiles.
+
+Qdrant's embedded local mode searches exhaustively and ignores quantization and HNSW settings,
+so this benchmark needs a running Qdrant service, e.g. the one from docker-compose.dev.yml or
+`docker run -p 6333:6333 qdrant/qdrant`.
+
+Run with QDRANT_BENCHMARK_URL set, e.g. to http://localhost:6333:
+    pytest tests/benchmarks/test_qdrant_storage_profiles.py -s --no-cov
+"""
+
+import asyncio
+import os
+import statistics
+import time
+import uuid
+
+import numpy as np
+import pytest
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models as rest
+
+from airweave.core.shared_models import VectorStorageProfile
+from airweave.platform.destinations.qdrant import QUANTIZATION_SEARCH_PARAMS, _storage_config
+
+QDRANT_URL = os.environ.get("QDRANT_BENCHMARK_URL")
+POINT_COUNT = int(os.environ.get("QDRANT_BENCHMARK_POINTS", "50000"))
+VECTOR_SIZE = 1536
+CLUSTER_COUNT = 200
+QUERY_COUNT = 100
+TOP_K = 10
+UPSERT_BATCH_SIZE = 500
+
+# Profiles and HNSW settings that are compared, (label, profile, m, ef_construct)
+CONFIGURATIONS = [
+    ("standard", VectorStorageProfile.STANDARD, None, None),
+    ("scalar", VectorStorageProfile.SCALAR, None, None),
+    ("binary", VectorStorageProfile.BINARY, None, None),
+    ("on_disk", VectorStorageProfile.ON_DISK, None, None),
+    ("scalar m=32", VectorStorageProfile.SCALAR, 32, 256),
+]
+
+
+def _clustered_vectors(count: int, rng: np.random.Generator) -> np.ndarray:
+    """Normalized vectors around random topic centers, closer to embeddings than uniform noise."""
+    centers = rng.standard_normal((CLUSTER_COUNT, VECTOR_SIZE), dtype=np.float32)
+    vectors = centers[rng.integers(0, CLUSTER_COUNT, count)]
+    vectors += 0.5 * rng.standard_normal((count, VECTOR_SIZE), dtype=np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+async def _fill_collection(
+    client: AsyncQdrantClient, collection_name: str, configuration: tuple, vectors: np.ndarray
+) -> None:
+    """Create a collection the way setup_collection does and wait until it is indexed."""
+    _, profile, hnsw_m, hnsw_ef_construct = configuration
+    storage = _storage_config(profile, hnsw_m, hnsw_ef_construct)
+    await client.create_collection(
+        collection_name=collection_name,
+        vectors_config=rest.VectorParams(
+            size=VECTOR_SIZE, distance=rest.Distance.COSINE, on_disk=storage["on_disk"]
+        ),
+        quantization_config=storage["quantization_config"],
+        hnsw_config=storage["hnsw_config"],
+        optimizers_config=rest.OptimizersConfigDiff(indexing_threshold=20000),
+        on_disk_payload=True,
+    )
+
+    for start in range(0, len(vectors), UPSERT_BATCH_SIZE):
+        batch = vectors[start : start + UPSERT_BATCH_SIZE]
+        await client.upsert(
+            collection_name=collection_name,
+            points=rest.Batch(ids=list(range(start, start + len(batch))), vectors=batch.tolist()),
+            wait=True,
+        )
+
+    while (await client.get_collection(collection_name)).status != rest.CollectionStatus.GREEN:
+        await asyncio.sleep(1)
+
+
+async def _search(
+    client: AsyncQdrantClient, collection_name: str, queries: np.ndarray
+) -> tuple[list[list[int]], list[float]]:
+    """Search every query the way QdrantDestination.search does and time each search."""
+    results, latencies = [], []
+    for query in queries:
+        start = time.perf_counter()
+        response = await client.query_points(
+            collection_name=collection_name,
+            query=query.tolist(),
+            limit=TOP_K,
+            search_params=QUANTIZATION_SEARCH_PARAMS,
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append([point.id for point in response.points])
+    return results, latencies
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not QDRANT_URL, reason="QDRANT_BENCHMARK_URL is not set")
+@pytest.mark.asyncio
+async def test_storage_profile_recall_and_latency():
+    """Report recall@10 against exact search and search latency per storage profile."""
+    rng = np.random.default_rng(42)
+    vectors = _clustered_vectors(POINT_COUNT, rng)
+    queries = _clustered_vectors(QUERY_COUNT, rng)
+    exact = np.argsort(-(queries @ vectors.T), axis=1)[:, :TOP_K]
+
+    client = AsyncQdrantClient(url=QDRANT_URL, timeout=300)
+    report = {}
+    try:
+        for configuration in CONFIGURATIONS:
+            collection_name = f"benchmark_storage_{uuid.uuid4().hex}"
+            try:
+                await _fill_collection(client, collection_name, configuration, vectors)
+                results, latencies = await _search(client, collection_name, queries)
+            finally:
+                await client.delete_collection(collection_name)
+
+            recall = statistics.mean(
+                len(set(found) & set(expected.tolist())) / TOP_K
+                for found, expected in zip(results, exact, strict=True)
+            )
+            report[configuration[0]] = (recall, latencies)
+    finally:
+        await client.close()
+
+    print(f"\n{POINT_COUNT} points of {VECTOR_SIZE} dimensions, {QUERY_COUNT} queries")
+    print(f"{'':<14} {'recall@10':>10} {'p50 ms':>8} {'p95 ms':>8}")
+    for label, (recall, latencies) in report.items():
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        print(f"{label:<14} {recall:>10.3f} {statistics.median(latencies):>8.2f} {p95:>8.2f}")
+
+    assert report["standard"][0] >= 0.9
@@ -0,0 +1,109 @@
+"""Benchmark of file chunking throughput and event loop stalls per number of worker processes.
+
+Chunks the same markdown documents with the file chunker's chunk_markdown, on the event loop
+(0 processes) and in TransformProcessPools of 1 process up to one per core. While chunking, a
+ticker on the event loop measures how late it wakes up, which is how long every other entity
+of a sync and every API request would wait.
+
+Run with: pytest tests/benchmarks/test_transform_process_pool.py -s --no-cov
+"""
+
+import asyncio
+import os
+import random
+import time
+
+import pytest
+
+from airweave.platform.transformers.default_file_chunker import chunk_markdown
+from airweave.platform.transformers.process_pool import TransformProcessPool
+
+DOC_COUNT = int(os.environ.get("TRANSFORM_BENCHMARK_DOCS", "48"))
+SECTIONS_PER_DOC = 200
+TICK_SECONDS = 0.01
+
+WORDS = (
+    "sync entity chunk vector search collection source destination token embedding "
+    "pipeline worker process markdown document section paragraph cursor"
+).split()
+
+
+def _document(rng: random.Random) -> str:
+    """Build a markdown document with headings, paragraphs and lists."""
+    parts = []
+    for section in range(SECTIONS_PER_DOC):
+        parts.append(f"\n## Section {section}\n")
+        for _ in range(3):
+            sentences = [
+                " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 20))).capitalize() + "."
+                for _ in range(rng.randint(3, 6))
+            ]
+            parts.append("\n\n" + " ".join(sentences))
+        parts.append("\n- " + "\n- ".join(rng.choice(WORDS) for _ in range(4)))
+    return "".join(parts)
+
+
+def _process_counts() -> list[int]:
+    """Return 0, then powers of two up to the number of cores, and the number of cores."""
+    cores = os.cpu_count() or 1
+    counts = [0]
+    processes = 1
+    while processes < cores:
+        counts.append(processes)
+        processes *= 2
+    counts.append(cores)
+    return counts
+
+
+async def _chunk_all(pool: TransformProcessPool, documents: list[str]) -> tuple[float, float]:
+    """Chunk all documents concurrently; return the duration and the largest loop stall."""
+    max_lag = 0.0
+    done = False
+
+    async def tick() -> None:
+        nonlocal max_lag
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(TICK_SECONDS)
+            max_lag = max(max_lag, time.perf_counter() - start - TICK_SECONDS)
+
+    ticker = asyncio.create_task(tick())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await asyncio.gather(*(pool.run(chunk_markdown, document) for document in documents))
+    duration = time.perf_counter() - start
+    done = True
+    await ticker
+    return duration, max_lag
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_chunking_throughput_per_process_count():
+    """Report documents per second and the largest event loop stall per process count."""
+    rng = random.Random(42)
+    documents = [_document(rng) for _ in range(DOC_COUNT)]
+
+    report = {}
+    for processes in _process_counts():
+        pool = TransformProcessPool(processes=processes)
+        try:
+            # Start the workers and load the tokenizer before timing
+            await asyncio.gather(*(pool.run(chunk_markdown, "# Warm up") for _ in range(processes)))
+            report[processes] = await _chunk_all(pool, documents)
+        finally:
+            pool.shutdown()
+
+    size_kb = sum(len(document) for document in documents) / 1024 / DOC_COUNT
+    print(f"\n{DOC_COUNT} documents of {size_kb:.0f} KB, {os.cpu_count()} cores")
+    print(f"{'processes':>10} {'docs/s':>8} {'speedup':>8} {'max stall ms':>13}")
+    baseline = DOC_COUNT / report[0][0]
+    for processes, (duration, max_lag) in report.items():
+        throughput = DOC_COUNT / duration
+        print(
+            f"{processes:>10} {throughput:>8.1f} {throughput / baseline:>7.2f}x "
+            f"{max_lag * 1000:>13.1f}"
+        )
+
+    # In worker processes, chunking no longer blocks the event loop for a whole document
+    assert report[max(report)][1] < report[0][1]
@@ -21,6 +21,7 @@ from tests.fixtures.common import (  # noqa
     app,
     mock_background_tasks,
     mock_db,
+    mock_db_context,
     mock_sync,
     mock_sync_dag,
     mock_sync_job,
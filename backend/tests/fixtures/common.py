@@ -1,6 +1,7 @@
 """Common test fixtures."""
 
 import uuid
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -99,6 +100,17 @@ def mock_db():
     return AsyncMock(spec=AsyncSession)
 
 
+@pytest.fixture
+def mock_db_context():
+    """Create a replacement for get_db_context that yields a mock database session."""
+
+    @asynccontextmanager
+    async def db_context():
+        yield AsyncMock(spec=AsyncSession)
+
+    return db_context
+
+
 @pytest.fixture
 def mock_background_tasks():
     """Create a mock background tasks."""
@@ -0,0 +1,38 @@
+"""Tests for the BM25 sparse encoder."""
+
+from airweave.platform.embedding_models.bm25 import BM25SparseEncoder, _term_index, tokenize
+
+
+def test_tokenize_keeps_identifiers_and_their_parts():
+    """Test that compound identifiers match both as a whole and by their parts."""
+    terms = tokenize("See ENG-1234 in getUserName, mail bob@example.com")
+
+    assert "eng-1234" in terms
+    assert {"eng", "1234"} <= set(terms)
+    assert {"getusername", "get", "user", "name"} <= set(terms)
+    assert {"bob@example.com", "bob", "example", "com"} <= set(terms)
+    assert "in" not in terms
+
+
+def test_document_weights_saturate_with_term_frequency():
+    """Test that repeated terms weigh more, with diminishing returns."""
+    encoder = BM25SparseEncoder()
+    vector = encoder.encode_document("crash crash crash report")
+    weights = dict(zip(vector.indices, vector.values, strict=True))
+
+    crash, report = weights[_term_index("crash")], weights[_term_index("report")]
+    assert report < crash < 3 * report
+    assert crash < encoder.k1 + 1
+
+
+def test_query_weights_and_empty_text():
+    """Test that query terms are deduplicated with weight 1 and empty texts encode to nothing."""
+    encoder = BM25SparseEncoder()
+
+    query = encoder.encode_query("ENG-1234 eng")
+
+    assert sorted(query.indices) == sorted(
+        {_term_index("eng-1234"), _term_index("eng"), _term_index("1234")}
+    )
+    assert set(query.values) == {1.0}
+    assert encoder.encode_document("the and of").indices == []
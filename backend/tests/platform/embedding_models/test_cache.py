@@ -0,0 +1,101 @@
+"""Tests for the embedding cache."""
+
+import sqlite3
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from airweave.platform.embedding_models.cache import CachedEmbeddingModel, EmbeddingCache
+from airweave.platform.embedding_models.local_text2vec import LocalText2Vec
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache backed by a temporary file."""
+    cache = EmbeddingCache(path=str(tmp_path / "cache.sqlite"), max_memory_entries=2)
+    yield cache
+    cache.close()
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache."""
+
+    def test_round_trip_through_disk(self, cache):
+        """Test that vectors evicted from memory are served from disk."""
+        cache.put_many(["a", "b", "c"], [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]], "m", 2)
+
+        a, c, x = cache.get_many(["a", "c", "x"], "m", 2)
+        assert a.tolist() == [1.0, 2.0]
+        assert c.tolist() == [5.0, 6.0]
+        assert x is None
+        assert cache.memory_hits == 1
+        assert cache.disk_hits == 1
+        assert cache.misses == 1
+
+    def test_key_includes_model_and_dimensions(self, cache):
+        """Test that the same text is cached separately per model and dimensions."""
+        cache.put_many(["a"], [[1.0, 2.0]], "m", 2)
+
+        assert cache.get_many(["a"], "other", 2) == [None]
+        assert cache.get_many(["a"], "m", 3) == [None]
+
+    def test_evicts_least_recently_used_on_disk(self, tmp_path):
+        """Test that the file is brought back under its size budget."""
+        vector_bytes = 4 * 4
+        cache = EmbeddingCache(
+            path=str(tmp_path / "cache.sqlite"),
+            max_memory_entries=1,
+            max_disk_bytes=vector_bytes * 3,
+        )
+        for text in ["a", "b", "c", "d"]:
+            cache.put_many([text], [[1.0] * 4], "m", 4)
+
+        assert cache.evictions >= 1
+        assert cache.get_many(["a"], "m", 4) == [None]
+        assert cache.get_many(["d"], "m", 4)[0].tolist() == [1.0] * 4
+        cache.close()
+
+
+class TestCachedEmbeddingModel:
+    """Tests for CachedEmbeddingModel."""
+
+    @pytest.mark.asyncio
+    async def test_only_misses_are_embedded(self, cache):
+        """Test that cached texts are not sent to the wrapped model."""
+        inner = LocalText2Vec(vector_dimensions=2)
+        model = CachedEmbeddingModel.wrap(inner, cache)
+
+        with patch.object(
+            LocalText2Vec, "embed_many", new=AsyncMock(return_value=[[1.0, 1.0], [2.0, 2.0]])
+        ):
+            first = await model.embed_many(["a", "b"])
+        with patch.object(
+            LocalText2Vec, "embed_many", new=AsyncMock(return_value=[[3.0, 3.0], [0.0, 0.0]])
+        ) as mock_embed:
+            second = await model.embed_many(["b", "c", "a", ""])
+
+        mock_embed.assert_called_once()
+        assert mock_embed.call_args.args[0] == ["c", ""]
+        assert first == [[1.0, 1.0], [2.0, 2.0]]
+        assert second == [[2.0, 2.0], [3.0, 3.0], [1.0, 1.0], [0.0, 0.0]]
+        assert model.cache_hits == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_errors_do_not_fail_embedding(self, cache):
+        """Test that a locked or broken cache file falls back to the wrapped model."""
+        inner = LocalText2Vec(vector_dimensions=2)
+        model = CachedEmbeddingModel.wrap(inner, cache)
+        locked = sqlite3.OperationalError("database is locked")
+
+        with (
+            patch.object(EmbeddingCache, "get_many", side_effect=locked),
+            patch.object(EmbeddingCache, "put_many", side_effect=locked),
+            patch.object(
+                LocalText2Vec, "embed_many", new=AsyncMock(return_value=[[1.0, 1.0], [2.0, 2.0]])
+            ) as mock_embed,
+        ):
+            result = await model.embed_many(["a", "b"])
+
+        assert mock_embed.call_args.args[0] == ["a", "b"]
+        assert result == [[1.0, 1.0], [2.0, 2.0]]
+        assert model.cache_misses == 2
@@ -1,13 +1,63 @@
 """Tests for LocalText2Vec embedding model."""
 
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from airweave.core.config import settings
+from airweave.platform.embedding_models import local_text2vec
 from airweave.platform.embedding_models.local_text2vec import LocalText2Vec
 
 
+def _stand_in_vector(text: str) -> list[float]:
+    """Vector the stand-in server returns for a text, unique per text length."""
+    return [float(len(text))] * 384
+
+
+class _StandInInferenceHandler(BaseHTTPRequestHandler):
+    """Minimal stand-in for the text2vec-transformers inference API."""
+
+    def do_POST(self):  # noqa: N802
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append(body)
+
+        if "texts" in body and self.server.supports_batch:
+            payload = {"vectors": [_stand_in_vector(text) for text in body["texts"]]}
+        elif "text" in body:
+            payload = {"vector": _stand_in_vector(body["text"])}
+        else:
+            self.send_response(422)
+            self.end_headers()
+            return
+
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(params=[True, False], ids=["batched", "single"])
+def inference_server(request):
+    """Run a stand-in inference server with or without batch support."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInInferenceHandler)
+    server.supports_batch = request.param
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    local_text2vec._batch_unsupported_urls.clear()
+
+
 class TestLocalText2Vec:
     """Tests for the LocalText2Vec embedding model."""
 
@@ -115,11 +165,10 @@ class TestLocalText2Vec:
         assert len(result) == 2
         assert all(len(vec) == 384 for vec in result)
 
-        # Verify the API call - updated to match the actual implementation
-        # The method is making individual calls for each text rather than a batch call
-        assert mock_post.call_count == 2
-        mock_post.assert_any_call(f"{model.inference_url}/vectors/", json={"text": "Text 1"})
-        mock_post.assert_any_call(f"{model.inference_url}/vectors/", json={"text": "Text 2"})
+        # Verify the API call - all texts are sent in a single batched request
+        mock_post.assert_called_once_with(
+            f"{model.inference_url}/vectors", json={"texts": ["Text 1", "Text 2"]}
+        )
 
     @pytest.mark.asyncio
     @patch("httpx.AsyncClient.post")
@@ -142,8 +191,8 @@ class TestLocalText2Vec:
 
         # Verify the API call
         mock_post.assert_called_once_with(
-            f"{model.inference_url}/vectors/",
-            json={"text": "Text 2"},  # Only non-empty text should be sent
+            f"{model.inference_url}/vectors",
+            json={"texts": ["Text 2"]},  # Only non-empty text should be sent
         )
 
     @pytest.mark.asyncio
@@ -157,3 +206,28 @@ class TestLocalText2Vec:
         """Test that dimensions override raises an error."""
         with pytest.raises(ValueError, match="Dimensions override not supported"):
             await model.embed_many(["Test text"], dimensions=512)
+
+    @pytest.mark.asyncio
+    async def test_embed_many_against_stand_in_server(self, model, inference_server):
+        """Test ordering and zero vectors with a batched and a single-text inference server."""
+        model.inference_url = f"http://127.0.0.1:{inference_server.server_port}"
+        texts = ["a", "", "abc", "ab", "  ", "abcd"]
+
+        with patch.object(local_text2vec.settings, "TEXT2VEC_BATCH_SIZE", 2):
+            result = await model.embed_many(texts)
+
+        assert result[0] == _stand_in_vector("a")
+        assert result[1] == [0.0] * 384
+        assert result[2] == _stand_in_vector("abc")
+        assert result[3] == _stand_in_vector("ab")
+        assert result[4] == [0.0] * 384
+        assert result[5] == _stand_in_vector("abcd")
+
+        sent = [body for body in inference_server.requests if "texts" in body]
+        if inference_server.supports_batch:
+            assert [body["texts"] for body in sent] == [["a", "abc"], ["ab", "abcd"]]
+        else:
+            # Batching is only attempted once per server, then texts are sent one by one
+            assert len(sent) == 1
+            single = [body["text"] for body in inference_server.requests if "text" in body]
+            assert sorted(single) == ["a", "ab", "abc", "abcd"]
@@ -1,10 +1,36 @@
 """Tests for OpenAIText2Vec embedding model."""
 
+import asyncio
+import base64
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+import numpy as np
 import pytest
 
+from airweave.platform.concurrency import bind_concurrency_limit
+from airweave.platform.embedding_models import openai_text2vec
 from airweave.platform.embedding_models.openai_text2vec import OpenAIText2Vec
+from airweave.platform.sync.worker_pool import AdaptiveConcurrencyLimit
+
+
+@pytest.fixture(autouse=True)
+def word_token_counter():
+    """Count one token per word, so tests don't need the tokenizer files."""
+    with patch.object(openai_text2vec, "count_tokens", side_effect=lambda text: len(text.split())):
+        yield
+
+
+def _embeddings_response(inputs: list[str]) -> MagicMock:
+    """Build an embeddings response whose vectors encode the length of each input."""
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.json.return_value = {
+        "data": [
+            {"index": i, "embedding": [float(len(text))] * 1536} for i, text in enumerate(inputs)
+        ]
+    }
+    return response
 
 
 class TestOpenAIText2Vec:
@@ -203,3 +229,138 @@ class TestOpenAIText2Vec:
         """Test that dimensions override raises an error."""
         with pytest.raises(ValueError, match="Dimensions override not supported"):
             await model.embed_many(["Test text"], dimensions=512)
+
+    @pytest.mark.asyncio
+    async def test_embed_many_splits_by_token_budget(self, model):
+        """Test that inputs are split into token-budgeted requests and reassembled in order."""
+        texts = ["one", "two words", "", "three words here", "four words are here"]
+
+        async def post(url, json, **kwargs):
+            return _embeddings_response(json["input"])
+
+        with (
+            patch("httpx.AsyncClient.post", side_effect=post) as mock_post,
+            patch.object(openai_text2vec.settings, "OPENAI_EMBEDDING_TOKENS_PER_REQUEST", 5),
+        ):
+            result = await model.embed_many(texts)
+
+        sent = [c.kwargs["json"]["input"] for c in mock_post.call_args_list]
+        assert sorted(sent) == sorted(
+            [["one", "two words"], ["three words here"], ["four words are here"]]
+        )
+        assert [vec[0] for vec in result] == [3.0, 9.0, 0.0, 16.0, 19.0]
+
+    @pytest.mark.asyncio
+    async def test_embed_many_retries_rate_limited_requests(self, model):
+        """Test that 429 responses are retried with backoff."""
+        request = httpx.Request("POST", openai_text2vec.OPENAI_EMBEDDINGS_URL)
+        rate_limited = MagicMock()
+        rate_limited.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "rate limited",
+            request=request,
+            response=httpx.Response(429, request=request),
+        )
+
+        with (
+            patch(
+                "httpx.AsyncClient.post",
+                new=AsyncMock(side_effect=[rate_limited, _embeddings_response(["a b"])]),
+            ) as mock_post,
+            patch.object(openai_text2vec.asyncio, "sleep", new=AsyncMock()) as mock_sleep,
+        ):
+            result = await model.embed_many(["a b"])
+
+        assert mock_post.call_count == 2
+        mock_sleep.assert_awaited_once()
+        assert result[0][0] == 3.0
+
+    @pytest.mark.asyncio
+    async def test_retried_rate_limits_are_reported_to_the_sync(self, model):
+        """Test that a 429 that is retried still backs off the running sync's limit."""
+        request = httpx.Request("POST", openai_text2vec.OPENAI_EMBEDDINGS_URL)
+        rate_limited = MagicMock()
+        rate_limited.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "rate limited",
+            request=request,
+            response=httpx.Response(429, request=request),
+        )
+        limit = AdaptiveConcurrencyLimit(initial_limit=20, backoff_ratio=0.5)
+
+        with (
+            patch(
+                "httpx.AsyncClient.post",
+                new=AsyncMock(side_effect=[rate_limited, _embeddings_response(["a b"])]),
+            ),
+            patch.object(openai_text2vec.asyncio, "sleep", new=AsyncMock()),
+            bind_concurrency_limit(limit),
+        ):
+            await model.embed_many(["a b"])
+
+        assert limit.limit == 10
+
+    @pytest.mark.asyncio
+    async def test_embed_many_does_not_retry_client_errors(self, model):
+        """Test that 4xx errors other than 429 are raised right away."""
+        request = httpx.Request("POST", openai_text2vec.OPENAI_EMBEDDINGS_URL)
+        bad_request = MagicMock()
+        bad_request.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "bad request",
+            request=request,
+            response=httpx.Response(400, request=request),
+        )
+
+        with patch("httpx.AsyncClient.post", new=AsyncMock(return_value=bad_request)) as mock_post:
+            with pytest.raises(httpx.HTTPStatusError):
+                await model.embed_many(["text"])
+
+        assert mock_post.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_sub_batch_cancels_the_others(self, model):
+        """Test that the other sub-batches stop once one of them fails."""
+        request = httpx.Request("POST", openai_text2vec.OPENAI_EMBEDDINGS_URL)
+        bad_request = MagicMock()
+        bad_request.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "bad request",
+            request=request,
+            response=httpx.Response(400, request=request),
+        )
+        cancelled = []
+
+        async def post(url, json, **kwargs):
+            if json["input"] == ["bad input"]:
+                return bad_request
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(json["input"])
+                raise
+            return _embeddings_response(json["input"])
+
+        with (
+            patch("httpx.AsyncClient.post", side_effect=post),
+            patch.object(openai_text2vec.settings, "OPENAI_EMBEDDING_TOKENS_PER_REQUEST", 2),
+        ):
+            with pytest.raises(httpx.HTTPStatusError):
+                await model.embed_many(["slow input", "bad input"])
+
+        assert cancelled == [["slow input"]]
+
+    @pytest.mark.asyncio
+    async def test_embed_many_compact_vectors(self, model_kwargs):
+        """Test that compact models request base64 and return float32 arrays."""
+        model = OpenAIText2Vec(**model_kwargs, compact_vectors=True)
+        vector = np.arange(1536, dtype="<f4")
+        response = MagicMock()
+        response.json.return_value = {
+            "data": [{"index": 0, "embedding": base64.b64encode(vector.tobytes()).decode()}]
+        }
+
+        with patch("httpx.AsyncClient.post", new=AsyncMock(return_value=response)) as mock_post:
+            result = await model.embed_many(["text", ""])
+
+        assert mock_post.call_args.kwargs["json"]["encoding_format"] == "base64"
+        assert result[0].dtype == np.float32
+        assert np.array_equal(result[0], vector)
+        assert result[1].dtype == np.float32
+        assert not result[1].any()
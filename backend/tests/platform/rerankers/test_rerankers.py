@@ -0,0 +1,47 @@
+"""Tests for the rerankers."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from airweave.platform.rerankers.lexical import LexicalReranker
+from airweave.platform.rerankers.local_cross_encoder import LocalCrossEncoderReranker
+
+
+@pytest.mark.asyncio
+async def test_lexical_reranker_promotes_exact_matches():
+    """Test that a candidate with the exact query terms moves up, others keep their order."""
+    texts = [
+        "Quarterly planning notes for the platform team",
+        "Release checklist and rollout steps",
+        "Incident ENG-1234: login outage postmortem",
+        "Team offsite agenda",
+    ]
+
+    scores = await LexicalReranker().score("ENG-1234 postmortem", texts)
+
+    order = sorted(range(len(texts)), key=lambda i: scores[i], reverse=True)
+    assert order == [2, 0, 1, 3]
+
+
+@pytest.mark.asyncio
+async def test_cross_encoder_scores_in_batches():
+    """Test that candidates are sent in batches and the scores come back in order."""
+    response = MagicMock()
+    response.json.side_effect = [
+        {"scores": [{"document": "a", "score": 0.1}, {"document": "b", "score": 0.9}]},
+        {"scores": [{"document": "c", "score": 0.5}]},
+    ]
+    client = MagicMock(post=AsyncMock(return_value=response))
+
+    with patch(
+        "airweave.platform.rerankers.local_cross_encoder.get_loop_bound_client", return_value=client
+    ):
+        reranker = LocalCrossEncoderReranker("http://reranker:8080", batch_size=2)
+        scores = await reranker.score("query", ["a", "b", "c"])
+
+    assert scores == [0.1, 0.9, 0.5]
+    assert [call.kwargs["json"]["documents"] for call in client.post.call_args_list] == [
+        ["a", "b"],
+        ["c"],
+    ]
@@ -247,15 +247,21 @@ class TestRunSync:
         crud.sync.get = AsyncMock(return_value=mock_sync)
         crud.sync_job.create = AsyncMock(return_value=mock_sync_job)
         crud.sync_dag.get_by_sync_id = AsyncMock(return_value=mock_sync_dag)
+        crud.source_connection.get_by_sync_id = AsyncMock(return_value=MagicMock())
+        crud.collection.get_by_readable_id = AsyncMock(return_value=MagicMock())
         sync_id = mock_sync.id
 
         # Act
-        result = await sync.run_sync(
-            db=mock_db,
-            sync_id=sync_id,
-            user=mock_user,
-            background_tasks=mock_background_tasks,
-        )
+        with (
+            patch.object(schemas.Collection, "model_validate"),
+            patch.object(schemas.SourceConnection, "from_orm_with_collection_mapping"),
+        ):
+            result = await sync.run_sync(
+                db=mock_db,
+                sync_id=sync_id,
+                user=mock_user,
+                background_tasks=mock_background_tasks,
+            )
 
         # Assert
         crud.sync.get.assert_called_once_with(
@@ -267,9 +273,11 @@ class TestRunSync:
 
     @pytest.mark.asyncio
     async def test_run_sync_not_found(self, mock_db, mock_user, mock_background_tasks):
-        """Test running a sync that doesn't exist."""
+        """Test running a sync that doesn't exist, and so has no source connection."""
         # Arrange
         crud.sync.get = AsyncMock(return_value=None)
+        crud.sync_job.create = AsyncMock()
+        crud.source_connection.get_by_sync_id = AsyncMock(return_value=None)
         sync_id = uuid.uuid4()
 
         # Act & Assert
@@ -282,7 +290,33 @@ class TestRunSync:
             )
 
         assert exc_info.value.status_code == 404
-        assert exc_info.value.detail == "Sync not found"
+        assert exc_info.value.detail == "Source connection not found for sync"
+        crud.sync_job.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_run_sync_without_collection(
+        self, mock_db, mock_user, mock_sync, mock_background_tasks
+    ):
+        """Test that no job is created for a sync whose collection is gone."""
+        # Arrange
+        crud.sync.get = AsyncMock(return_value=mock_sync)
+        crud.sync_job.create = AsyncMock()
+        crud.source_connection.get_by_sync_id = AsyncMock(return_value=MagicMock())
+        crud.collection.get_by_readable_id = AsyncMock(return_value=None)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await sync.run_sync(
+                db=mock_db,
+                sync_id=mock_sync.id,
+                user=mock_user,
+                background_tasks=mock_background_tasks,
+            )
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == "Collection not found for sync"
+        crud.sync_job.create.assert_not_called()
+        mock_background_tasks.add_task.assert_not_called()
 
 
 class TestListSyncJobs:
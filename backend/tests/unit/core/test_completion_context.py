@@ -0,0 +1,87 @@
+"""Unit tests for the completion context builder."""
+
+from unittest.mock import patch
+
+import pytest
+
+from airweave.core.completion_context import build_completion_context
+
+
+@pytest.fixture(autouse=True)
+def word_tokens():
+    """Count one token per word, so that budgets are easy to reason about."""
+    with (
+        patch(
+            "airweave.core.completion_context.count_tokens",
+            side_effect=lambda text: len(text.split()),
+        ),
+        patch(
+            "airweave.core.completion_context.truncate_to_tokens",
+            side_effect=lambda text, max_tokens: " ".join(text.split()[:max_tokens]),
+        ),
+    ):
+        yield
+
+
+def _result(entity_id, content, chunk_index=0, score=0.5):
+    return {
+        "id": f"{entity_id}-{chunk_index}",
+        "score": score,
+        "payload": {
+            "entity_id": entity_id,
+            "chunk_index": chunk_index,
+            "entity_type": "FileChunk",
+            "breadcrumbs": [{"entity_id": "f", "name": "Docs", "type": "folder"}],
+            "db_entity_id": "c4b1a0d2",
+            "sync_id": "9f1e",
+            "content": content,
+        },
+    }
+
+
+def test_chunks_are_grouped_by_entity_and_rendered_without_system_fields():
+    """Test that chunks of one entity are shown together in chunk order."""
+    context = build_completion_context(
+        [
+            _result("a", "second part", chunk_index=1, score=0.9),
+            _result("b", "other document"),
+            _result("a", "first part", chunk_index=0, score=0.8),
+        ],
+        max_tokens=1000,
+    )
+
+    assert context.text == (
+        "[1] FileChunk (Docs)\ncontent: first part\ncontent: second part\n\n"
+        "[2] FileChunk (Docs)\ncontent: other document"
+    )
+    assert context.chunks_used == 3
+    assert "db_entity_id" not in context.text and "9f1e" not in context.text
+
+
+def test_context_fits_the_token_budget():
+    """Test that duplicates are dropped, large chunks cut down and small ones packed after."""
+    long_text = " ".join(["word"] * 500)
+    context = build_completion_context(
+        [
+            _result("a", "short text"),
+            _result("b", "short text"),
+            _result("c", long_text),
+            _result("d", "tail"),
+        ],
+        max_tokens=100,
+    )
+
+    assert context.tokens <= 100
+    assert context.chunks_used == 2
+    assert context.chunks_total == 4
+    assert context.text.count("short text") == 1
+    assert "tail" not in context.text
+
+    context = build_completion_context(
+        [_result("a", "short text"), _result("c", long_text), _result("d", "tail")],
+        max_tokens=60,
+    )
+
+    assert context.chunks_used == 2
+    assert "word" not in context.text
+    assert "tail" in context.text
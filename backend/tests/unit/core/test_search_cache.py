@@ -0,0 +1,178 @@
+"""Unit tests for the search cache."""
+
+import uuid
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from airweave.core.search_cache import SearchCache
+from airweave.core.search_service import SearchService, reciprocal_rank_fusion
+from airweave.schemas.search import SearchParams
+
+
+@pytest.fixture
+def cache():
+    """Create an enabled search cache with small limits."""
+    return SearchCache(
+        embedding_max_entries=2,
+        embedding_ttl_seconds=60,
+        result_max_entries=2,
+        result_ttl_seconds=60,
+    )
+
+
+class TestSearchCache:
+    """Tests for SearchCache."""
+
+    def test_results_are_copied(self, cache):
+        """Test that callers modifying results do not modify the cached results."""
+        collection_id = uuid.uuid4()
+        cache.put_results(collection_id, [0.1, 0.2], {}, [{"payload": {"vector": [1.0]}}])
+
+        first = cache.get_results(collection_id, [0.1, 0.2], {})
+        first[0]["payload"].pop("vector")
+
+        assert cache.get_results(collection_id, [0.1, 0.2], {}) == [{"payload": {"vector": [1.0]}}]
+
+    def test_invalidate_collection(self, cache):
+        """Test that bumping the generation only invalidates the results of that collection."""
+        collection_id, other_collection_id = uuid.uuid4(), uuid.uuid4()
+        cache.put_results(collection_id, [0.1], {}, [{"id": 1}])
+        cache.put_results(other_collection_id, [0.1], {}, [{"id": 2}])
+
+        cache.invalidate_collection(collection_id)
+
+        assert cache.get_results(collection_id, [0.1], {}) is None
+        assert cache.get_results(other_collection_id, [0.1], {}) == [{"id": 2}]
+
+    def test_ttl_and_lru_eviction(self, cache):
+        """Test that entries expire after the TTL and the least recently used entry is evicted."""
+        with patch("airweave.core.search_cache.time.monotonic", return_value=0):
+            cache.put_embedding("model", "a", [0.1])
+            cache.put_embedding("model", "b", [0.2])
+            assert cache.get_embedding("model", "a") == [0.1]
+            cache.put_embedding("model", "c", [0.3])
+
+            assert cache.get_embedding("model", "b") is None
+            assert cache.get_embedding("model", "a") == [0.1]
+
+        with patch("airweave.core.search_cache.time.monotonic", return_value=61):
+            assert cache.get_embedding("model", "a") is None
+
+        stats = cache.stats()["embeddings"]
+        assert stats["hits"] == 2
+        assert stats["misses"] == 2
+        assert stats["evictions"] == 1
+        assert stats["expirations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_search_reuses_embedding_and_results(cache):
+    """Test that a repeated search costs neither an embedding, a vector query nor a lookup."""
+    collection = MagicMock(id=uuid.uuid4())
+    embedding_model = MagicMock(model_name="test-model")
+    embedding_model.embed = AsyncMock(return_value=[0.1, 0.2])
+    destination = MagicMock()
+    destination.search = AsyncMock(return_value=[{"id": "p1", "score": 0.9, "payload": {}}])
+    destination.sparse_search = AsyncMock(return_value=[])
+    destination_class = MagicMock(create=AsyncMock(return_value=destination))
+
+    with (
+        patch("airweave.core.search_service.search_cache", cache),
+        patch("airweave.core.search_service.settings.OPENAI_API_KEY", None),
+        patch("airweave.core.search_service.LocalText2Vec", return_value=embedding_model),
+        patch(
+            "airweave.core.search_service.crud.collection.get_by_readable_id",
+            new=AsyncMock(return_value=collection),
+        ) as get_collection,
+        patch(
+            "airweave.core.search_service.crud.destination.get_by_short_name",
+            new=AsyncMock(return_value=MagicMock(short_name="qdrant_native")),
+        ) as get_destination,
+        patch(
+            "airweave.core.search_service.resource_locator.get_destination",
+            return_value=destination_class,
+        ),
+        patch(
+            "airweave.core.search_service.crud.sync_job.get_last_finished_at_for_collection",
+            new=AsyncMock(return_value=None),
+        ),
+    ):
+        service = SearchService()
+        user = MagicMock(email="user@example.com")
+        first = await service.search(AsyncMock(), "query", "readable-id", user)
+        second = await service.search(AsyncMock(), "query", "readable-id", user)
+
+        cache.invalidate_collection(collection.id)
+        await service.search(AsyncMock(), "query", "readable-id", user)
+
+    assert first == second
+    assert embedding_model.embed.await_count == 1
+    assert destination.search.await_count == 2
+    assert get_collection.await_count == 1
+    assert get_destination.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_in_another_process_invalidates_results(cache):
+    """Test that results are not served after a sync job finished in a sync worker."""
+    collection_id = uuid.uuid4()
+    service = SearchService()
+    destination = MagicMock(search=AsyncMock(return_value=[{"id": "p1", "score": 0.9}]))
+    service._destination_class = MagicMock(create=AsyncMock(return_value=destination))
+    finished_at = [datetime(2024, 1, 1, 12, 0)]
+
+    async def search(now):
+        with patch("airweave.core.search_cache.time.monotonic", return_value=now):
+            sync_generation = await service._get_sync_generation(AsyncMock(), collection_id)
+            await service._search_collection(
+                collection_id, "q", [0.1], SearchParams(), sync_generation=sync_generation
+            )
+
+    with (
+        patch("airweave.core.search_service.search_cache", cache),
+        patch("airweave.core.search_service.settings.SEARCH_HYBRID_ENABLED", False),
+        patch(
+            "airweave.core.search_service.crud.sync_job.get_last_finished_at_for_collection",
+            new=AsyncMock(side_effect=lambda *_, **__: finished_at[0]),
+        ) as get_finished_at,
+    ):
+        await search(now=0)
+        await search(now=1)
+
+        # A worker finishes a sync, this process notices once the sync generation expired
+        finished_at[0] = datetime(2024, 1, 1, 13, 0)
+        await search(now=2)
+        await search(now=6)
+
+    assert destination.search.await_count == 2
+    assert get_finished_at.await_count == 2
+
+
+def test_reciprocal_rank_fusion():
+    """Test that results found by both channels rank first and keep their channel scores."""
+    dense = [{"id": "a", "score": 0.9}, {"id": "b", "score": 0.8}]
+    sparse = [{"id": "c", "score": 12.0}, {"id": "b", "score": 7.5}]
+
+    fused = reciprocal_rank_fusion({"dense": dense, "sparse": sparse})
+
+    assert [result["id"] for result in fused] == ["b", "a", "c"]
+    assert fused[0]["scores"] == {"dense": 0.8, "sparse": 7.5}
+    assert fused[0]["score"] == 1 / 62 + 1 / 62
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_pages_the_fused_ranking():
+    """Test that both channels fetch up to the page end and the page is cut after fusion."""
+    destination = MagicMock()
+    destination.search = AsyncMock(return_value=[{"id": i, "score": 1.0} for i in range(4)])
+    destination.sparse_search = AsyncMock(return_value=[{"id": 9, "score": 5.0}])
+
+    results = await SearchService()._hybrid_search(
+        destination, "ENG-1234", [0.1], SearchParams(limit=2, offset=1)
+    )
+
+    window = destination.search.call_args.args[1]
+    assert (window.limit, window.offset) == (3, 0)
+    assert [result["id"] for result in results] == [9, 1]
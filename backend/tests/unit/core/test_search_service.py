@@ -0,0 +1,169 @@
+"""Unit tests for the search service."""
+
+import copy
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from airweave.core.search_cache import SearchCache
+from airweave.core.search_service import COMPLETION_FALLBACKS, SearchService
+from airweave.schemas.search import SearchParams, SearchStatus
+
+
+@pytest.fixture(autouse=True)
+def word_tokens():
+    """Count one token per word instead of loading the tokenizer."""
+    with patch(
+        "airweave.core.completion_context.count_tokens",
+        side_effect=lambda text: len(text.split()),
+    ):
+        yield
+
+
+@pytest.fixture
+def cache():
+    """Create an enabled search cache."""
+    return SearchCache(
+        embedding_max_entries=10,
+        embedding_ttl_seconds=60,
+        result_max_entries=10,
+        result_ttl_seconds=60,
+    )
+
+
+def _chunk(content):
+    """Create a streamed completion chunk."""
+    return MagicMock(choices=[MagicMock(delta=MagicMock(content=content))])
+
+
+async def _stream(*contents):
+    for content in contents:
+        yield _chunk(content)
+
+
+async def _collect(service):
+    return [
+        event
+        async for event in service.stream_search_with_completion(
+            db=MagicMock(), query="q", readable_id="collection", current_user=MagicMock()
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_results_are_streamed_before_the_completion():
+    """Test that the results come first, then the completion pieces, then the status."""
+    service = SearchService()
+    results = [{"id": "p1", "score": 0.9, "payload": {"vector": [0.1], "download_url": "u"}}]
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(return_value=_stream("Hello", None, " world"))
+
+    with (
+        patch.object(service, "search", AsyncMock(return_value=results)),
+        patch("airweave.core.chat_service.chat_service.client", client),
+    ):
+        events = await _collect(service)
+
+    assert events == [
+        ("results", {"results": [{"id": "p1", "score": 0.9, "payload": {}}]}),
+        ("completion", {"content": "Hello"}),
+        ("completion", {"content": " world"}),
+        ("done", {"status": "success", "prompt_tokens": events[-1][1]["prompt_tokens"]}),
+    ]
+    assert events[-1][1]["prompt_tokens"] > 0
+    call = client.chat.completions.create.call_args.kwargs
+    assert call["stream"] is True
+    assert "download_url" not in call["messages"][0]["content"]
+
+
+@pytest.mark.asyncio
+async def test_no_results_skips_the_completion():
+    """Test that no completion is generated when nothing was found."""
+    service = SearchService()
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock()
+
+    with (
+        patch.object(service, "search", AsyncMock(return_value=[])),
+        patch("airweave.core.chat_service.chat_service.client", client),
+    ):
+        events = await _collect(service)
+
+    assert events == [
+        ("results", {"results": []}),
+        ("completion", {"content": COMPLETION_FALLBACKS[SearchStatus.NO_RESULTS]}),
+        ("done", {"status": "no_results"}),
+    ]
+    client.chat.completions.create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_search_many_merges_collections_by_score():
+    """Test that the query is embedded once and results are merged with their collection."""
+    service = SearchService()
+    collection_ids = {"sales": uuid.uuid4(), "support": uuid.uuid4()}
+    results = {
+        collection_ids["sales"]: [{"id": "s1", "score": 0.9}, {"id": "s2", "score": 0.5}],
+        collection_ids["support"]: [{"id": "t1", "score": 0.7}],
+    }
+
+    async def search_collection(collection_id, query, vector, params, sync_generation):
+        return results[collection_id]
+
+    with (
+        patch.object(
+            service,
+            "_resolve_collection_id",
+            AsyncMock(side_effect=lambda db, readable_id, user: collection_ids[readable_id]),
+        ),
+        patch.object(service, "_get_sync_generation", AsyncMock(return_value="")),
+        patch.object(service, "_get_destination_class", AsyncMock()),
+        patch.object(service, "_embed_query", AsyncMock(return_value=[0.1])) as embed_query,
+        patch.object(service, "_search_collection", side_effect=search_collection) as search,
+    ):
+        merged = await service.search_many(
+            MagicMock(),
+            "q",
+            ["sales", "support", "sales"],
+            MagicMock(),
+            SearchParams(limit=2, offset=1),
+        )
+
+    assert merged == [
+        {"id": "t1", "score": 0.7, "collection": "support"},
+        {"id": "s2", "score": 0.5, "collection": "sales"},
+    ]
+    assert embed_query.await_count == 1
+    assert search.call_count == 2
+    assert (search.call_args.args[3].limit, search.call_args.args[3].offset) == (3, 0)
+
+
+@pytest.mark.asyncio
+async def test_rerank_over_fetches_and_caches_scores(cache):
+    """Test that reranking pages the reranked candidates and reuses cached scores."""
+    service = SearchService()
+    candidates = [
+        {"id": i, "score": 0.9 - i / 100, "payload": {"content": f"chunk {i}"}} for i in range(5)
+    ]
+    destination = MagicMock(search=AsyncMock(side_effect=lambda *_: copy.deepcopy(candidates)))
+    service._destination_class = MagicMock(create=AsyncMock(return_value=destination))
+    reranker = MagicMock(cacheable=True)
+    reranker.name = "cross"
+    reranker.score = AsyncMock(return_value=[0.1, 0.5, 0.9, 0.3, 0.7])
+    service._reranker = reranker
+    params = SearchParams(limit=2, offset=1, rerank=True)
+
+    with (
+        patch("airweave.core.search_service.search_cache", cache),
+        patch("airweave.core.search_service.settings.SEARCH_HYBRID_ENABLED", False),
+        patch("airweave.core.search_service.settings.SEARCH_RERANK_CANDIDATES", 5),
+    ):
+        results = await service._search_collection(uuid.uuid4(), "q", [0.1], params)
+        # The same chunks in another collection are scored from the cache
+        await service._search_collection(uuid.uuid4(), "q", [0.1], params)
+
+    assert destination.search.call_args.args[1].limit == 5
+    assert [result["id"] for result in results] == [4, 1]
+    assert results[0]["scores"] == {"dense": 0.86, "rerank": 0.7}
+    assert reranker.score.await_count == 1
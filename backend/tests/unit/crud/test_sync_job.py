@@ -0,0 +1,54 @@
+"""Unit tests for the sync job queue operations of the SyncJob CRUD."""
+
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from airweave.crud.crud_sync_job import sync_job as crud_sync_job
+
+
+def _executed_sql(db: AsyncMock) -> str:
+    """Return the Postgres SQL of the statement the session executed."""
+    statement = db.execute.await_args.args[0]
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_requeue_does_not_count_the_attempt():
+    """Test that a job requeued by a stopping worker gets its attempt back."""
+    db = AsyncMock()
+
+    await crud_sync_job.release_lease(db, id=uuid.uuid4(), worker_id="w1", requeue=True)
+
+    sql = _executed_sql(db)
+    assert "attempts=greatest(sync_job.attempts - " in sql
+    assert "leased_by=" in sql
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_release_without_requeue_keeps_the_attempts():
+    """Test that releasing the lease of a finished job leaves its attempts alone."""
+    db = AsyncMock()
+
+    await crud_sync_job.release_lease(db, id=uuid.uuid4(), worker_id="w1")
+
+    assert "attempts" not in _executed_sql(db)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_fail_abandoned_also_fails_pending_jobs_out_of_attempts():
+    """Test that pending jobs without a lease that claim_next skips are failed too."""
+    db = AsyncMock()
+
+    await crud_sync_job.fail_abandoned(db, max_attempts=3)
+
+    sql = _executed_sql(db)
+    where = sql.split(" WHERE ", 1)[1]
+    assert "sync_job.lease_expires_at < " in where
+    assert "sync_job.status = %(status_2)s AND sync_job.leased_by IS NULL" in where
+    assert where.endswith("AND sync_job.attempts >= %(attempts_1)s::INTEGER")
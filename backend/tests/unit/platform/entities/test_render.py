@@ -0,0 +1,70 @@
+"""Unit tests for rendering entities into embeddable text."""
+
+from datetime import datetime
+from typing import ClassVar, List, Optional
+
+from airweave.platform.entities._base import Breadcrumb, ChunkEntity
+from airweave.platform.entities._render import entity_type_label, render_entity_text
+
+
+class ProjectTaskEntity(ChunkEntity):
+    """Task entity for testing."""
+
+    title: str
+    notes: Optional[str] = None
+    tags: List[str] = []
+    assignee_id: Optional[str] = None
+    priority: int = 1
+    created_at: Optional[datetime] = None
+
+
+class ExplicitTaskEntity(ProjectTaskEntity):
+    """Task entity with explicit embeddable fields."""
+
+    embeddable_fields: ClassVar[Optional[List[str]]] = ["title", "priority"]
+
+
+def test_entity_type_label():
+    """Test that class names are split into readable words."""
+    assert entity_type_label(ProjectTaskEntity) == "Project Task"
+
+
+def test_default_rendering_keeps_only_content_fields():
+    """Test that identifiers, scalars and platform fields are left out by default."""
+    entity = ProjectTaskEntity(
+        entity_id="task-1",
+        url="https://example.com/task-1",
+        breadcrumbs=[Breadcrumb(entity_id="p1", name="Roadmap", type="project")],
+        title="Ship search",
+        notes="  ",
+        tags=["search", "q3"],
+        assignee_id="user-1",
+        priority=4,
+        created_at=datetime(2024, 1, 1),
+    )
+
+    assert render_entity_text(entity) == (
+        "type: Project Task\npath: Roadmap\ntitle: Ship search\ntags: search, q3"
+    )
+
+
+def test_explicit_embeddable_fields():
+    """Test that embeddable_fields selects and orders the rendered fields."""
+    entity = ExplicitTaskEntity(
+        entity_id="task-1", title="Ship search", notes="ignored", priority=4
+    )
+
+    assert render_entity_text(entity) == "type: Explicit Task\ntitle: Ship search\npriority: 4"
+
+
+def test_embeddable_text_is_cached_and_excluded_from_payload():
+    """Test that the rendered text is computed once and never stored or hashed."""
+    entity = ProjectTaskEntity(entity_id="task-1", title="Ship search")
+    hash_before = entity.hash()
+
+    text = entity.to_embeddable_text()
+    entity.title = "Changed"
+
+    assert entity.to_embeddable_text() is text
+    assert "_embeddable_text" not in entity.to_storage_dict()
+    assert ProjectTaskEntity(entity_id="task-1", title="Ship search").hash() == hash_before
@@ -0,0 +1,85 @@
+"""Unit tests for the micro-batching stage."""
+
+import asyncio
+
+import pytest
+
+from airweave.platform.entities._base import ChunkEntity, DestinationAction
+from airweave.platform.sync.batcher import EntityBatcher, PendingEntity
+
+
+class MockChunkEntity(ChunkEntity):
+    """Mock ChunkEntity for testing."""
+
+    content: str = ""
+
+
+def _pending(entity_id: str, chunks: int = 1) -> PendingEntity:
+    """Build a pending INSERT with the given number of chunks."""
+    parent = MockChunkEntity(entity_id=entity_id)
+    entities = [MockChunkEntity(entity_id=f"{entity_id}-{i}") for i in range(chunks)]
+    return PendingEntity(parent, entities, None, DestinationAction.INSERT)
+
+
+class TestEntityBatcher:
+    """Tests for EntityBatcher."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_chunk_limit_reached(self):
+        """Test that a full buffer is flushed as one batch."""
+        batches = []
+
+        async def flush(items):
+            batches.append([item.parent_entity.entity_id for item in items])
+
+        batcher = EntityBatcher(flush, max_chunks=4, max_latency=60)
+        await batcher.submit(_pending("a", chunks=2))
+        assert batches == []
+        await batcher.submit(_pending("b", chunks=2))
+        assert batches == [["a", "b"]]
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_latency(self):
+        """Test that a partially filled buffer is flushed once the latency bound passes."""
+        flushed = asyncio.Event()
+
+        async def flush(items):
+            flushed.set()
+
+        batcher = EntityBatcher(flush, max_chunks=100, max_latency=0.01)
+        await batcher.submit(_pending("a"))
+        await asyncio.wait_for(flushed.wait(), timeout=1)
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_remaining(self):
+        """Test that close flushes entities still in the buffer."""
+        batches = []
+
+        async def flush(items):
+            batches.append(len(items))
+
+        batcher = EntityBatcher(flush, max_chunks=100, max_latency=60)
+        await batcher.submit(_pending("a"))
+        await batcher.submit(_pending("b"))
+        await batcher.close()
+        assert batches == [2]
+
+    @pytest.mark.asyncio
+    async def test_failure_is_attributed_to_entity(self):
+        """Test that a failing batch is retried per entity and only the culprit is failed."""
+        persisted = []
+
+        async def flush(items):
+            if any(item.parent_entity.entity_id == "bad" for item in items):
+                raise ValueError("boom")
+            persisted.extend(item.parent_entity.entity_id for item in items)
+
+        batcher = EntityBatcher(flush, max_chunks=3, max_latency=60)
+        for entity_id in ("a", "bad", "c"):
+            await batcher.submit(_pending(entity_id))
+        await batcher.close()
+
+        assert persisted == ["a", "c"]
+        assert batcher.failed_entity_ids == ["bad"]
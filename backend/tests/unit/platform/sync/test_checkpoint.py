@@ -0,0 +1,131 @@
+"""Unit tests for source checkpoints."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from airweave.platform.sources._base import BaseSource
+from airweave.platform.sources.notion import NotionSource
+from airweave.platform.sync.checkpoint import SourceCheckpointTracker
+from airweave.platform.sync.orchestrator import SyncOrchestrator
+
+
+class PagedSource(BaseSource):
+    """Source that yields pages of numbers and checkpoints after every page."""
+
+    supports_checkpoints = True
+
+    @classmethod
+    async def create(cls):
+        """Create the source."""
+        return cls()
+
+    async def generate_entities(self):
+        """Yield the numbers 0 to 5, from the resume cursor on."""
+        start = (self._resume_cursor or {}).get("next", 0)
+        for page_start in range(start, 6, 2):
+            for number in range(page_start, page_start + 2):
+                yield number
+            self.checkpoint({"next": page_start + 2})
+
+
+async def _consume(tracker, source):
+    """Take the stream like the orchestrator does, returning the checkpoints due per step."""
+    due = []
+    consumed = 0
+    async for _ in tracker.track(source.generate_entities()):
+        due.append(tracker.due(consumed))
+        consumed += 1
+    return due
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_is_due_only_once_its_entities_were_taken():
+    """Test that a checkpoint is due after every entity before it was taken from the stream."""
+    source = PagedSource()
+    tracker = SourceCheckpointTracker(source, uuid.uuid4(), interval_seconds=0)
+
+    due = await _consume(tracker, source)
+
+    # The checkpoint after the first page is seen with the third entity, when two were taken
+    assert due == [None, None, {"next": 2}, None, {"next": 4}, None]
+
+
+@pytest.mark.asyncio
+async def test_checkpoints_wait_for_the_interval():
+    """Test that checkpoints are not due before the interval has passed."""
+    source = PagedSource()
+    tracker = SourceCheckpointTracker(source, uuid.uuid4(), interval_seconds=3600)
+
+    assert await _consume(tracker, source) == [None] * 6
+
+
+@pytest.mark.asyncio
+async def test_save_failures_do_not_fail_the_sync(mock_db_context):
+    """Test that a checkpoint that cannot be saved is logged and skipped."""
+    tracker = SourceCheckpointTracker(PagedSource(), uuid.uuid4(), interval_seconds=0)
+
+    with (
+        patch("airweave.platform.sync.checkpoint.get_db_context", mock_db_context),
+        patch(
+            "airweave.platform.sync.checkpoint.crud.sync_job.save_checkpoint",
+            new=AsyncMock(side_effect=[RuntimeError("database down"), None]),
+        ) as save_checkpoint,
+    ):
+        await tracker.save({"next": 2})
+        await tracker.save({"next": 4})
+
+    assert save_checkpoint.await_count == 2
+    assert tracker.checkpoints_saved == 1
+
+
+@pytest.mark.asyncio
+async def test_resuming_from_a_failed_job_takes_over_its_entities(mock_db_context):
+    """Test that the entities of the failed job are handed over before the source resumes."""
+    failed_job_id = uuid.uuid4()
+    source = PagedSource()
+    sync_context = MagicMock(source=source)
+    sync_context.sync_job.id = uuid.uuid4()
+
+    with (
+        patch("airweave.platform.sync.orchestrator.settings.SYNC_CHECKPOINTS_ENABLED", True),
+        patch("airweave.platform.sync.orchestrator.get_db_context", mock_db_context),
+        patch(
+            "airweave.platform.sync.orchestrator.crud.sync_job.get_resumable_checkpoint",
+            new=AsyncMock(return_value=(failed_job_id, {"next": 4})),
+        ),
+        patch(
+            "airweave.platform.sync.orchestrator.crud.sync_job.save_checkpoint",
+            new=AsyncMock(),
+        ) as save_checkpoint,
+        patch(
+            "airweave.platform.sync.orchestrator.crud.entity.reassign_sync_job",
+            new=AsyncMock(return_value=4),
+        ) as reassign,
+        patch(
+            "airweave.platform.sync.orchestrator.crud.sync_job.take_over_watermark",
+            new=AsyncMock(),
+        ) as take_over_watermark,
+    ):
+        await SyncOrchestrator()._initialize_checkpoints(sync_context)
+
+    assert reassign.await_args.kwargs["from_sync_job_id"] == failed_job_id
+    assert reassign.await_args.kwargs["to_sync_job_id"] == sync_context.sync_job.id
+    assert save_checkpoint.await_args.kwargs["cursor"] == {"next": 4}
+    assert take_over_watermark.await_args.kwargs["from_id"] == failed_job_id
+    assert isinstance(sync_context.checkpoints, SourceCheckpointTracker)
+    assert [number async for number in source.generate_entities()] == [4, 5]
+
+
+def test_notion_pages_are_ordered_by_last_edit():
+    """Test that Notion pages edited after a checkpoint sort behind it."""
+    pages = [
+        {"id": "b", "last_edited_time": "2024-01-02T00:00:00.000Z"},
+        {"id": "c", "last_edited_time": "2024-01-01T00:00:00.000Z"},
+        {"id": "a", "last_edited_time": "2024-01-02T00:00:00.000Z"},
+    ]
+
+    pages.sort(key=NotionSource._page_position)
+
+    assert [page["id"] for page in pages] == ["c", "a", "b"]
@@ -0,0 +1,84 @@
+"""Unit tests for the prefetched entity hash index."""
+
+import hashlib
+import os
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from airweave.platform.sync.entity_index import EntityHashIndex
+
+
+def _rows(count: int, prefix: str = "entity") -> list[tuple[uuid.UUID, str, str]]:
+    """Build (db_id, entity_id, hash) rows."""
+    return [
+        (uuid.uuid4(), f"{prefix}-{i:06d}", hashlib.sha256(str(i).encode()).hexdigest())
+        for i in range(count)
+    ]
+
+
+class TestEntityHashIndex:
+    """Tests for EntityHashIndex."""
+
+    def test_in_memory_lookup(self):
+        """Test lookups and hit/miss counting without spilling."""
+        rows = _rows(10)
+        index = EntityHashIndex(max_in_memory=100)
+        index.add_many(rows)
+
+        db_id, entity_id, entity_hash = rows[3]
+        indexed = index.get(entity_id)
+        assert indexed.db_id == db_id
+        assert indexed.hash == entity_hash
+        assert index.get("unknown") is None
+
+        assert not index.is_spilled
+        assert len(index) == 10
+        assert (index.hits, index.misses) == (1, 1)
+        index.close()
+
+    def test_non_hex_hash_round_trip(self):
+        """Test that hashes which are not sha256 hex digests are preserved."""
+        index = EntityHashIndex()
+        db_id = uuid.uuid4()
+        index.add_many([(db_id, "a", "not-a-hex-digest")])
+        assert index.get("a").hash == "not-a-hex-digest"
+
+    def test_spills_to_disk(self):
+        """Test that the index spills to disk and keeps serving lookups."""
+        rows = _rows(25)
+        index = EntityHashIndex(max_in_memory=10)
+        index.add_many(rows[:8])
+        assert not index.is_spilled
+
+        index.add_many(rows[8:])
+        assert index.is_spilled
+        assert len(index) == 25
+
+        for db_id, entity_id, entity_hash in (rows[0], rows[24]):
+            indexed = index.get(entity_id)
+            assert indexed.db_id == db_id
+            assert indexed.hash == entity_hash
+
+        disk_path = index._disk_path
+        assert os.path.exists(disk_path)
+        index.close()
+        assert not os.path.exists(disk_path)
+
+    @pytest.mark.asyncio
+    async def test_load_paginates(self):
+        """Test that load pages through the entity table with a keyset cursor."""
+        rows = _rows(5)
+        pages = [rows[:2], rows[2:4], rows[4:]]
+
+        with patch(
+            "airweave.platform.sync.entity_index.crud.entity.get_hash_page_by_sync_id",
+            new=AsyncMock(side_effect=pages),
+        ) as mock_page:
+            index = await EntityHashIndex.load(AsyncMock(), sync_id=uuid.uuid4(), page_size=2)
+
+        assert len(index) == 5
+        assert mock_page.call_count == 3
+        cursors = [call.kwargs["after_entity_id"] for call in mock_page.call_args_list]
+        assert cursors == [None, rows[1][1], rows[3][1]]
@@ -0,0 +1,76 @@
+"""Unit tests for incremental syncs."""
+
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from airweave.core.shared_models import SyncMode
+from airweave.platform.sources.notion import NotionSource
+from airweave.platform.sync.orchestrator import SyncOrchestrator
+
+
+def _sync_context(sync_mode, supports_incremental=True):
+    source = NotionSource()
+    source.supports_incremental = supports_incremental
+    sync_context = MagicMock(source=source)
+    sync_context.sync_job.id = uuid.uuid4()
+    sync_context.sync_job.sync_mode = sync_mode
+    return sync_context
+
+
+async def _initialize(sync_context, watermark, mock_db_context):
+    with (
+        patch("airweave.platform.sync.orchestrator.settings.SYNC_INCREMENTAL_ENABLED", True),
+        patch("airweave.platform.sync.orchestrator.settings.SYNC_INCREMENTAL_OVERLAP_SECONDS", 60),
+        patch("airweave.platform.sync.orchestrator.get_db_context", mock_db_context),
+        patch(
+            "airweave.platform.sync.orchestrator.crud.sync_job.get_last_watermark",
+            new=AsyncMock(return_value=watermark),
+        ),
+        patch(
+            "airweave.platform.sync.orchestrator.crud.sync_job.start_window", new=AsyncMock()
+        ) as start_window,
+    ):
+        await SyncOrchestrator()._initialize_sync_mode(sync_context)
+    return start_window.await_args.kwargs["sync_mode"]
+
+
+@pytest.mark.asyncio
+async def test_incremental_job_fetches_changes_since_the_watermark(mock_db_context):
+    """Test that the source gets the last watermark, moved back by the overlap."""
+    sync_context = _sync_context(SyncMode.INCREMENTAL)
+
+    recorded_mode = await _initialize(sync_context, datetime(2024, 1, 1, 12, 0), mock_db_context)
+
+    assert recorded_mode == SyncMode.INCREMENTAL
+    assert sync_context.sync_mode == SyncMode.INCREMENTAL
+    assert sync_context.source._changed_since == datetime(2024, 1, 1, 11, 59, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "watermark, supports_incremental",
+    [(None, True), (datetime(2024, 1, 1, 12, 0), False)],
+)
+async def test_incremental_job_falls_back_to_a_full_sync(
+    watermark, supports_incremental, mock_db_context
+):
+    """Test that a job runs in full without a completed job or incremental source support."""
+    sync_context = _sync_context(SyncMode.INCREMENTAL, supports_incremental)
+
+    recorded_mode = await _initialize(sync_context, watermark, mock_db_context)
+
+    assert recorded_mode == SyncMode.FULL
+    assert sync_context.sync_mode == SyncMode.FULL
+    assert sync_context.source._changed_since is None
+
+
+def test_notion_skips_pages_not_edited_since_the_watermark():
+    """Test that Notion only processes pages edited since the watermark."""
+    source = NotionSource()
+    source.sync_changes_since(datetime(2024, 1, 2, tzinfo=timezone.utc))
+
+    assert source._edited_since({"id": "a", "last_edited_time": "2024-01-02T00:00:00.000Z"})
+    assert not source._edited_since({"id": "b", "last_edited_time": "2024-01-01T23:59:00.000Z"})
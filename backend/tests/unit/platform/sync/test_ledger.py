@@ -0,0 +1,95 @@
+"""Unit tests for the buffered entity ledger writer."""
+
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from airweave.platform.entities._base import ChunkEntity
+from airweave.platform.sync.ledger import EntityLedgerWriter
+
+
+class MockChunkEntity(ChunkEntity):
+    """Mock ChunkEntity for testing."""
+
+    content: str = ""
+
+
+@pytest.fixture
+def ledger():
+    """Create a ledger writer with a small batch size."""
+    return EntityLedgerWriter(
+        sync_id=uuid.uuid4(),
+        sync_job_id=uuid.uuid4(),
+        organization_id=uuid.uuid4(),
+        batch_size=2,
+    )
+
+
+class TestEntityLedgerWriter:
+    """Tests for EntityLedgerWriter."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_in_batches(self, ledger, mock_db_context):
+        """Test that rows are written with one upsert per full batch."""
+        with (
+            patch("airweave.platform.sync.ledger.get_db_context", mock_db_context),
+            patch(
+                "airweave.platform.sync.ledger.crud.entity.bulk_upsert",
+                new=AsyncMock(side_effect=lambda db, rows, organization_id: len(rows)),
+            ) as mock_upsert,
+        ):
+            entities = [MockChunkEntity(entity_id=f"e{i}", content=str(i)) for i in range(3)]
+            for entity in entities:
+                await ledger.add(entity)
+            assert mock_upsert.call_count == 1
+
+            await ledger.close()
+
+        assert mock_upsert.call_count == 2
+        first_rows = mock_upsert.call_args_list[0].kwargs["rows"]
+        assert [row["entity_id"] for row in first_rows] == ["e0", "e1"]
+        assert first_rows[0]["id"] == entities[0].db_entity_id
+        assert first_rows[0]["hash"] == entities[0].hash()
+        assert ledger.rows_written == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_rows(self, ledger, mock_db_context):
+        """Test that rows of a failed flush are retried by the next flush."""
+        with (
+            patch("airweave.platform.sync.ledger.get_db_context", mock_db_context),
+            patch(
+                "airweave.platform.sync.ledger.crud.entity.bulk_upsert",
+                new=AsyncMock(side_effect=[RuntimeError("db down"), 2]),
+            ) as mock_upsert,
+        ):
+            await ledger.add(MockChunkEntity(entity_id="a"))
+            await ledger.add(MockChunkEntity(entity_id="b"))
+            await ledger.close()
+
+        retried_rows = mock_upsert.call_args_list[1].kwargs["rows"]
+        assert [row["entity_id"] for row in retried_rows] == ["a", "b"]
+        assert ledger.rows_written == 2
+
+    @pytest.mark.asyncio
+    async def test_touched_entities_update_sync_job_id(self, ledger, mock_db_context):
+        """Test that unchanged entities only get their sync job id bumped."""
+        with (
+            patch("airweave.platform.sync.ledger.get_db_context", mock_db_context),
+            patch(
+                "airweave.platform.sync.ledger.crud.entity.bulk_upsert",
+                new=AsyncMock(return_value=0),
+            ),
+            patch(
+                "airweave.platform.sync.ledger.crud.entity.bulk_update_sync_job_id",
+                new=AsyncMock(return_value=2),
+            ) as mock_touch,
+        ):
+            await ledger.touch("a")
+            await ledger.touch("b")
+            await ledger.close()
+
+        assert mock_touch.call_count == 1
+        assert mock_touch.call_args.kwargs["entity_ids"] == ["a", "b"]
+        assert mock_touch.call_args.kwargs["sync_job_id"] == ledger.sync_job_id
+        assert ledger.rows_touched == 2
@@ -0,0 +1,76 @@
+"""Unit tests for the sync orchestrator."""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from airweave.platform.entities._base import DestinationAction
+from airweave.platform.sync.orchestrator import EntityProcessor, SyncOrchestrator
+from airweave.schemas.dag import NodeType
+
+
+class DocumentEntity:
+    """Entity of the first sync."""
+
+    def __init__(self, entity_id: str):
+        """Initialize the entity."""
+        self.entity_id = entity_id
+
+
+class TicketEntity(DocumentEntity):
+    """Entity of the second sync."""
+
+
+def _sync_context(*entity_types):
+    """Build the context of a sync whose DAG has the given entity types."""
+    sync_context = MagicMock()
+    sync_context.sync.id = uuid.uuid4()
+    sync_context.dag.nodes = []
+    for entity_type in entity_types:
+        node = MagicMock(type=NodeType.entity)
+        node.name = entity_type.__name__
+        sync_context.dag.nodes.append(node)
+    sync_context.progress.increment = AsyncMock()
+    sync_context.progress.update_entities_encountered = AsyncMock()
+    return sync_context
+
+
+@pytest.mark.asyncio
+async def test_concurrent_syncs_track_their_own_entities():
+    """Test that a sync starting while another runs does not reset the other's tracking."""
+    orchestrator = SyncOrchestrator()
+    first = _sync_context(DocumentEntity)
+    second = _sync_context(TicketEntity)
+
+    async def determine_action(self, entity, sync_context, db):
+        await asyncio.sleep(0)
+        return None, DestinationAction.KEEP
+
+    async def process(sync_context, entities):
+        for entity in entities:
+            await orchestrator.entity_processor.process(
+                entity=entity, source_node=MagicMock(), sync_context=sync_context, db=AsyncMock()
+            )
+
+    with (
+        patch.object(EntityProcessor, "_determine_action", determine_action),
+        patch.object(EntityProcessor, "_touch_ledger", new=AsyncMock()),
+    ):
+        orchestrator._initialize_entity_tracking(first)
+        first_run = asyncio.create_task(
+            process(first, [DocumentEntity("a"), DocumentEntity("shared")])
+        )
+        await asyncio.sleep(0)
+
+        # The second sync starts while the first one is still processing
+        orchestrator._initialize_entity_tracking(second)
+        await asyncio.gather(
+            first_run, process(second, [TicketEntity("shared"), TicketEntity("b")])
+        )
+
+    assert first.entities_encountered == {"DocumentEntity": {"a", "shared"}}
+    assert second.entities_encountered == {"TicketEntity": {"shared", "b"}}
+    assert first.progress.increment.await_count == 2
+    assert second.progress.increment.await_count == 2
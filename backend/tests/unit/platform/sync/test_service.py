@@ -158,6 +158,76 @@ class TestSyncServiceRun:
                     assert "Error during sync" in mock_logger_error.call_args[0][0]
 
 
+class TestSyncServiceDispatch:
+    """Tests for the SyncService.dispatch method with the job queue enabled."""
+
+    async def _dispatch(self, held, access_token="token"):
+        """Dispatch a job with a request-scoped token; return the hold and background mocks."""
+        mock_db_context = AsyncMock()
+        background_tasks = MagicMock()
+        with (
+            patch("airweave.core.sync_service.settings.SYNC_JOB_QUEUE_ENABLED", True),
+            patch("airweave.core.sync_service.get_db_context", return_value=mock_db_context),
+            patch(
+                "airweave.core.sync_service.crud.sync_job.hold", new=AsyncMock(return_value=held)
+            ) as mock_hold,
+        ):
+            await SyncService().dispatch(
+                MagicMock(),
+                MagicMock(id=uuid.uuid4()),
+                MagicMock(),
+                MagicMock(),
+                MagicMock(),
+                MagicMock(),
+                access_token=access_token,
+                background_tasks=background_tasks,
+            )
+        return mock_hold, background_tasks
+
+    @pytest.mark.asyncio
+    async def test_held_job_runs_in_process(self):
+        """Test that a job with an access token runs here once this process holds it."""
+        mock_hold, background_tasks = await self._dispatch(held=True)
+
+        mock_hold.assert_awaited_once()
+        background_tasks.add_task.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_job_claimed_by_a_worker_is_not_run_twice(self):
+        """Test that a job a worker claimed before it was held is left to the worker."""
+        _, background_tasks = await self._dispatch(held=False)
+
+        background_tasks.add_task.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_job_without_token_is_left_to_the_workers(self):
+        """Test that a job without an access token is not held or run here."""
+        mock_hold, background_tasks = await self._dispatch(held=True, access_token=None)
+
+        mock_hold.assert_not_awaited()
+        background_tasks.add_task.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_job_run_in_process_is_created_held(self, mock_user):
+        """Test that a job this process will run is inserted already held by it."""
+        service = SyncService()
+        mock_db = AsyncMock(spec=AsyncSession)
+        with (
+            patch("airweave.core.sync_service.settings.SYNC_JOB_QUEUE_ENABLED", True),
+            patch("airweave.core.sync_service.crud.sync.get", new=AsyncMock()),
+            patch("airweave.core.sync_service.crud.sync_job.create", new=AsyncMock()) as create,
+            patch("airweave.core.sync_service.crud.sync_dag.get_by_sync_id", new=AsyncMock()),
+            patch("airweave.core.sync_service.schemas.Sync.model_validate"),
+            patch("airweave.core.sync_service.schemas.SyncJob.model_validate"),
+            patch("airweave.core.sync_service.schemas.SyncDag.model_validate"),
+        ):
+            await service.trigger_sync_run(
+                mock_db, sync_id=uuid.uuid4(), current_user=mock_user, run_in_process=True
+            )
+
+        assert create.await_args.kwargs["obj_in"]["leased_by"] == service._process_id
+
+
 class TestSyncServiceSingleton:
     """Tests for the SyncService singleton instance."""
 
@@ -0,0 +1,82 @@
+"""Unit tests for the stale entity cleanup at the end of a sync job."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from airweave.platform.sync.orchestrator import SyncOrchestrator
+
+
+@pytest.fixture
+def sync_context():
+    """Create a minimal sync context with one destination."""
+    context = MagicMock()
+    context.sync.id = uuid.uuid4()
+    context.sync_job.id = uuid.uuid4()
+    context.destinations = [AsyncMock()]
+    context.progress = AsyncMock()
+    context.batcher = None
+    context.failed_entity_ids = set()
+    return context
+
+
+class TestDeleteStaleEntities:
+    """Tests for SyncOrchestrator._delete_stale_entities."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_outdated_entities_page_by_page(self, sync_context, mock_db_context):
+        """Test that each page of outdated rows is deleted in bulk and counted."""
+        pages = [
+            [(uuid.uuid4(), "a"), (uuid.uuid4(), "b")],
+            [(uuid.uuid4(), "c")],
+        ]
+        with (
+            patch("airweave.platform.sync.orchestrator.get_db_context", mock_db_context),
+            patch("airweave.platform.sync.orchestrator.settings") as mock_settings,
+            patch(
+                "airweave.platform.sync.orchestrator.crud.entity.get_outdated_page",
+                new=AsyncMock(side_effect=pages),
+            ) as mock_page,
+            patch(
+                "airweave.platform.sync.orchestrator.crud.entity.bulk_remove",
+                new=AsyncMock(),
+            ) as mock_remove,
+        ):
+            mock_settings.SYNC_STALE_ENTITY_CLEANUP_ENABLED = True
+            mock_settings.SYNC_STALE_ENTITY_PAGE_SIZE = 2
+            await SyncOrchestrator()._delete_stale_entities(sync_context)
+
+        destination = sync_context.destinations[0]
+        assert [c.args[0] for c in destination.bulk_delete.call_args_list] == [["a", "b"], ["c"]]
+        assert mock_page.call_args_list[1].kwargs["after_entity_id"] == "b"
+        assert [c.kwargs["ids"] for c in mock_remove.call_args_list] == [
+            [pages[0][0][0], pages[0][1][0]],
+            [pages[1][0][0]],
+        ]
+        sync_context.progress.increment.assert_any_call("deleted", 2)
+        sync_context.progress.increment.assert_any_call("deleted", 1)
+
+    @pytest.mark.asyncio
+    async def test_skips_entities_that_failed(self, sync_context, mock_db_context):
+        """Test that entities which failed to process in this job are not deleted."""
+        sync_context.failed_entity_ids = {"a"}
+        with (
+            patch("airweave.platform.sync.orchestrator.get_db_context", mock_db_context),
+            patch("airweave.platform.sync.orchestrator.settings") as mock_settings,
+            patch(
+                "airweave.platform.sync.orchestrator.crud.entity.get_outdated_page",
+                new=AsyncMock(return_value=[(uuid.uuid4(), "a"), (uuid.uuid4(), "b")]),
+            ),
+            patch(
+                "airweave.platform.sync.orchestrator.crud.entity.bulk_remove",
+                new=AsyncMock(),
+            ),
+        ):
+            mock_settings.SYNC_STALE_ENTITY_CLEANUP_ENABLED = True
+            mock_settings.SYNC_STALE_ENTITY_PAGE_SIZE = 10
+            await SyncOrchestrator()._delete_stale_entities(sync_context)
+
+        sync_context.destinations[0].bulk_delete.assert_called_once_with(
+            ["b"], sync_context.sync.id
+        )
@@ -0,0 +1,245 @@
+"""Unit tests for the worker pool and its adaptive concurrency limit."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from airweave.platform.concurrency import (
+    bind_concurrency_limit,
+    is_throttling_error,
+    measure_stage,
+    reporting_http_client,
+)
+from airweave.platform.sync.worker_pool import (
+    AdaptiveConcurrencyLimit,
+    AsyncWorkerPool,
+    GlobalConcurrencyLimit,
+)
+
+
+class ThrottledError(Exception):
+    """Error of a client library that keeps the status code of the response."""
+
+    def __init__(self, status_code: int):
+        """Initialize the error."""
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+async def _run_tasks(pool, count, coro):
+    """Submit tasks to the pool like the orchestrator does and wait for all of them."""
+    for _ in range(count):
+        await pool.submit(coro)
+        if len(pool.pending_tasks) >= pool.current_limit * 2:
+            await pool.wait_for_batch(timeout=0.5)
+    await pool.wait_for_completion()
+
+
+def test_limit_grows_while_in_use():
+    """Test that tasks that complete while the limit is in use grow it up to the maximum."""
+    limit = AdaptiveConcurrencyLimit(initial_limit=4, max_limit=8)
+
+    for _ in range(100):
+        limit.on_success(in_flight=limit.limit)
+
+    assert limit.limit == 8
+
+
+def test_limit_does_not_grow_while_idle():
+    """Test that a limit that is far from used does not grow."""
+    limit = AdaptiveConcurrencyLimit(initial_limit=10, max_limit=50)
+
+    for _ in range(100):
+        limit.on_success(in_flight=1)
+
+    assert limit.limit == 10
+
+
+def test_throttling_backs_off_once_per_window():
+    """Test that throttled calls started before the last decrease do not decrease it again."""
+    limit = AdaptiveConcurrencyLimit(initial_limit=20, min_limit=2, backoff_ratio=0.5)
+    started_at = time.monotonic()
+
+    for _ in range(5):
+        limit.on_throttled(started_at)
+    assert limit.limit == 10
+
+    for _ in range(5):
+        limit.on_throttled(time.monotonic())
+    assert limit.limit == 2
+
+
+def test_rising_stage_latency_backs_off():
+    """Test that calls of a stage that are much slower than usual decrease the limit."""
+    limit = AdaptiveConcurrencyLimit(initial_limit=20, warmup_samples=10)
+    for _ in range(50):
+        limit.on_latency("source", time.monotonic(), 0.01)
+
+    for _ in range(10):
+        limit.on_latency("source", time.monotonic(), 0.5)
+
+    assert limit.limit < 20
+
+
+def test_stage_latencies_are_averaged_separately():
+    """Test that a stage that is always slower than another does not decrease the limit."""
+    limit = AdaptiveConcurrencyLimit(initial_limit=20, warmup_samples=10)
+
+    for _ in range(50):
+        for _ in range(10):
+            limit.on_latency("source", time.monotonic(), 0.01)
+        limit.on_latency("embedding", time.monotonic(), 1.0)
+
+    assert limit.limit == 20
+
+
+def test_measure_stage_reports_latency_and_throttling():
+    """Test that a measured call reports to the bound limit and re-raises its error."""
+    limit = AdaptiveConcurrencyLimit(initial_limit=20, backoff_ratio=0.5)
+
+    with bind_concurrency_limit(limit):
+        with measure_stage("destination"):
+            pass
+        with pytest.raises(ThrottledError), measure_stage("destination"):
+            raise ThrottledError(429)
+        with pytest.raises(ValueError), measure_stage("destination"):
+            raise ValueError("invalid")
+
+    assert limit.limit == 10
+    assert limit._latencies["destination"].samples == 1
+
+
+def test_measure_stage_without_limit():
+    """Test that calls outside of a sync report nowhere."""
+    with pytest.raises(ThrottledError), measure_stage("destination"):
+        raise ThrottledError(429)
+
+
+@pytest.mark.asyncio
+async def test_http_client_reports_source_responses():
+    """Test that the source HTTP client reports latencies and rate limited responses."""
+    statuses = iter([200, 200, 429])
+    limit = AdaptiveConcurrencyLimit(initial_limit=20, backoff_ratio=0.5)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses))
+
+    with bind_concurrency_limit(limit):
+        async with reporting_http_client(transport=httpx.MockTransport(handler)) as client:
+            for _ in range(3):
+                await client.get("https://api.example.com/items")
+
+    assert limit._latencies["source"].samples == 2
+    assert limit.limit == 10
+
+
+@pytest.mark.parametrize(
+    "error, throttled",
+    [
+        (ThrottledError(429), True),
+        (ThrottledError(503), True),
+        (ThrottledError(404), False),
+        (asyncio.TimeoutError(), True),
+        (httpx.ReadTimeout("timed out"), True),
+        (
+            httpx.HTTPStatusError(
+                "rate limited",
+                request=httpx.Request("GET", "https://example.com"),
+                response=httpx.Response(429),
+            ),
+            True,
+        ),
+        (ValueError("invalid"), False),
+    ],
+)
+def test_is_throttling_error(error, throttled):
+    """Test which errors count as throttling."""
+    assert is_throttling_error(error) == throttled
+
+
+@pytest.mark.asyncio
+async def test_pool_respects_adaptive_limit_and_global_ceiling():
+    """Test that no more tasks run than the pool's limit and the shared ceiling allow."""
+    global_limit = GlobalConcurrencyLimit(max_workers=3)
+    pools = [
+        AsyncWorkerPool(
+            max_workers=10,
+            limit=AdaptiveConcurrencyLimit(initial_limit=2, max_limit=10),
+            global_limit=global_limit,
+        )
+        for _ in range(2)
+    ]
+    running = 0
+    max_running = 0
+
+    async def task():
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+
+    await asyncio.gather(*(_run_tasks(pool, 50, task) for pool in pools))
+
+    assert max_running == 3
+    assert all(pool.current_limit > 2 for pool in pools)
+
+
+@pytest.mark.asyncio
+async def test_pool_backs_off_on_throttling_and_reports_queue_depth():
+    """Test that throttled tasks lower the pool's limit and waiting tasks count as queued."""
+    pool = AsyncWorkerPool(
+        max_workers=10, limit=AdaptiveConcurrencyLimit(initial_limit=8, min_limit=2)
+    )
+    release = asyncio.Event()
+
+    async def throttled():
+        await release.wait()
+        raise ThrottledError(429)
+
+    for _ in range(12):
+        await pool.submit(throttled)
+    await asyncio.sleep(0)
+
+    assert pool.in_flight == 8
+    assert pool.queue_depth == 4
+
+    release.set()
+    await pool.wait_for_completion()
+
+    assert pool.current_limit < 8
+    assert pool.in_flight == 0
+    assert pool.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_without_adaptive_limit_stays_fixed():
+    """Test that a pool without an adaptive limit keeps max_workers as its limit."""
+    pool = AsyncWorkerPool(max_workers=4)
+
+    async def task():
+        await asyncio.sleep(0)
+
+    await _run_tasks(pool, 20, task)
+
+    assert pool.current_limit == 4
+
+
+@pytest.mark.asyncio
+async def test_pool_ignores_the_duration_of_tasks():
+    """Test that a task that takes long, e.g. by flushing a batch, does not lower the limit."""
+    pool = AsyncWorkerPool(max_workers=10, limit=AdaptiveConcurrencyLimit(initial_limit=4))
+
+    async def task():
+        await asyncio.sleep(0)
+
+    async def flushing_task():
+        await asyncio.sleep(0.05)
+
+    await _run_tasks(pool, 40, task)
+    grown = pool.current_limit
+    await _run_tasks(pool, 4, flushing_task)
+
+    assert pool.current_limit >= grown > 4
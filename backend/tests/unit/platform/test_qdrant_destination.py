@@ -1,14 +1,27 @@
 """Unit tests for the async Qdrant destination implementation."""
 
 import uuid
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 from qdrant_client.async_qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models as rest
 
+from airweave.core.shared_models import VectorStorageProfile
 from airweave.platform.configs.auth import QdrantAuthConfig
-from airweave.platform.destinations.qdrant import QdrantDestination
+from airweave.platform.destinations.qdrant import (
+    PAYLOAD_INDEX_FIELDS,
+    QdrantDestination,
+    _clients,
+    _point_id,
+    _storage_config,
+    backfill_payload_indexes,
+)
+from airweave.platform.embedding_models.bm25 import SparseVector
 from airweave.platform.entities._base import ChunkEntity
+from airweave.schemas.search import SearchParams
 
 
 class MockChunkEntity(ChunkEntity):
@@ -18,6 +31,14 @@ class MockChunkEntity(ChunkEntity):
     description: str = "Test Description"
 
 
+@pytest.fixture(autouse=True)
+def clear_client_registry():
+    """Make every test connect with its own client."""
+    _clients.clear()
+    yield
+    _clients.clear()
+
+
 @pytest.fixture
 def mock_entity():
     """Create a mock entity for testing."""
@@ -143,6 +164,24 @@ class TestQdrantDestinationConnection:
             )
             mock_client.get_collections.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_connect_to_qdrant_reuses_client(self):
+        """Test that destinations for the same service share one connected client."""
+        with (
+            patch("airweave.platform.destinations.qdrant.AsyncQdrantClient") as mock_client_class,
+            patch("airweave.platform.destinations.qdrant.settings") as mock_settings,
+        ):
+            mock_settings.qdrant_url = "http://test-qdrant-settings.com:6333"
+            mock_client_class.return_value = AsyncMock()
+
+            first, second = QdrantDestination(), QdrantDestination()
+            await first.connect_to_qdrant()
+            await second.connect_to_qdrant()
+
+            assert first.client is second.client
+            mock_client_class.assert_called_once()
+            first.client.get_collections.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_close_connection(self):
         """Test closing the connection."""
@@ -187,6 +226,82 @@ class TestQdrantDestinationCollections:
             destination.client.get_collections.assert_called_once()
 
 
+class TestQdrantPayloadIndexes:
+    """Tests for the payload indexes of Qdrant collections."""
+
+    @pytest.mark.asyncio
+    async def test_setup_collection_creates_payload_indexes(self, mock_qdrant_client):
+        """Test that a new collection gets a keyword index for every filtered field."""
+        destination = QdrantDestination()
+        destination.client = mock_qdrant_client
+        destination.collection_name = "test_collection"
+        mock_qdrant_client.get_collection.return_value = MagicMock(payload_schema={})
+
+        await destination.setup_collection(vector_size=4)
+
+        mock_qdrant_client.create_collection.assert_called_once()
+        indexed = [
+            call.kwargs["field_name"]
+            for call in mock_qdrant_client.create_payload_index.call_args_list
+        ]
+        assert indexed == list(PAYLOAD_INDEX_FIELDS)
+
+    @pytest.mark.asyncio
+    async def test_backfill_only_creates_missing_indexes(self, mock_qdrant_client):
+        """Test that the backfill skips fields that are already indexed."""
+        collection = MagicMock()
+        collection.name = "existing_collection"
+        mock_qdrant_client.get_collections.return_value = MagicMock(collections=[collection])
+        mock_qdrant_client.get_collection.return_value = MagicMock(
+            payload_schema={field: MagicMock() for field in PAYLOAD_INDEX_FIELDS[1:]}
+        )
+
+        with patch(
+            "airweave.platform.destinations.qdrant._get_client",
+            new=AsyncMock(return_value=mock_qdrant_client),
+        ):
+            created = await backfill_payload_indexes("http://qdrant:6333")
+
+        assert created == {"existing_collection": [PAYLOAD_INDEX_FIELDS[0]]}
+        assert mock_qdrant_client.create_payload_index.call_args.kwargs["wait"] is False
+
+
+class TestQdrantStorageProfiles:
+    """Tests for the vector storage profiles of Qdrant collections."""
+
+    @pytest.mark.asyncio
+    async def test_setup_collection_applies_storage_profile(self, mock_qdrant_client):
+        """Test that a quantized profile keeps full vectors on disk and tunes the HNSW index."""
+        destination = QdrantDestination()
+        destination.client = mock_qdrant_client
+        destination.collection_name = "test_collection"
+        mock_qdrant_client.get_collection.return_value = MagicMock(payload_schema={})
+
+        await destination.setup_collection(
+            vector_size=4, storage_profile=VectorStorageProfile.SCALAR, hnsw_m=32
+        )
+
+        kwargs = mock_qdrant_client.create_collection.call_args.kwargs
+        assert kwargs["vectors_config"].on_disk is True
+        assert kwargs["quantization_config"].scalar.type == rest.ScalarType.INT8
+        assert kwargs["quantization_config"].scalar.always_ram is True
+        assert kwargs["hnsw_config"].m == 32
+
+    def test_storage_configs(self):
+        """Test the settings of the standard, binary and on-disk profiles."""
+        standard = _storage_config(VectorStorageProfile.STANDARD, None, None)
+        assert standard == {"on_disk": False, "quantization_config": None, "hnsw_config": None}
+
+        binary = _storage_config(VectorStorageProfile.BINARY, None, None)
+        assert isinstance(binary["quantization_config"], rest.BinaryQuantization)
+
+        on_disk = _storage_config(VectorStorageProfile.ON_DISK, 24, None)
+        assert on_disk["on_disk"] is True
+        assert on_disk["quantization_config"] is None
+        assert on_disk["hnsw_config"].on_disk is True
+        assert on_disk["hnsw_config"].m == 24
+
+
 class TestQdrantDestinationOperations:
     """Tests for QdrantDestination operations."""
 
@@ -207,8 +322,59 @@ class TestQdrantDestinationOperations:
         assert call_args["collection_name"] == "test_collection"
         assert len(call_args["points"]) == 1
         point = call_args["points"][0]
-        assert point.id == str(mock_entity.db_entity_id)
+        assert point.id == _point_id(mock_entity)
         assert point.vector == mock_entity.vector
+        assert point.payload["entity_type"] == "MockChunkEntity"
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_chunk_point_ids(self):
+        """Test that chunks of one entity get distinct point IDs that are stable across writes."""
+        destination = QdrantDestination()
+        destination.client = AsyncMock()
+        destination.collection_name = "test_collection"
+        destination.client.upsert.return_value = MagicMock(errors=None)
+
+        sync_id = uuid.uuid4()
+
+        def make_chunks():
+            return [
+                MockChunkEntity(
+                    entity_id="test_entity_id",
+                    db_entity_id=uuid.uuid4(),
+                    sync_id=sync_id,
+                    chunk_index=i,
+                    vector=[0.1, 0.2, 0.3, 0.4],
+                )
+                for i in range(3)
+            ]
+
+        await destination.bulk_insert(make_chunks())
+        await destination.bulk_insert(make_chunks())
+
+        first, second = (
+            [point.id for point in call.kwargs["points"]]
+            for call in destination.client.upsert.call_args_list
+        )
+        assert len(set(first)) == 3
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_orphans(self, mock_entity):
+        """Test that orphan deletion keeps the points that were just written."""
+        destination = QdrantDestination()
+        destination.client = AsyncMock()
+        destination.collection_name = "test_collection"
+
+        await destination.bulk_delete_orphans(
+            [mock_entity], ["test_entity_id"], mock_entity.sync_id
+        )
+
+        points_filter = destination.client.delete.call_args.kwargs["points_selector"].filter
+        assert [condition.key for condition in points_filter.must] == [
+            "sync_id",
+            "parent_entity_id",
+        ]
+        assert points_filter.must_not[0].has_id == [_point_id(mock_entity)]
 
     @pytest.mark.asyncio
     async def test_bulk_insert(self):
@@ -243,6 +409,55 @@ class TestQdrantDestinationOperations:
         assert call_args["collection_name"] == "test_collection"
         assert len(call_args["points"]) == 3
 
+    @pytest.mark.asyncio
+    async def test_bulk_insert_compact_vectors(self):
+        """Test that float32 array vectors are sent as lists of floats."""
+        destination = QdrantDestination()
+        destination.client = AsyncMock()
+        destination.collection_name = "test_collection"
+        destination.client.upsert.return_value = MagicMock(errors=None)
+
+        entity = MockChunkEntity(
+            entity_id="test_entity_id",
+            db_entity_id=uuid.uuid4(),
+            sync_id=uuid.uuid4(),
+            vector=np.array([0.5, 0.25, 1.0, 2.0], dtype=np.float32),
+        )
+
+        await destination.bulk_insert([entity])
+
+        point = destination.client.upsert.call_args[1]["points"][0]
+        assert point.vector == [0.5, 0.25, 1.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_sparse_vectors(self):
+        """Test that sparse vectors are only sent to collections that store them."""
+        destination = QdrantDestination()
+        destination.client = AsyncMock()
+        destination.collection_name = "test_collection"
+        destination.client.upsert.return_value = MagicMock(errors=None)
+
+        entity = MockChunkEntity(
+            entity_id="test_entity_id",
+            sync_id=uuid.uuid4(),
+            vector=[0.1, 0.2, 0.3, 0.4],
+            sparse_vector=SparseVector(indices=[3, 7], values=[1.5, 0.5]),
+        )
+
+        for stored in (True, False):
+            with patch.object(destination, "has_sparse_vectors", AsyncMock(return_value=stored)):
+                await destination.bulk_insert([entity])
+
+        with_sparse, without_sparse = (
+            call.kwargs["points"][0].vector for call in destination.client.upsert.call_args_list
+        )
+        assert with_sparse[""] == [0.1, 0.2, 0.3, 0.4]
+        assert with_sparse["bm25"].indices == [3, 7]
+        assert without_sparse == [0.1, 0.2, 0.3, 0.4]
+        assert (
+            "sparse_vector" not in destination.client.upsert.call_args.kwargs["points"][0].payload
+        )
+
     @pytest.mark.asyncio
     async def test_search(self):
         """Test searching for entities."""
@@ -257,7 +472,7 @@ class TestQdrantDestinationOperations:
             MagicMock(id="result1", score=0.95, payload={"field": "value1"}),
             MagicMock(id="result2", score=0.85, payload={"field": "value2"}),
         ]
-        destination.client.search.return_value = mock_results
+        destination.client.query_points.return_value = MagicMock(points=mock_results)
 
         # Perform search
         query_vector = [0.1, 0.2, 0.3, 0.4]
@@ -269,6 +484,42 @@ class TestQdrantDestinationOperations:
         assert results[0]["score"] == 0.95
         assert results[0]["payload"] == {"field": "value1"}
 
+        call_args = destination.client.query_points.call_args.kwargs
+        assert call_args["limit"] == 10
+        assert call_args["query_filter"] is None
+        assert call_args["with_payload"] is True
+
+    @pytest.mark.asyncio
+    async def test_search_with_params(self):
+        """Test that filters, pagination and payload projection are passed to Qdrant."""
+        destination = QdrantDestination()
+        destination.client = AsyncMock()
+        destination.collection_name = "test_collection"
+        destination.client.query_points.return_value = MagicMock(points=[])
+
+        sync_id = uuid.uuid4()
+        params = SearchParams(
+            limit=5,
+            offset=20,
+            source_names=["slack"],
+            sync_ids=[sync_id],
+            entity_types=["SlackMessageEntity"],
+            time_from=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            include_fields=["entity_id", "text"],
+        )
+        await destination.search([0.1, 0.2, 0.3, 0.4], params)
+
+        call_args = destination.client.query_points.call_args.kwargs
+        assert call_args["limit"] == 5
+        assert call_args["offset"] == 20
+        assert call_args["with_payload"] == ["entity_id", "text"]
+        conditions = {condition.key: condition for condition in call_args["query_filter"].must}
+        assert conditions["source_name"].match.any == ["slack"]
+        assert conditions["sync_id"].match.any == [str(sync_id)]
+        assert conditions["entity_type"].match.any == ["SlackMessageEntity"]
+        assert conditions["created_at"].range.gte == params.time_from
+        assert conditions["created_at"].range.lte is None
+
 
 class TestQdrantDestinationUtilities:
     """Tests for QdrantDestination utility methods."""
@@ -8,7 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 import pytest
 
 from airweave import crud, schemas
-from airweave.core.shared_models import SyncJobStatus, SyncStatus
+from airweave.core.shared_models import SyncJobStatus, SyncMode, SyncStatus
 from airweave.platform.scheduler import PlatformScheduler, ensure_utc
 
 
@@ -529,6 +529,11 @@ class TestTriggerSync:
                 new_callable=AsyncMock,
                 return_value=mock_user,
             ),
+            patch(
+                "airweave.platform.scheduler.crud.sync_job.get_last_full_sync_at",
+                new_callable=AsyncMock,
+                return_value=None,
+            ),
             patch(
                 "airweave.platform.scheduler.crud.sync_job.create",
                 new_callable=AsyncMock,
@@ -588,6 +593,11 @@ class TestTriggerSync:
                 new_callable=AsyncMock,
                 return_value=mock_user,
             ),
+            patch(
+                "airweave.platform.scheduler.crud.sync_job.get_last_full_sync_at",
+                new_callable=AsyncMock,
+                return_value=None,
+            ),
             patch("airweave.platform.scheduler.crud.sync_job.create", new_callable=AsyncMock),
             patch(
                 "airweave.platform.scheduler.crud.sync_dag.get_by_sync_id",
@@ -602,3 +612,42 @@ class TestTriggerSync:
             crud.user.get_by_email.assert_called_once()
             crud.sync_job.create.assert_called_once()
             crud.sync_dag.get_by_sync_id.assert_called_once()
+
+
+class TestChooseSyncMode:
+    """Tests for _choose_sync_mode method."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "last_full_sync_minutes_ago, full_sync_cron, expected",
+        [
+            (None, None, SyncMode.FULL),
+            (0, None, SyncMode.INCREMENTAL),
+            (25 * 60, None, SyncMode.FULL),
+            (2, "* * * * *", SyncMode.FULL),
+        ],
+    )
+    async def test_choose_sync_mode(
+        self, mock_sync_with_schedule, last_full_sync_minutes_ago, full_sync_cron, expected
+    ):
+        """Test that a run is full when no full sync completed since the full sync cron was due."""
+        last_full_sync_at = None
+        if last_full_sync_minutes_ago is not None:
+            last_full_sync_at = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+                minutes=last_full_sync_minutes_ago
+            )
+        mock_sync_with_schedule.full_sync_cron_schedule = full_sync_cron
+
+        with (
+            patch("airweave.platform.scheduler.settings.SYNC_FULL_SYNC_CRON_SCHEDULE", "0 0 * * *"),
+            patch(
+                "airweave.platform.scheduler.crud.sync_job.get_last_full_sync_at",
+                new_callable=AsyncMock,
+                return_value=last_full_sync_at,
+            ),
+        ):
+            sync_mode = await PlatformScheduler()._choose_sync_mode(
+                AsyncMock(), mock_sync_with_schedule
+            )
+
+        assert sync_mode == expected
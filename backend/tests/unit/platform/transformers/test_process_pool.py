@@ -0,0 +1,62 @@
+"""Unit tests for the transformer process pool."""
+
+import os
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from airweave.platform.entities._base import ChunkEntity
+from airweave.platform.transformers.entity_field_chunker import entity_chunker
+from airweave.platform.transformers.process_pool import TransformProcessPool
+
+
+class MockChunkEntity(ChunkEntity):
+    """Mock ChunkEntity for testing."""
+
+    content: str = ""
+
+
+def _pid(offset: int) -> int:
+    return os.getpid() + offset
+
+
+def _die() -> None:
+    os._exit(1)
+
+
+@pytest.mark.asyncio
+async def test_without_processes_runs_on_the_event_loop():
+    """Test that a pool without processes calls the function directly."""
+    pool = TransformProcessPool(processes=0)
+
+    assert await pool.run(_pid, 1) == os.getpid() + 1
+    assert pool._executor is None
+
+
+@pytest.mark.asyncio
+async def test_runs_in_worker_processes_and_restarts_after_a_crash():
+    """Test that functions run in another process, and a dead worker does not break the pool."""
+    pool = TransformProcessPool(processes=1)
+    try:
+        assert await pool.run(_pid, 0) != os.getpid()
+
+        with pytest.raises(BrokenProcessPool):
+            await pool.run(_die)
+
+        assert await pool.run(_pid, 0) != os.getpid()
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_small_entities_are_not_sent_to_the_pool():
+    """Test that entities that are small in bytes skip token counting in the pool."""
+    entity = MockChunkEntity(entity_id="e1", content="short")
+
+    with patch(
+        "airweave.platform.transformers.entity_field_chunker.transform_pool.run", new=AsyncMock()
+    ) as run:
+        assert await entity_chunker(entity) == [entity]
+
+    run.assert_not_called()
@@ -0,0 +1,31 @@
+"""Unit tests for the shared HTTP clients."""
+
+import asyncio
+
+import pytest
+
+from airweave.platform.utils.http import get_loop_bound, get_loop_bound_client
+
+
+@pytest.mark.asyncio
+async def test_client_is_shared_until_closed():
+    """Test that calls share one client per key, and that a closed client is replaced."""
+    client = get_loop_bound_client("test_shared", timeout=5.0)
+
+    assert get_loop_bound_client("test_shared", timeout=5.0) is client
+    assert get_loop_bound_client("test_other") is not client
+
+    await client.aclose()
+    assert not get_loop_bound_client("test_shared").is_closed
+
+
+def test_objects_are_created_per_event_loop():
+    """Test that another event loop gets its own object."""
+
+    async def get():
+        return get_loop_bound("test_loop", asyncio.Lock)
+
+    first = asyncio.run(get())
+    second = asyncio.run(get())
+
+    assert first is not second
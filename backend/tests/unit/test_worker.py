@@ -0,0 +1,100 @@
+"""Unit tests for the sync worker."""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from airweave.worker import SyncWorker
+
+
+@pytest.fixture
+def queue(mock_db_context):
+    """Patch the job queue, with one job to claim."""
+    job_id = uuid.uuid4()
+    sync_job = MagicMock()
+    sync_job.fail_abandoned = AsyncMock(return_value=0)
+    sync_job.claim_next = AsyncMock(side_effect=[job_id] + [None] * 1000)
+    sync_job.renew_lease = AsyncMock(return_value=True)
+    sync_job.release_lease = AsyncMock()
+
+    with (
+        patch("airweave.worker.crud.sync_job", sync_job),
+        patch("airweave.worker.get_db_context", mock_db_context),
+    ):
+        yield job_id, sync_job
+
+
+def _worker(**kwargs):
+    return SyncWorker(
+        concurrency=2, poll_seconds=0.01, lease_seconds=10, heartbeat_seconds=0.01, **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_worker_runs_claimed_job_and_releases_the_lease(queue):
+    """Test that a claimed job is run with heartbeats and its lease is released."""
+    job_id, sync_job = queue
+    worker = _worker(worker_id="w1")
+    done = asyncio.Event()
+
+    async def run_job(claimed_id):
+        await asyncio.sleep(0.05)
+        done.set()
+
+    with patch("airweave.worker.sync_service.run_job", side_effect=run_job) as run:
+        serving = asyncio.create_task(worker.run())
+        await asyncio.wait_for(done.wait(), timeout=1)
+        await asyncio.sleep(0.02)
+        worker.stop()
+        await serving
+
+    run.assert_awaited_once_with(job_id)
+    assert sync_job.renew_lease.await_count >= 1
+    sync_job.release_lease.assert_awaited_once_with(
+        sync_job.release_lease.await_args.args[0], id=job_id, worker_id="w1", requeue=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_lost_lease_cancels_the_job(queue):
+    """Test that a job is cancelled when another worker took its lease over."""
+    _, sync_job = queue
+    sync_job.renew_lease = AsyncMock(return_value=False)
+    worker = _worker()
+    cancelled = asyncio.Event()
+
+    async def run_job(claimed_id):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with patch("airweave.worker.sync_service.run_job", side_effect=run_job):
+        serving = asyncio.create_task(worker.run())
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        worker.stop()
+        await serving
+
+
+@pytest.mark.asyncio
+async def test_stopping_requeues_running_jobs(queue):
+    """Test that jobs that are still running when the worker stops go back in the queue."""
+    job_id, sync_job = queue
+    worker = _worker()
+    started = asyncio.Event()
+
+    async def run_job(claimed_id):
+        started.set()
+        await asyncio.sleep(10)
+
+    with patch("airweave.worker.sync_service.run_job", side_effect=run_job):
+        serving = asyncio.create_task(worker.run())
+        await asyncio.wait_for(started.wait(), timeout=1)
+        worker.stop()
+        await asyncio.wait_for(serving, timeout=1)
+
+    assert sync_job.release_lease.await_args.kwargs["requeue"] is True
+    assert sync_job.release_lease.await_args.kwargs["id"] == job_id